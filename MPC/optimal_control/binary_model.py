@@ -37,7 +37,18 @@ import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from optimal_control.value_arrays import *
+
 class Binary_Model():
+    ## Start values of the linear binary model from the last step of this model: variable, index of the layer and column of the results (e.g. of the warmstart)
+    END_STATES = {"T_HP_HT_start":("T_HP_HT_T",(),"T_HP_HT_T"),"T_HP_LT_start":("T_HP_LT_T",(),"T_HP_LT_T"),"T_HS_start":("T_HS_T",(),"T_HS_T"),"T_HXA_start":("T_HXA_T",(),"T_HXA_T"),
+    "T_HXH_start":("T_HP_HT_T",(),"T_HP_HT_T"),"T_HGC_start":("T_HGC_T",(),"T_HGC_T"),"T_HXC_start":("T_HP_LT_T",(),"T_HP_LT_T"),"T_HGS_start":("T_HGS_T",(),"T_HGS_T"),
+    "T_IS_w_1_start":("T_IS_W_T_WR",(0,),"T_IS_W_0_T"),"T_IS_w_2_start":("T_IS_W_T_WR",(2,),"T_IS_W_1_T"),"T_IS_w_3_start":("T_IS_W_T_WR",(4,),"T_IS_W_2_T"),
+    "T_IS_c_1_start":("T_IS_C_T_CR",(0,),"T_IS_C_0_T"),"T_IS_c_2_start":("T_IS_C_T_CR",(1,),"T_IS_C_1_T"),"T_IS_c_3_start":("T_IS_C_T_CR",(2,),"T_IS_C_2_T"),"T_IS_c_4_start":("T_IS_C_T_CR",(3,),"T_IS_C_3_T"),
+    "T_IS_c_5_start":("T_IS_C_T_CR",(4,),"T_IS_C_4_T"),"T_GS_w_1_start":("T_GS_W_T_WR_WC",(0,1),"T_GS_W_0_T"),"T_GS_w_2_start":("T_GS_W_T_WR_WC",(0,3),"T_GS_W_1_T"),"T_GS_w_3_start":("T_GS_W_T_WR_WC",(0,5),"T_GS_W_2_T"),
+    "T_GS_c_1_start":("T_GS_C_T_CR_CC",(0,0),"T_GS_C_0_T"),"T_GS_c_2_start":("T_GS_C_T_CR_CC",(0,1),"T_GS_C_1_T"),"T_GS_c_3_start":("T_GS_C_T_CR_CC",(0,2),"T_GS_C_2_T"),"T_GS_c_4_start":("T_GS_C_T_CR_CC",(0,3),"T_GS_C_3_T"),
+    "T_GS_c_5_start":("T_GS_C_T_CR_CC",(0,4),"T_GS_C_4_T"),"T_GS_c_6_start":("T_GS_C_T_CR_CC",(0,5),"T_GS_C_5_T"),"T_GS_c_7_start":("T_GS_C_T_CR_CC",(0,6),"T_GS_C_6_T"),
+    "T_CS_start":("T_CS_T",(),"T_CS_T"),"T_RLTS_start":("T_RLTS_T",(),"T_RLTS_T")}
     
     def __init__(self):
         self.warmstart_available = False
@@ -508,6 +519,25 @@ class Binary_Model():
         self.m.Z_VP_V_T_2 = pyo.Var(self.V_2, self.T, domain=pyo.NonNegativeReals)
         self.m.E_VP_EL_T = pyo.Var(self.T[0:-1], domain=pyo.NonNegativeReals)
 
+        ## Profiles (mutable, updated by updateProfiles if the model is reused)
+        self.m.q_dem_HS_T = pyo.Param(self.T[0:-1], initialize=dict(zip(self.T[0:-1],self.q_dem_HS_T)), mutable=True)
+        self.m.q_dem_CS_T = pyo.Param(self.T[0:-1], initialize=dict(zip(self.T[0:-1],self.q_dem_CS_T)), mutable=True)
+        self.m.q_dem_RLTS_T = pyo.Param(self.T[0:-1], initialize=dict(zip(self.T[0:-1],self.q_dem_RLTS_T)), mutable=True)
+        self.m.temp_amb_T = pyo.Param(self.T[0:-1], initialize=dict(zip(self.T[0:-1],self.temp_amb_T)), mutable=True)
+        self.m.c_ELECTRICITY_buy_T = pyo.Param(self.T[0:-1], initialize=dict(zip(self.T[0:-1],self.c_ELECTRICITY_buy_T)), mutable=True)
+        self.m.temp_frost_T = pyo.Param(self.T[0:-1], initialize=dict(zip(self.T[0:-1],self.temp_frost_T)), mutable=True)
+
+        return self.m
+
+    def updateProfiles(self,model):
+        self.m = model
+        for t in self.T[0:-1]:
+            self.m.q_dem_HS_T[t] = self.q_dem_HS_T[t]
+            self.m.q_dem_CS_T[t] = self.q_dem_CS_T[t]
+            self.m.q_dem_RLTS_T[t] = self.q_dem_RLTS_T[t]
+            self.m.temp_amb_T[t] = self.temp_amb_T[t]
+            self.m.c_ELECTRICITY_buy_T[t] = self.c_ELECTRICITY_buy_T[t]
+            self.m.temp_frost_T[t] = self.temp_frost_T[t]
         return self.m
 
     def setStartValues(self,model,T_HP_HT_start,T_HP_LT_start,T_HS_start,T_HXA_start,T_HGC_start,T_HGS_start,T_IS_w_1_start,T_IS_w_2_start,T_IS_w_3_start,T_IS_c_1_start,T_IS_c_2_start,T_IS_c_3_start,
@@ -559,6 +589,25 @@ class Binary_Model():
             self.B_GS_CS_start = B_GS_CS_start
             self.B_GS_HGS_CS_start = B_GS_HGS_CS_start
             self.B_VP_start = B_VP_start
+
+        ## Start values (mutable, only the values are updated if the model is reused)
+        startValues = ["T_HP_HT_start","T_HP_LT_start","T_HS_start","T_HXA_start","T_HGC_start","T_HGS_start","T_IS_w_1_start","T_IS_w_2_start","T_IS_w_3_start","T_IS_c_1_start","T_IS_c_2_start","T_IS_c_3_start",
+        "T_IS_c_4_start","T_IS_c_5_start","T_GS_w_1_start","T_GS_w_2_start","T_GS_w_3_start","T_GS_c_1_start","T_GS_c_2_start","T_GS_c_3_start","T_GS_c_4_start","T_GS_c_5_start","T_GS_c_6_start","T_GS_c_7_start","T_CS_start","T_RLTS_start"]
+        if Start_Toggle_Constraints == True:
+            startValues = startValues + ["B_HP_1_start","B_HP_2_start","B_HP_3_start","B_HP_4_start","B_HXH_HS_start","B_HGC_HGCHXC_start","B_HXA_start","B_HXH_HGC_start","B_HS_IS_start","B_IS_HGS_start","B_GS_HGS_start","B_GS_CS_start","B_GS_HGS_CS_start"]
+        for name in startValues:
+            if self.m.find_component(name + "_T") is None:
+                self.m.add_component(name + "_T", pyo.Param(initialize=getattr(self,name), mutable=True))
+            else:
+                getattr(self.m,name + "_T").set_value(getattr(self,name))
+            setattr(self,name,getattr(self.m,name + "_T"))
+        if Start_Toggle_Constraints == True:
+            if self.m.find_component("B_VP_start_T") is None:
+                self.m.B_VP_start_T = pyo.Param(self.V_1, initialize=dict(zip(self.V_1,B_VP_start)), mutable=True)
+            else:
+                for v in self.V_1:
+                    self.m.B_VP_start_T[v] = B_VP_start[v]
+            self.B_VP_start = self.m.B_VP_start_T
         return self.m
 
     def setEndValues(self,model,End_Temp_Constraints,T_HS_end,T_CS_end,T_RLTS_end,End_Toggle_Constraints,B_HP_1_end,B_HP_2_end,B_HP_3_end,B_HP_4_end,B_HXH_HS_end,B_HGC_HGCHXC_end,B_HXA_end,B_HXH_HGC_end,B_HS_IS_end,B_IS_HGS_end,B_GS_HGS_end,B_GS_CS_end,B_GS_HGS_CS_end):
@@ -587,6 +636,12 @@ class Binary_Model():
             ## All but cold side HP HXC
         return self.m
 
+    def getEndStates(self,model=None,results=None):
+        ## Start values of the linear binary model (END_STATES): the variables of the last step of the block (e.g. as links of getLinks) or the last row of results
+        if results is not None:
+            return {name:results[column].iloc[-1] for name,(variable,index,column) in self.END_STATES.items()}
+        return {name:model.component(variable)[(self.T[-1],) + index] for name,(variable,index,column) in self.END_STATES.items()}
+
     def setConstraints(self,model):
         self.m = model
         ## General cost constraint
@@ -595,7 +650,7 @@ class Binary_Model():
         ## Cost constraints 
         self.m.Constraint_Cost_time_T = pyo.ConstraintList()
         for t in self.T[0:-1]:
-            self.m.Constraint_Cost_time_T.add(self.m.C_OP_T[t] == self.StepSizeInSec/self.t_hour_in_sec * ((self.m.E_HP_EL_in_T[t] + self.m.E_HXA_EL_T[t] + self.m.E_IS_EL_T[t] + self.m.E_GS_EL_T[t] + self.m.E_VP_EL_T[t]) * self.c_ELECTRICITY_buy_T[t]))
+            self.m.Constraint_Cost_time_T.add(self.m.C_OP_T[t] == self.StepSizeInSec/self.t_hour_in_sec * ((self.m.E_HP_EL_in_T[t] + self.m.E_HXA_EL_T[t] + self.m.E_IS_EL_T[t] + self.m.E_GS_EL_T[t] + self.m.E_VP_EL_T[t]) * self.m.c_ELECTRICITY_buy_T[t]))
 
         ## General Slack constraint
         self.m.Constraint_Slack_T = pyo.Constraint(expr = self.m.S_TOT_T_ == sum(self.m.S_OP_T[t] for t in self.T[1:]))
@@ -815,7 +870,7 @@ class Binary_Model():
            self.m.Constraint_HS_T.add(self.m.T_HS_T[self.T[-1]] >= self.T_HS_end - self.m.S_T_HS_T[self.T[-1]])
 
         for t in self.T[0:-1]:
-            self.m.Constraint_HS_T.add(self.m.T_HS_T[t+1] == self.m.T_HS_T[t] + self.StepSizeInSec * (1/(self.m_HS_w * self.c_w) * (self.c_w * sum(self.mdot_HP_w_H[h] * self.m.Z_HS_HT_H_T[h,t] for h in self.H) + self.c_w * self.mdot_IS_w_2 * self.m.Z_HS_LT_T[t] + self.c_w * self.mdot_IS_w_2 * self.m.Z_HS_LT_2_T[t])) - self.StepSizeInSec * self.q_dem_HS_T[t]/(self.m_HS_w * self.c_w) + self.StepSizeInSec * self.alpha_HS_time * (self.t_default - self.m.T_HS_T[t+1])/(self.m_HS_w * self.c_w)) ## General energy flow
+            self.m.Constraint_HS_T.add(self.m.T_HS_T[t+1] == self.m.T_HS_T[t] + self.StepSizeInSec * (1/(self.m_HS_w * self.c_w) * (self.c_w * sum(self.mdot_HP_w_H[h] * self.m.Z_HS_HT_H_T[h,t] for h in self.H) + self.c_w * self.mdot_IS_w_2 * self.m.Z_HS_LT_T[t] + self.c_w * self.mdot_IS_w_2 * self.m.Z_HS_LT_2_T[t])) - self.StepSizeInSec * self.m.q_dem_HS_T[t]/(self.m_HS_w * self.c_w) + self.StepSizeInSec * self.alpha_HS_time * (self.t_default - self.m.T_HS_T[t+1])/(self.m_HS_w * self.c_w)) ## General energy flow
         
         for t in self.T[0:-1]:
             for h in self.H:
@@ -852,10 +907,10 @@ class Binary_Model():
 
         if self.TControlPeriodSwitch1 > 0:
             for t in self.T[0:self.TControlPeriodSwitch1]:
-                self.m.Constraint_CS_T.add(self.m.T_CS_T[t+1] == self.m.T_CS_T[t] + self.StepSizeInSec * (1/(self.m_CS_w * self.c_w) * (self.c_w * self.mdot_GS_w * self.m.Z_CS_GS_T[t] + self.c_w * self.mdot_GS_w_2 * self.m.Z_CS_GS_2_T[t] + self.c_w * sum(self.mdot_VP_CS_V_1[v] * self.m.Z_CS_HXC_V_T_1[v,t] for v in self.V_1))) + self.StepSizeInSec * self.q_dem_CS_T[t]/(self.m_CS_w * self.c_w) + self.StepSizeInSec * self.alpha_CS_time * (self.t_default - self.m.T_CS_T[t+1])/(self.m_CS_w * self.c_w)) ## General energy flow
+                self.m.Constraint_CS_T.add(self.m.T_CS_T[t+1] == self.m.T_CS_T[t] + self.StepSizeInSec * (1/(self.m_CS_w * self.c_w) * (self.c_w * self.mdot_GS_w * self.m.Z_CS_GS_T[t] + self.c_w * self.mdot_GS_w_2 * self.m.Z_CS_GS_2_T[t] + self.c_w * sum(self.mdot_VP_CS_V_1[v] * self.m.Z_CS_HXC_V_T_1[v,t] for v in self.V_1))) + self.StepSizeInSec * self.m.q_dem_CS_T[t]/(self.m_CS_w * self.c_w) + self.StepSizeInSec * self.alpha_CS_time * (self.t_default - self.m.T_CS_T[t+1])/(self.m_CS_w * self.c_w)) ## General energy flow
             
         for t in self.T[self.TControlPeriodSwitch1:-1]:
-            self.m.Constraint_CS_T.add(self.m.T_CS_T[t+1] == self.m.T_CS_T[t] + self.StepSizeInSec * (1/(self.m_CS_w * self.c_w) * (self.c_w * self.mdot_GS_w * self.m.Z_CS_GS_T[t] + self.c_w * self.mdot_GS_w_2 * self.m.Z_CS_GS_2_T[t] + self.c_w * sum(self.mdot_VP_CS_V_2[v] * self.m.Z_CS_HXC_V_T_2[v,t] for v in self.V_2))) + self.StepSizeInSec * self.q_dem_CS_T[t]/(self.m_CS_w * self.c_w) + self.StepSizeInSec * self.alpha_CS_time * (self.t_default - self.m.T_CS_T[t+1])/(self.m_CS_w * self.c_w)) ## General energy flow
+            self.m.Constraint_CS_T.add(self.m.T_CS_T[t+1] == self.m.T_CS_T[t] + self.StepSizeInSec * (1/(self.m_CS_w * self.c_w) * (self.c_w * self.mdot_GS_w * self.m.Z_CS_GS_T[t] + self.c_w * self.mdot_GS_w_2 * self.m.Z_CS_GS_2_T[t] + self.c_w * sum(self.mdot_VP_CS_V_2[v] * self.m.Z_CS_HXC_V_T_2[v,t] for v in self.V_2))) + self.StepSizeInSec * self.m.q_dem_CS_T[t]/(self.m_CS_w * self.c_w) + self.StepSizeInSec * self.alpha_CS_time * (self.t_default - self.m.T_CS_T[t+1])/(self.m_CS_w * self.c_w)) ## General energy flow
  
         for t in self.T[0:-1]:
             self.m.Constraint_CS_T.add(self.m.Z_CS_GS_T[t] <= self.T_CS_delta_max) ## Big M constraint input
@@ -907,10 +962,10 @@ class Binary_Model():
         
         if self.TControlPeriodSwitch1 > 0:
             for t in self.T[0:self.TControlPeriodSwitch1]:
-                self.m.Constraint_RLTS_T.add(self.m.T_RLTS_T[t+1] == self.m.T_RLTS_T[t] + self.StepSizeInSec * (1/(self.m_RLTS_w * self.c_w) * (self.c_w * sum(self.mdot_VP_RLTS_V_2[v] * self.m.Z_RLTS_HXC_V_T_1[v,t] for v in self.V_1))) + self.StepSizeInSec * self.q_dem_RLTS_T[t]/(self.m_RLTS_w * self.c_w) + self.StepSizeInSec * self.alpha_RLTS_time * (self.t_default - self.m.T_RLTS_T[t+1])/(self.m_RLTS_w * self.c_w)) ## General energy flow
+                self.m.Constraint_RLTS_T.add(self.m.T_RLTS_T[t+1] == self.m.T_RLTS_T[t] + self.StepSizeInSec * (1/(self.m_RLTS_w * self.c_w) * (self.c_w * sum(self.mdot_VP_RLTS_V_2[v] * self.m.Z_RLTS_HXC_V_T_1[v,t] for v in self.V_1))) + self.StepSizeInSec * self.m.q_dem_RLTS_T[t]/(self.m_RLTS_w * self.c_w) + self.StepSizeInSec * self.alpha_RLTS_time * (self.t_default - self.m.T_RLTS_T[t+1])/(self.m_RLTS_w * self.c_w)) ## General energy flow
         
         for t in self.T[self.TControlPeriodSwitch1:-1]:
-            self.m.Constraint_RLTS_T.add(self.m.T_RLTS_T[t+1] == self.m.T_RLTS_T[t] + self.StepSizeInSec * (1/(self.m_RLTS_w * self.c_w) * (self.c_w * sum(self.mdot_VP_RLTS_V_2[v] * self.m.Z_RLTS_HXC_V_T_2[v,t] for v in self.V_2))) + self.StepSizeInSec * self.q_dem_RLTS_T[t]/(self.m_RLTS_w * self.c_w) + self.StepSizeInSec * self.alpha_RLTS_time * (self.t_default - self.m.T_RLTS_T[t+1])/(self.m_RLTS_w * self.c_w)) ## General energy flow
+            self.m.Constraint_RLTS_T.add(self.m.T_RLTS_T[t+1] == self.m.T_RLTS_T[t] + self.StepSizeInSec * (1/(self.m_RLTS_w * self.c_w) * (self.c_w * sum(self.mdot_VP_RLTS_V_2[v] * self.m.Z_RLTS_HXC_V_T_2[v,t] for v in self.V_2))) + self.StepSizeInSec * self.m.q_dem_RLTS_T[t]/(self.m_RLTS_w * self.c_w) + self.StepSizeInSec * self.alpha_RLTS_time * (self.t_default - self.m.T_RLTS_T[t+1])/(self.m_RLTS_w * self.c_w)) ## General energy flow
         
         if self.TControlPeriodSwitch1 > 0:
             for t in self.T[0:self.TControlPeriodSwitch1]:
@@ -1450,8 +1505,8 @@ class Binary_Model():
         ## HXA
         self.m.Constraint_HXA_T = pyo.ConstraintList()
         for t in self.T[0:-1]:
-            self.m.Constraint_HXA_T.add(self.m.T_HXA_in_T[t] == self.temp_amb_T[t]) ## General temperature connection
-            self.m.Constraint_HXA_T.add(self.m.Z_HXA_T[t] == self.m.B_HXA_T[t] * (1-self.temp_frost_T[t]))
+            self.m.Constraint_HXA_T.add(self.m.T_HXA_in_T[t] == self.m.temp_amb_T[t]) ## General temperature connection
+            self.m.Constraint_HXA_T.add(self.m.Z_HXA_T[t] == self.m.B_HXA_T[t] * (1-self.m.temp_frost_T[t]))
         
         if self.TControlPeriodSwitch1 > 0:
             for t in self.T[0:self.TControlPeriodSwitch1-(self.ControlPeriod1)+1]:
@@ -1486,7 +1541,7 @@ class Binary_Model():
         self.m.Constraint_HXA_T.add(self.m.T_HXA_T[0] == self.T_HXA_start) ## Start temperature
 
         for t in self.T[0:-1]:
-            self.m.Constraint_HXA_T.add(self.m.T_HXA_T[t+1] == self.m.T_HXA_T[t] + self.StepSizeInSec * (1/(self.m_HXA_b * self.c_b) * (self.alpha_factor_HXA * self.c_a * self.mdot_HXA_a * self.m.Z_HXA_out_T[t] + self.c_b * self.mdot_HXA_b * self.m.Z_T_HXA_HXH_T[t] + self.c_b * self.mdot_HXA_b * self.m.Z_T_HXA_HGC_T[t])) + self.StepSizeInSec * self.alpha_HXA_time * (self.temp_amb_T[t] - self.m.T_HXA_T[t+1])/(self.m_HXA_b * self.c_b)) ## General energy flow
+            self.m.Constraint_HXA_T.add(self.m.T_HXA_T[t+1] == self.m.T_HXA_T[t] + self.StepSizeInSec * (1/(self.m_HXA_b * self.c_b) * (self.alpha_factor_HXA * self.c_a * self.mdot_HXA_a * self.m.Z_HXA_out_T[t] + self.c_b * self.mdot_HXA_b * self.m.Z_T_HXA_HXH_T[t] + self.c_b * self.mdot_HXA_b * self.m.Z_T_HXA_HGC_T[t])) + self.StepSizeInSec * self.alpha_HXA_time * (self.m.temp_amb_T[t] - self.m.T_HXA_T[t+1])/(self.m_HXA_b * self.c_b)) ## General energy flow
         
         for t in self.T[0:-1]:
             self.m.Constraint_HXA_T.add(self.m.Z_HXA_out_T[t] <= self.T_HXA_delta_max) ## Big M constraint input
@@ -1988,129 +2043,78 @@ class Binary_Model():
 
     def getResults(self,model,source=None,savePath="",singleFile=False):
         self.m = model
-        self.safeFile = pd.DataFrame(columns = ["C_OP_T","C_HP_T","C_HXA_T","C_IS_T","C_GS_T","C_VP_T","B_HP_4_T","B_HP_3_T","B_HP_2_T","B_HP_1_T","B_HP_0_T","B_HXH_HS_T","B_HGC_HGCHXC_T","B_HXA_T","B_HXH_HGC_T",
+        columns = ["C_OP_T","C_HP_T","C_HXA_T","C_IS_T","C_GS_T","C_VP_T","B_HP_4_T","B_HP_3_T","B_HP_2_T","B_HP_1_T","B_HP_0_T","B_HXH_HS_T","B_HGC_HGCHXC_T","B_HXA_T","B_HXH_HGC_T",
         "B_HS_IS_T","B_IS_HGS_T","B_GS_HGS_T","B_GS_CS_T","B_GS_HGS_CS_T","B_VP_7_T_1","B_VP_6_T_1","B_VP_5_T_1","B_VP_4_T_1","B_VP_3_T_1","B_VP_2_T_1","B_VP_1_T_1","B_VP_0_T_1","B_VP_13_T_2","B_VP_12_T_2","B_VP_11_T_2",
         "B_VP_10_T_2","B_VP_9_T_2","B_VP_8_T_2","B_VP_7_T_2","B_VP_6_T_2","B_VP_5_T_2","B_VP_4_T_2","B_VP_3_T_2","B_VP_2_T_2","B_VP_1_T_2","B_VP_0_T_2","E_HP_EL_T","Q_HP_HT_T","Q_HP_LT_T","E_HP_EL_in_T",
         "T_HP_HT_T","T_HP_LT_T","T_HS_T","T_HXH_T","T_HGC_T","T_HXA_T","T_HXC_T","T_IS_T","T_ISw_T","T_ISc_T","T_IS_W_0_T","T_IS_W_1_T","T_IS_W_2_T","T_IS_C_0_T","T_IS_C_1_T","T_IS_C_2_T","T_IS_C_3_T","T_IS_C_4_T",
         "T_GS_T","T_GSw_T","T_GSc_T","T_GS_W_0_T","T_GS_W_1_T","T_GS_W_2_T","T_GS_C_0_T","T_GS_C_1_T","T_GS_C_2_T","T_GS_C_3_T","T_GS_C_4_T","T_GS_C_5_T","T_GS_C_6_T",
         "T_HGS_T","T_CS_T","T_RLTS_T","S_OP_T","S_T_HP_T","S_T_HS_T","S_T_HXH_T","S_T_HGC_T","S_T_HXA_T",
-        "S_T_HXC_T","S_T_IS_T","S_T_GS_T","S_T_HGS_T","S_T_CS_T","S_T_RLTS_T","q_dem_HS_T","q_dem_CS_T","q_dem_RLTS_T","temp_amb_T"]) 
-        try: # Everything but slack constraints
+        "S_T_HXC_T","S_T_IS_T","S_T_GS_T","S_T_HGS_T","S_T_CS_T","S_T_RLTS_T","q_dem_HS_T","q_dem_CS_T","q_dem_RLTS_T","temp_amb_T"]
+        try:
+            ## All values are read column wise, rows are the time steps T (last row only holds storage temperatures and slacks)
+            results = {}
+            # Costs (everything but the last time step)
+            results["C_OP_T"] = getValueArray(self.m.C_OP_T,self.T)
+            if np.isnan(results["C_OP_T"][0:-1]).any():
+                raise RuntimeError("Optimization T didn't come to a solution.")
+            costFactor = getValueArray(self.m.c_ELECTRICITY_buy_T,self.T)*self.StepSizeInSec/self.t_hour_in_sec
+            results["C_HP_T"] = getValueArray(self.m.E_HP_EL_in_T,self.T)*costFactor
+            results["C_HXA_T"] = getValueArray(self.m.E_HXA_EL_T,self.T)*costFactor
+            results["C_IS_T"] = getValueArray(self.m.E_IS_EL_T,self.T)*costFactor
+            results["C_GS_T"] = getValueArray(self.m.E_GS_EL_T,self.T)*costFactor
+            results["C_VP_T"] = getValueArray(self.m.E_VP_EL_T,self.T)*costFactor
+            # Binaries
+            B_HP = getValueArray(self.m.B_HP_H_T,self.H,self.T)
+            for h in self.H:
+                results["B_HP_"+str(h)+"_T"] = B_HP[h]
+            for name in ["B_HXH_HS_T","B_HGC_HGCHXC_T","B_HXA_T","B_HXH_HGC_T","B_HS_IS_T","B_IS_HGS_T","B_GS_HGS_T","B_GS_CS_T","B_GS_HGS_CS_T"]:
+                results[name] = getValueArray(getattr(self.m,name),self.T)
             if self.TControlPeriodSwitch1 > 0:
-                self.safeFile = self.safeFile.append({"C_OP_T":self.m.C_OP_T[0](),"C_HP_T":self.m.E_HP_EL_in_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,
-                "C_HXA_T":self.m.E_HXA_EL_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,"C_IS_T":self.m.E_IS_EL_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,
-                "C_GS_T":self.m.E_GS_EL_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,"C_VP_T":self.m.E_VP_EL_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,
-                "B_HP_4_T":self.m.B_HP_H_T[4,0](),"B_HP_3_T":self.m.B_HP_H_T[3,0](),"B_HP_2_T":self.m.B_HP_H_T[2,0](),"B_HP_1_T":self.m.B_HP_H_T[1,0](),"B_HP_0_T":self.m.B_HP_H_T[0,0](),
-                "B_HXH_HS_T":self.m.B_HXH_HS_T[0](),"B_HGC_HGCHXC_T":self.m.B_HGC_HGCHXC_T[0](),"B_HXA_T":self.m.B_HXA_T[0](),"B_HXH_HGC_T":self.m.B_HXH_HGC_T[0](),"B_HS_IS_T":self.m.B_HS_IS_T[0](),"B_IS_HGS_T":self.m.B_IS_HGS_T[0](),
-                "B_GS_HGS_T":self.m.B_GS_HGS_T[0](),"B_GS_CS_T":self.m.B_GS_CS_T[0](),"B_GS_HGS_CS_T":self.m.B_GS_HGS_CS_T[0](),"B_VP_7_T_1":self.m.B_VP_V_T_1[7,0](),"B_VP_6_T_1":self.m.B_VP_V_T_1[6,0](),
-                "B_VP_5_T_1":self.m.B_VP_V_T_1[5,0](),"B_VP_4_T_1":self.m.B_VP_V_T_1[4,0](),"B_VP_3_T_1":self.m.B_VP_V_T_1[3,0](),"B_VP_2_T_1":self.m.B_VP_V_T_1[2,0](),"B_VP_1_T_1":self.m.B_VP_V_T_1[1,0](),"B_VP_0_T_1":self.m.B_VP_V_T_1[0,0](),
-                "E_HP_EL_T":self.m.E_HP_EL_T[0](),"Q_HP_HT_T":self.m.Q_HP_HT_T[0](),"Q_HP_LT_T":self.m.Q_HP_LT_T[0](),"E_HP_EL_in_T":self.m.E_HP_EL_in_T[0](),"T_HP_HT_T":self.m.T_HP_HT_T[0](),
-                "T_HP_LT_T":self.m.T_HP_LT_T[0](),"T_HS_T":self.m.T_HS_T[0](),"T_HXH_T":self.m.T_HXH_T[0](),"T_HGC_T":self.m.T_HGC_T[0](),
-                "T_HXA_T":self.m.T_HXA_T[0](),"T_HXC_T":self.m.T_HXC_T[0](),"T_IS_T":self.m.T_IS_T[0](),"T_ISw_T":(sum(self.m.T_IS_W_T_WR[0,r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_T":(sum(self.m.T_IS_C_T_CR[0,r]() for r in self.cr_IS)/len(self.cr_IS)),
-                "T_IS_W_0_T":self.m.T_IS_W_T_WR[0,0](),"T_IS_W_1_T":self.m.T_IS_W_T_WR[0,2](),"T_IS_W_2_T":self.m.T_IS_W_T_WR[0,4](),"T_IS_C_0_T":self.m.T_IS_C_T_CR[0,0](),"T_IS_C_1_T":self.m.T_IS_C_T_CR[0,1](),"T_IS_C_2_T":self.m.T_IS_C_T_CR[0,2](),"T_IS_C_3_T":self.m.T_IS_C_T_CR[0,3](),"T_IS_C_4_T":self.m.T_IS_C_T_CR[0,4](),
-                "T_GS_T":self.m.T_GS_T[0](),"T_GSw_T":(sum(sum(self.m.T_GS_W_T_WR_WC[0,c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_T":(sum(sum(self.m.T_GS_C_T_CR_CC[0,c,r]() for c in self.cc_GS) for r in self.cr_GS)/(len(self.cc_GS)*len(self.cr_GS))),
-                "T_GS_W_0_T":sum(self.m.T_GS_W_T_WR_WC[0,c,1]() for c in self.wc_GS),"T_GS_W_1_T":sum(self.m.T_GS_W_T_WR_WC[0,c,3]() for c in self.wc_GS),"T_GS_W_2_T":sum(self.m.T_GS_W_T_WR_WC[0,c,5]() for c in self.wc_GS),
-                "T_GS_C_0_T":sum(self.m.T_GS_C_T_CR_CC[0,c,0]() for c in self.cc_GS),"T_GS_C_1_T":sum(self.m.T_GS_C_T_CR_CC[0,c,1]() for c in self.cc_GS),"T_GS_C_2_T":sum(self.m.T_GS_C_T_CR_CC[0,c,2]() for c in self.cc_GS),"T_GS_C_3_T":sum(self.m.T_GS_C_T_CR_CC[0,c,3]() for c in self.cc_GS),"T_GS_C_4_T":sum(self.m.T_GS_C_T_CR_CC[0,c,4]() for c in self.cc_GS),"T_GS_C_5_T":sum(self.m.T_GS_C_T_CR_CC[0,c,5]() for c in self.cc_GS),"T_GS_C_6_T":sum(self.m.T_GS_C_T_CR_CC[0,c,6]() for c in self.cc_GS),
-                "T_HGS_T":self.m.T_HGS_T[0](),"T_CS_T":self.m.T_CS_T[0](),"T_RLTS_T":self.m.T_RLTS_T[0](),"q_dem_HS_T":self.q_dem_HS_T[0],"q_dem_CS_T":self.q_dem_CS_T[0],"q_dem_RLTS_T":self.q_dem_RLTS_T[0],"temp_amb_T":self.temp_amb_T[0]}, ignore_index=True)
-                # ALL
-                for t in self.T[1:self.TControlPeriodSwitch1]:
-                    self.safeFile = self.safeFile.append({"C_OP_T":self.m.C_OP_T[t](),"C_HP_T":self.m.E_HP_EL_in_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,
-                    "C_HXA_T":self.m.E_HXA_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,"C_IS_T":self.m.E_IS_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,
-                    "C_GS_T":self.m.E_GS_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,"C_VP_T":self.m.E_VP_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,
-                    "B_HP_4_T":self.m.B_HP_H_T[4,t](),"B_HP_3_T":self.m.B_HP_H_T[3,t](),"B_HP_2_T":self.m.B_HP_H_T[2,t](),"B_HP_1_T":self.m.B_HP_H_T[1,t](),"B_HP_0_T":self.m.B_HP_H_T[0,t](),
-                    "B_HXH_HS_T":self.m.B_HXH_HS_T[t](),"B_HGC_HGCHXC_T":self.m.B_HGC_HGCHXC_T[t](),"B_HXA_T":self.m.B_HXA_T[t](),"B_HXH_HGC_T":self.m.B_HXH_HGC_T[t](),"B_HS_IS_T":self.m.B_HS_IS_T[t](),"B_IS_HGS_T":self.m.B_IS_HGS_T[t](),
-                    "B_GS_HGS_T":self.m.B_GS_HGS_T[t](),"B_GS_CS_T":self.m.B_GS_CS_T[t](),"B_GS_HGS_CS_T":self.m.B_GS_HGS_CS_T[t](),"B_VP_7_T_1":self.m.B_VP_V_T_1[7,t](),"B_VP_6_T_1":self.m.B_VP_V_T_1[6,t](),
-                    "B_VP_5_T_1":self.m.B_VP_V_T_1[5,t](),"B_VP_4_T_1":self.m.B_VP_V_T_1[4,t](),"B_VP_3_T_1":self.m.B_VP_V_T_1[3,t](),"B_VP_2_T_1":self.m.B_VP_V_T_1[2,t](),"B_VP_1_T_1":self.m.B_VP_V_T_1[1,t](),"B_VP_0_T_1":self.m.B_VP_V_T_1[0,t](),
-                    "E_HP_EL_T":self.m.E_HP_EL_T[t](),"Q_HP_HT_T":self.m.Q_HP_HT_T[t](),"Q_HP_LT_T":self.m.Q_HP_LT_T[t](),"E_HP_EL_in_T":self.m.E_HP_EL_in_T[t](),"T_HP_HT_T":self.m.T_HP_HT_T[t](),
-                    "T_HP_LT_T":self.m.T_HP_LT_T[t](),"T_HS_T":self.m.T_HS_T[t](),"T_HXH_T":self.m.T_HXH_T[t](),"T_HGC_T":self.m.T_HGC_T[t](),
-                    "T_HXA_T":self.m.T_HXA_T[t](),"T_HXC_T":self.m.T_HXC_T[t](),"T_IS_T":self.m.T_IS_T[t](),"T_ISw_T":(sum(self.m.T_IS_W_T_WR[t,r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_T":(sum(self.m.T_IS_C_T_CR[t,r]() for r in self.cr_IS)/len(self.cr_IS)),
-                    "T_IS_W_0_T":self.m.T_IS_W_T_WR[t,0](),"T_IS_W_1_T":self.m.T_IS_W_T_WR[t,2](),"T_IS_W_2_T":self.m.T_IS_W_T_WR[t,4](),"T_IS_C_0_T":self.m.T_IS_C_T_CR[t,0](),"T_IS_C_1_T":self.m.T_IS_C_T_CR[t,1](),"T_IS_C_2_T":self.m.T_IS_C_T_CR[t,2](),"T_IS_C_3_T":self.m.T_IS_C_T_CR[t,3](),"T_IS_C_4_T":self.m.T_IS_C_T_CR[t,4](),
-                    "T_GS_T":self.m.T_GS_T[t](),"T_GSw_T":(sum(sum(self.m.T_GS_W_T_WR_WC[t,c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_T":(sum(sum(self.m.T_GS_C_T_CR_CC[t,c,r]() for c in self.cc_GS) for r in self.cr_GS)/(len(self.cc_GS)*len(self.cr_GS))),
-                    "T_GS_W_0_T":sum(self.m.T_GS_W_T_WR_WC[t,c,1]() for c in self.wc_GS),"T_GS_W_1_T":sum(self.m.T_GS_W_T_WR_WC[t,c,3]() for c in self.wc_GS),"T_GS_W_2_T":sum(self.m.T_GS_W_T_WR_WC[t,c,5]() for c in self.wc_GS),
-                    "T_GS_C_0_T":sum(self.m.T_GS_C_T_CR_CC[t,c,0]() for c in self.cc_GS),"T_GS_C_1_T":sum(self.m.T_GS_C_T_CR_CC[t,c,1]() for c in self.cc_GS),"T_GS_C_2_T":sum(self.m.T_GS_C_T_CR_CC[t,c,2]() for c in self.cc_GS),"T_GS_C_3_T":sum(self.m.T_GS_C_T_CR_CC[t,c,3]() for c in self.cc_GS),"T_GS_C_4_T":sum(self.m.T_GS_C_T_CR_CC[t,c,4]() for c in self.cc_GS),"T_GS_C_5_T":sum(self.m.T_GS_C_T_CR_CC[t,c,5]() for c in self.cc_GS),"T_GS_C_6_T":sum(self.m.T_GS_C_T_CR_CC[t,c,6]() for c in self.cc_GS),
-                    "T_HGS_T":self.m.T_HGS_T[t](),"T_CS_T":self.m.T_CS_T[t](),"T_RLTS_T":self.m.T_RLTS_T[t](),"S_OP_T":self.m.S_OP_T[t](),"S_T_HP_T":self.m.S_T_HP_T[t](),"S_T_HS_T":self.m.S_T_HS_T[t](),"S_T_HXH_T":self.m.S_T_HXH_T[t](),"S_T_HGC_T":self.m.S_T_HGC_T[t](),
-                    "S_T_HXA_T":self.m.S_T_HXA_T[t](),"S_T_HXC_T":self.m.S_T_HXC_T[t](),"S_T_IS_T":sum(self.m.S_T_IS_W_T_WR[t,r]() for r in self.wr_IS)+sum(self.m.S_T_IS_C_T_CR[t,r]() for r in self.cr_IS),"S_T_GS_T":sum(sum(self.m.S_T_GS_W_T_WR_WC[t,c,r]() for r in self.wr_GS) for c in self.wc_GS)+sum(sum(self.m.S_T_GS_C_T_CR_CC[t,c,r]() for r in self.cr_GS)for c in self.cc_GS),
-                    "S_T_HGS_T":self.m.S_T_HGS_T[t](),"S_T_CS_T":self.m.S_T_CS_T[t](),"S_T_RLTS_T":self.m.S_T_RLTS_T[t](),"q_dem_HS_T":self.q_dem_HS_T[t],"q_dem_CS_T":self.q_dem_CS_T[t],"q_dem_RLTS_T":self.q_dem_RLTS_T[t],"temp_amb_T":self.temp_amb_T[t]}, ignore_index=True)
-                # ALL
-                for t in self.T[self.TControlPeriodSwitch1:-1]:
-                    self.safeFile = self.safeFile.append({"C_OP_T":self.m.C_OP_T[t](),"C_HP_T":self.m.E_HP_EL_in_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,
-                    "C_HXA_T":self.m.E_HXA_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,"C_IS_T":self.m.E_IS_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,
-                    "C_GS_T":self.m.E_GS_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,"C_VP_T":self.m.E_VP_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,
-                    "B_HP_4_T":self.m.B_HP_H_T[4,t](),"B_HP_3_T":self.m.B_HP_H_T[3,t](),"B_HP_2_T":self.m.B_HP_H_T[2,t](),"B_HP_1_T":self.m.B_HP_H_T[1,t](),"B_HP_0_T":self.m.B_HP_H_T[0,t](),
-                    "B_HXH_HS_T":self.m.B_HXH_HS_T[t](),"B_HGC_HGCHXC_T":self.m.B_HGC_HGCHXC_T[t](),"B_HXA_T":self.m.B_HXA_T[t](),"B_HXH_HGC_T":self.m.B_HXH_HGC_T[t](),"B_HS_IS_T":self.m.B_HS_IS_T[t](),"B_IS_HGS_T":self.m.B_IS_HGS_T[t](),
-                    "B_GS_HGS_T":self.m.B_GS_HGS_T[t](),"B_GS_CS_T":self.m.B_GS_CS_T[t](),"B_GS_HGS_CS_T":self.m.B_GS_HGS_CS_T[t](),"B_VP_13_T_2":self.m.B_VP_V_T_2[13,t](),"B_VP_12_T_2":self.m.B_VP_V_T_2[12,t](),"B_VP_11_T_2":self.m.B_VP_V_T_2[11,t](),
-                    "B_VP_10_T_2":self.m.B_VP_V_T_2[10,t](),"B_VP_9_T_2":self.m.B_VP_V_T_2[9,t](),"B_VP_8_T_2":self.m.B_VP_V_T_2[8,t](),"B_VP_7_T_2":self.m.B_VP_V_T_2[7,t](),"B_VP_6_T_2":self.m.B_VP_V_T_2[6,t](),
-                    "B_VP_5_T_2":self.m.B_VP_V_T_2[5,t](),"B_VP_4_T_2":self.m.B_VP_V_T_2[4,t](),"B_VP_3_T_2":self.m.B_VP_V_T_2[3,t](),"B_VP_2_T_2":self.m.B_VP_V_T_2[2,t](),"B_VP_1_T_2":self.m.B_VP_V_T_2[1,t](),"B_VP_0_T_2":self.m.B_VP_V_T_2[0,t](),
-                    "E_HP_EL_T":self.m.E_HP_EL_T[t](),"Q_HP_HT_T":self.m.Q_HP_HT_T[t](),"Q_HP_LT_T":self.m.Q_HP_LT_T[t](),"E_HP_EL_in_T":self.m.E_HP_EL_in_T[t](),"T_HP_HT_T":self.m.T_HP_HT_T[t](),
-                    "T_HP_LT_T":self.m.T_HP_LT_T[t](),"T_HS_T":self.m.T_HS_T[t](),"T_HXH_T":self.m.T_HXH_T[t](),"T_HGC_T":self.m.T_HGC_T[t](),
-                    "T_HXA_T":self.m.T_HXA_T[t](),"T_HXC_T":self.m.T_HXC_T[t](),"T_IS_T":self.m.T_IS_T[t](),"T_ISw_T":(sum(self.m.T_IS_W_T_WR[t,r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_T":(sum(self.m.T_IS_C_T_CR[t,r]() for r in self.cr_IS)/len(self.cr_IS)),
-                    "T_IS_W_0_T":self.m.T_IS_W_T_WR[t,0](),"T_IS_W_1_T":self.m.T_IS_W_T_WR[t,2](),"T_IS_W_2_T":self.m.T_IS_W_T_WR[t,4](),"T_IS_C_0_T":self.m.T_IS_C_T_CR[t,0](),"T_IS_C_1_T":self.m.T_IS_C_T_CR[t,1](),"T_IS_C_2_T":self.m.T_IS_C_T_CR[t,2](),"T_IS_C_3_T":self.m.T_IS_C_T_CR[t,3](),"T_IS_C_4_T":self.m.T_IS_C_T_CR[t,4](),   
-                    "T_GS_T":self.m.T_GS_T[t](),"T_GSw_T":(sum(sum(self.m.T_GS_W_T_WR_WC[t,c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_T":(sum(sum(self.m.T_GS_C_T_CR_CC[t,c,r]() for c in self.cc_GS) for r in self.cr_GS)/(len(self.cc_GS)*len(self.cr_GS))),
-                    "T_GS_W_0_T":sum(self.m.T_GS_W_T_WR_WC[t,c,1]() for c in self.wc_GS),"T_GS_W_1_T":sum(self.m.T_GS_W_T_WR_WC[t,c,3]() for c in self.wc_GS),"T_GS_W_2_T":sum(self.m.T_GS_W_T_WR_WC[t,c,5]() for c in self.wc_GS),
-                    "T_GS_C_0_T":sum(self.m.T_GS_C_T_CR_CC[t,c,0]() for c in self.cc_GS),"T_GS_C_1_T":sum(self.m.T_GS_C_T_CR_CC[t,c,1]() for c in self.cc_GS),"T_GS_C_2_T":sum(self.m.T_GS_C_T_CR_CC[t,c,2]() for c in self.cc_GS),"T_GS_C_3_T":sum(self.m.T_GS_C_T_CR_CC[t,c,3]() for c in self.cc_GS),"T_GS_C_4_T":sum(self.m.T_GS_C_T_CR_CC[t,c,4]() for c in self.cc_GS),"T_GS_C_5_T":sum(self.m.T_GS_C_T_CR_CC[t,c,5]() for c in self.cc_GS),"T_GS_C_6_T":sum(self.m.T_GS_C_T_CR_CC[t,c,6]() for c in self.cc_GS),
-                    "T_HGS_T":self.m.T_HGS_T[t](),"T_CS_T":self.m.T_CS_T[t](),"T_RLTS_T":self.m.T_RLTS_T[t](),"S_OP_T":self.m.S_OP_T[t](),"S_T_HP_T":self.m.S_T_HP_T[t](),"S_T_HS_T":self.m.S_T_HS_T[t](),"S_T_HXH_T":self.m.S_T_HXH_T[t](),"S_T_HGC_T":self.m.S_T_HGC_T[t](),
-                    "S_T_HXA_T":self.m.S_T_HXA_T[t](),"S_T_HXC_T":self.m.S_T_HXC_T[t](),"S_T_IS_T":sum(self.m.S_T_IS_W_T_WR[t,r]() for r in self.wr_IS)+sum(self.m.S_T_IS_C_T_CR[t,r]() for r in self.cr_IS),"S_T_GS_T":sum(sum(self.m.S_T_GS_W_T_WR_WC[t,c,r]() for r in self.wr_GS) for c in self.wc_GS)+sum(sum(self.m.S_T_GS_C_T_CR_CC[t,c,r]() for r in self.cr_GS)for c in self.cc_GS),
-                    "S_T_HGS_T":self.m.S_T_HGS_T[t](),"S_T_CS_T":self.m.S_T_CS_T[t](),"S_T_RLTS_T":self.m.S_T_RLTS_T[t](),"q_dem_HS_T":self.q_dem_HS_T[t],"q_dem_CS_T":self.q_dem_CS_T[t],"q_dem_RLTS_T":self.q_dem_RLTS_T[t],"temp_amb_T":self.temp_amb_T[t]}, ignore_index=True)
-                # Storage temperatures and slacks
-                self.safeFile = self.safeFile.append({"T_HP_HT_T":self.m.T_HP_HT_T[self.T[-1]](),"T_HP_LT_T":self.m.T_HP_LT_T[self.T[-1]](),"T_HS_T":self.m.T_HS_T[self.T[-1]](),"T_HXH_T":self.m.T_HXH_T[self.T[-1]](),"T_HGC_T":self.m.T_HGC_T[self.T[-1]](),
-                "T_HXA_T":self.m.T_HXA_T[self.T[-1]](),"T_HXC_T":self.m.T_HXC_T[self.T[-1]](),"T_IS_T":self.m.T_IS_T[self.T[-1]](),"T_ISw_T":(sum(self.m.T_IS_W_T_WR[self.T[-1],r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_T":(sum(self.m.T_IS_C_T_CR[self.T[-1],r]() for r in self.cr_IS)/len(self.cr_IS)),
-                "T_IS_W_0_T":self.m.T_IS_W_T_WR[self.T[-1],0](),"T_IS_W_1_T":self.m.T_IS_W_T_WR[self.T[-1],2](),"T_IS_W_2_T":self.m.T_IS_W_T_WR[self.T[-1],4](),"T_IS_C_0_T":self.m.T_IS_C_T_CR[self.T[-1],0](),"T_IS_C_1_T":self.m.T_IS_C_T_CR[self.T[-1],1](),"T_IS_C_2_T":self.m.T_IS_C_T_CR[self.T[-1],2](),"T_IS_C_3_T":self.m.T_IS_C_T_CR[self.T[-1],3](),"T_IS_C_4_T":self.m.T_IS_C_T_CR[self.T[-1],4](),   
-                "T_GS_T":self.m.T_GS_T[self.T[-1]](),"T_GSw_T":(sum(sum(self.m.T_GS_W_T_WR_WC[self.T[-1],c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_T":(sum(sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,r]() for c in self.cc_GS) for r in self.cr_GS)/(len(self.cc_GS)*len(self.cr_GS))),
-                "T_GS_W_0_T":sum(self.m.T_GS_W_T_WR_WC[self.T[-1],c,1]() for c in self.wc_GS),"T_GS_W_1_T":sum(self.m.T_GS_W_T_WR_WC[self.T[-1],c,3]() for c in self.wc_GS),"T_GS_W_2_T":sum(self.m.T_GS_W_T_WR_WC[self.T[-1],c,5]() for c in self.wc_GS),
-                "T_GS_C_0_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,0]() for c in self.cc_GS),"T_GS_C_1_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,1]() for c in self.cc_GS),"T_GS_C_2_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,2]() for c in self.cc_GS),"T_GS_C_3_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,3]() for c in self.cc_GS),"T_GS_C_4_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,4]() for c in self.cc_GS),"T_GS_C_5_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,5]() for c in self.cc_GS),"T_GS_C_6_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,6]() for c in self.cc_GS),
-                "T_HGS_T":self.m.T_HGS_T[self.T[-1]](),"T_CS_T":self.m.T_CS_T[self.T[-1]](),
-                "T_RLTS_T":self.m.T_RLTS_T[self.T[-1]](),"S_OP_T":self.m.S_OP_T[self.T[-1]](),"S_T_HP_T":self.m.S_T_HP_T[self.T[-1]](),"S_T_HS_T":self.m.S_T_HS_T[self.T[-1]](),"S_T_HGC_T":self.m.S_T_HGC_T[self.T[-1]](),
-                "S_T_HXA_T":self.m.S_T_HXA_T[self.T[-1]](),"S_T_IS_T":sum(self.m.S_T_IS_W_T_WR[self.T[-1],r]() for r in self.wr_IS)+sum(self.m.S_T_IS_C_T_CR[self.T[-1],r]() for r in self.cr_IS),"S_T_GS_T":sum(sum(self.m.S_T_GS_W_T_WR_WC[self.T[-1],c,r]() for r in self.wr_GS) for c in self.wc_GS)+sum(sum(self.m.S_T_GS_C_T_CR_CC[self.T[-1],c,r]() for r in self.cr_GS)for c in self.cc_GS),
-                "S_T_HGS_T":self.m.S_T_HGS_T[self.T[-1]](),"S_T_CS_T":self.m.S_T_CS_T[self.T[-1]](),"S_T_RLTS_T":self.m.S_T_RLTS_T[self.T[-1]]()}, ignore_index=True)
-            else: # Everything but slack constraints
-                self.safeFile = self.safeFile.append({"C_OP_T":self.m.C_OP_T[0](),"C_HP_T":self.m.E_HP_EL_in_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,
-                "C_HXA_T":self.m.E_HXA_EL_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,"C_IS_T":self.m.E_IS_EL_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,
-                "C_GS_T":self.m.E_GS_EL_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,"C_VP_T":self.m.E_VP_EL_T[0]()*self.c_ELECTRICITY_buy_T[0]*self.StepSizeInSec/self.t_hour_in_sec,
-                "B_HP_4_T":self.m.B_HP_H_T[4,0](),"B_HP_3_T":self.m.B_HP_H_T[3,0](),"B_HP_2_T":self.m.B_HP_H_T[2,0](),"B_HP_1_T":self.m.B_HP_H_T[1,0](),"B_HP_0_T":self.m.B_HP_H_T[0,0](),
-                "B_HXH_HS_T":self.m.B_HXH_HS_T[0](),"B_HGC_HGCHXC_T":self.m.B_HGC_HGCHXC_T[0](),"B_HXA_T":self.m.B_HXA_T[0](),"B_HXH_HGC_T":self.m.B_HXH_HGC_T[0](),"B_HS_IS_T":self.m.B_HS_IS_T[0](),"B_IS_HGS_T":self.m.B_IS_HGS_T[0](),
-                "B_GS_HGS_T":self.m.B_GS_HGS_T[0](),"B_GS_CS_T":self.m.B_GS_CS_T[0](),"B_GS_HGS_CS_T":self.m.B_GS_HGS_CS_T[0](),"B_VP_13_T_2":self.m.B_VP_V_T_2[13,0](),"B_VP_12_T_2":self.m.B_VP_V_T_2[12,0](),"B_VP_11_T_2":self.m.B_VP_V_T_2[11,0](),
-                "B_VP_10_T_2":self.m.B_VP_V_T_2[10,0](),"B_VP_9_T_2":self.m.B_VP_V_T_2[9,0](),"B_VP_8_T_2":self.m.B_VP_V_T_2[8,0](),"B_VP_7_T_2":self.m.B_VP_V_T_2[7,0](),"B_VP_6_T_2":self.m.B_VP_V_T_2[6,0](),
-                "B_VP_5_T_2":self.m.B_VP_V_T_2[5,0](),"B_VP_4_T_2":self.m.B_VP_V_T_2[4,0](),"B_VP_3_T_2":self.m.B_VP_V_T_2[3,0](),"B_VP_2_T_2":self.m.B_VP_V_T_2[2,0](),"B_VP_1_T_2":self.m.B_VP_V_T_2[1,0](),"B_VP_0_T_2":self.m.B_VP_V_T_2[0,0](),
-                "E_HP_EL_T":self.m.E_HP_EL_T[0](),"Q_HP_HT_T":self.m.Q_HP_HT_T[0](),"Q_HP_LT_T":self.m.Q_HP_LT_T[0](),"E_HP_EL_in_T":self.m.E_HP_EL_in_T[0](),"T_HP_HT_T":self.m.T_HP_HT_T[0](),
-                "T_HP_LT_T":self.m.T_HP_LT_T[0](),"T_HS_T":self.m.T_HS_T[0](),"T_HXH_T":self.m.T_HXH_T[0](),"T_HGC_T":self.m.T_HGC_T[0](),
-                "T_HXA_T":self.m.T_HXA_T[0](),"T_HXC_T":self.m.T_HXC_T[0](),"T_IS_T":self.m.T_IS_T[0](),"T_ISw_T":(sum(self.m.T_IS_W_T_WR[0,r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_T":(sum(self.m.T_IS_C_T_CR[0,r]() for r in self.cr_IS)/len(self.cr_IS)),
-                "T_IS_W_0_T":self.m.T_IS_W_T_WR[0,0](),"T_IS_W_1_T":self.m.T_IS_W_T_WR[0,2](),"T_IS_W_2_T":self.m.T_IS_W_T_WR[0,4](),"T_IS_C_0_T":self.m.T_IS_C_T_CR[0,0](),"T_IS_C_1_T":self.m.T_IS_C_T_CR[0,1](),"T_IS_C_2_T":self.m.T_IS_C_T_CR[0,2](),"T_IS_C_3_T":self.m.T_IS_C_T_CR[0,3](),"T_IS_C_4_T":self.m.T_IS_C_T_CR[0,4](),
-                "T_GS_T":self.m.T_GS_T[0](),"T_GSw_T":(sum(sum(self.m.T_GS_W_T_WR_WC[0,c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_T":(sum(sum(self.m.T_GS_C_T_CR_CC[0,c,r]() for c in self.cc_GS) for r in self.cr_GS)/(len(self.cc_GS)*len(self.cr_GS))),
-                "T_GS_W_0_T":sum(self.m.T_GS_W_T_WR_WC[0,c,1]() for c in self.wc_GS),"T_GS_W_1_T":sum(self.m.T_GS_W_T_WR_WC[0,c,3]() for c in self.wc_GS),"T_GS_W_2_T":sum(self.m.T_GS_W_T_WR_WC[0,c,5]() for c in self.wc_GS),
-                "T_GS_C_0_T":sum(self.m.T_GS_C_T_CR_CC[0,c,0]() for c in self.cc_GS),"T_GS_C_1_T":sum(self.m.T_GS_C_T_CR_CC[0,c,1]() for c in self.cc_GS),"T_GS_C_2_T":sum(self.m.T_GS_C_T_CR_CC[0,c,2]() for c in self.cc_GS),"T_GS_C_3_T":sum(self.m.T_GS_C_T_CR_CC[0,c,3]() for c in self.cc_GS),"T_GS_C_4_T":sum(self.m.T_GS_C_T_CR_CC[0,c,4]() for c in self.cc_GS),"T_GS_C_5_T":sum(self.m.T_GS_C_T_CR_CC[0,c,5]() for c in self.cc_GS),"T_GS_C_6_T":sum(self.m.T_GS_C_T_CR_CC[0,c,6]() for c in self.cc_GS),
-                "T_HGS_T":self.m.T_HGS_T[0](),"T_CS_T":self.m.T_CS_T[0](),"T_RLTS_T":self.m.T_RLTS_T[0](),"q_dem_HS_T":self.q_dem_HS_T[0],"q_dem_CS_T":self.q_dem_CS_T[0],"q_dem_RLTS_T":self.q_dem_RLTS_T[0],"temp_amb_T":self.temp_amb_T[0]}, ignore_index=True)
-                # ALL
-                for t in self.T[1:-1]:
-                    self.safeFile = self.safeFile.append({"C_OP_T":self.m.C_OP_T[t](),"C_HP_T":self.m.E_HP_EL_in_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,
-                    "C_HXA_T":self.m.E_HXA_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,"C_IS_T":self.m.E_IS_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,
-                    "C_GS_T":self.m.E_GS_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,"C_VP_T":self.m.E_VP_EL_T[t]()*self.c_ELECTRICITY_buy_T[t]*self.StepSizeInSec/self.t_hour_in_sec,
-                    "B_HP_4_T":self.m.B_HP_H_T[4,t](),"B_HP_3_T":self.m.B_HP_H_T[3,t](),"B_HP_2_T":self.m.B_HP_H_T[2,t](),"B_HP_1_T":self.m.B_HP_H_T[1,t](),"B_HP_0_T":self.m.B_HP_H_T[0,t](),
-                    "B_HXH_HS_T":self.m.B_HXH_HS_T[t](),"B_HGC_HGCHXC_T":self.m.B_HGC_HGCHXC_T[t](),"B_HXA_T":self.m.B_HXA_T[t](),"B_HXH_HGC_T":self.m.B_HXH_HGC_T[t](),"B_HS_IS_T":self.m.B_HS_IS_T[t](),"B_IS_HGS_T":self.m.B_IS_HGS_T[t](),
-                    "B_GS_HGS_T":self.m.B_GS_HGS_T[t](),"B_GS_CS_T":self.m.B_GS_CS_T[t](),"B_GS_HGS_CS_T":self.m.B_GS_HGS_CS_T[t](),"B_VP_13_T_2":self.m.B_VP_V_T_2[13,t](),"B_VP_12_T_2":self.m.B_VP_V_T_2[12,t](),"B_VP_11_T_2":self.m.B_VP_V_T_2[11,t](),
-                    "B_VP_10_T_2":self.m.B_VP_V_T_2[10,t](),"B_VP_9_T_2":self.m.B_VP_V_T_2[9,t](),"B_VP_8_T_2":self.m.B_VP_V_T_2[8,t](),"B_VP_7_T_2":self.m.B_VP_V_T_2[7,t](),"B_VP_6_T_2":self.m.B_VP_V_T_2[6,t](),
-                    "B_VP_5_T_2":self.m.B_VP_V_T_2[5,t](),"B_VP_4_T_2":self.m.B_VP_V_T_2[4,t](),"B_VP_3_T_2":self.m.B_VP_V_T_2[3,t](),"B_VP_2_T_2":self.m.B_VP_V_T_2[2,t](),"B_VP_1_T_2":self.m.B_VP_V_T_2[1,t](),"B_VP_0_T_2":self.m.B_VP_V_T_2[0,t](),
-                    "E_HP_EL_T":self.m.E_HP_EL_T[t](),"Q_HP_HT_T":self.m.Q_HP_HT_T[t](),"Q_HP_LT_T":self.m.Q_HP_LT_T[t](),"E_HP_EL_in_T":self.m.E_HP_EL_in_T[t](),"T_HP_HT_T":self.m.T_HP_HT_T[t](),
-                    "T_HP_LT_T":self.m.T_HP_LT_T[t](),"T_HS_T":self.m.T_HS_T[t](),"T_HXH_T":self.m.T_HXH_T[t](),"T_HGC_T":self.m.T_HGC_T[t](),
-                    "T_HXA_T":self.m.T_HXA_T[t](),"T_HXC_T":self.m.T_HXC_T[t](),"T_IS_T":self.m.T_IS_T[t](),"T_ISw_T":(sum(self.m.T_IS_W_T_WR[t,r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_T":(sum(self.m.T_IS_C_T_CR[t,r]() for r in self.cr_IS)/len(self.cr_IS)),
-                    "T_IS_W_0_T":self.m.T_IS_W_T_WR[t,0](),"T_IS_W_1_T":self.m.T_IS_W_T_WR[t,2](),"T_IS_W_2_T":self.m.T_IS_W_T_WR[t,4](),"T_IS_C_0_T":self.m.T_IS_C_T_CR[t,0](),"T_IS_C_1_T":self.m.T_IS_C_T_CR[t,1](),"T_IS_C_2_T":self.m.T_IS_C_T_CR[t,2](),"T_IS_C_3_T":self.m.T_IS_C_T_CR[t,3](),"T_IS_C_4_T":self.m.T_IS_C_T_CR[t,4](),
-                    "T_GS_T":self.m.T_GS_T[t](),"T_GSw_T":(sum(sum(self.m.T_GS_W_T_WR_WC[t,c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_T":(sum(sum(self.m.T_GS_C_T_CR_CC[t,c,r]() for c in self.cc_GS) for r in self.cr_GS)/(len(self.cc_GS)*len(self.cr_GS))),
-                    "T_GS_W_0_T":sum(self.m.T_GS_W_T_WR_WC[t,c,1]() for c in self.wc_GS),"T_GS_W_1_T":sum(self.m.T_GS_W_T_WR_WC[t,c,3]() for c in self.wc_GS),"T_GS_W_2_T":sum(self.m.T_GS_W_T_WR_WC[t,c,5]() for c in self.wc_GS),
-                    "T_GS_C_0_T":sum(self.m.T_GS_C_T_CR_CC[t,c,0]() for c in self.cc_GS),"T_GS_C_1_T":sum(self.m.T_GS_C_T_CR_CC[t,c,1]() for c in self.cc_GS),"T_GS_C_2_T":sum(self.m.T_GS_C_T_CR_CC[t,c,2]() for c in self.cc_GS),"T_GS_C_3_T":sum(self.m.T_GS_C_T_CR_CC[t,c,3]() for c in self.cc_GS),"T_GS_C_4_T":sum(self.m.T_GS_C_T_CR_CC[t,c,4]() for c in self.cc_GS),"T_GS_C_5_T":sum(self.m.T_GS_C_T_CR_CC[t,c,5]() for c in self.cc_GS),"T_GS_C_6_T":sum(self.m.T_GS_C_T_CR_CC[t,c,6]() for c in self.cc_GS),
-                    "T_HGS_T":self.m.T_HGS_T[t](),"T_CS_T":self.m.T_CS_T[t](),"T_RLTS_T":self.m.T_RLTS_T[t](),"S_OP_T":self.m.S_OP_T[t](),"S_T_HP_T":self.m.S_T_HP_T[t](),"S_T_HS_T":self.m.S_T_HS_T[t](),"S_T_HXH_T":self.m.S_T_HXH_T[t](),"S_T_HGC_T":self.m.S_T_HGC_T[t](),
-                    "S_T_HXA_T":self.m.S_T_HXA_T[t](),"S_T_HXC_T":self.m.S_T_HXC_T[t](),"S_T_IS_T":sum(self.m.S_T_IS_W_T_WR[t,r]() for r in self.wr_IS)+sum(self.m.S_T_IS_C_T_CR[t,r]() for r in self.cr_IS),"S_T_GS_T":sum(sum(self.m.S_T_GS_W_T_WR_WC[t,c,r]() for r in self.wr_GS) for c in self.wc_GS)+sum(sum(self.m.S_T_GS_C_T_CR_CC[t,c,r]() for r in self.cr_GS)for c in self.cc_GS),
-                    "S_T_HGS_T":self.m.S_T_HGS_T[t](),"S_T_CS_T":self.m.S_T_CS_T[t](),"S_T_RLTS_T":self.m.S_T_RLTS_T[t](),"q_dem_HS_T":self.q_dem_HS_T[t],"q_dem_CS_T":self.q_dem_CS_T[t],"q_dem_RLTS_T":self.q_dem_RLTS_T[t],"temp_amb_T":self.temp_amb_T[t]}, ignore_index=True)
-                # Storage temperatures and slacks
-                self.safeFile = self.safeFile.append({"T_HP_HT_T":self.m.T_HP_HT_T[self.T[-1]](),"T_HP_LT_T":self.m.T_HP_LT_T[self.T[-1]](),"T_HS_T":self.m.T_HS_T[self.T[-1]](),"T_HXH_T":self.m.T_HXH_T[self.T[-1]](),"T_HGC_T":self.m.T_HGC_T[self.T[-1]](),
-                "T_HXA_T":self.m.T_HXA_T[self.T[-1]](),"T_HXC_T":self.m.T_HXC_T[self.T[-1]](),"T_IS_T":self.m.T_IS_T[self.T[-1]](),"T_ISw_T":(sum(self.m.T_IS_W_T_WR[self.T[-1],r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_T":(sum(self.m.T_IS_C_T_CR[self.T[-1],r]() for r in self.cr_IS)/len(self.cr_IS)),
-                "T_IS_W_0_T":self.m.T_IS_W_T_WR[self.T[-1],0](),"T_IS_W_1_T":self.m.T_IS_W_T_WR[self.T[-1],2](),"T_IS_W_2_T":self.m.T_IS_W_T_WR[self.T[-1],4](),"T_IS_C_0_T":self.m.T_IS_C_T_CR[self.T[-1],0](),"T_IS_C_1_T":self.m.T_IS_C_T_CR[self.T[-1],1](),"T_IS_C_2_T":self.m.T_IS_C_T_CR[self.T[-1],2](),"T_IS_C_3_T":self.m.T_IS_C_T_CR[self.T[-1],3](),"T_IS_C_4_T":self.m.T_IS_C_T_CR[self.T[-1],4](),   
-                "T_GS_T":self.m.T_GS_T[self.T[-1]](),"T_GSw_T":(sum(sum(self.m.T_GS_W_T_WR_WC[self.T[-1],c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_T":(sum(sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,r]() for c in self.cc_GS) for r in self.cr_GS)/(len(self.cc_GS)*len(self.cr_GS))),
-                "T_GS_W_0_T":sum(self.m.T_GS_W_T_WR_WC[self.T[-1],c,1]() for c in self.wc_GS),"T_GS_W_1_T":sum(self.m.T_GS_W_T_WR_WC[self.T[-1],c,3]() for c in self.wc_GS),"T_GS_W_2_T":sum(self.m.T_GS_W_T_WR_WC[self.T[-1],c,5]() for c in self.wc_GS),
-                "T_GS_C_0_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,0]() for c in self.cc_GS),"T_GS_C_1_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,1]() for c in self.cc_GS),"T_GS_C_2_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,2]() for c in self.cc_GS),"T_GS_C_3_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,3]() for c in self.cc_GS),"T_GS_C_4_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,4]() for c in self.cc_GS),"T_GS_C_5_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,5]() for c in self.cc_GS),"T_GS_C_6_T":sum(self.m.T_GS_C_T_CR_CC[self.T[-1],c,6]() for c in self.cc_GS),
-                "T_HGS_T":self.m.T_HGS_T[self.T[-1]](),"T_CS_T":self.m.T_CS_T[self.T[-1]](),
-                "T_RLTS_T":self.m.T_RLTS_T[self.T[-1]](),"S_OP_T":self.m.S_OP_T[self.T[-1]](),"S_T_HP_T":self.m.S_T_HP_T[self.T[-1]](),"S_T_HS_T":self.m.S_T_HS_T[self.T[-1]](),"S_T_HGC_T":self.m.S_T_HGC_T[self.T[-1]](),
-                "S_T_HXA_T":self.m.S_T_HXA_T[self.T[-1]](),"S_T_IS_T":sum(self.m.S_T_IS_W_T_WR[self.T[-1],r]() for r in self.wr_IS)+sum(self.m.S_T_IS_C_T_CR[self.T[-1],r]() for r in self.cr_IS),"S_T_GS_T":sum(sum(self.m.S_T_GS_W_T_WR_WC[self.T[-1],c,r]() for r in self.wr_GS) for c in self.wc_GS)+sum(sum(self.m.S_T_GS_C_T_CR_CC[self.T[-1],c,r]() for r in self.cr_GS)for c in self.cc_GS),
-                "S_T_HGS_T":self.m.S_T_HGS_T[self.T[-1]](),"S_T_CS_T":self.m.S_T_CS_T[self.T[-1]](),"S_T_RLTS_T":self.m.S_T_RLTS_T[self.T[-1]]()}, ignore_index=True)
-
+                B_VP_1 = getValueArray(self.m.B_VP_V_T_1,self.V_1,self.T)
+                for v in self.V_1:
+                    results["B_VP_"+str(v)+"_T_1"] = B_VP_1[v]
+            B_VP_2 = getValueArray(self.m.B_VP_V_T_2,self.V_2,self.T)
+            for v in self.V_2:
+                results["B_VP_"+str(v)+"_T_2"] = B_VP_2[v]
+            # HP
+            for name in ["E_HP_EL_T","Q_HP_HT_T","Q_HP_LT_T","E_HP_EL_in_T"]:
+                results[name] = getValueArray(getattr(self.m,name),self.T)
+            # Temperatures (all time steps)
+            for name in ["T_HP_HT_T","T_HP_LT_T","T_HS_T","T_HXH_T","T_HGC_T","T_HXA_T","T_HXC_T","T_IS_T"]:
+                results[name] = getValueArray(getattr(self.m,name),self.T)
+            T_IS_W = getValueArray(self.m.T_IS_W_T_WR,self.T,self.wr_IS)
+            T_IS_C = getValueArray(self.m.T_IS_C_T_CR,self.T,self.cr_IS)
+            results["T_ISw_T"] = T_IS_W.mean(axis=1)
+            results["T_ISc_T"] = T_IS_C.mean(axis=1)
+            for k,r in enumerate([0,2,4]):
+                results["T_IS_W_"+str(k)+"_T"] = T_IS_W[:,self.wr_IS.index(r)]
+            for r in range(0,5):
+                results["T_IS_C_"+str(r)+"_T"] = T_IS_C[:,self.cr_IS.index(r)]
+            results["T_GS_T"] = getValueArray(self.m.T_GS_T,self.T)
+            T_GS_W = getValueArray(self.m.T_GS_W_T_WR_WC,self.T,self.wc_GS,self.wr_GS)
+            T_GS_C = getValueArray(self.m.T_GS_C_T_CR_CC,self.T,self.cc_GS,self.cr_GS)
+            results["T_GSw_T"] = T_GS_W.mean(axis=(1,2))
+            results["T_GSc_T"] = T_GS_C.mean(axis=(1,2))
+            for k,r in enumerate([1,3,5]):
+                results["T_GS_W_"+str(k)+"_T"] = T_GS_W[:,:,self.wr_GS.index(r)].sum(axis=1)
+            for r in range(0,7):
+                results["T_GS_C_"+str(r)+"_T"] = T_GS_C[:,:,self.cr_GS.index(r)].sum(axis=1)
+            for name in ["T_HGS_T","T_CS_T","T_RLTS_T"]:
+                results[name] = getValueArray(getattr(self.m,name),self.T)
+            # Slacks (all time steps but the first, HXH and HXC not for the last)
+            for name in ["S_OP_T","S_T_HP_T","S_T_HS_T","S_T_HXH_T","S_T_HGC_T","S_T_HXA_T","S_T_HXC_T","S_T_HGS_T","S_T_CS_T","S_T_RLTS_T"]:
+                results[name] = getValueArray(getattr(self.m,name),self.T)
+            results["S_T_IS_T"] = getValueArray(self.m.S_T_IS_W_T_WR,self.T,self.wr_IS).sum(axis=1) + getValueArray(self.m.S_T_IS_C_T_CR,self.T,self.cr_IS).sum(axis=1)
+            results["S_T_GS_T"] = getValueArray(self.m.S_T_GS_W_T_WR_WC,self.T,self.wc_GS,self.wr_GS).sum(axis=(1,2)) + getValueArray(self.m.S_T_GS_C_T_CR_CC,self.T,self.cc_GS,self.cr_GS).sum(axis=(1,2))
+            for name in ["S_OP_T","S_T_HP_T","S_T_HS_T","S_T_HXH_T","S_T_HGC_T","S_T_HXA_T","S_T_HXC_T","S_T_IS_T","S_T_GS_T","S_T_HGS_T","S_T_CS_T","S_T_RLTS_T"]:
+                results[name][0] = np.nan
+            results["S_T_HXH_T"][-1] = np.nan
+            results["S_T_HXC_T"][-1] = np.nan
+            # Profiles
+            for name in ["q_dem_HS_T","q_dem_CS_T","q_dem_RLTS_T","temp_amb_T"]:
+                results[name] = getValueArray(getattr(self.m,name),self.T)
+
+            self.safeFile = pd.DataFrame(results,columns=columns)
             self.safeFile = self.safeFile.round(4)
             if singleFile == True:
                 source.setOptimizationResults(dataFrame=self.safeFile,savePath=savePath)
@@ -0,0 +1,70 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import pickle
+
+class Checkpoint_Interface():
+    ## State of the closed loop after an iteration, so a batch run can be resumed after a crash
+    def __init__(self,savePath="",name="Checkpoint"):
+        self.savePath = savePath
+        self.name = name
+        try:
+            os.makedirs(self.savePath,exist_ok=True)
+        except:
+            pass
+
+    def getPath(self):
+        return self.savePath + self.name + ".pkl"
+
+    def setCheckpoint(self,checkpoint):
+        ## Written to a temporary file first, so a crash while writing keeps the last checkpoint
+        try:
+            with open(self.getPath() + ".tmp","wb") as file:
+                pickle.dump(checkpoint,file,protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(self.getPath() + ".tmp",self.getPath())
+        except:
+            print("Checkpoint could not be written.")
+
+    def getCheckpoint(self):
+        try:
+            with open(self.getPath(),"rb") as file:
+                return pickle.load(file)
+        except:
+            return None
+
+    def removeCheckpoint(self):
+        try:
+            os.remove(self.getPath())
+        except:
+            pass
@@ -0,0 +1,72 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pandas as pd
+
+class Closed_Loop_Summary():
+    ## Key figures of the applied (first) step of every iteration: operating cost, comfort slack and switching of the binaries
+    def __init__(self):
+        self.rows = []
+        self.lastSwitches = None
+
+    def setIteration(self,timestamp,results=None):
+        row = {"timestamp":str(timestamp),"solved":results is not None,"cost":np.nan,"slack":np.nan,"switches":np.nan}
+        if results is not None:
+            row["cost"] = results["C_OP_T"].iloc[0]
+            row["slack"] = results["S_OP_T"].iloc[1] ## slacks of the state at the end of the first step
+            switches = {}
+            for column in results.columns:
+                if column.startswith("B_") and column.endswith(("_T","_T_1","_T_2")) and not np.isnan(results[column].iloc[0]):
+                    switches[column] = results[column].iloc[0]
+            if self.lastSwitches is not None:
+                row["switches"] = int(sum(1 for column in switches if column in self.lastSwitches and round(switches[column]) != round(self.lastSwitches[column])))
+            else:
+                row["switches"] = 0
+            self.lastSwitches = switches
+        self.rows.append(row)
+
+    def getState(self):
+        return {"rows":self.rows,"lastSwitches":self.lastSwitches}
+
+    def setState(self,state):
+        self.rows = state["rows"]
+        self.lastSwitches = state["lastSwitches"]
+
+    def getIterations(self):
+        return pd.DataFrame(self.rows,columns=["timestamp","solved","cost","slack","switches"])
+
+    def getSummary(self):
+        iterations = self.getIterations()
+        return {"iterations":len(iterations),"failed":int((iterations["solved"] == False).sum()),"cost":round(float(iterations["cost"].sum()),4),"slack":round(float(iterations["slack"].sum()),4),
+        "maxSlack":round(float(iterations["slack"].max()),4),"switches":int(iterations["switches"].sum())}
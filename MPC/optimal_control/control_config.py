@@ -0,0 +1,116 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import os
+import json
+
+class Control_Config():
+    ## Settings of one controller instance, the defaults give the allowed names and types (e.g. the settings of run_control)
+    def __init__(self,defaults,optional=[],**settings):
+        self.defaults = dict(defaults)
+        self.optional = list(optional) ## settings that can also be None
+        for name,value in self.defaults.items():
+            setattr(self,name,value)
+        self.setSettings(**settings)
+
+    def getType(self,name,value):
+        default = self.defaults[name]
+        if isinstance(default,bool) or default is None:
+            return value if isinstance(value,type(default)) or default is None else None
+        if isinstance(default,float) and isinstance(value,(int,float)) and not isinstance(value,bool):
+            return float(value)
+        if isinstance(default,int) and isinstance(value,int) and not isinstance(value,bool):
+            return value
+        if isinstance(default,str) and isinstance(value,str):
+            if "PATH" in name and default.endswith(("\\","/")) and value != "" and not value.endswith(("\\","/")):
+                value = value + os.sep ## folders are concatenated with the file names
+            return value
+        if isinstance(default,(list,tuple)) and isinstance(value,(list,tuple)):
+            return list(value)
+        return None
+
+    def setSettings(self,**settings):
+        for name,value in settings.items():
+            if name not in self.defaults:
+                raise RuntimeError("Unknown setting " + str(name) + ".")
+            if value is None and name in self.optional:
+                setattr(self,name,None)
+                continue
+            checkedValue = self.getType(name,value)
+            if checkedValue is None:
+                raise RuntimeError("Setting " + str(name) + " needs the type " + type(self.defaults[name]).__name__ + ", got " + repr(value) + ".")
+            setattr(self,name,checkedValue)
+        self.checkSettings()
+
+    def checkSettings(self):
+        for name in ["TIMESTEPS_BINARY","TIMESTEPS_LINEAR_BINARY","TIMESTEPS_LONG_TERM"]:
+            if name in self.defaults and getattr(self,name) < 2:
+                raise RuntimeError("Setting " + name + " needs at least 2 time steps.")
+        for name in ["SIM_INTERVAL","CYCLETIME_LOOP","SOLVER_THREADS"]:
+            if name in self.defaults and getattr(self,name) <= 0:
+                raise RuntimeError("Setting " + name + " needs to be positive.")
+
+    def getSettings(self):
+        return {name:getattr(self,name) for name in self.defaults}
+
+    def setFromFile(self,path):
+        ## json, toml or yaml (with pyyaml installed), relative paths are resolved from the folder of the file
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".json":
+            with open(path,"r") as file:
+                settings = json.load(file)
+        elif extension == ".toml":
+            try:
+                import tomllib
+            except ImportError:
+                import tomli as tomllib
+            with open(path,"rb") as file:
+                settings = tomllib.load(file)
+        elif extension in [".yaml",".yml"]:
+            try:
+                import yaml
+            except ImportError:
+                raise RuntimeError("Reading " + str(path) + " needs pyyaml.")
+            with open(path,"r") as file:
+                settings = yaml.safe_load(file) or {}
+        else:
+            raise RuntimeError("Unknown config file type " + str(extension) + ".")
+        folder = os.path.dirname(os.path.abspath(path))
+        for name,value in settings.items():
+            if "PATH" in name and isinstance(value,str) and value != "" and not os.path.isabs(value):
+                settings[name] = os.path.join(folder,value)
+        self.setSettings(**settings)
+        return self
+
+    def writeFile(self,path):
+        with open(path,"w") as file:
+            json.dump(self.getSettings(),file,indent=4)
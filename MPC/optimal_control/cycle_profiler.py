@@ -0,0 +1,151 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import json
+import cProfile
+import tracemalloc
+from time import perf_counter
+from datetime import datetime
+import pyomo.environ as pyo
+from pyomo.core.expr.visitor import identify_variables
+try:
+    import resource
+except:
+    resource = None # not available on windows
+
+class Cycle_Profiler():
+    ## Wall time (and memory) of the phases of every MPC iteration, written as one json line per iteration
+    def __init__(self,savePath="",timestamp="",active=True,modelStatistics=False,profile=False,traceMemory=False):
+        self.savePath = savePath
+        self.started = timestamp
+        if timestamp == "":
+            self.started = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+        self.active = active
+        self.modelStatistics = modelStatistics
+        self.profile = profile ## cProfile of every iteration (Profile_<started>_iter_<n>.prof)
+        self.traceMemory = traceMemory ## peak of the python allocations per phase (tracemalloc), else peak rss of the process
+        self.record = None
+        self.phaseStart = {}
+        self.profiler = None
+        if self.active == True and self.savePath != "":
+            try:
+                os.makedirs(self.savePath,exist_ok=True)
+            except:
+                pass
+        if self.active == True and self.traceMemory == True:
+            tracemalloc.start()
+
+    def startIteration(self,iteration,timestamp=None):
+        if self.active == False:
+            return
+        self.record = {"iteration":iteration,"timestamp":str(timestamp),"started":datetime.now().strftime("%Y-%m-%d %H:%M:%S"),"phases":{},"model":{},"solver":{}}
+        self.iterationStart = perf_counter()
+        if self.profile == True:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def getMemory(self):
+        ## in MB
+        if self.traceMemory == True:
+            return round(tracemalloc.get_traced_memory()[1]/1e6,3)
+        if resource is not None:
+            return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1e3,3)
+        return None
+
+    def startPhase(self,name):
+        if self.active == False:
+            return
+        if self.traceMemory == True:
+            tracemalloc.reset_peak()
+        self.phaseStart[name] = perf_counter()
+
+    def stopPhase(self,name):
+        if self.active == False:
+            return None
+        seconds = perf_counter() - self.phaseStart.pop(name)
+        self.setPhase(name=name,seconds=seconds,memory=self.getMemory())
+        return seconds
+
+    def setPhase(self,name,seconds,memory=None):
+        ## Phases measured somewhere else (e.g. the partitions of the warmstart models), a repeated name adds up
+        if self.active == False or self.record is None or seconds is None:
+            return
+        if name in self.record["phases"]:
+            self.record["phases"][name]["seconds"] = self.record["phases"][name]["seconds"] + round(seconds,4)
+        else:
+            self.record["phases"][name] = {"seconds":round(seconds,4),"memoryInMB":memory}
+
+    def setModelStatistics(self,model):
+        if self.active == False or self.record is None or self.modelStatistics == False:
+            return
+        timeStart = perf_counter()
+        self.record["model"] = self.getModelStatistics(model=model)
+        self.setPhase(name="model_statistics",seconds=perf_counter() - timeStart) ## walks all constraints, so it is a phase of its own
+
+    def setSolverStatistics(self,statistics):
+        if self.active == False or self.record is None:
+            return
+        self.record["solver"] = statistics
+
+    def getModelStatistics(self,model):
+        variables = 0
+        binaries = 0
+        for v in model.component_data_objects(pyo.Var,descend_into=True):
+            variables = variables + 1
+            if v.is_binary():
+                binaries = binaries + 1
+        constraints = 0
+        nonzeros = 0
+        for c in model.component_data_objects(pyo.Constraint,active=True,descend_into=True):
+            constraints = constraints + 1
+            nonzeros = nonzeros + sum(1 for v in identify_variables(c.body,include_fixed=False))
+        return {"variables":variables,"binaries":binaries,"constraints":constraints,"nonzeros":nonzeros}
+
+    def stopIteration(self):
+        if self.active == False or self.record is None:
+            return None
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.savePath+"Profile_"+str(self.started)+"_iter_"+str(self.record["iteration"])+".prof")
+            self.profiler = None
+        self.record["seconds"] = round(perf_counter() - self.iterationStart,4)
+        self.record["memoryInMB"] = self.getMemory()
+        try:
+            with open(self.savePath+"Cycle_Profile_"+str(self.started)+".jsonl","a") as file:
+                file.write(json.dumps(self.record) + "\n")
+        except:
+            print("Cycle profile could not be written.")
+        record = self.record
+        self.record = None
+        return record
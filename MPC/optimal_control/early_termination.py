@@ -0,0 +1,101 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import time
+import numpy as np
+
+class Early_Termination():
+    ## Stops the solver when the relative mip gap is small enough, the incumbent didn't improve for stallTime seconds or the deadline (time.monotonic()) is reached
+    ## Gap and deadline are also given to the solver as options, the stall criterion needs the callbacks of highs or gurobi
+    def __init__(self,gap=None,stallTime=None,deadline=None):
+        self.gap = gap
+        self.stallTime = stallTime
+        self.deadline = deadline
+        self.deadlineLimit = False
+        self.start()
+
+    def start(self):
+        self.reason = None
+        self.incumbent = None
+        self.timeImproved = time.monotonic()
+
+    def getStop(self,incumbent,bound=None):
+        if incumbent is not None and np.isfinite(incumbent) and abs(incumbent) < 1e30: ## gurobi gives 1e100 without incumbent
+            if self.incumbent is None or incumbent < self.incumbent - 1e-9 * max(1,abs(incumbent)):
+                self.incumbent = incumbent
+                self.timeImproved = time.monotonic()
+            if self.gap is not None and bound is not None and np.isfinite(bound) and abs(incumbent - bound) / max(abs(incumbent),1e-10) <= self.gap:
+                self.reason = "gap"
+            elif self.stallTime is not None and time.monotonic() - self.timeImproved >= self.stallTime:
+                self.reason = "stall"
+        if self.reason is None and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = "deadline"
+        return self.reason is not None
+
+    def getReason(self):
+        return self.reason
+
+    def getTimeLimit(self,timeLimit):
+        ## The deadline is the time limit of the solver, if it comes first, so also linear programs and solvers without callback stop at it
+        self.deadlineLimit = self.deadline is not None and self.deadline - time.monotonic() <= timeLimit
+        if self.deadlineLimit == True:
+            return max(1,int(self.deadline - time.monotonic()))
+        return timeLimit
+
+    def getDeadlineLimit(self):
+        return self.deadlineLimit
+
+    def getHighsCallback(self):
+        def callback(event):
+            if self.getStop(incumbent=event.data_out.mip_primal_bound,bound=event.data_out.mip_dual_bound):
+                event.interrupt()
+        return callback
+
+    def setHighsCallback(self,highs):
+        self.highsCallback = self.getHighsCallback()
+        highs.cbMipInterrupt += self.highsCallback
+
+    def removeHighsCallback(self,highs):
+        highs.cbMipInterrupt -= self.highsCallback
+        if self.reason is not None:
+            ## HiGHS keeps the interrupt for the next run of the instance, setting the callbacks again clears it
+            highs.disableCallbacks()
+            highs.enableCallbacks()
+
+    def getGurobiCallback(self):
+        ## Callback of the appsi gurobi interface (set_callback)
+        def callback(cb_m,cb_opt,cb_where):
+            from gurobipy import GRB
+            if cb_where == GRB.Callback.MIP:
+                if self.getStop(incumbent=cb_opt.cbGet(GRB.Callback.MIP_OBJBST),bound=cb_opt.cbGet(GRB.Callback.MIP_OBJBND)):
+                    cb_opt._solver_model.terminate()
+        return callback
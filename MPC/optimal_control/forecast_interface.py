@@ -31,18 +31,27 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import os
 import numpy as np
 import pandas as pd
 from datetime import datetime
 from datetime import timedelta
 
+from optimal_control.forecast_store import *
+
 class Forecast_Interface():
         
-    def __init__(self,source="sim",priceType="flat",loadPathDemand="",loadPathWeather="",loadPathPrice=""):
+    def __init__(self,source="sim",priceType="flat",loadPathDemand="",loadPathWeather="",loadPathPrice="",storePath=""):
         self.started = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")   
         self.hour_in_sec = 3600
         self.source = source
         self.priceType = priceType
+        self.prefixSums = {}
+        self.intervalMeans = {}
+        ## If a store path is given, the forecast csv files are converted once and read as memory mapped columns (see Forecast_Store)
+        self.storePath = storePath
+        self.loadPaths = {"demand":loadPathDemand,"weather":loadPathWeather,"price":loadPathPrice}
+        self.forecastStores = {}
         #self.forecast_demand_csv = pd.read_csv(loadPathDemand,index_col=0) !! activate, if modelica model connected
         #self.forecast_weather_csv = pd.read_csv(loadPathWeather,index_col=0) !! activate, if modelica model connected
         #self.forecast_price_csv = pd.read_csv(loadPathPrice,index_col=0) !! activate, if modelica model connected
@@ -54,10 +63,7 @@ class Forecast_Interface():
             for i in range(0,len(intervals)):
                 self.profileForecastHeat[i] = heat_dem_sim * np.random.random()
         elif self.source == "sim":
-            self.profileForecastHeat = []
-            for i in intervals:
-                self.profileForecastHeat.append(np.mean(self.forecast_demand_csv.loc[(timestampStart).strftime("%Y-%m-%d %H:%M:%S"):(timestampStart + timedelta(seconds=(i-1))).strftime("%Y-%m-%d %H:%M:%S"),"Q_HP_Last_Waerme_NEW"]))
-                timestampStart = timestampStart + timedelta(seconds=i)
+            self.profileForecastHeat = self.getIntervalMeans(file="demand",column="Q_HP_Last_Waerme_NEW",timestampStart=timestampStart,intervals=intervals)
         return self.profileForecastHeat
 
     def getProfileForecastCool(self, timestampStart=datetime.strptime("2000-01-01 00:00:00","%Y-%m-%d %H:%M:%S"), intervals=[]):
@@ -67,10 +73,7 @@ class Forecast_Interface():
             for i in range(0,len(intervals)):
                 self.profileForecastCool[i] = cool_dem_sim * np.random.random()
         elif self.source == "sim":
-            self.profileForecastCool = []
-            for i in intervals:
-                self.profileForecastCool.append(np.mean(self.forecast_demand_csv.loc[(timestampStart).strftime("%Y-%m-%d %H:%M:%S"):(timestampStart + timedelta(seconds=(i-1))).strftime("%Y-%m-%d %H:%M:%S"),"Q_HP_Last_Kältespeicher_NEW"]))
-                timestampStart = timestampStart + timedelta(seconds=i)
+            self.profileForecastCool = self.getIntervalMeans(file="demand",column="Q_HP_Last_Kältespeicher_NEW",timestampStart=timestampStart,intervals=intervals)
         return self.profileForecastCool
 
     def getProfileForecastDry(self, timestampStart=datetime.strptime("2000-01-01 00:00:00","%Y-%m-%d %H:%M:%S"), intervals=[]):
@@ -80,10 +83,7 @@ class Forecast_Interface():
             for i in range(0,len(intervals)):
                 self.profileForecastDry[i] = dry_dem_sim * np.random.random()
         elif self.source == "sim":
-            self.profileForecastDry = []
-            for i in intervals:
-                self.profileForecastDry.append(np.mean(self.forecast_demand_csv.loc[(timestampStart).strftime("%Y-%m-%d %H:%M:%S"):(timestampStart + timedelta(seconds=(i-1))).strftime("%Y-%m-%d %H:%M:%S"),"Q_HP_Last_Pufferspeicher_NEW"]))
-                timestampStart = timestampStart + timedelta(seconds=i)
+            self.profileForecastDry = self.getIntervalMeans(file="demand",column="Q_HP_Last_Pufferspeicher_NEW",timestampStart=timestampStart,intervals=intervals)
         return self.profileForecastDry
 
     def getProfileForecastWeather(self, timestampStart=datetime.strptime("2000-01-01 00:00:00","%Y-%m-%d %H:%M:%S"), intervals=[]):
@@ -94,10 +94,7 @@ class Forecast_Interface():
             for i in range(0,len(intervals)):
                 self.profileForecastWeather[i] = weather_sim + random_factor * np.random.random()
         elif self.source == "sim":
-            self.profileForecastWeather = []
-            for i in intervals:
-                self.profileForecastWeather.append(np.mean(self.forecast_weather_csv.loc[(timestampStart).strftime("%Y-%m-%d %H:%M:%S"):(timestampStart + timedelta(seconds=(i-1))).strftime("%Y-%m-%d %H:%M:%S"),"TT_10"]))
-                timestampStart = timestampStart + timedelta(seconds=i)
+            self.profileForecastWeather = self.getIntervalMeans(file="weather",column="TT_10",timestampStart=timestampStart,intervals=intervals)
         return self.profileForecastWeather
 
     def getProfileForecastPrice(self, timestampStart=datetime.strptime("2000-01-01 00:00:00","%Y-%m-%d %H:%M:%S"), intervals=[]):
@@ -109,10 +106,7 @@ class Forecast_Interface():
                 for i in range(0,len(intervals)):
                     self.profileForecastPrice[i] = price_cost_sim + random_factor * np.random.random()
             elif self.priceType == "variable":
-                self.profileForecastPrice = []
-                for i in intervals:
-                    self.profileForecastPrice.append(np.mean(self.forecast_price_csv.loc[(timestampStart).strftime("%Y-%m-%d %H:%M:%S"):(timestampStart + timedelta(seconds=(i-1))).strftime("%Y-%m-%d %H:%M:%S"),"price"]))
-                    timestampStart = timestampStart + timedelta(seconds=i)
+                self.profileForecastPrice = self.getIntervalMeans(file="price",column="price",timestampStart=timestampStart,intervals=intervals)
         return self.profileForecastPrice
 
     def getProfileForecastFrost(self, timestampStart=datetime.strptime("2000-01-01 00:00:00","%Y-%m-%d %H:%M:%S"), intervals=[]):
@@ -120,11 +114,8 @@ class Forecast_Interface():
             self.profileForecastFrost = [0] * len(intervals)
         elif self.source == "sim":
             self.profileForecastFrost = [0] * len(intervals)
-            profileForecastWeather = []
+            profileForecastWeather = self.getIntervalMeans(file="weather",column="TT_10",timestampStart=timestampStart,intervals=intervals)
             j = 0
-            for i in intervals:
-                profileForecastWeather.append(np.mean(self.forecast_weather_csv.loc[(timestampStart).strftime("%Y-%m-%d %H:%M:%S"):(timestampStart + timedelta(seconds=(i-1))).strftime("%Y-%m-%d %H:%M:%S"),"TT_10"]))
-                timestampStart = timestampStart + timedelta(seconds=i)
             for i in profileForecastWeather:
                 if i <= 0:
                     self.profileForecastFrost[j] == 1
@@ -135,13 +126,56 @@ class Forecast_Interface():
         if self.source == "random":
             self.forecastFrost = 0
         elif self.source == "sim":
-            profileForecastWeather = np.mean(self.forecast_weather_csv.loc[(timestampStart).strftime("%Y-%m-%d %H:%M:%S"):(timestampStart + timedelta(seconds=((3600*periodInHours)-1))).strftime("%Y-%m-%d %H:%M:%S"),"TT_10"])
+            profileForecastWeather = self.getIntervalMeans(file="weather",column="TT_10",timestampStart=timestampStart,intervals=[3600*periodInHours])[0]
             if profileForecastWeather <= 0:
                 self.forecastFrost = 1
             else:
                 self.forecastFrost = 0
         return self.forecastFrost
 
+    def getForecastStore(self,file):
+        if file not in self.forecastStores:
+            self.forecastStores[file] = Forecast_Store(loadPath=self.loadPaths[file],storePath=os.path.join(self.storePath,file))
+        return self.forecastStores[file]
+
+    def getPrefixSums(self,seconds,columns,values):
+        ## Prefix sums (and counts of valid values) of all columns
+        valid = ~np.isnan(values)
+        sums = np.zeros((len(seconds)+1,len(columns)))
+        sums[1:] = np.cumsum(np.where(valid,values,0),axis=0)
+        counts = np.zeros((len(seconds)+1,len(columns)))
+        counts[1:] = np.cumsum(valid,axis=0)
+        return {"seconds":seconds,"columns":columns,"sums":sums,"counts":counts}
+
+    def setPrefixSums(self,file):
+        ## Converts the time index once to seconds and builds the prefix sums of all numeric columns of a loaded forecast file
+        csv = getattr(self,"forecast_"+file+"_csv")
+        values = csv.select_dtypes(include=[np.number])
+        seconds = pd.to_datetime(csv.index).values.astype("datetime64[s]").astype(np.int64)
+        self.prefixSums[file] = self.getPrefixSums(seconds=seconds,columns=list(values.columns),values=values.to_numpy(dtype=float))
+        return self.prefixSums[file]
+
+    def getIntervalMeans(self,file,column,timestampStart,intervals):
+        ## Means of all columns of a forecast file over all intervals in one pass, rows from timestampStart to timestampStart + interval - 1s are averaged like before
+        ## The means of the last request are kept, so the profiles of the same file and intervals only cost a lookup
+        key = (timestampStart,tuple(intervals))
+        if file not in self.intervalMeans or self.intervalMeans[file]["key"] != key:
+            if self.storePath != "":
+                ## Only the window of the horizon is read from the store
+                store = self.getForecastStore(file)
+                seconds,values = store.getWindow(timestampStart=timestampStart,timestampEnd=timestampStart + timedelta(seconds=int(np.sum(intervals))))
+                prefix = self.getPrefixSums(seconds=seconds,columns=store.columns,values=values)
+            else:
+                if file not in self.prefixSums:
+                    self.setPrefixSums(file)
+                prefix = self.prefixSums[file]
+            edges = np.datetime64(timestampStart,"s").astype(np.int64) + np.concatenate(([0],np.cumsum(intervals,dtype=np.int64)))
+            positions = np.searchsorted(prefix["seconds"],edges,side="left")
+            with np.errstate(invalid="ignore",divide="ignore"):
+                means = (prefix["sums"][positions[1:]] - prefix["sums"][positions[:-1]]) / (prefix["counts"][positions[1:]] - prefix["counts"][positions[:-1]])
+            self.intervalMeans[file] = {"key":key,"columns":prefix["columns"],"means":means}
+        return self.intervalMeans[file]["means"][:,self.intervalMeans[file]["columns"].index(column)].tolist()
+
     def getProfilesAll(self, timestampStart=datetime.strptime("2000-01-01 00:00:00","%Y-%m-%d %H:%M:%S"), intervals=[], periodFrostInHours=168):
         profileForecastHeat = self.getProfileForecastHeat(timestampStart=timestampStart,intervals=intervals)
         profileForecastCool = self.getProfileForecastCool(timestampStart=timestampStart,intervals=intervals)
@@ -0,0 +1,77 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import numpy as np
+import pandas as pd
+
+class Forecast_Store():
+    ## Columnar binary copy of a forecast csv (one .npy file per numeric column and an epoch second time axis)
+    ## The csv is parsed only once (or again if it changed), afterwards the columns are memory mapped and only the requested window is read
+
+    def __init__(self,loadPath="",storePath=""):
+        self.loadPath = loadPath
+        self.storePath = storePath
+        secondsPath = os.path.join(self.storePath,"seconds.npy")
+        if not os.path.isfile(secondsPath) or (os.path.isfile(self.loadPath) and os.path.getmtime(self.loadPath) > os.path.getmtime(secondsPath)):
+            self.setStore()
+        self.seconds = np.load(secondsPath,mmap_mode="r")
+        self.columns = list(pd.read_csv(os.path.join(self.storePath,"columns.csv"))["column"])
+        self.values = [np.load(os.path.join(self.storePath,"column_" + str(k) + ".npy"),mmap_mode="r") for k in range(0,len(self.columns))]
+
+    def setStore(self):
+        csv = pd.read_csv(self.loadPath,index_col=0)
+        values = csv.select_dtypes(include=[np.number])
+        os.makedirs(self.storePath,exist_ok=True)
+        for k in range(0,len(values.columns)):
+            np.save(os.path.join(self.storePath,"column_" + str(k) + ".npy"),values.iloc[:,k].to_numpy(dtype=float))
+        pd.DataFrame({"column":list(values.columns)}).to_csv(os.path.join(self.storePath,"columns.csv"),index=False)
+        ## Time axis last, so an interrupted conversion is repeated on the next start
+        np.save(os.path.join(self.storePath,"seconds.npy"),pd.to_datetime(csv.index).values.astype("datetime64[s]").astype(np.int64))
+        print("Forecast store written: " + self.storePath)
+
+    def getSeconds(self,timestamp):
+        return int(pd.Timestamp(timestamp).to_datetime64().astype("datetime64[s]").astype(np.int64))
+
+    def getWindow(self,timestampStart,timestampEnd):
+        ## Rows from timestampStart (inclusive) to timestampEnd (exclusive)
+        start,end = np.searchsorted(self.seconds,[self.getSeconds(timestampStart),self.getSeconds(timestampEnd)],side="left")
+        seconds = np.array(self.seconds[start:end])
+        values = np.empty((end-start,len(self.columns)))
+        for k in range(0,len(self.columns)):
+            values[:,k] = self.values[k][start:end]
+        return seconds,values
+
+    def getDataFrame(self,timestampStart,timestampEnd):
+        seconds,values = self.getWindow(timestampStart=timestampStart,timestampEnd=timestampEnd)
+        return pd.DataFrame(values,index=pd.to_datetime(seconds,unit="s").strftime("%Y-%m-%d %H:%M:%S"),columns=self.columns)
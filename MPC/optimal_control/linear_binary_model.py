@@ -37,7 +37,17 @@ import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from optimal_control.value_arrays import *
+
 class Linear_Binary_Model():
+    ## End values of the binary model from the first step of this model: the variables (summed up) and the index of the stage
+    START_TOGGLES = {"B_HP_1_end":[("B_HP_H_I",(1,))],"B_HP_2_end":[("B_HP_H_I",(2,))],"B_HP_3_end":[("B_HP_H_I",(3,))],"B_HP_4_end":[("B_HP_H_I",(4,))],"B_HXH_HS_end":[("V_HP_HXH_I",())],
+    "B_HGC_HGCHXC_end":[("V_HP_HGCHXC_I",())],"B_HXA_end":[("P_HXA_I",())],"B_HXH_HGC_end":[("V_HXA_HXH_I",())],"B_HS_IS_end":[("V_HS_IS_I",())],"B_IS_HGS_end":[("V_IS_HGS_I",())],
+    "B_GS_HGS_end":[("V_GS_HGS_I",())],"B_GS_CS_end":[("V_GS_CS_I",())],"B_GS_HGS_CS_end":[("V_GS_HGS_I",()),("V_GS_CS_I",())]}
+    ## Start values of the long term model from the last step of this model: variable and index of the layer
+    END_STATES = {"T_HS_start":("T_HS_I",()),"T_GS_w_1_start":("T_GS_W_I_WR_WC",(0,1)),"T_GS_w_2_start":("T_GS_W_I_WR_WC",(0,3)),"T_GS_w_3_start":("T_GS_W_I_WR_WC",(0,5)),
+    "T_GS_c_1_start":("T_GS_C_I_CR_CC",(0,0)),"T_GS_c_2_start":("T_GS_C_I_CR_CC",(0,1)),"T_GS_c_3_start":("T_GS_C_I_CR_CC",(0,2)),"T_GS_c_4_start":("T_GS_C_I_CR_CC",(0,3)),
+    "T_GS_c_5_start":("T_GS_C_I_CR_CC",(0,4)),"T_GS_c_6_start":("T_GS_C_I_CR_CC",(0,5)),"T_GS_c_7_start":("T_GS_C_I_CR_CC",(0,6))}
     
     def __init__(self):
         self.warmstart_available = False
@@ -50,6 +60,12 @@ class Linear_Binary_Model():
         self.c_ELECTRICITY_buy_I = profileForecastPrice
         self.temp_frost_I = profileForecastFrost
 
+    def getMcCormickSegments(self):
+        ## Lower and upper temperature of the McCormick segments, an equal partition of [T_lower_MC,T_upper_MC]
+        segments = np.arange(self.N_MC[-1]+1)
+        width = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1)
+        return (width * segments + self.T_lower_MC).tolist(), (width * (segments+1) + self.T_lower_MC).tolist()
+
     def setParams(self,timeSteps,stepSizeInSec,controlPeriod,NMcCormick):
         ## Time
         self.I = timeSteps
@@ -127,12 +143,7 @@ class Linear_Binary_Model():
         ## HXA
         self.V_HXA_min = 0
         self.V_HXA_max = 1
-        self.T_HXAR_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HXAR_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HXAR_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HXAR_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HXAR_min_N, self.T_HXAR_max_N = self.getMcCormickSegments()
 
         self.mdot_HXA_a = 44.94 * 2 # see datasheet recooler
         self.mdot_HXA_b = 11.67
@@ -149,21 +160,11 @@ class Linear_Binary_Model():
         ## V_HP_HXH_HS
         self.V_HP_HXH_min = 0
         self.V_HP_HXH_max = 1
-        self.T_HP_HXH_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HP_HXH_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HP_HXH_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HP_HXH_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HP_HXH_min_N, self.T_HP_HXH_max_N = self.getMcCormickSegments()
 
         self.V_HP_HS_min = 0
         self.V_HP_HS_max = 1
-        self.T_HP_HS_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HP_HS_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HP_HS_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HP_HS_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HP_HS_min_N, self.T_HP_HS_max_N = self.getMcCormickSegments()
 
         self.c_switch_HXH_HS = 0.01
         ## HXH
@@ -180,21 +181,11 @@ class Linear_Binary_Model():
         ## V_HXA_HXH_HGC
         self.V_HXA_HXH_min = 0
         self.V_HXA_HXH_max = 1
-        self.T_HXA_HXH_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HXA_HXH_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HXA_HXH_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HXA_HXH_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HXA_HXH_min_N, self.T_HXA_HXH_max_N = self.getMcCormickSegments()
 
         self.V_HXA_HGC_min = 0
         self.V_HXA_HGC_max = 1
-        self.T_HXA_HGC_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HXA_HGC_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HXA_HGC_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HXA_HGC_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HXA_HGC_min_N, self.T_HXA_HGC_max_N = self.getMcCormickSegments()
 
         self.c_switch_HXH_HGC = 0.01
         ## HGC
@@ -278,59 +269,29 @@ class Linear_Binary_Model():
         ## VP_HS_IS
         self.V_HS_IS_min = 0
         self.V_HS_IS_max = 1
-        self.T_HS_IS_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HS_IS_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HS_IS_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HS_IS_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HS_IS_min_N, self.T_HS_IS_max_N = self.getMcCormickSegments()
         ## V_HP_HGC_HGCHXC
         self.V_HP_HGC_min = 0
         self.V_HP_HGC_max = 1
-        self.T_HP_HGC_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HP_HGC_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HP_HGC_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HP_HGC_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HP_HGC_min_N, self.T_HP_HGC_max_N = self.getMcCormickSegments()
 
         self.V_HP_HGCHXC_min = 0
         self.V_HP_HGCHXC_max = 1
-        self.T_HP_HGCHXC_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HP_HGCHXC_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HP_HGCHXC_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HP_HGCHXC_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HP_HGCHXC_min_N, self.T_HP_HGCHXC_max_N = self.getMcCormickSegments()
 
         self.c_switch_HGC_HGCHXC = 0.01
         ## VP_IS_HGS
         self.V_IS_HGS_min = 0
         self.V_IS_HGS_max = 1
-        self.T_IS_HGS_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_IS_HGS_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_IS_HGS_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_IS_HGS_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_IS_HGS_min_N, self.T_IS_HGS_max_N = self.getMcCormickSegments()
         ## V_GS_HGS_CS
         self.V_GS_HGS_min = 0
         self.V_GS_HGS_max = 1
-        self.T_GS_HGS_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_GS_HGS_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_GS_HGS_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_GS_HGS_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_GS_HGS_min_N, self.T_GS_HGS_max_N = self.getMcCormickSegments()
 
         self.V_GS_CS_min = 0
         self.V_GS_CS_max = 1
-        self.T_GS_CS_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_GS_CS_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_GS_CS_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_GS_CS_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_GS_CS_min_N, self.T_GS_CS_max_N = self.getMcCormickSegments()
 
         self.c_switch_HGS_CS = 0.01
         ## CS
@@ -350,30 +311,15 @@ class Linear_Binary_Model():
         ## VP_HXC_HGS_CS_RLTS
         self.V_HXC_HGS_min = 0
         self.V_HXC_HGS_max = 1
-        self.T_HXC_HGS_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HXC_HGS_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HXC_HGS_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HXC_HGS_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HXC_HGS_min_N, self.T_HXC_HGS_max_N = self.getMcCormickSegments()
 
         self.V_HXC_CS_min = 0
         self.V_HXC_CS_max = 1
-        self.T_HXC_CS_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HXC_CS_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HXC_CS_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HXC_CS_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HXC_CS_min_N, self.T_HXC_CS_max_N = self.getMcCormickSegments()
 
         self.V_HXC_RLTS_min = 0
         self.V_HXC_RLTS_max = 1
-        self.T_HXC_RLTS_min_N = [0] * (self.N_MC[-1]+1)
-        self.T_HXC_RLTS_max_N = [0] * (self.N_MC[-1]+1)
-        for i in self.N_MC:
-            self.T_HXC_RLTS_min_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * i + self.T_lower_MC
-        for i in self.N_MC:
-            self.T_HXC_RLTS_max_N[i] = (self.T_upper_MC-self.T_lower_MC)/(self.N_MC[-1]+1) * (i+1) + self.T_lower_MC
+        self.T_HXC_RLTS_min_N, self.T_HXC_RLTS_max_N = self.getMcCormickSegments()
 
         self.mdot_VP_tot = 16.00
         self.c_switch_VP_lin = 0.01
@@ -721,6 +667,25 @@ class Linear_Binary_Model():
         self.m.Z_VP_I = pyo.Var(self.I[0:-1], domain=pyo.NonNegativeReals)
         self.m.E_VP_EL_I = pyo.Var(self.I[0:-1], domain=pyo.NonNegativeReals)
 
+        ## Profiles (mutable, updated by updateProfiles if the model is reused)
+        self.m.q_dem_HS_I = pyo.Param(self.I[0:-1], initialize=dict(zip(self.I[0:-1],self.q_dem_HS_I)), mutable=True)
+        self.m.q_dem_CS_I = pyo.Param(self.I[0:-1], initialize=dict(zip(self.I[0:-1],self.q_dem_CS_I)), mutable=True)
+        self.m.q_dem_RLTS_I = pyo.Param(self.I[0:-1], initialize=dict(zip(self.I[0:-1],self.q_dem_RLTS_I)), mutable=True)
+        self.m.temp_amb_I = pyo.Param(self.I[0:-1], initialize=dict(zip(self.I[0:-1],self.temp_amb_I)), mutable=True)
+        self.m.c_ELECTRICITY_buy_I = pyo.Param(self.I[0:-1], initialize=dict(zip(self.I[0:-1],self.c_ELECTRICITY_buy_I)), mutable=True)
+        self.m.temp_frost_I = pyo.Param(self.I[0:-1], initialize=dict(zip(self.I[0:-1],self.temp_frost_I)), mutable=True)
+
+        return self.m
+
+    def updateProfiles(self,model):
+        self.m = model
+        for i in self.I[0:-1]:
+            self.m.q_dem_HS_I[i] = self.q_dem_HS_I[i]
+            self.m.q_dem_CS_I[i] = self.q_dem_CS_I[i]
+            self.m.q_dem_RLTS_I[i] = self.q_dem_RLTS_I[i]
+            self.m.temp_amb_I[i] = self.temp_amb_I[i]
+            self.m.c_ELECTRICITY_buy_I[i] = self.c_ELECTRICITY_buy_I[i]
+            self.m.temp_frost_I[i] = self.temp_frost_I[i]
         return self.m
 
     def setStartValues(self,model,T_HP_HT_start,T_HP_LT_start,T_HS_start,T_HXA_start,T_HXH_start,T_HGC_start,T_HXC_start,T_HGS_start,T_IS_w_1_start,T_IS_w_2_start,T_IS_w_3_start,T_IS_c_1_start,T_IS_c_2_start,T_IS_c_3_start,T_IS_c_4_start,T_IS_c_5_start,T_GS_w_1_start,T_GS_w_2_start,T_GS_w_3_start,T_GS_c_1_start,T_GS_c_2_start,T_GS_c_3_start,T_GS_c_4_start,T_GS_c_5_start,T_GS_c_6_start,T_GS_c_7_start,T_CS_start,T_RLTS_start):
@@ -786,6 +751,14 @@ class Linear_Binary_Model():
             ## All but cold side HP HXC
         return self.m
 
+    def getStartToggles(self,model):
+        ## End values of the binary model (START_TOGGLES) from the variables of the first step of the block, e.g. as links of getLinks
+        return {name:sum(model.component(variable)[index + (self.I[0],)] for variable,index in terms) for name,terms in self.START_TOGGLES.items()}
+
+    def getEndStates(self,model):
+        ## Start values of the long term model (END_STATES) from the variables of the last step of the block, e.g. as links of getLinks
+        return {name:model.component(variable)[(self.I[-1],) + index] for name,(variable,index) in self.END_STATES.items()}
+
     def setConstraints(self,model):
         self.m = model
         ## General cost constraint
@@ -794,7 +767,7 @@ class Linear_Binary_Model():
         ## Cost constraints 
         self.m.Constraint_Cost_time_I = pyo.ConstraintList()
         for i in self.I[0:-1]:
-            self.m.Constraint_Cost_time_I.add(self.m.C_OP_I[i] == self.StepSizeInSec2/self.t_hour_in_sec * ((self.m.E_HP_EL_in_I[i] + self.m.E_HXA_EL_I[i] + self.m.E_IS_EL_I[i] + self.m.E_GS_EL_I[i] + self.m.E_VP_EL_I[i]) * self.c_ELECTRICITY_buy_I[i]))
+            self.m.Constraint_Cost_time_I.add(self.m.C_OP_I[i] == self.StepSizeInSec2/self.t_hour_in_sec * ((self.m.E_HP_EL_in_I[i] + self.m.E_HXA_EL_I[i] + self.m.E_IS_EL_I[i] + self.m.E_GS_EL_I[i] + self.m.E_VP_EL_I[i]) * self.m.c_ELECTRICITY_buy_I[i]))
 
         ## General Slack constraint
         self.m.Constraint_Slack_I = pyo.Constraint(expr = self.m.S_TOT_I_ == sum(self.m.S_OP_I[i] for i in self.I[1:]))
@@ -940,7 +913,7 @@ class Linear_Binary_Model():
             self.m.Constraint_HS_I.add(self.m.T_HS_I[self.I[-1]] >= self.T_HS_end - self.m.S_T_HS_I[self.I[-1]])
 
         for i in self.I[0:-1]: 
-            self.m.Constraint_HS_I.add(self.m.T_HS_I[i+1] == self.m.T_HS_I[i] + self.StepSizeInSec2 * (1/(self.m_HS_w * self.c_w) * (self.c_w * sum(self.mdot_HP_w_H[h] * self.m.Z_HP_HS_H_I[h,i] for h in self.H) - self.c_w * self.mdot_IS_w * self.m.W_HS_IS_I[i])) - self.StepSizeInSec2 * self.q_dem_HS_I[i]/(self.m_HS_w * self.c_w) + self.StepSizeInSec2 * self.alpha_HS_time * (self.t_default - self.m.T_HS_I[i+1])/(self.m_HS_w * self.c_w)) ## General energy flow
+            self.m.Constraint_HS_I.add(self.m.T_HS_I[i+1] == self.m.T_HS_I[i] + self.StepSizeInSec2 * (1/(self.m_HS_w * self.c_w) * (self.c_w * sum(self.mdot_HP_w_H[h] * self.m.Z_HP_HS_H_I[h,i] for h in self.H) - self.c_w * self.mdot_IS_w * self.m.W_HS_IS_I[i])) - self.StepSizeInSec2 * self.m.q_dem_HS_I[i]/(self.m_HS_w * self.c_w) + self.StepSizeInSec2 * self.alpha_HS_time * (self.t_default - self.m.T_HS_I[i+1])/(self.m_HS_w * self.c_w)) ## General energy flow
 
         for i in self.I[1:]:
             self.m.Constraint_HS_I.add(self.m.T_HS_I[i] <= self.T_HS_max + self.m.S_T_HS_I[i]) ## Temperature range tank
@@ -953,7 +926,7 @@ class Linear_Binary_Model():
             self.m.Constraint_CS_I.add(self.m.T_CS_I[self.I[-1]] <= self.T_CS_end + self.m.S_T_CS_I[self.I[-1]])
 
         for i in self.I[0:-1]:
-            self.m.Constraint_CS_I.add(self.m.T_CS_I[i+1] == self.m.T_CS_I[i] + self.StepSizeInSec2 * (1/(self.m_CS_w * self.c_w) * (self.c_w * self.mdot_GS_w * self.m.W_GS_CS_I[i] + self.c_w * self.mdot_VP_tot * self.m.W_HXC_CS_I[i])) + self.StepSizeInSec2 * self.q_dem_CS_I[i]/(self.m_CS_w * self.c_w) + self.StepSizeInSec2 * self.alpha_CS_time * (self.t_default - self.m.T_CS_I[i+1])/(self.m_CS_w * self.c_w)) ## General energy flow
+            self.m.Constraint_CS_I.add(self.m.T_CS_I[i+1] == self.m.T_CS_I[i] + self.StepSizeInSec2 * (1/(self.m_CS_w * self.c_w) * (self.c_w * self.mdot_GS_w * self.m.W_GS_CS_I[i] + self.c_w * self.mdot_VP_tot * self.m.W_HXC_CS_I[i])) + self.StepSizeInSec2 * self.m.q_dem_CS_I[i]/(self.m_CS_w * self.c_w) + self.StepSizeInSec2 * self.alpha_CS_time * (self.t_default - self.m.T_CS_I[i+1])/(self.m_CS_w * self.c_w)) ## General energy flow
 
         for i in self.I[1:]:
             self.m.Constraint_CS_I.add(self.m.T_CS_I[i] <= self.T_CS_max + self.m.S_T_CS_I[i]) ## Temperature range tank
@@ -967,7 +940,7 @@ class Linear_Binary_Model():
 
 
         for i in self.I[0:-1]:
-            self.m.Constraint_RLTS_I.add(self.m.T_RLTS_I[i+1] == self.m.T_RLTS_I[i] + self.StepSizeInSec2 * (1/(self.m_RLTS_w * self.c_w) * (self.c_w * self.mdot_VP_tot * self.m.W_HXC_RLTS_I[i])) + self.StepSizeInSec2 * self.q_dem_RLTS_I[i]/(self.m_RLTS_w * self.c_w) + self.StepSizeInSec2 * self.alpha_RLTS_time * (self.t_default - self.m.T_RLTS_I[i+1])/(self.m_RLTS_w * self.c_w)) ## General energy flow
+            self.m.Constraint_RLTS_I.add(self.m.T_RLTS_I[i+1] == self.m.T_RLTS_I[i] + self.StepSizeInSec2 * (1/(self.m_RLTS_w * self.c_w) * (self.c_w * self.mdot_VP_tot * self.m.W_HXC_RLTS_I[i])) + self.StepSizeInSec2 * self.m.q_dem_RLTS_I[i]/(self.m_RLTS_w * self.c_w) + self.StepSizeInSec2 * self.alpha_RLTS_time * (self.t_default - self.m.T_RLTS_I[i+1])/(self.m_RLTS_w * self.c_w)) ## General energy flow
 
         for i in self.I[1:]:
             self.m.Constraint_RLTS_I.add(self.m.T_RLTS_I[i] <= self.T_RLTS_max + self.m.S_T_RLTS_I[i]) ## Temperature range tank
@@ -1986,7 +1959,7 @@ class Linear_Binary_Model():
         ## HXA
         self.m.Constraint_HXA_I = pyo.ConstraintList()
         for i in self.I[0:-1]:
-            self.m.Constraint_HXA_I.add(self.m.T_HXAR_in_I[i] == self.temp_amb_I[i]) ## General temperature connection
+            self.m.Constraint_HXA_I.add(self.m.T_HXAR_in_I[i] == self.m.temp_amb_I[i]) ## General temperature connection
 
         for i in self.I[0:-1]:
             self.m.Constraint_HXA_I.add(self.m.W_HXA_I[i] >= sum(self.V_HXA_min * self.m.Z_HXAR_N_I[n,i] + self.T_HXAR_min_N[n] * self.m.P_HXA_N_I[n,i] - self.V_HXA_min * self.T_HXAR_min_N[n] * self.m.B_T_HXAR_N_I[n,i] for n in self.N_MC))
@@ -2002,8 +1975,8 @@ class Linear_Binary_Model():
 
         for i in self.I[0:-1]:
             for n in self.N_MC: 
-                self.m.Constraint_HXA_I.add(self.m.P_HXA_N_I[n,i]  <= self.V_HXA_max * self.m.B_T_HXAR_N_I[n,i] * (1-self.temp_frost_I[i]))
-                self.m.Constraint_HXA_I.add(self.m.P_HXA_N_I[n,i]  >= self.V_HXA_min * self.m.B_T_HXAR_N_I[n,i] * (1-self.temp_frost_I[i]))
+                self.m.Constraint_HXA_I.add(self.m.P_HXA_N_I[n,i]  <= self.V_HXA_max * self.m.B_T_HXAR_N_I[n,i] * (1-self.m.temp_frost_I[i]))
+                self.m.Constraint_HXA_I.add(self.m.P_HXA_N_I[n,i]  >= self.V_HXA_min * self.m.B_T_HXAR_N_I[n,i] * (1-self.m.temp_frost_I[i]))
 
         for i in self.I[0:-1]:
             for n in self.N_MC:                
@@ -2045,7 +2018,7 @@ class Linear_Binary_Model():
         self.m.Constraint_HXA_I.add(self.m.T_HXA_I[0] == self.T_HXA_start) ## Start temperature
 
         for i in self.I[0:-1]:
-            self.m.Constraint_HXA_I.add(self.m.T_HXA_I[i+1] == self.m.T_HXA_I[i] + self.StepSizeInSec2 * (1/(self.m_HXA_b * self.c_b) * (self.alpha_factor_HXA * self.c_a * self.mdot_HXA_a * self.m.W_HXA_I[i] - self.c_b * self.mdot_HXA_b * self.m.W_HXA_HXH_I[i] - self.c_b * self.mdot_HXA_b * self.m.W_HXA_HGC_I[i])) + self.StepSizeInSec2 * self.alpha_HXA_time * (self.temp_amb_I[i] - self.m.T_HXA_I[i+1])/(self.m_HXA_b * self.c_b)) ## General energy flow
+            self.m.Constraint_HXA_I.add(self.m.T_HXA_I[i+1] == self.m.T_HXA_I[i] + self.StepSizeInSec2 * (1/(self.m_HXA_b * self.c_b) * (self.alpha_factor_HXA * self.c_a * self.mdot_HXA_a * self.m.W_HXA_I[i] - self.c_b * self.mdot_HXA_b * self.m.W_HXA_HXH_I[i] - self.c_b * self.mdot_HXA_b * self.m.W_HXA_HGC_I[i])) + self.StepSizeInSec2 * self.alpha_HXA_time * (self.m.temp_amb_I[i] - self.m.T_HXA_I[i+1])/(self.m_HXA_b * self.c_b)) ## General energy flow
             
         for i in self.I[1:]:
             self.m.Constraint_HXA_I.add(self.m.T_HXA_I[i] <= self.T_HXA_max + self.m.S_T_HXA_I[i]) ## Temperature range tank
@@ -2399,7 +2372,7 @@ class Linear_Binary_Model():
 
     def getResults(self,model,source=None,savePath="",singleFile=False):
         self.m = model
-        self.safeFile = pd.DataFrame(columns = ["C_OP_I","C_HP_I","C_HXA_I","C_IS_I","C_GS_I","C_VP_I","B_HP_4_I","B_HP_3_I","B_HP_2_I","B_HP_1_I","B_HP_0_I","P_HP_HXH_I","P_HP_HS_I","P_HP_HGC_H_I","P_HP_HGCHXC_H_I","P_HP_HGC_2_H_I","P_HP_HGCHXC_2_H_I","P_HXA_I","P_HXA_HXH_I","P_HXA_HGC_I",
+        columns = ["C_OP_I","C_HP_I","C_HXA_I","C_IS_I","C_GS_I","C_VP_I","B_HP_4_I","B_HP_3_I","B_HP_2_I","B_HP_1_I","B_HP_0_I","P_HP_HXH_I","P_HP_HS_I","P_HP_HGC_H_I","P_HP_HGCHXC_H_I","P_HP_HGC_2_H_I","P_HP_HGCHXC_2_H_I","P_HXA_I","P_HXA_HXH_I","P_HXA_HGC_I",
         "P_HS_IS_I","P_IS_HGS_I","P_GS_HGS_I","P_GS_CS_I","P_VP_HGS_I","P_VP_CS_I","P_VP_RLTS_I","E_HP_EL_I","Q_HP_HT_I","Q_HP_LT_I","E_HP_EL_in_I","T_HP_HT_I","T_HP_LT_I","T_HS_I","T_HXH_I","T_HXH_b_I","T_HXH_w_I",
         "T_HGC_I","T_HXA_I","T_HXC_I","T_HXC_b_I","T_HXC_w_I","T_IS_I","T_ISw_I","T_ISc_I","T_IS_W_0_I","T_IS_W_1_I","T_IS_W_2_I","T_IS_C_0_I","T_IS_C_1_I","T_IS_C_2_I","T_IS_C_3_I","T_IS_C_4_I",
         "T_GS_I","T_GSw_I","T_GSc_I","T_GS_W_0_I","T_GS_W_1_I","T_GS_W_2_I","T_GS_C_0_I","T_GS_C_1_I","T_GS_C_2_I","T_GS_C_3_I","T_GS_C_4_I","T_GS_C_5_I","T_GS_C_6_I",
@@ -2407,67 +2380,93 @@ class Linear_Binary_Model():
         "S_T_CS_I","S_T_RLTS_I","q_dem_HS_I","q_dem_CS_I","q_dem_RLTS_I","temp_amb_I","B_T_HXAR_0_I","B_T_HXAR_1_I","B_T_HP_HXH_0_I","B_T_HP_HXH_1_I","B_T_HP_HS_0_I","B_T_HP_HS_1_I","B_T_HXA_HXH_0_I","B_T_HXA_HXH_1_I",
         "B_T_HXA_HGC_0_I","B_T_HXA_HGC_1_I","B_T_HS_IS_0_I","B_T_HS_IS_1_I","B_T_HS_IS_0_I_2","B_T_HS_IS_1_I_2","B_T_HP_HGC_0_I","B_T_HP_HGC_1_I","B_T_HP_HGCHXC_0_I","B_T_HP_HGCHXC_1_I","B_T_HP_HGCHXC_0_2_I","B_T_HP_HGCHXC_1_2_I",
         "B_T_IS_HGS_0_I","B_T_IS_HGS_1_I","B_T_IS_HGS_0_I_2","B_T_IS_HGS_1_I_2","B_T_GS_HGS_0_I","B_T_GS_HGS_1_I","B_T_GS_CS_0_I","B_T_GS_CS_1_I","B_T_GS_HGS_0_I_2","B_T_GS_HGS_1_I_2","B_T_GS_CS_0_I_2","B_T_GS_CS_1_I_2",
-        "B_T_HXC_HGS_0_I","B_T_HXC_HGS_1_I","B_T_HXC_CS_0_I","B_T_HXC_CS_1_I","B_T_HXC_RLTS_0_I","B_T_HXC_RLTS_1_I"]) 
-        try: # Everything but slack constraints
-            self.safeFile = self.safeFile.append({"C_OP_I":self.m.C_OP_I[0](),"C_HP_I":self.m.E_HP_EL_in_I[0]()*self.c_ELECTRICITY_buy_I[0]*self.StepSizeInSec2/self.t_hour_in_sec,
-            "C_HXA_I":self.m.E_HXA_EL_I[0]()*self.c_ELECTRICITY_buy_I[0]*self.StepSizeInSec2/self.t_hour_in_sec,"C_IS_I":self.m.E_IS_EL_I[0]()*self.c_ELECTRICITY_buy_I[0]*self.StepSizeInSec2/self.t_hour_in_sec,
-            "C_GS_I":self.m.E_GS_EL_I[0]()*self.c_ELECTRICITY_buy_I[0]*self.StepSizeInSec2/self.t_hour_in_sec,"C_VP_I":self.m.E_VP_EL_I[0]()*self.c_ELECTRICITY_buy_I[0]*self.StepSizeInSec2/self.t_hour_in_sec,
-            "B_HP_4_I":self.m.B_HP_H_I[4 ,0](),"B_HP_3_I":self.m.B_HP_H_I[3 ,0](),"B_HP_2_I":self.m.B_HP_H_I[2 ,0](),"B_HP_1_I":self.m.B_HP_H_I[1 ,0](),"B_HP_0_I":self.m.B_HP_H_I[0 ,0](),
-            "P_HP_HXH_I":(self.c_w * sum(self.mdot_HP_w_H[h] * self.m.Z_HP_HXH_H_I[h,0]() for h in self.H)),"P_HP_HS_I":(self.c_w * sum(self.mdot_HP_w_H[h] * self.m.Z_HP_HS_H_I[h,0]() for h in self.H)),"P_HP_HGC_H_I":(self.c_b * sum(self.mdot_HP_b_H[h] * self.m.Z_HP_HGC_H_I[h,0]() for h in self.H)),
-            "P_HP_HGCHXC_H_I":(self.c_b * sum(self.mdot_HP_b_H[h] * self.m.Z_HP_HGCHXC_H_I[h,0]() for h in self.H)),"P_HP_HGC_2_H_I":(self.c_b * sum(self.mdot_HP_b_H[h] * self.m.Z_HP_HGC_2_H_I[h,0]() for h in self.H)),"P_HP_HGCHXC_2_H_I":(self.c_b * sum(self.mdot_HP_b_H[h] * self.m.Z_HP_HGCHXC_2_H_I[h,0]() for h in self.H)),"P_HXA_I":(self.alpha_factor_HXA * self.c_a * self.mdot_HXA_a * self.m.W_HXA_I[0]()),
-            "P_HXA_HXH_I":(self.m.W_HXA_HXH_I[0]() * self.mdot_HXA_b * self.c_b),"P_HXA_HGC_I":(self.m.W_HXA_HGC_I[0]() * self.c_b * self.mdot_HXA_b),"P_HS_IS_I":(self.m.W_HS_IS_I[0]() * self.c_w * self.mdot_IS_w),
-            "P_IS_HGS_I":(self.m.W_IS_HGS_I[0]() * self.c_w * self.mdot_IS_w),"P_GS_HGS_I":(self.m.W_GS_HGS_I[0]() * self.c_w * self.mdot_GS_w),"P_GS_CS_I":(self.m.W_GS_CS_I[0]() * self.c_w * self.mdot_GS_w),
-            "P_VP_HGS_I":(self.m.W_HXC_HGS_I[0]() * self.mdot_VP_tot * self.c_w),"P_VP_CS_I":(self.m.W_HXC_CS_I[0]() * self.mdot_VP_tot * self.c_w),"P_VP_RLTS_I":(self.m.W_HXC_RLTS_I[0]() * self.mdot_VP_tot * self.c_w),
-            "E_HP_EL_I":self.m.E_HP_EL_I[0](),"Q_HP_HT_I":self.m.Q_HP_HT_I[0](),"Q_HP_LT_I":self.m.Q_HP_LT_I[0](),"E_HP_EL_in_I":self.m.E_HP_EL_in_I[0](),"T_HP_HT_I":self.m.T_HP_HT_I[0](),
-            "T_HP_LT_I":self.m.T_HP_LT_I[0](),"T_HS_I":self.m.T_HS_I[0](),"T_HXH_I":self.m.T_HXH_I[0](),"T_HXH_b_I":self.m.T_HXH_b_I[0](),"T_HXH_w_I":self.m.T_HXH_w_I[0](),"T_HGC_I":self.m.T_HGC_I[0](),
-            "T_HXA_I":self.m.T_HXA_I[0](),"T_HXC_I":self.m.T_HXC_I[0](),"T_HXC_b_I":self.m.T_HXC_b_I[0](),"T_HXC_w_I":self.m.T_HXC_w_I[0](),"T_IS_I":self.m.T_IS_I[0](),"T_ISw_I":(sum(self.m.T_IS_W_I_WR[0,r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_I":(sum(self.m.T_IS_C_I_CR[0,r]() for r in self.cr_IS)/len(self.cr_IS)),
-            "T_IS_W_0_I":self.m.T_IS_W_I_WR[0,0](),"T_IS_W_1_I":self.m.T_IS_W_I_WR[0,2](),"T_IS_W_2_I":self.m.T_IS_W_I_WR[0,4](),"T_IS_C_0_I":self.m.T_IS_C_I_CR[0,0](),"T_IS_C_1_I":self.m.T_IS_C_I_CR[0,1](),"T_IS_C_2_I":self.m.T_IS_C_I_CR[0,2](),"T_IS_C_3_I":self.m.T_IS_C_I_CR[0,3](),"T_IS_C_4_I":self.m.T_IS_C_I_CR[0,4](),
-            "T_GS_I":self.m.T_GS_I[0](),"T_GSw_I":(sum(sum(self.m.T_GS_W_I_WR_WC[0,c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_I":(sum(sum(self.m.T_GS_C_I_CR_CC[0,c,r]() for r in self.cr_GS) for c in self.cc_GS)/(len(self.cr_GS)*len(self.cc_GS))),
-            "T_GS_W_0_I":sum(self.m.T_GS_W_I_WR_WC[0,c,1]() for c in self.wc_GS),"T_GS_W_1_I":sum(self.m.T_GS_W_I_WR_WC[0,c,3]() for c in self.wc_GS),"T_GS_W_2_I":sum(self.m.T_GS_W_I_WR_WC[0,c,5]() for c in self.wc_GS),
-            "T_GS_C_0_I":sum(self.m.T_GS_C_I_CR_CC[0,c,0]() for c in self.cc_GS),"T_GS_C_1_I":sum(self.m.T_GS_C_I_CR_CC[0,c,1]() for c in self.cc_GS),"T_GS_C_2_I":sum(self.m.T_GS_C_I_CR_CC[0,c,2]() for c in self.cc_GS),"T_GS_C_3_I":sum(self.m.T_GS_C_I_CR_CC[0,c,3]() for c in self.cc_GS),"T_GS_C_4_I":sum(self.m.T_GS_C_I_CR_CC[0,c,4]() for c in self.cc_GS),"T_GS_C_5_I":sum(self.m.T_GS_C_I_CR_CC[0,c,5]() for c in self.cc_GS),"T_GS_C_6_I":sum(self.m.T_GS_C_I_CR_CC[0,c,6]() for c in self.cc_GS),
-            "T_HGS_I":self.m.T_HGS_I[0](),"T_CS_I":self.m.T_CS_I[0](),"T_RLTS_I":self.m.T_RLTS_I[0](),"q_dem_HS_I":self.q_dem_HS_I[0],"q_dem_CS_I":self.q_dem_CS_I[0],"q_dem_RLTS_I":self.q_dem_RLTS_I[0],"temp_amb_I":self.temp_amb_I[0],"B_T_HXAR_0_I":self.m.B_T_HXAR_N_I[0,0](),"B_T_HXAR_1_I":self.m.B_T_HXAR_N_I[1,0](),"B_T_HP_HXH_0_I":self.m.B_T_HP_HXH_N_I[0,0](),"B_T_HP_HXH_1_I":self.m.B_T_HP_HXH_N_I[1,0](),
-            "B_T_HP_HS_0_I":self.m.B_T_HP_HS_N_I[0,0](),"B_T_HP_HS_1_I":self.m.B_T_HP_HS_N_I[1,0](),"B_T_HXA_HXH_0_I":self.m.B_T_HXA_HXH_N_I[0,0](),"B_T_HXA_HXH_1_I":self.m.B_T_HXA_HXH_N_I[1,0](),"B_T_HXA_HGC_0_I":self.m.B_T_HXA_HGC_N_I[0,0](),"B_T_HXA_HGC_1_I":self.m.B_T_HXA_HGC_N_I[1,0](),"B_T_HS_IS_0_I":self.m.B_T_HS_IS_N_I[0,0](),"B_T_HS_IS_1_I":self.m.B_T_HS_IS_N_I[1,0](),
-            "B_T_HS_IS_0_I_2":self.m.B_T_HS_IS_N_I_2[0,0](),"B_T_HS_IS_1_I_2":self.m.B_T_HS_IS_N_I_2[1,0](),"B_T_HP_HGC_0_I":self.m.B_T_HP_HGC_N_I[0,0](),"B_T_HP_HGC_1_I":self.m.B_T_HP_HGC_N_I[1,0](),"B_T_HP_HGCHXC_0_I":self.m.B_T_HP_HGCHXC_N_I[0,0](),"B_T_HP_HGCHXC_1_I":self.m.B_T_HP_HGCHXC_N_I[1,0](),"B_T_HP_HGCHXC_0_2_I":self.m.B_T_HP_HGCHXC_N_2_I[0,0](),"B_T_HP_HGCHXC_1_2_I":self.m.B_T_HP_HGCHXC_N_2_I[1,0](),
-            "B_T_IS_HGS_0_I":self.m.B_T_IS_HGS_N_I[0,0](),"B_T_IS_HGS_1_I":self.m.B_T_IS_HGS_N_I[1,0](),"B_T_IS_HGS_0_I_2":self.m.B_T_IS_HGS_N_I_2[0,0](),"B_T_IS_HGS_1_I_2":self.m.B_T_IS_HGS_N_I_2[1,0](),"B_T_GS_HGS_0_I":self.m.B_T_GS_HGS_N_I[0,0](),"B_T_GS_HGS_1_I":self.m.B_T_GS_HGS_N_I[1,0](),"B_T_GS_CS_0_I":self.m.B_T_GS_CS_N_I[0,0](),"B_T_GS_CS_1_I":self.m.B_T_GS_CS_N_I[1,0](),
-            "B_T_GS_HGS_0_I_2":self.m.B_T_GS_HGS_N_I_2[0,0](),"B_T_GS_HGS_1_I_2":self.m.B_T_GS_HGS_N_I_2[1,0](),"B_T_GS_CS_0_I_2":self.m.B_T_GS_CS_N_I_2[0,0](),"B_T_GS_CS_1_I_2":self.m.B_T_GS_CS_N_I_2[1,0](),"B_T_HXC_HGS_0_I":self.m.B_T_HXC_HGS_N_I[0,0](),"B_T_HXC_HGS_1_I":self.m.B_T_HXC_HGS_N_I[1,0](),
-            "B_T_HXC_CS_0_I":self.m.B_T_HXC_CS_N_I[0,0](),"B_T_HXC_CS_1_I":self.m.B_T_HXC_CS_N_I[1,0](),"B_T_HXC_RLTS_0_I":self.m.B_T_HXC_RLTS_N_I[0,0](),"B_T_HXC_RLTS_1_I":self.m.B_T_HXC_RLTS_N_I[1,0]()}, ignore_index=True)
-             # ALL
-            for i in self.I[1:-1]:
-                self.safeFile = self.safeFile.append({"C_OP_I":self.m.C_OP_I[i](),"C_HP_I":self.m.E_HP_EL_in_I[i]()*self.c_ELECTRICITY_buy_I[i]*self.StepSizeInSec2/self.t_hour_in_sec,
-                "C_HXA_I":self.m.E_HXA_EL_I[i]()*self.c_ELECTRICITY_buy_I[i]*self.StepSizeInSec2/self.t_hour_in_sec,"C_IS_I":self.m.E_IS_EL_I[i]()*self.c_ELECTRICITY_buy_I[i]*self.StepSizeInSec2/self.t_hour_in_sec,
-                "C_GS_I":self.m.E_GS_EL_I[i]()*self.c_ELECTRICITY_buy_I[i]*self.StepSizeInSec2/self.t_hour_in_sec,"C_VP_I":self.m.E_VP_EL_I[i]()*self.c_ELECTRICITY_buy_I[i]*self.StepSizeInSec2/self.t_hour_in_sec,
-                "B_HP_4_I":self.m.B_HP_H_I[4 ,i](),"B_HP_3_I":self.m.B_HP_H_I[3 ,i](),"B_HP_2_I":self.m.B_HP_H_I[2 ,i](),"B_HP_1_I":self.m.B_HP_H_I[1 ,i](),"B_HP_0_I":self.m.B_HP_H_I[0 ,i](),
-                "P_HP_HXH_I":(self.c_w * sum(self.mdot_HP_w_H[h] * self.m.Z_HP_HXH_H_I[h,i]() for h in self.H)),"P_HP_HS_I":(self.c_w * sum(self.mdot_HP_w_H[h] * self.m.Z_HP_HS_H_I[h,i]() for h in self.H)),"P_HP_HGC_H_I":(self.c_b * sum(self.mdot_HP_b_H[h] * self.m.Z_HP_HGC_H_I[h,i]() for h in self.H)),
-                "P_HP_HGCHXC_H_I":(self.c_b * sum(self.mdot_HP_b_H[h] * self.m.Z_HP_HGCHXC_H_I[h,i]() for h in self.H)),"P_HP_HGC_2_H_I":(self.c_b * sum(self.mdot_HP_b_H[h] * self.m.Z_HP_HGC_2_H_I[h,i]() for h in self.H)),"P_HP_HGCHXC_2_H_I":(self.c_b * sum(self.mdot_HP_b_H[h] * self.m.Z_HP_HGCHXC_2_H_I[h,i]() for h in self.H)),"P_HXA_I":(self.alpha_factor_HXA * self.c_a * self.mdot_HXA_a * self.m.W_HXA_I[i]()),
-                "P_HXA_HXH_I":(self.m.W_HXA_HXH_I[i]() * self.mdot_HXA_b * self.c_b),"P_HXA_HGC_I":(self.m.W_HXA_HGC_I[i]() * self.c_b * self.mdot_HXA_b),"P_HS_IS_I":(self.m.W_HS_IS_I[i]() * self.c_w * self.mdot_IS_w),
-                "P_IS_HGS_I":(self.m.W_IS_HGS_I[i]() * self.c_w * self.mdot_IS_w),"P_GS_HGS_I":(self.m.W_GS_HGS_I[i]() * self.c_w * self.mdot_GS_w),"P_GS_CS_I":(self.m.W_GS_CS_I[i]() * self.c_w * self.mdot_GS_w),
-                "P_VP_HGS_I":(self.m.W_HXC_HGS_I[i]() * self.mdot_VP_tot * self.c_w),"P_VP_CS_I":(self.m.W_HXC_CS_I[i]() * self.mdot_VP_tot * self.c_w),"P_VP_RLTS_I":(self.m.W_HXC_RLTS_I[i]() * self.mdot_VP_tot * self.c_w),
-                "E_HP_EL_I":self.m.E_HP_EL_I[i](),"Q_HP_HT_I":self.m.Q_HP_HT_I[i](),"Q_HP_LT_I":self.m.Q_HP_LT_I[i](),"E_HP_EL_in_I":self.m.E_HP_EL_in_I[i](),"T_HP_HT_I":self.m.T_HP_HT_I[i](),
-                "T_HP_LT_I":self.m.T_HP_LT_I[i](),"T_HS_I":self.m.T_HS_I[i](),"T_HXH_I":self.m.T_HXH_I[i](),"T_HXH_b_I":self.m.T_HXH_b_I[i](),"T_HXH_w_I":self.m.T_HXH_w_I[i](),"T_HGC_I":self.m.T_HGC_I[i](),
-                "T_HXA_I":self.m.T_HXA_I[i](),"T_HXC_I":self.m.T_HXC_I[i](),"T_HXC_b_I":self.m.T_HXC_b_I[i](),"T_HXC_w_I":self.m.T_HXC_w_I[i](),"T_IS_I":self.m.T_IS_I[i](),"T_ISw_I":(sum(self.m.T_IS_W_I_WR[i,r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_I":(sum(self.m.T_IS_C_I_CR[i,r]() for r in self.cr_IS)/len(self.cr_IS)),
-                "T_IS_W_0_I":self.m.T_IS_W_I_WR[i,0](),"T_IS_W_1_I":self.m.T_IS_W_I_WR[i,2](),"T_IS_W_2_I":self.m.T_IS_W_I_WR[i,4](),"T_IS_C_0_I":self.m.T_IS_C_I_CR[i,0](),"T_IS_C_1_I":self.m.T_IS_C_I_CR[i,1](),"T_IS_C_2_I":self.m.T_IS_C_I_CR[i,2](),"T_IS_C_3_I":self.m.T_IS_C_I_CR[i,3](),"T_IS_C_4_I":self.m.T_IS_C_I_CR[i,4](),
-                "T_GS_I":self.m.T_GS_I[i](),"T_GSw_I":(sum(sum(self.m.T_GS_W_I_WR_WC[i,c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_I":(sum(sum(self.m.T_GS_C_I_CR_CC[i,c,r]() for r in self.cr_GS) for c in self.cc_GS)/(len(self.cr_GS)*len(self.cc_GS))),
-                "T_GS_W_0_I":sum(self.m.T_GS_W_I_WR_WC[i,c,1]() for c in self.wc_GS),"T_GS_W_1_I":sum(self.m.T_GS_W_I_WR_WC[i,c,3]() for c in self.wc_GS),"T_GS_W_2_I":sum(self.m.T_GS_W_I_WR_WC[i,c,5]() for c in self.wc_GS),
-                "T_GS_C_0_I":sum(self.m.T_GS_C_I_CR_CC[i,c,0]() for c in self.cc_GS),"T_GS_C_1_I":sum(self.m.T_GS_C_I_CR_CC[i,c,1]() for c in self.cc_GS),"T_GS_C_2_I":sum(self.m.T_GS_C_I_CR_CC[i,c,2]() for c in self.cc_GS),"T_GS_C_3_I":sum(self.m.T_GS_C_I_CR_CC[i,c,3]() for c in self.cc_GS),"T_GS_C_4_I":sum(self.m.T_GS_C_I_CR_CC[i,c,4]() for c in self.cc_GS),"T_GS_C_5_I":sum(self.m.T_GS_C_I_CR_CC[i,c,5]() for c in self.cc_GS),"T_GS_C_6_I":sum(self.m.T_GS_C_I_CR_CC[i,c,6]() for c in self.cc_GS),
-                "T_HGS_I":self.m.T_HGS_I[i](),"T_CS_I":self.m.T_CS_I[i](),"T_RLTS_I":self.m.T_RLTS_I[i](),"S_OP_I":self.m.S_OP_I[i](),"S_T_HP_I":self.m.S_T_HP_I[i](),"S_T_HS_I":self.m.S_T_HS_I[i](),"S_T_HXH_I":self.m.S_T_HXH_I[i]() + self.m.S_T_HXH_b_I[i]() + self.m.S_T_HXH_w_I[i](),"S_T_HGC_I":self.m.S_T_HGC_I[i](),
-                "S_T_HXA_I":self.m.S_T_HXA_I[i](),"S_T_HXC_I":self.m.S_T_HXC_I[i]() + self.m.S_T_HXC_w_I[i]() + self.m.S_T_HXC_b_I[i](),"S_T_IS_I":sum(self.m.S_T_IS_W_I_WR[i,r]() for r in self.wr_IS)+sum(self.m.S_T_IS_C_I_CR[i,r]() for r in self.cr_IS),"S_T_GS_I":sum(sum(self.m.S_T_GS_W_I_WR_WC[i,c,r]() for r in self.wr_GS) for c in self.wc_GS)+sum(sum(self.m.S_T_GS_C_I_CR_CC[i,c,r]() for r in self.cr_GS)for c in self.cc_GS),
-                "S_T_HGS_I":self.m.S_T_HGS_I[i](),"S_T_CS_I":self.m.S_T_CS_I[i](),"S_T_RLTS_I":self.m.S_T_RLTS_I[i](),"q_dem_HS_I":self.q_dem_HS_I[i],"q_dem_CS_I":self.q_dem_CS_I[i],"q_dem_RLTS_I":self.q_dem_RLTS_I[i],"temp_amb_I":self.temp_amb_I[i],"B_T_HXAR_0_I":self.m.B_T_HXAR_N_I[0,i](),"B_T_HXAR_1_I":self.m.B_T_HXAR_N_I[1,i](),"B_T_HP_HXH_0_I":self.m.B_T_HP_HXH_N_I[0,i](),"B_T_HP_HXH_1_I":self.m.B_T_HP_HXH_N_I[1,i](),
-                "B_T_HP_HS_0_I":self.m.B_T_HP_HS_N_I[0,i](),"B_T_HP_HS_1_I":self.m.B_T_HP_HS_N_I[1,i](),"B_T_HXA_HXH_0_I":self.m.B_T_HXA_HXH_N_I[0,i](),"B_T_HXA_HXH_1_I":self.m.B_T_HXA_HXH_N_I[1,i](),"B_T_HXA_HGC_0_I":self.m.B_T_HXA_HGC_N_I[0,i](),"B_T_HXA_HGC_1_I":self.m.B_T_HXA_HGC_N_I[1,i](),"B_T_HS_IS_0_I":self.m.B_T_HS_IS_N_I[0,i](),"B_T_HS_IS_1_I":self.m.B_T_HS_IS_N_I[1,i](),
-                "B_T_HS_IS_0_I_2":self.m.B_T_HS_IS_N_I_2[0,i](),"B_T_HS_IS_1_I_2":self.m.B_T_HS_IS_N_I_2[1,i](),"B_T_HP_HGC_0_I":self.m.B_T_HP_HGC_N_I[0,i](),"B_T_HP_HGC_1_I":self.m.B_T_HP_HGC_N_I[1,i](),"B_T_HP_HGCHXC_0_I":self.m.B_T_HP_HGCHXC_N_I[0,i](),"B_T_HP_HGCHXC_1_I":self.m.B_T_HP_HGCHXC_N_I[1,i](),"B_T_HP_HGCHXC_0_2_I":self.m.B_T_HP_HGCHXC_N_2_I[0,i](),"B_T_HP_HGCHXC_1_2_I":self.m.B_T_HP_HGCHXC_N_2_I[1,i](),
-                "B_T_IS_HGS_0_I":self.m.B_T_IS_HGS_N_I[0,i](),"B_T_IS_HGS_1_I":self.m.B_T_IS_HGS_N_I[1,i](),"B_T_IS_HGS_0_I_2":self.m.B_T_IS_HGS_N_I_2[0,i](),"B_T_IS_HGS_1_I_2":self.m.B_T_IS_HGS_N_I_2[1,i](),"B_T_GS_HGS_0_I":self.m.B_T_GS_HGS_N_I[0,i](),"B_T_GS_HGS_1_I":self.m.B_T_GS_HGS_N_I[1,i](),"B_T_GS_CS_0_I":self.m.B_T_GS_CS_N_I[0,i](),"B_T_GS_CS_1_I":self.m.B_T_GS_CS_N_I[1,i](),
-                "B_T_GS_HGS_0_I_2":self.m.B_T_GS_HGS_N_I_2[0,i](),"B_T_GS_HGS_1_I_2":self.m.B_T_GS_HGS_N_I_2[1,i](),"B_T_GS_CS_0_I_2":self.m.B_T_GS_CS_N_I_2[0,i](),"B_T_GS_CS_1_I_2":self.m.B_T_GS_CS_N_I_2[1,i](),"B_T_HXC_HGS_0_I":self.m.B_T_HXC_HGS_N_I[0,i](),"B_T_HXC_HGS_1_I":self.m.B_T_HXC_HGS_N_I[1,i](),
-                "B_T_HXC_CS_0_I":self.m.B_T_HXC_CS_N_I[0,i](),"B_T_HXC_CS_1_I":self.m.B_T_HXC_CS_N_I[1,i](),"B_T_HXC_RLTS_0_I":self.m.B_T_HXC_RLTS_N_I[0,i](),"B_T_HXC_RLTS_1_I":self.m.B_T_HXC_RLTS_N_I[1,i]()}, ignore_index=True)
-             # Storage temperatures and slacks
-            self.safeFile = self.safeFile.append({"T_HP_HT_I":self.m.T_HP_HT_I[self.I[-1]](),"T_HP_LT_I":self.m.T_HP_LT_I[self.I[-1]](),"T_HS_I":self.m.T_HS_I[self.I[-1]](),"T_HXH_b_I":self.m.T_HXH_b_I[self.I[-1]](),"T_HXH_w_I":self.m.T_HXH_w_I[self.I[-1]](),"T_HGC_I":self.m.T_HGC_I[self.I[-1]](),
-            "T_HXA_I":self.m.T_HXA_I[self.I[-1]](),"T_HXC_b_I":self.m.T_HXC_b_I[self.I[-1]](),"T_HXC_w_I":self.m.T_HXC_w_I[self.I[-1]](),"T_IS_I":self.m.T_IS_I[self.I[-1]](),"T_ISw_I":(sum(self.m.T_IS_W_I_WR[self.I[-1],r]() for r in self.wr_IS)/len(self.wr_IS)),"T_ISc_I":(sum(self.m.T_IS_C_I_CR[self.I[-1],r]() for r in self.cr_IS)/len(self.cr_IS)),
-            "T_IS_W_0_I":self.m.T_IS_W_I_WR[self.I[-1],0](),"T_IS_W_1_I":self.m.T_IS_W_I_WR[self.I[-1],2](),"T_IS_W_2_I":self.m.T_IS_W_I_WR[self.I[-1],4](),"T_IS_C_0_I":self.m.T_IS_C_I_CR[self.I[-1],0](),"T_IS_C_1_I":self.m.T_IS_C_I_CR[self.I[-1],1](),"T_IS_C_2_I":self.m.T_IS_C_I_CR[self.I[-1],2](),"T_IS_C_3_I":self.m.T_IS_C_I_CR[self.I[-1],3](),"T_IS_C_4_I":self.m.T_IS_C_I_CR[self.I[-1],4](),
-            "T_GS_I":self.m.T_GS_I[self.I[-1]](),"T_GSw_I":(sum(sum(self.m.T_GS_W_I_WR_WC[self.I[-1],c,r]() for c in self.wc_GS) for r in self.wr_GS)/(len(self.wc_GS)*len(self.wr_GS))),"T_GSc_I":(sum(sum(self.m.T_GS_C_I_CR_CC[self.I[-1],c,r]() for r in self.cr_GS) for c in self.cc_GS)/(len(self.cr_GS)*len(self.cc_GS))),
-            "T_GS_W_0_I":sum(self.m.T_GS_W_I_WR_WC[self.I[-1],c,1]() for c in self.wc_GS),"T_GS_W_1_I":sum(self.m.T_GS_W_I_WR_WC[self.I[-1],c,3]() for c in self.wc_GS),"T_GS_W_2_I":sum(self.m.T_GS_W_I_WR_WC[self.I[-1],c,5]() for c in self.wc_GS),
-            "T_GS_C_0_I":sum(self.m.T_GS_C_I_CR_CC[self.I[-1],c,0]() for c in self.cc_GS),"T_GS_C_1_I":sum(self.m.T_GS_C_I_CR_CC[self.I[-1],c,1]() for c in self.cc_GS),"T_GS_C_2_I":sum(self.m.T_GS_C_I_CR_CC[self.I[-1],c,2]() for c in self.cc_GS),"T_GS_C_3_I":sum(self.m.T_GS_C_I_CR_CC[self.I[-1],c,3]() for c in self.cc_GS),"T_GS_C_4_I":sum(self.m.T_GS_C_I_CR_CC[self.I[-1],c,4]() for c in self.cc_GS),"T_GS_C_5_I":sum(self.m.T_GS_C_I_CR_CC[self.I[-1],c,5]() for c in self.cc_GS),"T_GS_C_6_I":sum(self.m.T_GS_C_I_CR_CC[self.I[-1],c,6]() for c in self.cc_GS),
-            "T_HGS_I":self.m.T_HGS_I[self.I[-1]](),"T_CS_I":self.m.T_CS_I[self.I[-1]](),"T_RLTS_I":self.m.T_RLTS_I[self.I[-1]](),"S_OP_I":self.m.S_OP_I[self.I[-1]](),"S_T_HP_I":self.m.S_T_HP_I[self.I[-1]](),"S_T_HS_I":self.m.S_T_HS_I[self.I[-1]](),"S_T_HXH_I":self.m.S_T_HXH_I[self.I[-1]]() + self.m.S_T_HXH_b_I[self.I[-1]]() + self.m.S_T_HXH_w_I[self.I[-1]](),"S_T_HGC_I":self.m.S_T_HGC_I[self.I[-1]](),
-            "S_T_HXA_I":self.m.S_T_HXA_I[self.I[-1]](),"S_T_HXC_I":self.m.S_T_HXC_I[self.I[-1]]() + self.m.S_T_HXC_w_I[self.I[-1]]() + self.m.S_T_HXC_b_I[self.I[-1]](),"S_T_IS_I":sum(self.m.S_T_IS_W_I_WR[self.I[-1],r]() for r in self.wr_IS)+sum(self.m.S_T_IS_C_I_CR[self.I[-1],r]() for r in self.cr_IS),"S_T_GS_I":sum(sum(self.m.S_T_GS_W_I_WR_WC[self.I[-1],c,r]() for r in self.wr_GS) for c in self.wc_GS)+sum(sum(self.m.S_T_GS_C_I_CR_CC[self.I[-1],c,r]() for r in self.cr_GS)for c in self.cc_GS),"S_T_HGS_I":self.m.S_T_HGS_I[self.I[-1]](),"S_T_CS_I":self.m.S_T_CS_I[i](),
-            "S_T_RLTS_I":self.m.S_T_RLTS_I[self.I[-1]]()}, ignore_index=True)
-           
+        "B_T_HXC_HGS_0_I","B_T_HXC_HGS_1_I","B_T_HXC_CS_0_I","B_T_HXC_CS_1_I","B_T_HXC_RLTS_0_I","B_T_HXC_RLTS_1_I"]
+        try:
+            ## All values are read column wise, rows are the time steps I (last row only holds storage temperatures and slacks)
+            results = {}
+            # Costs (everything but the last time step)
+            results["C_OP_I"] = getValueArray(self.m.C_OP_I,self.I)
+            if np.isnan(results["C_OP_I"][0:-1]).any():
+                raise RuntimeError("Optimization I didn't come to a solution.")
+            costFactor = getValueArray(self.m.c_ELECTRICITY_buy_I,self.I)*self.StepSizeInSec2/self.t_hour_in_sec
+            results["C_HP_I"] = getValueArray(self.m.E_HP_EL_in_I,self.I)*costFactor
+            results["C_HXA_I"] = getValueArray(self.m.E_HXA_EL_I,self.I)*costFactor
+            results["C_IS_I"] = getValueArray(self.m.E_IS_EL_I,self.I)*costFactor
+            results["C_GS_I"] = getValueArray(self.m.E_GS_EL_I,self.I)*costFactor
+            results["C_VP_I"] = getValueArray(self.m.E_VP_EL_I,self.I)*costFactor
+            # HP
+            B_HP = getValueArray(self.m.B_HP_H_I,self.H,self.I)
+            for h in self.H:
+                results["B_HP_"+str(h)+"_I"] = B_HP[h]
+            # Power flows
+            mdot_HP_w_H = np.array(self.mdot_HP_w_H)
+            mdot_HP_b_H = np.array(self.mdot_HP_b_H)
+            results["P_HP_HXH_I"] = self.c_w * mdot_HP_w_H.dot(getValueArray(self.m.Z_HP_HXH_H_I,self.H,self.I))
+            results["P_HP_HS_I"] = self.c_w * mdot_HP_w_H.dot(getValueArray(self.m.Z_HP_HS_H_I,self.H,self.I))
+            results["P_HP_HGC_H_I"] = self.c_b * mdot_HP_b_H.dot(getValueArray(self.m.Z_HP_HGC_H_I,self.H,self.I))
+            results["P_HP_HGCHXC_H_I"] = self.c_b * mdot_HP_b_H.dot(getValueArray(self.m.Z_HP_HGCHXC_H_I,self.H,self.I))
+            results["P_HP_HGC_2_H_I"] = self.c_b * mdot_HP_b_H.dot(getValueArray(self.m.Z_HP_HGC_2_H_I,self.H,self.I))
+            results["P_HP_HGCHXC_2_H_I"] = self.c_b * mdot_HP_b_H.dot(getValueArray(self.m.Z_HP_HGCHXC_2_H_I,self.H,self.I))
+            results["P_HXA_I"] = self.alpha_factor_HXA * self.c_a * self.mdot_HXA_a * getValueArray(self.m.W_HXA_I,self.I)
+            results["P_HXA_HXH_I"] = getValueArray(self.m.W_HXA_HXH_I,self.I) * self.mdot_HXA_b * self.c_b
+            results["P_HXA_HGC_I"] = getValueArray(self.m.W_HXA_HGC_I,self.I) * self.c_b * self.mdot_HXA_b
+            results["P_HS_IS_I"] = getValueArray(self.m.W_HS_IS_I,self.I) * self.c_w * self.mdot_IS_w
+            results["P_IS_HGS_I"] = getValueArray(self.m.W_IS_HGS_I,self.I) * self.c_w * self.mdot_IS_w
+            results["P_GS_HGS_I"] = getValueArray(self.m.W_GS_HGS_I,self.I) * self.c_w * self.mdot_GS_w
+            results["P_GS_CS_I"] = getValueArray(self.m.W_GS_CS_I,self.I) * self.c_w * self.mdot_GS_w
+            results["P_VP_HGS_I"] = getValueArray(self.m.W_HXC_HGS_I,self.I) * self.mdot_VP_tot * self.c_w
+            results["P_VP_CS_I"] = getValueArray(self.m.W_HXC_CS_I,self.I) * self.mdot_VP_tot * self.c_w
+            results["P_VP_RLTS_I"] = getValueArray(self.m.W_HXC_RLTS_I,self.I) * self.mdot_VP_tot * self.c_w
+            for name in ["E_HP_EL_I","Q_HP_HT_I","Q_HP_LT_I","E_HP_EL_in_I"]:
+                results[name] = getValueArray(getattr(self.m,name),self.I)
+            # Temperatures (all time steps)
+            for name in ["T_HP_HT_I","T_HP_LT_I","T_HS_I","T_HXH_I","T_HXH_b_I","T_HXH_w_I","T_HGC_I","T_HXA_I","T_HXC_I","T_HXC_b_I","T_HXC_w_I","T_IS_I"]:
+                results[name] = getValueArray(getattr(self.m,name),self.I)
+            T_IS_W = getValueArray(self.m.T_IS_W_I_WR,self.I,self.wr_IS)
+            T_IS_C = getValueArray(self.m.T_IS_C_I_CR,self.I,self.cr_IS)
+            results["T_ISw_I"] = T_IS_W.mean(axis=1)
+            results["T_ISc_I"] = T_IS_C.mean(axis=1)
+            for k,r in enumerate([0,2,4]):
+                results["T_IS_W_"+str(k)+"_I"] = T_IS_W[:,self.wr_IS.index(r)]
+            for r in range(0,5):
+                results["T_IS_C_"+str(r)+"_I"] = T_IS_C[:,self.cr_IS.index(r)]
+            results["T_GS_I"] = getValueArray(self.m.T_GS_I,self.I)
+            T_GS_W = getValueArray(self.m.T_GS_W_I_WR_WC,self.I,self.wc_GS,self.wr_GS)
+            T_GS_C = getValueArray(self.m.T_GS_C_I_CR_CC,self.I,self.cc_GS,self.cr_GS)
+            results["T_GSw_I"] = T_GS_W.mean(axis=(1,2))
+            results["T_GSc_I"] = T_GS_C.mean(axis=(1,2))
+            for k,r in enumerate([1,3,5]):
+                results["T_GS_W_"+str(k)+"_I"] = T_GS_W[:,:,self.wr_GS.index(r)].sum(axis=1)
+            for r in range(0,7):
+                results["T_GS_C_"+str(r)+"_I"] = T_GS_C[:,:,self.cr_GS.index(r)].sum(axis=1)
+            for name in ["T_HGS_I","T_CS_I","T_RLTS_I"]:
+                results[name] = getValueArray(getattr(self.m,name),self.I)
+            # Slacks (all time steps but the first)
+            for name in ["S_OP_I","S_T_HP_I","S_T_HS_I","S_T_HGC_I","S_T_HXA_I","S_T_HGS_I","S_T_CS_I","S_T_RLTS_I"]:
+                results[name] = getValueArray(getattr(self.m,name),self.I)
+            results["S_T_HXH_I"] = getValueArray(self.m.S_T_HXH_I,self.I) + getValueArray(self.m.S_T_HXH_b_I,self.I) + getValueArray(self.m.S_T_HXH_w_I,self.I)
+            results["S_T_HXC_I"] = getValueArray(self.m.S_T_HXC_I,self.I) + getValueArray(self.m.S_T_HXC_w_I,self.I) + getValueArray(self.m.S_T_HXC_b_I,self.I)
+            results["S_T_IS_I"] = getValueArray(self.m.S_T_IS_W_I_WR,self.I,self.wr_IS).sum(axis=1) + getValueArray(self.m.S_T_IS_C_I_CR,self.I,self.cr_IS).sum(axis=1)
+            results["S_T_GS_I"] = getValueArray(self.m.S_T_GS_W_I_WR_WC,self.I,self.wc_GS,self.wr_GS).sum(axis=(1,2)) + getValueArray(self.m.S_T_GS_C_I_CR_CC,self.I,self.cc_GS,self.cr_GS).sum(axis=(1,2))
+            for name in ["S_OP_I","S_T_HP_I","S_T_HS_I","S_T_HXH_I","S_T_HGC_I","S_T_HXA_I","S_T_HXC_I","S_T_IS_I","S_T_GS_I","S_T_HGS_I","S_T_CS_I","S_T_RLTS_I"]:
+                results[name][0] = np.nan
+            # Profiles
+            for name in ["q_dem_HS_I","q_dem_CS_I","q_dem_RLTS_I","temp_amb_I"]:
+                results[name] = getValueArray(getattr(self.m,name),self.I)
+            # McCormick binaries
+            for name in ["HXAR","HP_HXH","HP_HS","HXA_HXH","HXA_HGC","HS_IS","HP_HGC","HP_HGCHXC","IS_HGS","GS_HGS","GS_CS","HXC_HGS","HXC_CS","HXC_RLTS"]:
+                B_T = getValueArray(getattr(self.m,"B_T_"+name+"_N_I"),self.N_MC,self.I)
+                for n in [0,1]:
+                    results["B_T_"+name+"_"+str(n)+"_I"] = B_T[self.N_MC.index(n)]
+            for name in ["HS_IS","IS_HGS","GS_HGS","GS_CS"]:
+                B_T = getValueArray(getattr(self.m,"B_T_"+name+"_N_I_2"),self.N_MC,self.I)
+                for n in [0,1]:
+                    results["B_T_"+name+"_"+str(n)+"_I_2"] = B_T[self.N_MC.index(n)]
+            B_T = getValueArray(self.m.B_T_HP_HGCHXC_N_2_I,self.N_MC,self.I)
+            for n in [0,1]:
+                results["B_T_HP_HGCHXC_"+str(n)+"_2_I"] = B_T[self.N_MC.index(n)]
+
+            self.safeFile = pd.DataFrame(results,columns=columns)
             self.safeFile = self.safeFile.round(4)
             if singleFile == True:
                 source.setOptimizationResults(dataFrame=self.safeFile,savePath=savePath)
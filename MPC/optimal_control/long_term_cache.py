@@ -0,0 +1,68 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+
+class Long_Term_Cache():
+    ## Decides if the block of the long term model is rebuilt, gets new profiles or is reused as it is
+    ## Inputs are the frost flag, the heat demand and price profiles (6 hours) and the start temperatures of HS and GS (quantized)
+    ## The inputs are compared with the ones applied last, so a slow drift also leads to an update
+    def __init__(self,tolerance=0.05,quantization=0.5):
+        self.tolerance = tolerance
+        self.quantization = quantization
+        self.inputs = None
+        self.state = None
+
+    def getInputs(self,forecastFrost,profileForecastHeat,profileForecastPrice,T_HS_start,T_GS_start):
+        temperatures = np.round(np.array([T_HS_start] + list(T_GS_start),dtype=float) / self.quantization) * self.quantization
+        return {"frost":forecastFrost,"heat":np.array(profileForecastHeat,dtype=float),"price":np.array(profileForecastPrice,dtype=float),"temperatures":temperatures}
+
+    def getProfileChanged(self,old,new):
+        if old.size != new.size:
+            return True
+        if old.size == 0:
+            return False
+        return np.max(np.abs(new - old)) > self.tolerance * max(np.max(np.abs(old)),1e-10)
+
+    def getState(self,forecastFrost,profileForecastHeat,profileForecastPrice,T_HS_start,T_GS_start):
+        ## "rebuild" for the first call and another frost period, "update" if an input left its tolerance, otherwise "reuse"
+        inputs = self.getInputs(forecastFrost=forecastFrost,profileForecastHeat=profileForecastHeat,profileForecastPrice=profileForecastPrice,T_HS_start=T_HS_start,T_GS_start=T_GS_start)
+        if self.inputs is None or inputs["frost"] != self.inputs["frost"]:
+            self.state = "rebuild"
+        elif self.getProfileChanged(self.inputs["heat"],inputs["heat"]) or self.getProfileChanged(self.inputs["price"],inputs["price"]) or np.any(inputs["temperatures"] != self.inputs["temperatures"]):
+            self.state = "update"
+        else:
+            self.state = "reuse"
+        if self.state != "reuse":
+            self.inputs = inputs
+        return self.state
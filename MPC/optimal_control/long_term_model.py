@@ -37,6 +37,8 @@ import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from optimal_control.value_arrays import *
+
 class Long_Term_Model():
 
     def __init__(self):
@@ -150,12 +152,25 @@ class Long_Term_Model():
             self.m.Q_GS_W_C_J_WR_WC = pyo.Var(self.J,self.wc_GS,self.wr_GS, domain=pyo.Reals)
             self.m.T_GS_J = pyo.Var(self.J, domain=pyo.Reals)
             self.m.E_GS_EL_J = pyo.Var(self.J[0:-1], domain=pyo.NonNegativeReals)
+            ## Profiles (mutable, updated by updateProfiles if the model is reused)
+            self.m.q_dem_HS_J = pyo.Param(self.J[0:-1], initialize=dict(zip(self.J[0:-1],self.q_dem_HS_J)), mutable=True)
+            self.m.c_ELECTRICITY_buy_J = pyo.Param(self.J[0:-1], initialize=dict(zip(self.J[0:-1],self.c_ELECTRICITY_buy_J)), mutable=True)
         else:
             self.m.C_TOT_J_ = pyo.Var(domain=pyo.NonNegativeReals)
             self.m.S_TOT_J_ = pyo.Var(domain=pyo.NonNegativeReals)
             self.m.T_TOT_J_ = pyo.Var(domain=pyo.NonNegativeReals)
         return self.m
 
+    def updateProfiles(self,model):
+        self.m = model
+        if self.forecast_frost == True:
+            for j in self.J[0:-1]:
+                self.m.q_dem_HS_J[j] = self.q_dem_HS_J[j]
+                self.m.c_ELECTRICITY_buy_J[j] = self.c_ELECTRICITY_buy_J[j]
+        else:
+            pass
+        return self.m
+
     def setStartValues(self,model,T_HS_start,T_GS_w_1_start,T_GS_w_2_start,T_GS_w_3_start,T_GS_c_1_start,T_GS_c_2_start,T_GS_c_3_start,T_GS_c_4_start,T_GS_c_5_start,T_GS_c_6_start,T_GS_c_7_start):
         self.m = model
         if self.forecast_frost == True:
@@ -191,7 +206,7 @@ class Long_Term_Model():
             ## Cost constraints 
             self.m.Constraint_Cost_time_J = pyo.ConstraintList()
             for j in self.J[0:-1]:
-                self.m.Constraint_Cost_time_J.add(self.m.C_OP_J[j] == self.StepSizeInSec/self.t_hour_in_sec * (self.m.E_HP_EL_J[j] * self.c_ELECTRICITY_buy_J[j]))
+                self.m.Constraint_Cost_time_J.add(self.m.C_OP_J[j] == self.StepSizeInSec/self.t_hour_in_sec * (self.m.E_HP_EL_J[j] * self.m.c_ELECTRICITY_buy_J[j]))
 
             ## General Slack constraint
             self.m.Constraint_Slack_J = pyo.Constraint(expr = self.m.S_TOT_J_ == sum(self.m.S_OP_J[j] for j in self.J[1:]))
@@ -216,7 +231,7 @@ class Long_Term_Model():
             self.m.Constraint_HS_J.add(self.m.T_HS_J[0] == self.T_HS_start) ## Start temperature
 
             for j in self.J[0:-1]: 
-                self.m.Constraint_HS_J.add(self.m.T_HS_J[j+1] == self.m.T_HS_J[j] + self.StepSizeInSec * self.m.Q_HP_HT_J[j]/(self.m_HS_w * self.c_w) - self.StepSizeInSec * self.q_dem_HS_J[j]/(self.m_HS_w * self.c_w) + self.StepSizeInSec * self.alpha_HS_time * (self.t_default - self.m.T_HS_J[j+1])/(self.m_HS_w * self.c_w)) 
+                self.m.Constraint_HS_J.add(self.m.T_HS_J[j+1] == self.m.T_HS_J[j] + self.StepSizeInSec * self.m.Q_HP_HT_J[j]/(self.m_HS_w * self.c_w) - self.StepSizeInSec * self.m.q_dem_HS_J[j]/(self.m_HS_w * self.c_w) + self.StepSizeInSec * self.alpha_HS_time * (self.t_default - self.m.T_HS_J[j+1])/(self.m_HS_w * self.c_w)) 
 
             for j in self.J[1:]:
                 self.m.Constraint_HS_J.add(self.m.T_HS_J[j] <= self.T_HS_max + self.m.S_T_HS_J[j]) ## Temperature range tank
@@ -402,18 +417,21 @@ class Long_Term_Model():
     def getResults(self,model,source=None,savePath="",singleFile=False):
         self.m = model
         if self.forecast_frost == True:
-            self.safeFile = pd.DataFrame(columns = ["C_OP_J","E_HP_EL_J","Q_HP_HT_J","Q_HP_LT_J","T_HS_J","T_GS_J","S_OP_J","S_T_HS_J","S_T_GS_J","q_dem_HS_J"]) 
-            try: # Everything but slack constraints
-                self.safeFile = self.safeFile.append({"C_OP_J":self.m.C_OP_J[0](),"E_HP_EL_J":self.m.E_HP_EL_J[0](),"Q_HP_HT_J":self.m.Q_HP_HT_J[0](),"Q_HP_LT_J":self.m.Q_HP_LT_J[0](),
-                "T_HS_J":self.m.T_HS_J[0](),"T_GS_J":self.m.T_GS_J[0](),"q_dem_HS_J":self.q_dem_HS_J[0]}, ignore_index=True)
-                # ALL
-                for j in self.J[1:-1]:
-                    self.safeFile = self.safeFile.append({"C_OP_J":self.m.C_OP_J[j](),"E_HP_EL_J":self.m.E_HP_EL_J[j](),"Q_HP_HT_J":self.m.Q_HP_HT_J[j](),"Q_HP_LT_J":self.m.Q_HP_LT_J[j](),
-                    "T_HS_J":self.m.T_HS_J[j](),"T_GS_J":self.m.T_GS_J[j](),"S_OP_J":self.m.S_OP_J[self.J[-1]](),"S_T_HS_J":self.m.S_T_HS_J[self.J[-1]](),"S_T_GS_J":sum(sum(self.m.S_T_GS_W_J_WR_WC[j,c,r]() for r in self.wr_GS) for c in self.wc_GS)+sum(sum(self.m.S_T_GS_C_J_CR_CC[j,c,r]() for r in self.cr_GS)for c in self.cc_GS),"q_dem_HS_J":self.q_dem_HS_J[j]}, ignore_index=True)
-                # Storage temperatures and slacks
-                self.safeFile = self.safeFile.append({"T_HS_J":self.m.T_HS_J[self.J[-1]](),"T_GS_J":self.m.T_GS_J[self.J[-1]](),"S_OP_J":self.m.S_OP_J[self.J[-1]](),"S_T_HS_J":self.m.S_T_HS_J[self.J[-1]](),"S_T_GS_J":sum(sum(self.m.S_T_GS_W_J_WR_WC[self.J[-1],c,r]() for r in self.wr_GS) for c in self.wc_GS)+sum(sum(self.m.S_T_GS_C_J_CR_CC[self.J[-1],c,r]() for r in self.cr_GS)for c in self.cc_GS)}, ignore_index=True)
+            columns = ["C_OP_J","E_HP_EL_J","Q_HP_HT_J","Q_HP_LT_J","T_HS_J","T_GS_J","S_OP_J","S_T_HS_J","S_T_GS_J","q_dem_HS_J"]
+            try:
+                ## All values are read column wise, rows are the time steps J (last row only holds storage temperatures and slacks)
+                results = {}
+                for name in ["C_OP_J","E_HP_EL_J","Q_HP_HT_J","Q_HP_LT_J","T_HS_J","T_GS_J","S_OP_J","S_T_HS_J","q_dem_HS_J"]:
+                    results[name] = getValueArray(getattr(self.m,name),self.J)
+                if np.isnan(results["C_OP_J"][0:-1]).any():
+                    raise RuntimeError("Optimization J didn't come to a solution.")
+                results["S_T_GS_J"] = getValueArray(self.m.S_T_GS_W_J_WR_WC,self.J,self.wc_GS,self.wr_GS).sum(axis=(1,2)) + getValueArray(self.m.S_T_GS_C_J_CR_CC,self.J,self.cc_GS,self.cr_GS).sum(axis=(1,2))
+                # Slacks (all time steps but the first)
+                for name in ["S_OP_J","S_T_HS_J","S_T_GS_J"]:
+                    results[name][0] = np.nan
                 print("Frost Period added")
 
+                self.safeFile = pd.DataFrame(results,columns=columns)
                 self.safeFile = self.safeFile.round(4)
                 if singleFile == True:
                     source.setOptimizationResults(dataFrame=self.safeFile,savePath=savePath)
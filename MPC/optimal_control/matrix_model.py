@@ -0,0 +1,289 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numbers
+import numpy as np
+import pyomo.environ as pyo
+from pyomo.repn import generate_standard_repn
+from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+
+class Linear_Expression():
+    ## Linear expression of the matrix model: columns and coefficients of the variables and a constant
+    ## Built by the same arithmetic as the pyomo expressions, but without an expression tree
+    __slots__ = ("matrix","columns","coefficients","constant")
+    __hash__ = None
+
+    def __init__(self,matrix,columns,coefficients,constant=0.0):
+        self.matrix = matrix
+        self.columns = columns
+        self.coefficients = coefficients
+        self.constant = constant
+
+    def getScaled(self,factor):
+        return Linear_Expression(self.matrix,self.columns,[factor*c for c in self.coefficients],factor*self.constant)
+
+    def __add__(self,other):
+        if other.__class__ is float or other.__class__ is int:
+            return Linear_Expression(self.matrix,self.columns,self.coefficients,self.constant+other)
+        other = self.matrix.getLinear(other)
+        return Linear_Expression(self.matrix,self.columns+other.columns,self.coefficients+other.coefficients,self.constant+other.constant)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return self.getScaled(-1.0)
+
+    def __pos__(self):
+        return self
+
+    def __sub__(self,other):
+        if other.__class__ is float or other.__class__ is int:
+            return Linear_Expression(self.matrix,self.columns,self.coefficients,self.constant-other)
+        other = self.matrix.getLinear(other)
+        return Linear_Expression(self.matrix,self.columns+other.columns,self.coefficients+[-c for c in other.coefficients],self.constant-other.constant)
+
+    def __rsub__(self,other):
+        other = self.matrix.getLinear(other)
+        return Linear_Expression(self.matrix,other.columns+self.columns,other.coefficients+[-c for c in self.coefficients],other.constant-self.constant)
+
+    def __mul__(self,other):
+        if other.__class__ is float or other.__class__ is int:
+            return self.getScaled(other)
+        other = self.matrix.getLinear(other)
+        if len(other.columns) == 0:
+            return self.getScaled(other.constant)
+        if len(self.columns) == 0:
+            return other.getScaled(self.constant)
+        raise RuntimeError("Product of two variables, the matrix model is only linear.")
+
+    __rmul__ = __mul__
+
+    def __truediv__(self,other):
+        other = self.matrix.getLinear(other)
+        if len(other.columns) > 0:
+            raise RuntimeError("Division by a variable, the matrix model is only linear.")
+        return self.getScaled(1.0/other.constant)
+
+    def __le__(self,other):
+        expression = self - other
+        return Linear_Relation(expression,-np.inf,-expression.constant)
+
+    def __ge__(self,other):
+        expression = self - other
+        return Linear_Relation(expression,-expression.constant,np.inf)
+
+    def __eq__(self,other):
+        expression = self - other
+        return Linear_Relation(expression,-expression.constant,-expression.constant)
+
+class Linear_Relation():
+    ## Row of the matrix model: lower <= coefficients * columns <= upper
+    __slots__ = ("expression","lower","upper")
+
+    def __init__(self,expression,lower,upper):
+        self.expression = expression
+        self.lower = lower
+        self.upper = upper
+
+class Matrix_Var():
+    ## Indexed variable of the pyomo model, the entries are linear expressions of the matrix model
+    def __init__(self,matrix,var):
+        self.matrix = matrix
+        self.var = var
+        self.columns = {}
+
+    def __getitem__(self,index):
+        column = self.columns.get(index)
+        if column is None:
+            column = self.matrix.getVariable(self.var[index]).columns[0]
+            self.columns[index] = column
+        return Linear_Expression(self.matrix,[column],[1.0])
+
+class Matrix_Constraint_List():
+    ## Stands in for pyo.ConstraintList, the constraints are added as rows of the matrix model
+    def __init__(self,matrix,name):
+        self.matrix = matrix
+        self.name = name
+
+    def add(self,relation):
+        self.matrix.addRow(relation=relation,name=self.name)
+
+class Matrix_Model():
+    ## Stands in for the pyomo model while the constraints of a model object (e.g. Binary_Model) are set
+    ## Variables and parameters stay in the pyomo model, the constraints go directly into sparse rows (no pyomo constraints and expression trees)
+    ## The rows are solved together with the rest of the pyomo model (getMatrixProblem), the values are loaded back into the pyomo variables
+    def __init__(self,model):
+        object.__setattr__(self,"model",model)
+        object.__setattr__(self,"object",None)
+        object.__setattr__(self,"variables",[])
+        object.__setattr__(self,"variableColumns",{})
+        object.__setattr__(self,"constraintNames",[])
+        object.__setattr__(self,"rowColumns",[])
+        object.__setattr__(self,"rowCoefficients",[])
+        object.__setattr__(self,"rowPointer",[0])
+        object.__setattr__(self,"rowLower",[])
+        object.__setattr__(self,"rowUpper",[])
+
+    def __getattr__(self,name):
+        ## Only called on the first access, afterwards the variable or component is an attribute of the matrix model
+        component = getattr(self.model,name)
+        if getattr(component,"ctype",None) is pyo.Var:
+            if component.is_indexed() == False:
+                component = self.getVariable(component) ## the expressions are never changed in place
+            else:
+                component = Matrix_Var(self,component)
+        object.__setattr__(self,name,component) ## parameters and sets of the pyomo model as they are
+        return component
+
+    def __setattr__(self,name,value):
+        if isinstance(value,pyo.ConstraintList):
+            self.constraintNames.append(name)
+            object.__setattr__(self,name,Matrix_Constraint_List(self,name))
+        elif isinstance(value,pyo.Constraint):
+            self.constraintNames.append(name)
+            self.addRow(relation=value.rule(None,None),name=name)
+        else:
+            setattr(self.model,name,value)
+
+    def getVariable(self,var):
+        column = self.variableColumns.get(id(var))
+        if column is None:
+            column = len(self.variables)
+            self.variables.append(var)
+            self.variableColumns[id(var)] = column
+        return Linear_Expression(self,[column],[1.0])
+
+    def getLinear(self,other):
+        ## Numbers, parameters, variables and linear expressions of the pyomo model as linear expression of the matrix model
+        if other.__class__ is Linear_Expression:
+            return other
+        if other.__class__ is float or other.__class__ is int or isinstance(other,numbers.Number):
+            return Linear_Expression(self,[],[],float(other))
+        if other.is_potentially_variable() == False:
+            return Linear_Expression(self,[],[],float(pyo.value(other)))
+        if other.is_variable_type():
+            return self.getVariable(other)
+        repn = generate_standard_repn(other,compute_values=True,quadratic=False)
+        if repn.is_linear() == False:
+            raise RuntimeError("Nonlinear expression " + str(other) + ", the matrix model is only linear.")
+        expression = Linear_Expression(self,[],[],float(repn.constant))
+        for var,coefficient in zip(repn.linear_vars,repn.linear_coefs):
+            expression = expression + self.getVariable(var).getScaled(float(coefficient))
+        return expression
+
+    def addRow(self,relation,name=""):
+        if not isinstance(relation,Linear_Relation):
+            raise RuntimeError("Constraint " + str(name) + " is not a linear relation of the matrix model.")
+        self.rowColumns.extend(relation.expression.columns)
+        self.rowCoefficients.extend(relation.expression.coefficients)
+        self.rowPointer.append(len(self.rowColumns))
+        self.rowLower.append(relation.lower)
+        self.rowUpper.append(relation.upper)
+
+    def setConstraints(self,object):
+        ## Runs setConstraints of the model object against the matrix model, afterwards the object points to the pyomo model again
+        super().__setattr__("object",object)
+        try:
+            object.setConstraints(model=self)
+        finally:
+            object.m = self.model
+        return self
+
+    def getMatrix(self):
+        ## Rows as csr matrix over the variables of the matrix model (getVariables)
+        import scipy.sparse as sp
+        matrix = sp.csr_array((np.array(self.rowCoefficients,dtype=float),np.array(self.rowColumns,dtype=np.int32),np.array(self.rowPointer,dtype=np.int32)),shape=(len(self.rowLower),len(self.variables)))
+        matrix.sum_duplicates()
+        matrix.eliminate_zeros()
+        lower = np.array(self.rowLower,dtype=float)
+        upper = np.array(self.rowUpper,dtype=float)
+        empty = np.diff(matrix.indptr) == 0 ## only parameters or cancelled variables, skipped like in the standard form of pyomo
+        if np.any((lower[empty] > 1e-9) | (upper[empty] < -1e-9)):
+            raise RuntimeError("Infeasible constraint without variables in the matrix model.")
+        return matrix[~empty], lower[~empty], upper[~empty]
+
+    def getVariables(self):
+        return self.variables
+
+    def getStatistics(self):
+        return {"rows":len(self.rowLower),"columns":len(self.variables),"nonzeros":len(self.rowColumns)}
+
+    def deleteConstraints(self,model):
+        ## Removes the pyomo constraints of the model object, e.g. after they were built for a comparison with the matrix model
+        for name in self.constraintNames:
+            if model.find_component(name) is not None:
+                model.del_component(name)
+
+def getMatrixProblem(model,matrixModels):
+    ## Standard form of the pyomo model (active constraints and objective) together with the rows of the matrix models
+    ## Returns the variables of the columns, costs, bounds, integrality and the constraint matrix (csc)
+    import scipy.sparse as sp
+    standardForm = LinearStandardFormCompiler().write(model,mixed_form=True,set_sense=pyo.minimize)
+    variables = list(standardForm.columns)
+    variableColumns = {id(var):k for k,var in enumerate(variables)}
+    matrix = standardForm.A.tocsr()
+    matrices = [(matrix.data,matrix.indices,matrix.indptr)]
+    bounds = np.array([entry.bound_type for entry in standardForm.rows],dtype=int)
+    rhs = np.array(standardForm.rhs,dtype=float)
+    rowLower = [np.where(bounds == 1,-np.inf,rhs)]
+    rowUpper = [np.where(bounds == -1,np.inf,rhs)]
+    for matrixModel in matrixModels:
+        columns = np.empty(len(matrixModel.getVariables()),dtype=np.int32)
+        for k,var in enumerate(matrixModel.getVariables()):
+            if id(var) not in variableColumns:
+                variableColumns[id(var)] = len(variables)
+                variables.append(var)
+            columns[k] = variableColumns[id(var)]
+        matrix, lower, upper = matrixModel.getMatrix()
+        matrices.append((matrix.data,columns[matrix.indices],matrix.indptr))
+        rowLower.append(lower)
+        rowUpper.append(upper)
+    matrices = [sp.csr_array(matrix,shape=(len(matrix[2])-1,len(variables))) for matrix in matrices] ## all rows over the columns of all parts
+
+    cost = np.zeros(len(variables))
+    objective = standardForm.c.tocsr()
+    cost[objective.indices[objective.indptr[0]:objective.indptr[1]]] = objective.data[objective.indptr[0]:objective.indptr[1]]
+    lower = np.empty(len(variables))
+    upper = np.empty(len(variables))
+    integrality = np.zeros(len(variables),dtype=np.int32)
+    for k,var in enumerate(variables):
+        if var.fixed == True:
+            lower[k] = upper[k] = var.value
+        else:
+            lb, ub = var.bounds
+            lower[k] = -np.inf if lb is None else lb
+            upper[k] = np.inf if ub is None else ub
+        if var.is_integer() == True:
+            integrality[k] = 1
+    return {"variables":variables,"cost":cost,"offset":float(standardForm.c_offset[0]) if len(standardForm.c_offset) > 0 else 0.0,"lower":lower,"upper":upper,"integrality":integrality,
+            "matrix":sp.vstack(matrices,format="csc"),"rowLower":np.concatenate(rowLower),"rowUpper":np.concatenate(rowUpper)}
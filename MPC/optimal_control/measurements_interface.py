@@ -32,19 +32,26 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import numpy as np
-import pandas as pd
 from datetime import datetime
 from optimal_control.optimization_results_interface import *
+from optimal_control.plant_state import *
+
+## Columns of the measurements in the layout of Plant_State (temperatures, then HP, valve and pump states and VP)
+STANDARD_STATE = [45,10,35,20,30,25,22,22,22,16,16,16,14,12,30,30] + [1,0,0,0,0] + [0,1,1,0,0,0,0,0,0] + [1,0,0,0,0,0,0,0]
+SIM_TEMPERATURES = ["T_HP_HT_T","T_HP_LT_T","T_HS_T","T_HXA_T","T_HGC_T","T_HGS_T","T_ISw_T","T_ISc_T","T_ISc_T","T_GSw_T","T_GSc_T","T_GSc_T","T_CS_T","T_RLTS_T","T_HXH_T","T_HXC_T"]
+SIM_BINARIES = ["B_HP_" + str(i) + "_T" for i in range(5)] + ["B_HXH_HS_T","B_HGC_HGCHXC_T","B_HXA_T","B_HXH_HGC_T","B_HS_IS_T","B_IS_HGS_T","B_GS_HGS_T","B_GS_CS_T","B_GS_HGS_CS_T"] + ["B_VP_" + str(i) + "_T_1" for i in range(8)]
+DYMOLA_TEMPERATURES = ["T_hp_h_out","T_hp_c_out","T_hts","T_rc","T_header_rc","T_header_gs","T_chs_w","T_chs_c","T_chs_wc","T_gs_w","T_gs_c","T_gs_wc","T_lts","T_lts_dehum","T_hx_h","T_hx_c"]
+DYMOLA_MODES = ["HP_mode_ext","ST_mode_ext","HS_mode_ext","CS_mode_ext","AS_mode_ext","ASC_mode_ext","CHS_mode_ext","GS_mode_ext"]
 
 class Measurements_Interface():
 
-    def __init__(self,source="sim",loadPathMeasurements="",time="",timestamp=""):
+    def __init__(self,source="sim",loadPathMeasurements="",time="",timestamp="",buffer=None,resultsSource="csv"):
         self.started = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
         if time == "extern":
             self.started = timestamp
         self.source=source
         self.loadPathMeasurements = loadPathMeasurements
-        self.measurement_interface = Optimization_Results_Interface(source="csv",time="extern",timestamp=self.started)
+        self.measurement_interface = Optimization_Results_Interface(source=resultsSource,time="extern",timestamp=self.started,buffer=buffer) # reads the buffer first, the files (csv or store) only as fallback
 
     def getMeasurementHP_HT(self,update=True):
         if self.source == "standard":
@@ -472,44 +479,34 @@ class Measurements_Interface():
         return [self.B_VP_0,self.B_VP_1,self.B_VP_2,self.B_VP_3,self.B_VP_4,self.B_VP_5,self.B_VP_6,self.B_VP_7]
 
     def getMeasurementsAll(self,update=True):
+        ## Fills the plant state in one step per source, the columns are mapped to the fixed layout of Plant_State (same values as the single getMeasurement functions)
         if update == True:
             if self.source =="sim":
                 self.getLatestSimUpdate()
             elif self.source == "sim-dymola":
                 self.getLatestSimDymUpdate()
-        measurementHP_HT = self.getMeasurementHP_HT(update=False)
-        measurementHP_LT = self.getMeasurementHP_LT(update=False)
-        measurementHS = self.getMeasurementHS(update=False)
-        measurementHXA = self.getMeasurementHXA(update=False)
-        measurementHGC = self.getMeasurementHGC(update=False)
-        measurementHGS = self.getMeasurementHGS(update=False)
-        measurementISw = self.getMeasurementISw(update=False)
-        measurementISc = self.getMeasurementISc(update=False)
-        measurementISwc = self.getMeasurementISwc(update=False)
-        measurementGSw = self.getMeasurementGSw(update=False)
-        measurementGSc = self.getMeasurementGSc(update=False)
-        measurementGSwc = self.getMeasurementGSwc(update=False)
-        measurementCS = self.getMeasurementCS(update=False)
-        measurementRLTS = self.getMeasurementRLTS(update=False)
-        measurementHXH = self.getMeasurementHXH(update=False)
-        measurementHXC = self.getMeasurementHXC(update=False)
-        measurementHP = self.getMeasurementHP(update=False)
-        measurementHXH_HS = self.getMeasurementHXH_HS(update=False)
-        measurementHGC_HGCHXC = self.getMeasurementHGC_HGCHXC(update=False)
-        measurementHXAb = self.getMeasurementHXAb(update=False)
-        measurementHXH_HGC = self.getMeasurementHXH_HGC(update=False)
-        measurementHS_IS = self.getMeasurementHS_IS(update=False)
-        measurementIS_HGS = self.getMeasurementIS_HGS(update=False)
-        measurementGS_HGS = self.getMeasurementGS_HGS(update=False)
-        measurementGS_CS = self.getMeasurementGS_CS(update=False)
-        measurementGS_HGS_CS = self.getMeasurementGS_HGS_CS(update=False)
-        measurementVP = self.getMeasurementVP(update=False)
-        self.dictMeasurements = {"measurementHP_HT":measurementHP_HT,"measurementHP_LT":measurementHP_LT,"measurementHS":measurementHS,"measurementHXA":measurementHXA,"measurementHGC":measurementHGC,
-        "measurementHGS":measurementHGS,"measurementISw":measurementISw,"measurementISc":measurementISc,"measurementISwc":measurementISwc,"measurementGSw":measurementGSw,"measurementGSc":measurementGSc,"measurementGSwc":measurementGSwc,"measurementCS":measurementCS,"measurementRLTS":measurementRLTS,"measurementHXH":measurementHXH,"measurementHXC":measurementHXC,
-        "measurementHP":measurementHP,"measurementHXH_HS":measurementHXH_HS,"measurementHGC_HGCHXC":measurementHGC_HGCHXC,"measurementHXAb":measurementHXAb,"measurementHXH_HGC":measurementHXH_HGC,"measurementHS_IS":measurementHS_IS,
-        "measurementIS_HGS":measurementIS_HGS,"measurementGS_HGS":measurementGS_HGS,"measurementGS_CS":measurementGS_CS,"measurementGS_HGS_CS":measurementGS_HGS_CS,"measurementVP":measurementVP}
-        return self.dictMeasurements
+        plant_state = Plant_State()
+        if self.source == "standard":
+            plant_state.values[:] = STANDARD_STATE
+        elif self.source == "sim":
+            plant_state.setTemperatures(self.measurement_data[SIM_TEMPERATURES].iloc[1].to_numpy(dtype=float))
+            plant_state.values[Plant_State.SLICE_HP.start:] = self.measurement_data[SIM_BINARIES].iloc[0].to_numpy(dtype=float)
+        elif self.source == "sim-dymola":
+            plant_state.setTemperatures(self.measurement_data[DYMOLA_TEMPERATURES].iloc[0].to_numpy(dtype=float))
+            hp,st,hs,cs,asb,asc,chs,gs = self.measurement_data[DYMOLA_MODES].iloc[0].to_numpy(dtype=int)
+            plant_state.setHP(np.arange(Plant_State.N_HP) == hp)
+            plant_state.setVP(np.arange(Plant_State.N_VP) == st)
+            ## Modes of CHS and GS: bit 0 for the connection to HS or HGS, bit 1 for the connection to HGS or CS
+            plant_state.setStates([1-hs,cs,asb,1-asc,chs & 1,(chs >> 1) & 1,gs & 1,(gs >> 1) & 1,gs == 3])
+        self.plant_state = plant_state
+        return plant_state
     
+    def getCount(self):
+        return self.measurement_interface.getCount()
+
+    def setCount(self,count):
+        self.measurement_interface.setCount(count)
+
     def getLatestSimUpdate(self):
         measurement_data = self.measurement_interface.getOptimizationResults(savePath=self.loadPathMeasurements)
         self.measurement_interface.setOptimizationResults(onlySetCounter=True)
@@ -34,23 +34,30 @@
 from dymola.dymola_interface import DymolaInterface
 from dymola.dymola_exception import DymolaException
 from datetime import datetime
+from datetime import timedelta
 import pandas as pd
 import os
 import re
 
+from optimal_control.forecast_store import *
+
 class Modelica_Interface():
 
-    def __init__(self, simTimeStart="", simTimeStop="", packagePath="", modelName="",simOutputPath="",loadPathDemandsWeatherSIM="",loadPathDemandsMPC="",loadPathWeatherMPC=""):
+    def __init__(self, simTimeStart="", simTimeStop="", packagePath="", modelName="",simOutputPath="",loadPathDemandsWeatherSIM="",loadPathDemandsMPC="",loadPathWeatherMPC="",storePath=""):
         self.started = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
         self.packagePath = packagePath
         self.modelName = modelName
         self.simOutputPath = simOutputPath
 
         # Make demand and weather files for dymola
-        demands = pd.read_csv(loadPathDemandsMPC,index_col=0)
-        weather = pd.read_csv(loadPathWeatherMPC,index_col=0)
-        demands = demands.loc[simTimeStart:simTimeStop,]
-        weather = weather.loc[simTimeStart:simTimeStop,]
+        if storePath == "":
+            demands = pd.read_csv(loadPathDemandsMPC,index_col=0)
+            weather = pd.read_csv(loadPathWeatherMPC,index_col=0)
+            demands = demands.loc[simTimeStart:simTimeStop,]
+            weather = weather.loc[simTimeStart:simTimeStop,]
+        else: # only the simulation window is read from the forecast store (same store as Forecast_Interface)
+            demands = Forecast_Store(loadPath=loadPathDemandsMPC,storePath=os.path.join(storePath,"demand")).getDataFrame(timestampStart=simTimeStart,timestampEnd=pd.Timestamp(simTimeStop) + timedelta(seconds=1))
+            weather = Forecast_Store(loadPath=loadPathWeatherMPC,storePath=os.path.join(storePath,"weather")).getDataFrame(timestampStart=simTimeStart,timestampEnd=pd.Timestamp(simTimeStop) + timedelta(seconds=1))
         demands.index = range(0,len(demands.index)*120,120)
         weather.index = range(0,len(weather.index)*600,600)
 
@@ -37,6 +37,33 @@ import numpy as np
 import pandas as pd
 from datetime import datetime
 from datetime import timedelta
+import time
+import queue
+import multiprocessing
+from pyomo.core.expr import identify_variables
+
+from optimal_control.early_termination import *
+from optimal_control.matrix_model import *
+
+def solveRacer(number,racer,model,warmstart,timeLimit,threads,targetGap,resultsQueue):
+    ## Solves one solver setting of the race and returns the values of all variables through the queue
+    ## (module level function, so it can be run in a worker process)
+    result = {"racer":number,"solver":racer["solver"],"options":racer.get("options",{}),"solution":False,"statistics":{},"values":{}}
+    try:
+        options = dict(racer.get("options",{}))
+        gapOption = {0:"MIPGap",1:"ratioGap",2:"mipgap",3:"mip_rel_gap"}[racer["solver"]]
+        if gapOption not in options:
+            options[gapOption] = targetGap
+        optimal_control = Optimal_Control()
+        optimal_control.addModelParts(model=model)
+        optimal_control.setSolverAndRunOptimization(solver=racer["solver"],warmstart=warmstart,timeLimit=timeLimit,showSolverOutput=0,persistent=False,threads=threads,options=options)
+        result["solution"] = optimal_control.solutionAvailable
+        result["statistics"] = optimal_control.getSolverStatistics()
+        if optimal_control.solutionAvailable == True:
+            result["values"] = {var.name:var.value for var in model.component_data_objects(pyo.Var) if var.value is not None}
+    except Exception as e:
+        result["error"] = str(e)
+    resultsQueue.put(result)
 
 class Optimal_Control():
 
@@ -45,39 +72,138 @@ class Optimal_Control():
         self.m = pyo.ConcreteModel()
         self.position_symbol = {}
         self.position_object = {}
+        self.persistent_solvers = {}
+        self.solver_available = {}
+        self.solutionAvailable = False
+        self.solverUsed = None
+        self.solverChainLog = []
+        self.raceLog = []
+        self.raceStatistics = None
+        self.terminationReason = None
+        self.matrix_models = {}
+        self.matrixStatistics = None
+        self.link_sources = {}
     
-    def getModel(self):
-        return self.m
+    def getModel(self,symbol=None):
+        ## Without symbol the whole model, with symbol the block of the model object (added on first access)
+        if symbol is None:
+            return self.m
+        if self.m.component(symbol) is None:
+            self.m.add_component(symbol,pyo.Block())
+        return self.m.component(symbol)
+
+    def getModelPart(self,symbol):
+        ## Block of the model object or the model itself, if the object was built directly on the model
+        block = self.m.component(symbol)
+        if block is None:
+            return self.m
+        return block
     
     def addModelParts(self,model):
-        self.m = model
+        ## Blocks are already part of the model, only a new model replaces it
+        if model.parent_block() is None:
+            self.m = model
+
+    def getLinks(self,symbol,**links):
+        ## Boundary values from other blocks as link variables of the block (domain of the source variable), linked by the constraints Link_<symbol> of the model
+        ## The model objects only get variables of their own block, so the block can be deleted or taken over by another optimal control problem on its own
+        block = self.getModel(symbol)
+        if block.component("Link") is None:
+            block.Link = pyo.Var(pyo.Any,dense=False)
+        if self.m.component("Link_" + symbol) is None:
+            self.m.add_component("Link_" + symbol,pyo.Constraint(pyo.Any))
+        constraints = self.m.component("Link_" + symbol)
+        sources = self.link_sources.setdefault(symbol,{})
+        values = {}
+        for name,source in links.items():
+            if isinstance(source,(int,float)):
+                values[name] = source
+                continue
+            var = block.Link[name]
+            if source.is_variable_type() == True:
+                var.domain = source.domain
+            var.set_value(pyo.value(source,exception=False),skip_validation=True)
+            if name in constraints:
+                constraints[name].set_value(var == source)
+            else:
+                constraints[name] = var == source
+            sources[name] = set(v.parent_block().local_name for v in identify_variables(source))
+            values[name] = var
+        return values
+
+    def deleteBlock(self,symbol):
+        ## Removes a block with its links and matrix rows, e.g. to build the long term model again for another frost period
+        if self.m.component(symbol) is None:
+            return
+        self.m.del_component(symbol)
+        if self.m.component("Link_" + symbol) is not None:
+            self.m.del_component("Link_" + symbol)
+        self.link_sources.pop(symbol,None)
+        for target,sources in self.link_sources.items():
+            constraints = self.m.component("Link_" + target)
+            for name in [name for name,names in sources.items() if symbol in names]:
+                del constraints[name]
+                del sources[name]
+        self.matrix_models.pop(symbol,None)
+        if self.m.component("OBJ") is not None:
+            self.m.del_component("OBJ")
+
+    def setBlock(self,symbol,optimalControl):
+        ## Takes over the block of another optimal control problem (e.g. the cached long term model), its links are set again with getLinks
+        block = optimalControl.getModel(symbol)
+        optimalControl.deleteBlock(symbol)
+        self.deleteBlock(symbol)
+        self.m.add_component(symbol,block)
 
     def addModelObject(self,object,position=0, symbol=""):
         self.position_symbol[position] = symbol
         self.position_object[position] = object
         print("Added object " +str(symbol) + " at position " +str(position) +" to the optmimal control problem.")
 
-    def setObjective(self):
-        collectedModels = ""
+    def addMatrixModel(self,matrixModel,symbol=""):
+        ## Constraints of a model object as sparse rows (Matrix_Model), solved together with the pyomo model by highs
+        self.matrix_models[symbol] = matrixModel
 
-        for i in self.position_symbol.values():
-            collectedModels = collectedModels + " self.m.C_TOT_" +str(i) +"_ + self.m.S_TOT_" +str(i) +"_ + self.m.T_TOT_" +str(i) +"_ +"
-    
-        l = len(collectedModels)
-        collectedModels = collectedModels[:l-1]
-        collectedModels = collectedModels + " )"
+    def getObjectiveExpression(self,symbol):
+        ## Costs, slacks and toggles of a model object as expression OBJ_<symbol> of its block
+        model = self.getModelPart(symbol)
+        if model.component("OBJ_" + symbol) is None:
+            model.add_component("OBJ_" + symbol,pyo.Expression(expr=model.component("C_TOT_" + symbol + "_") + model.component("S_TOT_" + symbol + "_") + model.component("T_TOT_" + symbol + "_")))
+        return model.component("OBJ_" + symbol)
 
-        exec("self.m.OBJ = pyo.Objective(expr=" + str(collectedModels))
+    def setObjective(self):
+        objective = 0
+        for i in self.position_symbol.values():
+            objective = objective + self.getObjectiveExpression(symbol=str(i))
+        if self.m.component("OBJ") is not None:
+            self.m.del_component("OBJ")
+        self.m.OBJ = pyo.Objective(expr=objective)
         
-    def setSolverAndRunOptimization(self,solver = 0, warmstart = False, timeLimit = 180, showSolverOutput = 0, writeILP = 0, writeMPSfile = 0):
+    def setSolverAndRunOptimization(self,solver = 0, warmstart = False, timeLimit = 180, showSolverOutput = 0, writeILP = 0, writeMPSfile = 0, persistent = False, threads = 8, options = None, earlyTermination = None):
         print("### Main optimization started ###")
+        if options is None:
+            options = {}
+        self.raceStatistics = None
+        self.matrixStatistics = None
+        if earlyTermination is not None:
+            timeLimit = earlyTermination.getTimeLimit(timeLimit)
+        if len(self.matrix_models) > 0:
+            self.setMatrixSolverAndRunOptimization(solver=solver,warmstart=warmstart,timeLimit=timeLimit,showSolverOutput=showSolverOutput,writeMPSfile=writeMPSfile,threads=threads,options=options,earlyTermination=earlyTermination)
+            return
         if writeMPSfile == 1:
             self.m.write(filename = "WB.mps", io_options = {"symbolic_solver_labels":True})
 
+        if persistent == True:
+            if solver == 2:
+                print("No persistent interface for glpk available, solving without.")
+            else:
+                self.setPersistentSolverAndRunOptimization(solver=solver,warmstart=warmstart,timeLimit=timeLimit,showSolverOutput=showSolverOutput,writeILP=writeILP,threads=threads,earlyTermination=earlyTermination)
+                return
+
         if solver == 0:
             self.opt = pyo.SolverFactory('gurobi', solver_io="python")
             self.opt.options['TimeLimit'] = timeLimit
-            self.opt.options['threads'] = 8
+            self.opt.options['threads'] = threads
             #self.opt.options['MIPFocus'] = 1
             #self.opt.options['ObjBound'] = 50
             #self.opt.options['Cutoff'] = 500
@@ -90,24 +216,482 @@ class Optimal_Control():
             self.opt = pyo.SolverFactory('glpk')
             self.opt.options['tmlim'] = timeLimit
             #self.opt.options['mipgap'] = 1e-6 # not needed atm
+        elif solver == 3:
+            self.opt = pyo.SolverFactory('appsi_highs')
+            self.opt.options['time_limit'] = timeLimit
+            self.opt.options['threads'] = threads
+        for key,value in options.items():
+            self.opt.options[key] = value ## further options of the solver, e.g. seeds or emphasis
+        self.setEarlyTermination(solver=solver,earlyTermination=earlyTermination)
         
-        if writeILP == 1:
-            self.results = self.opt.solve(self.m,warmstart=warmstart,tee=True,symbolic_solver_labels=True) 
-        else:
-            self.results = self.opt.solve(self.m,warmstart=warmstart,tee=True)
+        try:
+            if writeILP == 1:
+                self.results = self.opt.solve(self.m,warmstart=warmstart,tee=True,load_solutions=False,symbolic_solver_labels=True) 
+            else:
+                self.results = self.opt.solve(self.m,warmstart=warmstart,tee=True,load_solutions=False)
+        finally:
+            self.removeEarlyTermination(solver=solver,earlyTermination=earlyTermination)
+        self.loadSolution(earlyTermination=earlyTermination)
+        self.setTerminationReason(earlyTermination=earlyTermination)
 
         if showSolverOutput == 1:
             print(self.results)
 
+    def setPersistentSolverAndRunOptimization(self,solver = 0, warmstart = False, timeLimit = 180, showSolverOutput = 0, writeILP = 0, threads = 8, earlyTermination = None):
+        ## The solver keeps its own copy of the model, following solves only push changed parameters, bounds and constraints
+        ## One instance per solver, so a fallback in the solver chain doesn't drop the instance of the first solver
+        if solver not in self.persistent_solvers:
+            if solver == 0:
+                self.opt = pyo.SolverFactory('appsi_gurobi')
+                self.opt.options['threads'] = threads
+                #self.opt.options['MIPFocus'] = 1
+                if writeILP == 1:
+                    self.opt.options['resultFile'] = 'test.ilp'
+            elif solver == 1:
+                self.opt = pyo.SolverFactory('appsi_cbc')
+            elif solver == 3:
+                self.opt = pyo.SolverFactory('appsi_highs')
+                self.opt.options['threads'] = threads
+            self.persistent_solvers[solver] = self.opt
+        self.opt = self.persistent_solvers[solver]
+        if solver == 3:
+            highs = self.getHighsInstance()
+            if highs is None:
+                print("No highs instance of the persistent interface available, solving without.")
+                del self.persistent_solvers[solver]
+                self.setSolverAndRunOptimization(solver=solver,warmstart=warmstart,timeLimit=timeLimit,showSolverOutput=showSolverOutput,writeILP=writeILP,persistent=False,threads=threads,earlyTermination=earlyTermination)
+                return
+            if not any(var.is_integer() for var in self.m.component_data_objects(pyo.Var,active=True) if not var.fixed):
+                timeLimit = timeLimit + highs.getRunTime() ## highs limits a linear program by the run time of all runs of the instance, a mixed integer program per run
+
+        self.setEarlyTermination(solver=solver,earlyTermination=earlyTermination)
+        try:
+            self.results = self.opt.solve(self.m,warmstart=warmstart,tee=True,timelimit=timeLimit,load_solutions=False,symbolic_solver_labels=(writeILP == 1))
+        finally:
+            self.removeEarlyTermination(solver=solver,earlyTermination=earlyTermination)
+        self.loadSolution(earlyTermination=earlyTermination)
+        self.setTerminationReason(earlyTermination=earlyTermination)
+
+        if showSolverOutput == 1:
+            print(self.results)
+
+    def setMatrixSolverAndRunOptimization(self,solver = 3, warmstart = False, timeLimit = 180, showSolverOutput = 0, writeMPSfile = 0, threads = 8, options = None, earlyTermination = None):
+        ## The pyomo model and the rows of the matrix models are passed to highs as arrays (passModel), the solution is loaded into the pyomo variables
+        if solver != 3:
+            raise RuntimeError("The matrix models are only solved by highs (solver 3).")
+        if options is None:
+            options = {}
+        import highspy
+        problem = getMatrixProblem(self.m,[matrixModel for matrixModel in self.matrix_models.values() if matrixModel.model.active == True])
+        matrix = problem["matrix"]
+        self.opt = highspy.Highs()
+        self.opt.setOptionValue("output_flag",True)
+        self.opt.setOptionValue("time_limit",float(timeLimit))
+        self.opt.setOptionValue("threads",int(threads))
+        for key,value in options.items():
+            self.opt.setOptionValue(key,value)
+        self.opt.passModel(len(problem["variables"]),matrix.shape[0],matrix.nnz,1,1,problem["offset"],problem["cost"],problem["lower"],problem["upper"],problem["rowLower"],problem["rowUpper"],
+            matrix.indptr.astype(np.int32),matrix.indices.astype(np.int32),matrix.data,problem["integrality"]) ## column wise, minimize
+        if writeMPSfile == 1:
+            self.opt.writeModel("WB.mps")
+        if warmstart == True:
+            index = [k for k,var in enumerate(problem["variables"]) if var.value is not None]
+            self.opt.setSolution(len(index),np.array(index,dtype=np.int32),np.array([problem["variables"][k].value for k in index],dtype=float))
+
+        if earlyTermination is not None:
+            earlyTermination.start()
+            if earlyTermination.gap is not None:
+                self.opt.setOptionValue("mip_rel_gap",float(earlyTermination.gap))
+            earlyTermination.setHighsCallback(self.opt)
+        try:
+            self.opt.run()
+        finally:
+            if earlyTermination is not None:
+                earlyTermination.removeHighsCallback(self.opt)
+
+        info = self.opt.getInfo()
+        self.results = None
+        self.solutionAvailable = info.primal_solution_status == 2 ## feasible
+        if self.solutionAvailable == True:
+            for var,value in zip(problem["variables"],self.opt.getSolution().col_value):
+                if var.fixed == False:
+                    var.set_value(value,skip_validation=True)
+        termination = self.opt.modelStatusToString(self.opt.getModelStatus())
+        termination = {"Optimal":"optimal","Time limit reached":"maxTimeLimit","Infeasible":"infeasible","Interrupted by user":"interrupted","Unknown":"unknown"}.get(termination,termination)
+        self.matrixStatistics = {"termination":termination,"objective":None,"bound":None,"gap":None,"reason":None}
+        if self.solutionAvailable == True:
+            self.matrixStatistics["objective"] = info.objective_function_value
+            if info.mip_node_count >= 0 and np.isfinite(info.mip_dual_bound):
+                self.matrixStatistics["bound"] = info.mip_dual_bound
+            elif termination == "optimal":
+                self.matrixStatistics["bound"] = info.objective_function_value ## linear program
+            if self.matrixStatistics["bound"] is not None:
+                self.matrixStatistics["gap"] = abs(info.objective_function_value - self.matrixStatistics["bound"]) / max(abs(info.objective_function_value),1e-10)
+        self.setTerminationReason(earlyTermination=earlyTermination)
+
+        if showSolverOutput == 1:
+            print(self.matrixStatistics)
+
+    def getMatrixValidation(self,pyomoSolver = 3, timeLimit = 180, threads = 8):
+        ## Solves the problem with the matrix models and with the same constraints built by pyomo and compares the objective values
+        ## The matrix models are always solved by highs, pyomoSolver only sets the solver of the pyomo build
+        ## The pyomo constraints are removed afterwards, the variables keep the values of the pyomo build
+        self.setSolverAndRunOptimization(solver=3,timeLimit=timeLimit,persistent=False,threads=threads)
+        objectiveMatrix = self.getSolverStatistics()["objective"]
+        matrixModels = self.matrix_models
+        self.matrix_models = {}
+        try:
+            for matrixModel in matrixModels.values():
+                self.addModelParts(matrixModel.object.setConstraints(model=matrixModel.model))
+            self.setSolverAndRunOptimization(solver=pyomoSolver,timeLimit=timeLimit,persistent=False,threads=threads)
+            objectivePyomo = self.getSolverStatistics()["objective"]
+        finally:
+            for matrixModel in matrixModels.values():
+                matrixModel.deleteConstraints(matrixModel.model)
+            self.matrix_models = matrixModels
+        validation = {"matrix":objectiveMatrix,"pyomo":objectivePyomo,"deviation":None}
+        if objectiveMatrix is not None and objectivePyomo is not None:
+            validation["deviation"] = abs(objectiveMatrix - objectivePyomo) / max(abs(objectivePyomo),1e-10)
+        print("Objective of the matrix models " + str(objectiveMatrix) + ", of the pyomo build " + str(objectivePyomo) + ".")
+        return validation
+
+    def setEarlyTermination(self,solver,earlyTermination):
+        ## The gap goes to the solver as option, the stall criterion is checked in the callbacks of highs and gurobi (appsi interfaces)
+        if earlyTermination is None:
+            return
+        earlyTermination.start()
+        if earlyTermination.gap is not None:
+            self.opt.options[{0:"MIPGap",1:"ratioGap",2:"mipgap",3:"mip_rel_gap"}[solver]] = earlyTermination.gap
+        try:
+            if solver == 3:
+                earlyTermination.setHighsCallback(self.getHighsInstance())
+            elif solver == 0 and hasattr(self.opt,"set_callback"):
+                self.opt.set_callback(earlyTermination.getGurobiCallback())
+        except:
+            print("No callback for the early termination of solver " + str(solver) + ", only the gap is used.")
+
+    def removeEarlyTermination(self,solver,earlyTermination):
+        if earlyTermination is None:
+            return
+        try:
+            if solver == 3:
+                earlyTermination.removeHighsCallback(self.getHighsInstance(instance=False))
+            elif solver == 0 and hasattr(self.opt,"set_callback"):
+                self.opt.set_callback(None)
+        except:
+            pass
+
+    def getHighsInstance(self,instance=True):
+        ## highspy instance behind the appsi interface of highs, only reachable by its private attributes _solver_model and _model (checked with Pyomo 6.10.1, highspy 1.15.1)
+        ## None if the interface has no such attributes (other Pyomo releases), the instance is built for the current model if instance is True
+        if hasattr(self.opt,"_solver_model") == False or hasattr(self.opt,"_model") == False:
+            return None
+        if instance == True and (self.opt._solver_model is None or self.opt._model is not self.m):
+            self.opt.set_instance(self.m)
+        return self.opt._solver_model
+
+    def setTerminationReason(self,earlyTermination=None):
+        ## gap, stall or deadline of the early termination, otherwise the termination condition of the solver
+        self.terminationReason = None
+        if earlyTermination is not None:
+            self.terminationReason = earlyTermination.getReason()
+        if self.terminationReason is None:
+            self.terminationReason = self.getSolverStatistics()["termination"]
+            if self.terminationReason == "maxTimeLimit" and earlyTermination is not None and earlyTermination.getDeadlineLimit() == True:
+                self.terminationReason = "deadline" ## time limit of the solver from the deadline
+            elif self.terminationReason == "optimal" and earlyTermination is not None and earlyTermination.gap is not None:
+                gap = self.getSolverStatistics()["gap"]
+                if gap is not None and gap > 1e-6:
+                    self.terminationReason = "gap" ## stopped by the gap option of the solver
+
+    def loadSolution(self,earlyTermination=None):
+        ## Only a found solution is loaded, without one the variables would keep the values of the last optimization
+        self.solutionAvailable = len(self.results.solution) > 0
+        if self.solutionAvailable == True:
+            if hasattr(self.opt,"load_vars"):
+                self.opt.load_vars()
+            else:
+                self.m.solutions.load_from(self.results)
+        elif earlyTermination is not None and earlyTermination.getReason() is not None and hasattr(self.opt,"load_vars"):
+            try:
+                self.opt.load_vars() ## HiGHS reports an interrupted run without solution, but keeps the incumbent (error without)
+                self.solutionAvailable = True
+                self.results.problem.upper_bound = earlyTermination.incumbent
+            except RuntimeError:
+                pass
+
+    def getSolverAvailable(self,solver,persistent=False):
+        if len(self.matrix_models) > 0 and solver != 3:
+            return False ## the matrix models are only solved by highs
+        if (solver,persistent) not in self.solver_available:
+            if solver == 4:
+                available = self.getSolverAvailable(3) or self.getSolverAvailable(2)
+            else:
+                try:
+                    if solver == 0:
+                        opt = pyo.SolverFactory('appsi_gurobi') if persistent == True else pyo.SolverFactory('gurobi', solver_io="python")
+                    elif solver == 1:
+                        opt = pyo.SolverFactory('appsi_cbc') if persistent == True else pyo.SolverFactory('cbc')
+                    elif solver == 2:
+                        opt = pyo.SolverFactory('glpk')
+                    elif solver == 3:
+                        opt = pyo.SolverFactory('appsi_highs')
+                    available = bool(opt.available(exception_flag=False))
+                except:
+                    available = False
+            self.solver_available[(solver,persistent)] = available
+        return self.solver_available[(solver,persistent)]
+
+    def getRoundingGroups(self,binaries):
+        ## Binaries of the binary model (T) per step in the groups that are rounded together: the one-hot binaries of an indexed variable (stages of HP, positions of VP) and the single binaries
+        steps = {}
+        for var in binaries:
+            if var.parent_component().name.endswith(("_T","_T_1","_T_2")):
+                index = var.index()
+                step = index[-1] if isinstance(index,tuple) else index
+                group = var.parent_component().name if isinstance(index,tuple) else var.name
+                steps.setdefault(step,{}).setdefault(group,[]).append(var)
+        return {step:list(groups.values()) for step,groups in steps.items()}
+
+    def getRoundingCandidates(self,group):
+        ## Integer values of a group, the closest to the relaxed values first: the one-hot choices by their relaxed value, a single binary rounded and then the other value
+        values = [var.value if var.value is not None else 0 for var in group]
+        if len(group) > 1:
+            return [[1 if k == j else 0 for k in range(0,len(group))] for j in sorted(range(0,len(group)),key=lambda j: -values[j])]
+        return [[round(values[0])],[1 - round(values[0])]]
+
+    def setRelaxedSolverAndRunOptimization(self, timeLimit = 180, showSolverOutput = 0, threads = 8):
+        ## Last resort: the binaries are relaxed to [0,1] and rounded step by step along the binary model (T) as long as the linear program stays feasible
+        ## A step is first rounded at once (one-hot groups to their largest value), if the linear program gets infeasible, the groups of the step are fixed one by one (dive)
+        ## and the next value of a group is tried when a fix makes it infeasible, so the start values and the toggle constraints are taken into account
+        ## The later steps that can't be rounded keep the relaxed values, without rounded first step there is no solution (it is applied to the plant)
+        solver = 3 if self.getSolverAvailable(3) == True else 2
+        deadline = time.monotonic() + timeLimit
+        binaries = [var for var in self.m.component_data_objects(pyo.Var,active=True) if var.is_binary() and not var.fixed]
+        variables = list(self.m.component_data_objects(pyo.Var,active=True))
+        steps = self.getRoundingGroups(binaries)
+        try:
+            for var in binaries:
+                var.domain = pyo.UnitInterval
+            self.setLinearSolverAndRunOptimization(solver=solver,deadline=deadline,showSolverOutput=showSolverOutput,threads=threads)
+            if self.solutionAvailable == False:
+                return
+            roundedSteps = 0
+            for step in sorted(steps):
+                if deadline - time.monotonic() < 1:
+                    break
+                groups = [[var for var in group if not var.fixed] for group in steps[step]]
+                groups = [group for group in groups if len(group) > 0]
+                feasibleResults = self.results
+                feasibleValues = [var.value for var in variables] ## rounding overwrites the values of the last feasible linear program
+                for group in groups:
+                    for var,value in zip(group,self.getRoundingCandidates(group)[0]):
+                        var.fix(value)
+                self.setLinearSolverAndRunOptimization(solver=solver,deadline=deadline,showSolverOutput=showSolverOutput,threads=threads)
+                if self.solutionAvailable == False:
+                    self.resetRounding(groups=groups,variables=variables,values=feasibleValues,results=feasibleResults)
+                    self.solutionAvailable = self.setDivingAndRunOptimization(groups=groups,solver=solver,deadline=deadline,showSolverOutput=showSolverOutput,threads=threads)
+                if self.solutionAvailable == False:
+                    self.resetRounding(groups=groups,variables=variables,values=feasibleValues,results=feasibleResults)
+                    break
+                roundedSteps = roundedSteps + 1
+            print("Relaxed optimization with rounded binaries in " + str(roundedSteps) + " of " + str(len(steps)) + " steps.")
+            self.solutionAvailable = roundedSteps > 0 or len(steps) == 0
+            self.terminationReason = "rounded" if self.solutionAvailable == True else "infeasible"
+        finally:
+            for var in binaries:
+                if var.fixed:
+                    var.unfix()
+                var.domain = pyo.Binary
+
+    def setDivingAndRunOptimization(self,groups,solver,deadline,showSolverOutput=0,threads=8):
+        ## Fixes the groups one by one, the most decided first, and tries the values of a group until the linear program stays feasible
+        ## A group that already has integer values in the linear program is fixed without a solve, returns False if a group has no feasible value
+        variables = list(self.m.component_data_objects(pyo.Var,active=True))
+        remaining = list(range(0,len(groups)))
+        while len(remaining) > 0:
+            k = min(remaining,key=lambda k: max(min(var.value,1 - var.value) if var.value is not None else 0.5 for var in groups[k])) ## least fractional group
+            remaining.remove(k)
+            group = groups[k]
+            candidates = self.getRoundingCandidates(group)
+            if all(var.value is not None and abs(var.value - value) < 1e-6 for var,value in zip(group,candidates[0])):
+                for var,value in zip(group,candidates[0]):
+                    var.fix(value)
+                continue
+            feasibleResults = self.results
+            feasibleValues = [var.value for var in variables]
+            for candidate in candidates:
+                if deadline - time.monotonic() < 1:
+                    return False
+                for var,value in zip(group,candidate):
+                    var.fix(value)
+                self.setLinearSolverAndRunOptimization(solver=solver,deadline=deadline,showSolverOutput=showSolverOutput,threads=threads)
+                if self.solutionAvailable == True:
+                    break
+                self.resetRounding(groups=[],variables=variables,values=feasibleValues,results=feasibleResults)
+            if self.solutionAvailable == False:
+                return False
+        return True
+
+    def setLinearSolverAndRunOptimization(self,solver,deadline,showSolverOutput=0,threads=8):
+        ## Linear program of the relaxed optimization until the deadline, only an optimal solution is feasible (the values of a simplex stopped at the time limit are not)
+        self.setSolverAndRunOptimization(solver=solver,warmstart=False,timeLimit=max(1,int(deadline-time.monotonic())),showSolverOutput=showSolverOutput,persistent=True,threads=threads)
+        if self.getSolverStatistics()["termination"] != "optimal":
+            self.solutionAvailable = False
+
+    def resetRounding(self,groups,variables,values,results):
+        ## Unfixes the groups and restores the values and results of the last feasible linear program
+        for group in groups:
+            for var in group:
+                var.unfix()
+        for var,value in zip(variables,values):
+            var.set_value(value,skip_validation=True)
+        self.results = results
+
+    def setRaceAndRunOptimization(self, racers, deadline = None, targetGap = 0.01, warmstart = False, timeLimit = 180, threads = 8, grace = 5):
+        ## The model is solved with every solver setting of racers in parallel processes, e.g. [{"solver":3,"options":{"random_seed":1}},{"solver":1}]
+        ## The first solution within targetGap wins and the other processes are stopped, otherwise the best solution at the deadline is taken
+        if len(self.matrix_models) > 0:
+            raise RuntimeError("The race only solves the pyomo model, not the matrix models.")
+        if deadline is None:
+            deadline = time.monotonic() + timeLimit
+        self.solutionAvailable = False
+        self.raceStatistics = None
+        self.raceLog = []
+        racers = [racer for racer in racers if self.getSolverAvailable(racer["solver"]) == True]
+        if len(racers) == 0:
+            print("No solver of the race is available.")
+            return False
+        raceLimit = max(1,int(min(deadline-time.monotonic()-grace,timeLimit)))
+        threadsRacer = max(1,int(threads/len(racers)))
+        resultsQueue = multiprocessing.Queue()
+        processes = []
+        for j,racer in enumerate(racers):
+            process = multiprocessing.Process(target=solveRacer,args=(j,racer,self.m,warmstart,raceLimit,threadsRacer,targetGap,resultsQueue),daemon=True)
+            process.start()
+            processes.append(process)
+        print("### Race of " + str(len(processes)) + " solver settings started ###")
+
+        timeStart = time.monotonic()
+        winner = None
+        while len(self.raceLog) < len(processes):
+            try:
+                result = resultsQueue.get(timeout=max(0.1,raceLimit+grace-(time.monotonic()-timeStart)))
+            except queue.Empty:
+                print("Race stopped at the deadline.")
+                break
+            result["seconds"] = time.monotonic() - timeStart
+            self.raceLog.append(result)
+            gap = result["statistics"].get("gap")
+            if result["solution"] == True and (result["statistics"].get("termination") == "optimal" or (gap is not None and gap <= targetGap)):
+                winner = result
+                break
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+        if winner is None:
+            candidates = [result for result in self.raceLog if result["solution"] == True and result["statistics"].get("objective") is not None]
+            if len(candidates) > 0:
+                winner = min(candidates,key=lambda result: result["statistics"]["objective"]) ## best incumbent at the deadline
+        if winner is None:
+            print("No solver of the race came to a solution.")
+            return False
+
+        variables = {var.name:var for var in self.m.component_data_objects(pyo.Var)}
+        for name,value in winner["values"].items():
+            variables[name].set_value(value,skip_validation=True)
+        self.solutionAvailable = True
+        self.raceStatistics = winner["statistics"]
+        print("Race won by solver " + str(winner["solver"]) + " with options " + str(winner["options"]) + " after " + str(round(winner["seconds"],2)) + " seconds.")
+        return True
+
+    def getRaceLog(self):
+        return [{key:value for key,value in result.items() if key != "values"} for result in self.raceLog]
+
+    def setSolverChainAndRunOptimization(self, solvers = None, deadline = None, share = 0.6, warmstart = False, timeLimit = 180, showSolverOutput = 0, persistent = False, threads = 8, racers = None, targetGap = 0.01, gap = None, stallTime = None):
+        ## The solvers are tried in the given order until one comes to a solution (0 gurobi, 1 cbc, 2 glpk, 3 highs, 4 relaxed and rounded, 5 race of racers)
+        ## Every solver gets the share of the time left until the deadline (time.monotonic()), the last one all of it, but never more than timeLimit
+        ## The solvers stop early at the relative mip gap or after stallTime seconds without a better incumbent (Early_Termination)
+        if solvers is None:
+            solvers = [0,3,1,4]
+        if racers is None:
+            racers = []
+        if deadline is None:
+            deadline = time.monotonic() + timeLimit
+        self.solutionAvailable = False
+        self.solverUsed = None
+        self.solverChainLog = []
+        for k,solver in enumerate(solvers):
+            remaining = deadline - time.monotonic()
+            if remaining < 1:
+                print("No time left for solver " + str(solver) + " of the solver chain.")
+                break
+            if solver != 5 and self.getSolverAvailable(solver,persistent=persistent) == False:
+                print("Solver " + str(solver) + " of the solver chain is not available.")
+                continue
+            if k < len(solvers)-1:
+                remaining = remaining * share
+            stageLimit = max(1,int(min(remaining,timeLimit)))
+            timeStart = time.monotonic()
+            try:
+                if solver == 4:
+                    self.setRelaxedSolverAndRunOptimization(timeLimit=stageLimit,showSolverOutput=showSolverOutput,threads=threads)
+                elif solver == 5:
+                    self.setRaceAndRunOptimization(racers=racers,deadline=time.monotonic()+stageLimit,targetGap=targetGap,warmstart=warmstart,timeLimit=stageLimit,threads=threads)
+                else:
+                    earlyTermination = None
+                    if gap is not None or stallTime is not None:
+                        earlyTermination = Early_Termination(gap=gap,stallTime=stallTime,deadline=time.monotonic()+stageLimit)
+                    self.setSolverAndRunOptimization(solver=solver,warmstart=warmstart,timeLimit=stageLimit,showSolverOutput=showSolverOutput,persistent=persistent,threads=threads,earlyTermination=earlyTermination)
+            except Exception as e:
+                print("Solver " + str(solver) + " of the solver chain failed: " + str(e))
+                self.solutionAvailable = False
+            self.solverChainLog.append({"solver":solver,"timeLimit":stageLimit,"seconds":time.monotonic()-timeStart,"solution":self.solutionAvailable,"reason":self.terminationReason})
+            if self.solutionAvailable == True:
+                self.solverUsed = solver
+                if k > 0:
+                    print("Solution of the solver chain from fallback solver " + str(solver) + ".")
+                return True
+            print("Solver " + str(solver) + " of the solver chain came to no solution, trying the next one.")
+        print("No solver of the solver chain came to a solution.")
+        return False
+
+    def getSolverChainLog(self):
+        return self.solverChainLog
+
+    def getSolverStatistics(self):
+        ## Termination, objective, best bound and relative mip gap of the last optimization
+        statistics = {"termination":None,"objective":None,"bound":None,"gap":None,"reason":self.terminationReason}
+        if self.raceStatistics is not None:
+            return dict(self.raceStatistics) ## solved in the process of the winner of the race
+        if self.matrixStatistics is not None:
+            return dict(self.matrixStatistics,reason=self.terminationReason)
+        try:
+            statistics["termination"] = str(self.results.solver.termination_condition)
+            statistics["objective"] = pyo.value(self.m.OBJ,exception=False)
+            upper = self.results.problem.upper_bound
+            lower = self.results.problem.lower_bound
+            if lower is not None and np.isfinite(lower):
+                statistics["bound"] = lower
+            if statistics["objective"] is not None and statistics["bound"] is not None and upper is not None and np.isfinite(upper):
+                statistics["gap"] = abs(upper - lower) / max(abs(upper),1e-10)
+        except:
+            pass
+        return statistics
+
     def getResults(self,source,savePath,combinedFile,singleFile,timestampStart,intervals):
         resultsFile = {} 
         results = pd.DataFrame()
         j = 0
         length_last_files = 0
 
+        if self.solutionAvailable == False:
+            raise RuntimeError("Optimization didn't come to a solution.")
         try:
-            for i in self.position_object.values():
-                resultsFile[j] = i.getResults(model=self.m,source=source,savePath=savePath,singleFile=singleFile)
+            for position,i in self.position_object.items():
+                resultsFile[j] = i.getResults(model=self.getModelPart(str(self.position_symbol[position])),source=source,savePath=savePath,singleFile=singleFile)
                 if length_last_files == 0:
                     pass
                 else:
@@ -32,52 +32,134 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import os
-import numpy as np
 import pandas as pd
 from datetime import datetime
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+
+from optimal_control.results_manifest import *
+from optimal_control.results_store import *
 
 class Optimization_Results_Interface():
 
-    def __init__(self,source="csv",time="bySet",timestamp=""):
+    def __init__(self,source="csv",time="bySet",timestamp="",buffer=None,writeFile=True,asyncWrite=False,writeQueueSize=10):
         self.started = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
         if time == "extern":
             self.started = timestamp
         self.source=source
         self.time = time
         self.count = 0
+        ## Optional in-process hand-off (Results_Buffer), csv files are then only an (optionally asynchronous) sink
+        self.buffer = buffer
+        self.writeFile = writeFile
+        self.writer = None
+        if asyncWrite == True:
+            self.writer = ThreadPoolExecutor(max_workers=1) # one worker keeps the order of the files
+            self.writeSlots = BoundedSemaphore(writeQueueSize) # pending writes, the loop only waits if the disk falls behind by writeQueueSize results
+        self.writes = [] # futures of the asynchronous writes, checked for errors
+        self.writeSeconds = None
+        ## source "arrow": all iterations of the run in one store per save path (Results_Store), the csv files are only read as fallback (e.g. start values)
+        self.stores = {}
+        self.manifests = {} ## iterations of the run per save path (Results_Manifest), for csv files and stores
+
+    def writeCsv(self,dataFrame,savePath,name,iteration):
+        timeStart = perf_counter()
+        dataFrame.to_csv(savePath+name, sep = ";")
+        self.getManifest(savePath).setEntry(iteration=iteration,name=name)
+        self.writeSeconds = perf_counter() - timeStart ## duration of the last written file (for the cycle profile)
+
+    def writeStore(self,dataFrame,savePath,iteration):
+        timeStart = perf_counter()
+        self.getStore(savePath).setResults(iteration=iteration,dataFrame=dataFrame)
+        self.writeSeconds = perf_counter() - timeStart
+
+    def getManifest(self,savePath):
+        if savePath not in self.manifests:
+            self.manifests[savePath] = Results_Manifest(savePath=savePath,run=self.started)
+        return self.manifests[savePath]
+
+    def getStore(self,savePath):
+        if savePath not in self.stores:
+            self.stores[savePath] = Results_Store(savePath=savePath,run=self.started,manifest=self.getManifest(savePath))
+        return self.stores[savePath]
+
+    def writeOptimizationResults(self,write,dataFrame,*args):
+        if self.writer is None:
+            write(dataFrame,*args)
+        else:
+            self.checkWrites()
+            self.writeSlots.acquire()
+            future = self.writer.submit(write, dataFrame.copy(), *args)
+            self.writes.append(future)
+            future.add_done_callback(self.setWriteDone)
+
+    def setWriteDone(self,future):
+        self.writeSlots.release()
+        if future.exception() is not None:
+            print("Writing the optimization results failed: " + repr(future.exception()))
+
+    def checkWrites(self):
+        ## The error of a failed asynchronous write is raised with the next write or when waiting for the writes, like the one of a synchronous write
+        writes = self.writes
+        self.writes = [future for future in writes if future.done() == False]
+        for future in writes:
+            if future.done() == True and future.exception() is not None:
+                raise future.exception()
+
+    def waitForWrites(self):
+        try:
+            if self.writer is not None:
+                self.writer.shutdown(wait=True)
+                self.writer = ThreadPoolExecutor(max_workers=1)
+                self.checkWrites()
+        finally:
+            for store in self.stores.values():
+                store.close()
 
     def setOptimizationResults(self,dataFrame=pd.DataFrame(),savePath="",onlySetCounter=False):
         if onlySetCounter == False:
-            if self.source == "csv":
+            if self.buffer is not None:
+                self.buffer.setResults(iteration=self.count,dataFrame=dataFrame)
+            if self.source == "csv" and self.writeFile == True:
                 if self.time == "bySet":
                     now = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-                    dataFrame.to_csv((savePath+'Results_'+str(now)+'.csv'), sep = ";")
+                    self.writeOptimizationResults(self.writeCsv,dataFrame,savePath,'Results_'+str(now)+'.csv',self.count)
                 elif self.time == "byCreate" or "extern":
-                    dataFrame.to_csv((savePath+'Results_'+str(self.started)+'_iter_'+str(self.count)+'.csv'), sep = ";")
+                    self.writeOptimizationResults(self.writeCsv,dataFrame,savePath,'Results_'+str(self.started)+'_iter_'+str(self.count)+'.csv',self.count)
+            if self.source == "arrow" and self.writeFile == True:
+                self.writeOptimizationResults(self.writeStore,dataFrame,savePath,self.count)
             self.count = self.count + 1
         if onlySetCounter == True:
             self.count = self.count + 1
 
+    def getCount(self):
+        return self.count
+
+    def setCount(self,count):
+        ## e.g. when a run is resumed from a checkpoint
+        self.count = count
+
     def getOptimizationResults(self,savePath=""):
-        if self.source == "csv":
-            if self.time == "byCreate" or "extern":
-                try:
-                    for i in range(-1,2):
-                        try:
-                            data = "Results_" + str(self.started) + "_iter_" + str(self.count+i) + ".csv"
-                            resultsDf = pd.read_csv(os.path.join(savePath,data), sep = ";", index_col=0, parse_dates=False)
-                        except:
-                            pass
-                    return resultsDf
-                except:
-                    for item in sorted(os.listdir(savePath)):
-                        full_path = os.path.join(savePath, item)
-                        if os.path.isfile(full_path):
-                            resultsDf = pd.read_csv(full_path, sep = ";", index_col=0, parse_dates=False)
-                    return resultsDf
-            if self.time == "bySet":
-                for i in os.listdir(savePath):
-                    if os.path.isfile(os.path.join(savePath,i)) and "Results_" in i:
-                        data = i
-                resultsDf = pd.read_csv(os.path.join(savePath,data), sep = ";", index_col=0, parse_dates=False)
-                return resultsDf
\ No newline at end of file
+        if self.buffer is not None:
+            ## Same preference as for the files: next, current, then last iteration
+            for i in range(1,-2,-1):
+                bufferedDf = self.buffer.getResults(iteration=self.count+i)
+                if bufferedDf is not None:
+                    return bufferedDf
+        if self.source == "csv" or self.source == "arrow":
+            manifest = self.getManifest(savePath)
+            for i in range(1,-2,-1):
+                if manifest.getEntry(self.count+i) is not None:
+                    return self.readOptimizationResults(savePath=savePath,iteration=self.count+i)
+            if manifest.getLatest() is not None:
+                return self.readOptimizationResults(savePath=savePath,iteration=manifest.getLatest())
+            ## No results of this run yet (e.g. the start values): last csv file of the directory
+            files = sorted(item for item in os.listdir(savePath) if item.endswith(".csv") and item.endswith("_index.csv") == False and os.path.isfile(os.path.join(savePath,item)))
+            return pd.read_csv(os.path.join(savePath,files[-1]), sep = ";", index_col=0, parse_dates=False)
+
+    def readOptimizationResults(self,savePath,iteration):
+        entry = self.getManifest(savePath).getEntry(iteration)
+        if entry["file"].endswith(".arrows"):
+            return self.getStore(savePath).getResults(iteration=iteration)
+        return pd.read_csv(os.path.join(savePath,entry["file"]), sep = ";", index_col=0, parse_dates=False)
\ No newline at end of file
@@ -0,0 +1,403 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from datetime import timedelta
+
+from optimal_control.binary_model import *
+
+class Plant_Simulator():
+    ## Surrogate of the plant without Dymola, same interface as Modelica_Interface (setParams, runInitialSimulation, runSimulation, getResults)
+    ## The energy balances of Binary_Model (implicit in time) are solved for one internal step as a linear system of the next temperatures
+    ## The state keeps all layers of IS and GS, the results only contain the measured (mean) temperatures like the Dymola model
+
+    ## Positions of the temperatures in the state (then the auxiliary values of one step)
+    HP_HT,HP_LT,HS,HXA,HGC,HGS,CS,RLTS = range(0,8)
+    IS_C = list(range(8,13))
+    IS_W = list(range(13,16)) ## water of the rows 0, 2 and 4 of IS
+    GS_C = list(range(16,23))
+    GS_W = list(range(23,26)) ## water of the rows 1, 3 and 5 of GS
+    SIZE_STATE = 26
+    HP_HT_OUT,HP_LT_OUT,Q_HP_HT,Q_HP_LT,HXH_W_OUT,HXH_B_OUT,HXC_W_OUT,HXC_B_OUT,Q_HXH,Q_HXC = range(26,36)
+    SIZE = 36
+
+    ## Binaries of the valves and pumps (the stage of HP and the position of VP are given as numbers)
+    MODES = ["B_HXH_HS","B_HGC_HGCHXC","B_HXA","B_HXH_HGC","B_HS_IS","B_IS_HGS","B_GS_HGS","B_GS_CS","B_GS_HGS_CS"]
+
+    ## Parameters of Binary_Model changed by the model mismatch
+    MISMATCH_PARAMS = ["m_HP_HT_w","m_HP_LT_b","m_HS_w","m_HXA_b","m_HGC_b","m_HGS_w","m_CS_w","m_RLTS_w","m_IS_c","m_IS_w","m_GS_c","m_GS_w",
+    "alpha_HP_time","alpha_HS_time","alpha_HXA_time","alpha_HGC_time","alpha_HGS_time","alpha_CS_time","alpha_RLTS_time",
+    "alpha_HXH_w_b","alpha_HXC_w_b","alpha_IS_w_c","alpha_GS_w_c","lambda_IS_c_c","lambda_IS_c_a","lambda_GS_c_c","lambda_GS_c_s","lambda_GS_c_a"]
+
+    def __init__(self,simTimeStart="",forecastInterface=None,subSteps=10,noise=0.0,mismatch=0.0,seed=None):
+        self.started = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+        self.timestamp = datetime.strptime(simTimeStart,"%Y-%m-%d %H:%M:%S")
+        self.forecastInterface = forecastInterface ## demands and weather of the plant (e.g. a Forecast_Interface of the measured values)
+        self.subSteps = subSteps
+        self.noise = noise ## in Kelvin, standard deviation of the measured temperatures
+        self.random = np.random.default_rng(seed)
+
+        ## Parameters of the binary model, optionally with a mismatch drawn once
+        self.params = Binary_Model()
+        self.params.setParams(timeSteps=[0,1],stepSizeInSec=600,controlPeriod1=1,controlPeriod2=1,tControlPeriodSwitch=0)
+        self.params.t_IS_air = 20
+        self.params.t_GS_soil = 16
+        self.params.t_GS_air = 16
+        if mismatch > 0:
+            for name in self.MISMATCH_PARAMS:
+                setattr(self.params,name,getattr(self.params,name) * max(0.1,1 + mismatch * self.random.standard_normal()))
+        self.x = np.zeros(self.SIZE)
+        self.disturbances = {"heat":0,"cool":0,"dry":0,"weather":self.params.t_default,"frost":0}
+
+    def setParams(self, stepSizeInSec=60.0):
+        self.delta_t = stepSizeInSec
+        self.t_start = 0
+        self.t_end = self.delta_t
+        self.iter_count = 0
+        self.initialInputs = dict(B_HP_0=0,B_HP_1=1,B_HXH_HS=0,B_HGC_HGCHXC=1,B_HXA=1,B_HXH_HGC=0,B_VP_0=0,B_VP_6=1) ## initial modes of Modelica_Interface
+        self.inputs = dict(self.initialInputs)
+        self.sim_results = {}
+
+    def getStartState(self,T_HP_HT_start,T_HP_LT_start,T_HS_start,T_HXA_start,T_HGC_start,T_HGS_start,T_IS_w_1_start,T_IS_w_2_start,T_IS_w_3_start,T_IS_c_1_start,T_IS_c_2_start,T_IS_c_3_start,T_IS_c_4_start,T_IS_c_5_start,
+    T_GS_w_1_start,T_GS_w_2_start,T_GS_w_3_start,T_GS_c_1_start,T_GS_c_2_start,T_GS_c_3_start,T_GS_c_4_start,T_GS_c_5_start,T_GS_c_6_start,T_GS_c_7_start,T_CS_start,T_RLTS_start):
+        ## Same start values as the binary model (e.g. Plant_State.getStartValues(binaries=False)) in the layout of the state
+        return np.array([T_HP_HT_start,T_HP_LT_start,T_HS_start,T_HXA_start,T_HGC_start,T_HGS_start,T_CS_start,T_RLTS_start,T_IS_c_1_start,T_IS_c_2_start,T_IS_c_3_start,T_IS_c_4_start,T_IS_c_5_start,
+        T_IS_w_1_start,T_IS_w_2_start,T_IS_w_3_start,T_GS_c_1_start,T_GS_c_2_start,T_GS_c_3_start,T_GS_c_4_start,T_GS_c_5_start,T_GS_c_6_start,T_GS_c_7_start,T_GS_w_1_start,T_GS_w_2_start,T_GS_w_3_start],dtype=float)
+
+    def setStartValues(self,**startValues):
+        self.x[:self.SIZE_STATE] = self.getStartState(**startValues)
+
+    def getState(self):
+        ## Snapshot of the plant (e.g. for a checkpoint), setState continues from it
+        return {"x":self.x.copy(),"timestamp":self.timestamp,"inputs":dict(self.inputs),"t_start":self.t_start,"t_end":self.t_end,"iter_count":self.iter_count,"random":self.random.bit_generator.state,
+        "disturbances":dict(self.disturbances),"results":dict(self.sim_results)}
+
+    def setState(self,state):
+        self.x = state["x"].copy()
+        self.timestamp = state["timestamp"]
+        self.inputs = dict(state["inputs"])
+        self.t_start = state["t_start"]
+        self.t_end = state["t_end"]
+        self.iter_count = state["iter_count"]
+        self.random.bit_generator.state = state["random"]
+        self.disturbances = dict(state["disturbances"])
+        self.sim_results = dict(state["results"])
+
+    def getInputs(self):
+        return dict(self.inputs)
+
+    def getResultsInputs(self,results,row=0):
+        ## Inputs of runSimulation from a row of the optimization results (first period of VP)
+        inputs = {name:results[name + "_T"].iloc[row] for name in ["B_HP_0","B_HP_1","B_HP_2","B_HP_3","B_HP_4"] + self.MODES}
+        for v in range(0,8):
+            inputs["B_VP_" + str(v)] = results["B_VP_" + str(v) + "_T_1"].iloc[row]
+        return inputs
+
+    def getResultsSchedule(self,results,steps):
+        ## Schedule of runBatchSimulation from the first steps of the optimization results (e.g. to screen warmstart candidates)
+        schedule = {name:np.zeros(steps,dtype=int) for name in ["B_HP_H","B_VP_V"] + self.MODES}
+        for row in range(0,steps):
+            modes,hp,vp = self.getModes(self.getResultsInputs(results=results,row=row))
+            schedule["B_HP_H"][row] = hp
+            schedule["B_VP_V"][row] = vp
+            for name in self.MODES:
+                schedule[name][row] = modes[name]
+        return schedule
+
+    def getModes(self,inputs):
+        ## Binaries are rounded like the modes of Modelica_Interface, the last stage of HP and position of VP set to 1 wins
+        modes = {name:int(round(value,0)) for name,value in inputs.items()}
+        hp = max([h for h in range(0,5) if modes["B_HP_" + str(h)] == 1] + [0])
+        vp = max([v for v in range(0,8) if modes["B_VP_" + str(v)] == 1] + [0])
+        return modes,hp,vp
+
+    def runInitialSimulation(self):
+        self.runSimulation(**self.initialInputs)
+
+    def runSimulation(self,B_HP_0=1,B_HP_1=0,B_HP_2=0,B_HP_3=0,B_HP_4=0,B_HXH_HS=0,B_HGC_HGCHXC=0,B_HXA=0,B_HXH_HGC=0,B_HS_IS=0,B_IS_HGS=0,B_GS_HGS=0,B_GS_CS=0,B_GS_HGS_CS=0,
+                        B_VP_0=1,B_VP_1=0,B_VP_2=0,B_VP_3=0,B_VP_4=0,B_VP_5=0,B_VP_6=0,B_VP_7=0):
+        self.inputs = dict(B_HP_0=B_HP_0,B_HP_1=B_HP_1,B_HP_2=B_HP_2,B_HP_3=B_HP_3,B_HP_4=B_HP_4,B_HXH_HS=B_HXH_HS,B_HGC_HGCHXC=B_HGC_HGCHXC,B_HXA=B_HXA,B_HXH_HGC=B_HXH_HGC,B_HS_IS=B_HS_IS,B_IS_HGS=B_IS_HGS,
+        B_GS_HGS=B_GS_HGS,B_GS_CS=B_GS_CS,B_GS_HGS_CS=B_GS_HGS_CS,B_VP_0=B_VP_0,B_VP_1=B_VP_1,B_VP_2=B_VP_2,B_VP_3=B_VP_3,B_VP_4=B_VP_4,B_VP_5=B_VP_5,B_VP_6=B_VP_6,B_VP_7=B_VP_7)
+        modes,hp,vp = self.getModes(self.inputs)
+        disturbances = self.getDisturbances()
+        print("Started simulation")
+        A,B = self.getSystem(modes={name:np.array([modes[name]]) for name in self.MODES},hp=np.array([hp]),vp=np.array([vp]),frost=np.array([disturbances["frost"]]),stepSizeInSec=self.delta_t / self.subSteps)
+        M = np.linalg.solve(A[0],B[0])
+        for i in range(0,self.subSteps):
+            self.x = M @ np.concatenate((self.x[:self.SIZE_STATE],[1,disturbances["heat"],disturbances["cool"],disturbances["dry"],disturbances["weather"]]))
+        print("Done simulating")
+        self.setResults(modes=modes,hp=hp,vp=vp,disturbances=disturbances)
+
+        self.timestamp = self.timestamp + timedelta(seconds=self.delta_t)
+        self.t_start = self.t_end
+        self.t_end += self.delta_t
+        self.iter_count += 1
+
+        if np.all(np.isfinite(self.x)) == False:
+            raise RuntimeError("Simulation Failed")
+
+    def runBatchSimulation(self,startStates,schedules,profiles={},stepSizeInSec=None,subSteps=None):
+        ## Many trajectories at once: start states [n_scenarios, SIZE_STATE] (see getStartState), schedules B_HP_H (stage), B_VP_V (position) and the binaries of MODES as [n_scenarios, horizon],
+        ## profiles heat, cool, dry, weather, frost and price as [n_scenarios, horizon] or anything broadcast to it (e.g. samples of the forecast)
+        ## Every combination of binaries gets one transition over all internal steps, so the trajectories only cost one matrix product per interval
+        if stepSizeInSec is None:
+            stepSizeInSec = self.delta_t
+        if subSteps is None:
+            subSteps = self.subSteps
+        B_HP_H = np.atleast_2d(np.asarray(schedules["B_HP_H"],dtype=int))
+        shape = B_HP_H.shape
+        codes = np.stack([B_HP_H,np.broadcast_to(np.asarray(schedules.get("B_VP_V",0),dtype=int),shape)] + [np.broadcast_to(np.rint(schedules.get(name,0)).astype(int),shape) for name in self.MODES]
+        + [np.broadcast_to(np.rint(profiles.get("frost",self.disturbances["frost"])).astype(int),shape)],axis=-1)
+        disturbances = np.stack([np.ones(shape)] + [np.broadcast_to(np.asarray(profiles.get(name,self.disturbances[name]),dtype=float),shape) for name in ["heat","cool","dry","weather"]],axis=-1)
+        price = np.broadcast_to(np.asarray(profiles.get("price",1),dtype=float),shape) ## without price, the costs are the electrical energy in kWh
+
+        ## Transition of one interval for every combination: [x, 1, heat, cool, dry, weather] to the same vector after all internal steps
+        combinations,index = np.unique(codes.reshape(-1,codes.shape[-1]),axis=0,return_inverse=True)
+        index = index.reshape(shape)
+        A,B = self.getSystem(modes={name:combinations[:,2+i] for i,name in enumerate(self.MODES)},hp=combinations[:,0],vp=combinations[:,1],frost=combinations[:,-1],stepSizeInSec=stepSizeInSec/subSteps)
+        transitions = np.zeros((len(combinations),B.shape[2],B.shape[2]))
+        transitions[:,:self.SIZE_STATE,:] = np.linalg.solve(A,B)[:,:self.SIZE_STATE,:]
+        transitions[:,self.SIZE_STATE:,self.SIZE_STATE:] = np.eye(B.shape[2] - self.SIZE_STATE)
+        transitions = np.linalg.matrix_power(transitions,subSteps)
+
+        states = np.zeros((shape[0],shape[1]+1,self.SIZE_STATE))
+        states[:,0,:] = np.broadcast_to(startStates,(shape[0],self.SIZE_STATE))
+        for t in range(0,shape[1]):
+            states[:,t+1,:] = np.einsum("nij,nj->ni",transitions[index[:,t],:self.SIZE_STATE,:],np.concatenate((states[:,t,:],disturbances[:,t,:]),axis=1))
+        power = self.getPower(codes=codes,states=states[:,1:,:])
+        return {"states":states,"power":power,"cost":np.sum(stepSizeInSec / self.params.t_hour_in_sec * power * price,axis=1),"slack":np.sum(self.getSlack(states=states[:,1:,:],stepSizeInSec=stepSizeInSec),axis=1)}
+
+    def getPower(self,codes,states):
+        ## Electrical power of HP, pumps and devices like the costs of the binary model, codes of runBatchSimulation
+        p = self.params
+        hp = codes[...,0]
+        modes = {name:codes[...,2+i] for i,name in enumerate(self.MODES)}
+        d = np.array(p.d_HP_power_H)[hp]
+        return (d * (p.a_HP_EL_0 + p.a_HP_EL_1 * states[...,self.HP_HT] + p.a_HP_EL_2 * states[...,self.HP_LT]) + np.array(p.e_HP_EL_pumps)[hp]
+        + modes["B_HXA"] * (1 - codes[...,-1]) * (p.e_HXA_EL_pump + p.e_HXA_EL_device) + np.maximum(modes["B_HS_IS"],modes["B_IS_HGS"]) * p.e_IS_EL
+        + (modes["B_GS_HGS"] + modes["B_GS_CS"] + modes["B_GS_HGS_CS"]) * p.e_GS_EL + (codes[...,1] > 0) * p.e_VP_EL)
+
+    def getSlack(self,states,stepSizeInSec):
+        ## Weighted violations of the temperature ranges like the slacks of the binary model (HP_HT and HP_LT share one slack)
+        p = self.params
+        lower = np.zeros(self.SIZE_STATE)
+        upper = np.zeros(self.SIZE_STATE)
+        weight = np.zeros(self.SIZE_STATE)
+        for i,low,up,s in [(self.HS,p.T_HS_min,p.T_HS_max,p.s_T_HS),(self.HXA,p.T_HXA_min,p.T_HXA_max,p.s_T_HXA),(self.HGC,p.T_HGC_min,p.T_HGC_max,p.s_T_HGC),(self.HGS,p.T_HGS_min,p.T_HGS_max,p.s_T_HGS),
+        (self.CS,p.T_CS_min,p.T_CS_max,p.s_T_CS),(self.RLTS,p.T_RLTS_min,p.T_RLTS_max,p.s_T_RLTS),(self.IS_C,p.T_IS_min_c,p.T_IS_max_c,p.s_T_IS_C),(self.IS_W,p.T_IS_min_w,p.T_IS_max_w,p.s_T_IS_W),
+        (self.GS_C,p.T_GS_min_c,p.T_GS_max_c,p.s_T_GS_C),(self.GS_W,p.T_GS_min_w,p.T_GS_max_w,p.s_T_GS_W)]:
+            lower[i] = low
+            upper[i] = up
+            weight[i] = s
+        violation = np.maximum(0,np.maximum(states - upper,lower - states))
+        violation_HP = np.maximum(np.maximum(0,np.maximum(states[...,self.HP_HT] - p.T_HP_HT_max,p.T_HP_HT_min - states[...,self.HP_HT])),np.maximum(0,np.maximum(states[...,self.HP_LT] - p.T_HP_LT_max,p.T_HP_LT_min - states[...,self.HP_LT])))
+        return stepSizeInSec / p.t_hour_in_sec * (violation @ weight + p.s_T_HP * violation_HP)
+
+    def getResults(self):
+        return pd.DataFrame(self.sim_results,index=[0])
+
+    def getDisturbances(self):
+        ## Means of the demands and the weather over the next interval, held for all internal steps
+        disturbances = dict(self.disturbances)
+        if self.forecastInterface is not None:
+            disturbances = {"heat":self.forecastInterface.getProfileForecastHeat(timestampStart=self.timestamp,intervals=[self.delta_t])[0],
+            "cool":self.forecastInterface.getProfileForecastCool(timestampStart=self.timestamp,intervals=[self.delta_t])[0],
+            "dry":self.forecastInterface.getProfileForecastDry(timestampStart=self.timestamp,intervals=[self.delta_t])[0],
+            "weather":self.forecastInterface.getProfileForecastWeather(timestampStart=self.timestamp,intervals=[self.delta_t])[0],
+            "frost":self.forecastInterface.getProfileForecastFrost(timestampStart=self.timestamp,intervals=[self.delta_t])[0]}
+        for name,value in disturbances.items():
+            if np.isfinite(value) == False: ## no values in the interval, the last ones are held
+                disturbances[name] = self.disturbances[name]
+        self.disturbances = disturbances
+        return disturbances
+
+    def getSystem(self,modes,hp,vp,frost,stepSizeInSec):
+        ## Linear systems A x(t+1) = B [x(t), 1, heat, cool, dry, weather] of one internal step for n combinations of binaries (arrays of length n)
+        ## The rows are the equations of Binary_Model for fixed binaries
+        p = self.params
+        n = len(hp)
+        A = np.zeros((n,self.SIZE,self.SIZE))
+        B = np.zeros((n,self.SIZE,self.SIZE_STATE+5))
+        ONE,HEAT,COOL,DRY,WEATHER = range(self.SIZE_STATE,self.SIZE_STATE+5)
+
+        def addStorage(i,capacity,flows,environment=[],sources=[]):
+            ## x'[i] = x[i] + dt/capacity * (sum flow * (x'[j] - x'[i]) + sum alpha * (T_env - x'[i]) + sources)
+            k = stepSizeInSec / capacity
+            A[:,i,i] += 1
+            B[:,i,i] += 1
+            for flow,j in flows:
+                A[:,i,i] += k * flow
+                A[:,i,j] -= k * flow
+            for alpha,column,value in environment:
+                A[:,i,i] += k * alpha
+                B[:,i,column] += k * alpha * value
+            for factor,column in sources:
+                B[:,i,column] += k * factor
+
+        z_HXA = modes["B_HXA"] * (1 - frost)
+        z_HXA_HXH = z_HXA * modes["B_HXH_HGC"]
+        z_HXA_HGC = z_HXA * (1 - modes["B_HXH_HGC"])
+        z_HS_IS_2 = modes["B_HS_IS"] * (1 - modes["B_IS_HGS"])
+        z_IS_HGS_2 = modes["B_IS_HGS"] * (1 - modes["B_HS_IS"])
+        pump_IS = np.maximum(modes["B_HS_IS"],modes["B_IS_HGS"])
+        pump_GS = modes["B_GS_HGS"] + modes["B_GS_CS"] + modes["B_GS_HGS_CS"]
+        mdot_HP_w = np.array(p.mdot_HP_w_H)[hp]
+        mdot_HP_b = np.array(p.mdot_HP_b_H)[hp]
+        mdot_VP_HGS = np.array(p.mdot_VP_HGS_V_1)[vp]
+        mdot_VP_CS = np.array(p.mdot_VP_CS_V_1)[vp]
+        mdot_VP_RLTS = np.array(p.mdot_VP_RLTS_V_1)[vp]
+
+        ## HP
+        A[:,self.Q_HP_HT,self.Q_HP_HT] = 1
+        A[:,self.Q_HP_HT,self.HP_HT] = -p.a_HP_HT_1
+        A[:,self.Q_HP_HT,self.HP_LT] = -p.a_HP_HT_2
+        B[:,self.Q_HP_HT,ONE] = p.a_HP_HT_0
+        A[:,self.Q_HP_LT,self.Q_HP_LT] = 1
+        A[:,self.Q_HP_LT,self.HP_HT] = -p.a_HP_LT_1
+        A[:,self.Q_HP_LT,self.HP_LT] = -p.a_HP_LT_2
+        B[:,self.Q_HP_LT,ONE] = p.a_HP_LT_0
+        A[:,self.HP_HT_OUT,self.HP_HT_OUT] = 1
+        A[:,self.HP_HT_OUT,self.HP_HT] = -1
+        A[:,self.HP_HT_OUT,self.Q_HP_HT] = -np.where(hp > 0,np.array(p.d_HP_power_H)[hp] / (p.c_w * np.where(hp > 0,mdot_HP_w,1)),0)
+        A[:,self.HP_LT_OUT,self.HP_LT_OUT] = 1
+        A[:,self.HP_LT_OUT,self.HP_LT] = -1
+        A[:,self.HP_LT_OUT,self.Q_HP_LT] = np.where(hp > 0,np.array(p.d_HP_power_H)[hp] / (p.c_b * np.where(hp > 0,mdot_HP_b,1)),0)
+        addStorage(self.HP_HT,p.m_HP_HT_w * p.c_w,flows=[(p.c_w * mdot_HP_w,self.HP_HT_OUT),(p.c_w * mdot_HP_w * modes["B_HXH_HS"],self.HXH_W_OUT),(p.c_w * mdot_HP_w * (1 - modes["B_HXH_HS"]),self.HS)],
+        environment=[(p.alpha_HP_time,ONE,p.t_default)])
+        addStorage(self.HP_LT,p.m_HP_LT_b * p.c_b,flows=[(p.c_b * mdot_HP_b,self.HP_LT_OUT),(p.c_b * mdot_HP_b,self.HGC)],environment=[(p.alpha_HP_time,ONE,p.t_default)])
+
+        ## Storages and headers
+        addStorage(self.HS,p.m_HS_w * p.c_w,flows=[(p.c_w * mdot_HP_w * (1 - modes["B_HXH_HS"]),self.HP_HT),(p.c_w * p.mdot_IS_w_2 * (modes["B_HS_IS"] + z_HS_IS_2),self.IS_W[-1])],
+        environment=[(p.alpha_HS_time,ONE,p.t_default)],sources=[(-1,HEAT)])
+        addStorage(self.HXA,p.m_HXA_b * p.c_b,flows=[(p.c_b * p.mdot_HXA_b * z_HXA_HXH,self.HXH_B_OUT),(p.c_b * p.mdot_HXA_b * z_HXA_HGC,self.HGC)],
+        environment=[(p.alpha_factor_HXA * p.c_a * p.mdot_HXA_a * z_HXA,WEATHER,1),(p.alpha_HXA_time,WEATHER,1)])
+        addStorage(self.HGC,p.m_HGC_b * p.c_b,flows=[(p.c_b * mdot_HP_b * modes["B_HGC_HGCHXC"],self.HP_LT),(p.c_b * mdot_HP_b * (1 - modes["B_HGC_HGCHXC"]),self.HXC_B_OUT),(p.c_b * p.mdot_HXA_b * z_HXA_HGC,self.HXA)],
+        environment=[(p.alpha_HGC_time,ONE,p.t_default)])
+        addStorage(self.HGS,p.m_HGS_w * p.c_w,flows=[(p.c_w * p.mdot_IS_w_2 * (modes["B_IS_HGS"] + z_IS_HGS_2),self.IS_W[-1]),(p.c_w * (p.mdot_GS_w * modes["B_GS_HGS"] + p.mdot_GS_w_2 * modes["B_GS_HGS_CS"]),self.GS_W[-1]),
+        (p.c_w * mdot_VP_HGS,self.HXC_W_OUT)],environment=[(p.alpha_HGS_time,ONE,p.t_default)])
+        addStorage(self.CS,p.m_CS_w * p.c_w,flows=[(p.c_w * (p.mdot_GS_w * modes["B_GS_CS"] + p.mdot_GS_w_2 * modes["B_GS_HGS_CS"]),self.GS_W[-1]),(p.c_w * mdot_VP_CS,self.HXC_W_OUT)],
+        environment=[(p.alpha_CS_time,ONE,p.t_default)],sources=[(1,COOL)])
+        addStorage(self.RLTS,p.m_RLTS_w * p.c_w,flows=[(p.c_w * mdot_VP_RLTS,self.HXC_W_OUT)],environment=[(p.alpha_RLTS_time,ONE,p.t_default)],sources=[(1,DRY)])
+
+        ## HXH (water of HP HT and brine of HXA), outflows are the inflows without heat transfer
+        flow_w = p.c_w * mdot_HP_w * modes["B_HXH_HS"]
+        flow_b = p.c_b * p.mdot_HXA_b * z_HXA_HXH
+        active = ((flow_w > 0) & (flow_b > 0)).astype(float)
+        ua = p.a_HXH_w_b * p.alpha_HXH_w_b
+        A[:,self.HXH_W_OUT,self.HXH_W_OUT] = 1
+        A[:,self.HXH_W_OUT,self.HP_HT] = -1
+        A[:,self.HXH_W_OUT,self.Q_HXH] = -active / np.where(flow_w > 0,flow_w,1)
+        A[:,self.HXH_B_OUT,self.HXH_B_OUT] = 1
+        A[:,self.HXH_B_OUT,self.HXA] = -1
+        A[:,self.HXH_B_OUT,self.Q_HXH] = active / np.where(flow_b > 0,flow_b,1)
+        A[:,self.Q_HXH,self.Q_HXH] = 1
+        A[:,self.Q_HXH,self.HP_HT] = -active * ua/2
+        A[:,self.Q_HXH,self.HXH_W_OUT] = -active * ua/2
+        A[:,self.Q_HXH,self.HXA] = active * ua/2
+        A[:,self.Q_HXH,self.HXH_B_OUT] = active * ua/2
+
+        ## HXC (water of HGS, CS and RLTS by the position of VP and brine of HP LT), without flow of VP the mean of the three
+        flow_w = p.c_w * (mdot_VP_HGS + mdot_VP_CS + mdot_VP_RLTS)
+        flow_b = p.c_b * mdot_HP_b * (1 - modes["B_HGC_HGCHXC"])
+        active = ((flow_w > 0) & (flow_b > 0)).astype(float)
+        ua = p.a_HXC_w_b * p.alpha_HXC_w_b
+        A[:,self.HXC_W_OUT,self.HXC_W_OUT] = 1
+        for mdot,j in [(mdot_VP_HGS,self.HGS),(mdot_VP_CS,self.CS),(mdot_VP_RLTS,self.RLTS)]:
+            A[:,self.HXC_W_OUT,j] = -np.where(flow_w > 0,p.c_w * mdot / np.where(flow_w > 0,flow_w,1),1/3)
+            ## T_HXC_w_delta_in of the model: inflow mixed by VP plus outflow
+            A[:,self.Q_HXC,j] = -active * ua/2 * mdot / p.mdot_VP_tot
+        A[:,self.HXC_W_OUT,self.Q_HXC] = -active / np.where(flow_w > 0,flow_w,1)
+        A[:,self.HXC_B_OUT,self.HXC_B_OUT] = 1
+        A[:,self.HXC_B_OUT,self.HP_LT] = -1
+        A[:,self.HXC_B_OUT,self.Q_HXC] = active / np.where(flow_b > 0,flow_b,1)
+        A[:,self.Q_HXC,self.Q_HXC] = 1
+        A[:,self.Q_HXC,self.HXC_W_OUT] = -active * ua/2 * flow_w / (p.c_w * p.mdot_VP_tot)
+        A[:,self.Q_HXC,self.HP_LT] = active * ua/2
+        A[:,self.Q_HXC,self.HXC_B_OUT] = active * ua/2
+
+        ## IS (concrete layers and water of the rows 0, 2 and 4)
+        conduction = p.lambda_IS_c_c / p.height_IS * p.a_north_south_IS
+        border = p.lambda_IS_c_a / p.height_IS * p.a_north_south_IS
+        pipe = p.alpha_IS_w_c * p.a_pipe_IS
+        for r in p.cr_IS:
+            flows = [(conduction,self.IS_C[j]) for j in [r-1,r+1] if j in p.cr_IS]
+            environment = [(border,ONE,p.t_IS_air) for j in [r-1,r+1] if j not in p.cr_IS]
+            if r in p.wr_IS:
+                flows.append((pipe,self.IS_W[p.wr_IS.index(r)]))
+            addStorage(self.IS_C[r],p.m_IS_c * p.c_c,flows=flows,environment=environment)
+        flow = p.c_w * p.mdot_IS_w_2 / p.n_IS_blocks
+        addStorage(self.IS_W[0],p.m_IS_w * p.c_w,flows=[(pipe,self.IS_C[p.wr_IS[0]]),(flow * (modes["B_HS_IS"] + z_HS_IS_2),self.HS),(flow * (modes["B_IS_HGS"] + z_IS_HGS_2),self.HGS)])
+        for i in range(1,len(p.wr_IS)):
+            addStorage(self.IS_W[i],p.m_IS_w * p.c_w,flows=[(pipe,self.IS_C[p.wr_IS[i]]),(p.c_w * p.mdot_IS_w / p.n_IS_blocks * pump_IS,self.IS_W[i-1])])
+
+        ## GS (one column of concrete layers, water of the rows 1, 3 and 5)
+        conduction = p.lambda_GS_c_c / p.height_GS * p.a_north_south_GS
+        pipe = p.alpha_GS_w_c * p.a_pipe_GS
+        for r in p.cr_GS:
+            flows = [(conduction,self.GS_C[j]) for j in [r-1,r+1] if j in p.cr_GS]
+            environment = []
+            if r == p.cr_GS[0]:
+                environment.append((p.lambda_GS_c_a / p.height_GS * p.a_north_south_GS,ONE,p.t_GS_air))
+            if r == p.cr_GS[-1]:
+                environment.append((p.lambda_GS_c_s / p.height_GS * p.a_north_south_GS,ONE,p.t_GS_soil))
+            if r in p.wr_GS:
+                flows.append((pipe,self.GS_W[p.wr_GS.index(r)]))
+            addStorage(self.GS_C[r],p.m_GS_c * p.c_c,flows=flows,environment=environment)
+        addStorage(self.GS_W[0],p.m_GS_w * p.c_w,flows=[(pipe,self.GS_C[p.wr_GS[0]]),(p.c_w / p.n_GS_blocks * (p.mdot_GS_w * modes["B_GS_HGS"] + p.mdot_GS_w_2 * modes["B_GS_HGS_CS"]),self.HGS),
+        (p.c_w / p.n_GS_blocks * (p.mdot_GS_w * modes["B_GS_CS"] + p.mdot_GS_w_2 * modes["B_GS_HGS_CS"]),self.CS)])
+        for i in range(1,len(p.wr_GS)):
+            addStorage(self.GS_W[i],p.m_GS_w * p.c_w,flows=[(pipe,self.GS_C[p.wr_GS[i]]),(p.c_w * p.mdot_GS_w / p.n_GS_blocks * pump_GS,self.GS_W[i-1])])
+        return A,B
+
+    def setResults(self,modes,hp,vp,disturbances):
+        ## Results with the names of the Dymola model (read by Measurements_Interface with source "sim-dymola")
+        p = self.params
+        x = self.x
+        measured = x + self.noise * self.random.standard_normal(self.SIZE) if self.noise > 0 else x
+        T_IS_wc = np.mean(measured[[self.IS_C[r] for r in p.wr_IS]])
+        T_IS_c = np.mean(measured[[self.IS_C[r] for r in p.cr_IS if r not in p.wr_IS]])
+        T_GS_wc = np.mean(measured[[self.GS_C[r] for r in p.wr_GS]])
+        T_GS_c = np.mean(measured[[self.GS_C[r] for r in p.cr_GS if r not in p.wr_GS]])
+        T_HXC_w_delta_in = (p.mdot_VP_HGS_V_1[vp] * x[self.HGS] + p.mdot_VP_CS_V_1[vp] * x[self.CS] + p.mdot_VP_RLTS_V_1[vp] * x[self.RLTS] + (vp == 0) * p.mdot_VP_tot / 3 * (x[self.HGS] + x[self.CS] + x[self.RLTS])) / p.mdot_VP_tot + x[self.HXC_W_OUT]
+        E_HP_EL = p.a_HP_EL_0 + p.a_HP_EL_1 * x[self.HP_HT] + p.a_HP_EL_2 * x[self.HP_LT]
+        CHS_mode_ext = modes["B_HS_IS"] + 2 * modes["B_IS_HGS"]
+        GS_mode_ext = 3 if modes["B_GS_HGS_CS"] == 1 else (2 if modes["B_GS_CS"] == 1 else (1 if modes["B_GS_HGS"] == 1 else 0))
+        self.sim_results = {"HP_mode_ext":hp,"CHS_mode_ext":CHS_mode_ext,"GS_mode_ext":GS_mode_ext,"ST_mode_ext":vp,"HS_mode_ext":1 - modes["B_HXH_HS"],"CS_mode_ext":modes["B_HGC_HGCHXC"],"AS_mode_ext":modes["B_HXA"],"ASC_mode_ext":1 - modes["B_HXH_HGC"],
+        "T_hts":measured[self.HS],"T_lts":measured[self.CS],"T_lts_dehum":measured[self.RLTS],"T_amb":disturbances["weather"],
+        "T_gs_w":np.mean(measured[self.GS_W]),"T_gs_c":T_GS_c,"T_gs_wc":T_GS_wc,"T_chs_w":np.mean(measured[self.IS_W]),"T_chs_c":T_IS_c,"T_chs_wc":T_IS_wc,
+        "T_rc":measured[self.HXA],"T_hx_c":(T_HXC_w_delta_in + 2 * x[self.HXC_W_OUT] + x[self.HP_LT] + x[self.HXC_B_OUT])/4,"T_hx_h":(x[self.HP_HT] + x[self.HXH_W_OUT] + x[self.HXA] + x[self.HXH_B_OUT])/4,
+        "T_hp_c_in":x[self.HP_LT],"T_hp_c_out":measured[self.HP_LT],"T_hp_h_in":x[self.HP_HT],"T_hp_h_out":measured[self.HP_HT],"T_header_rc":measured[self.HGC],"T_header_gs":measured[self.HGS],
+        "Qdot_hp_ht":(hp > 0) * p.d_HP_power_H[hp] * x[self.Q_HP_HT],"Qdot_hp_lt":(hp > 0) * p.d_HP_power_H[hp] * x[self.Q_HP_LT],"P_hp_el":p.d_HP_power_H[hp] * E_HP_EL + p.e_HP_EL_pumps[hp],
+        "Qdot_hts_dem_MW":disturbances["heat"]/1000,"Qdot_lts_dem_MW":disturbances["cool"]/1000,"Qdot_lts_dh_dem_MW":disturbances["dry"]/1000}
@@ -0,0 +1,113 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+
+class Plant_State():
+    ## Measured state of the plant as one float array with a fixed layout: temperatures, heat pump stages, valve and pump states, valve positions of VP
+    ## Copies are cheap (one array), e.g. as snapshot for parallel scenarios
+    __slots__ = ["values"]
+
+    TEMPERATURES = ["HP_HT","HP_LT","HS","HXA","HGC","HGS","ISw","ISc","ISwc","GSw","GSc","GSwc","CS","RLTS","HXH","HXC"]
+    STATES = ["HXH_HS","HGC_HGCHXC","HXAb","HXH_HGC","HS_IS","IS_HGS","GS_HGS","GS_CS","GS_HGS_CS"]
+    N_HP = 5
+    N_VP = 8
+    SLICE_TEMPERATURES = slice(0,16)
+    SLICE_HP = slice(16,21)
+    SLICE_STATES = slice(21,30)
+    SLICE_VP = slice(30,38)
+    SIZE = 38
+
+    ## Positions of the keys of the former measurement dictionary (HP and VP are vectors)
+    POSITIONS = dict(list(zip(["measurement" + name for name in TEMPERATURES],range(SLICE_TEMPERATURES.start,SLICE_TEMPERATURES.stop)))
+    + list(zip(["measurement" + name for name in STATES],range(SLICE_STATES.start,SLICE_STATES.stop))) + [("measurementHP",SLICE_HP),("measurementVP",SLICE_VP)])
+
+    def __init__(self,values=None):
+        if values is None:
+            self.values = np.zeros(self.SIZE)
+        else:
+            self.values = np.array(values,dtype=float)
+            if self.values.shape != (self.SIZE,):
+                raise RuntimeError("Plant state needs " + str(self.SIZE) + " values, got " + str(self.values.shape))
+
+    def __getitem__(self,key):
+        value = self.values[self.POSITIONS[key]]
+        if isinstance(value,np.ndarray):
+            return value.tolist()
+        return float(value)
+
+    def copy(self):
+        return Plant_State(self.values)
+
+    def getTemperatures(self):
+        return self.values[self.SLICE_TEMPERATURES]
+
+    def getHP(self):
+        return self.values[self.SLICE_HP]
+
+    def getStates(self):
+        return self.values[self.SLICE_STATES]
+
+    def getVP(self):
+        return self.values[self.SLICE_VP]
+
+    def getTemperature(self,name):
+        return float(self.values[self.TEMPERATURES.index(name)])
+
+    def setTemperatures(self,temperatures):
+        self.values[self.SLICE_TEMPERATURES] = temperatures
+
+    def setHP(self,hp):
+        self.values[self.SLICE_HP] = hp
+
+    def setStates(self,states):
+        self.values[self.SLICE_STATES] = states
+
+    def setVP(self,vp):
+        self.values[self.SLICE_VP] = vp
+
+    def getStartValues(self,binaries=True):
+        ## Keyword arguments of setStartValues of the binary model (binaries=True) or of its warmstart (binaries=False)
+        ## The layers of IS and GS alternate between the measured warm, cold and mixed temperatures
+        T = dict(zip(self.TEMPERATURES,self.getTemperatures().tolist()))
+        startValues = dict(T_HP_HT_start=T["HP_HT"],T_HP_LT_start=T["HP_LT"],T_HS_start=T["HS"],T_HXA_start=T["HXA"],T_HGC_start=T["HGC"],T_HGS_start=T["HGS"],
+        T_IS_w_1_start=T["ISw"],T_IS_w_2_start=T["ISw"],T_IS_w_3_start=T["ISw"],T_IS_c_1_start=T["ISwc"],T_IS_c_2_start=T["ISc"],T_IS_c_3_start=T["ISwc"],T_IS_c_4_start=T["ISc"],T_IS_c_5_start=T["ISwc"],
+        T_GS_w_1_start=T["GSw"],T_GS_w_2_start=T["GSw"],T_GS_w_3_start=T["GSw"],T_GS_c_1_start=T["GSc"],T_GS_c_2_start=T["GSwc"],T_GS_c_3_start=T["GSc"],T_GS_c_4_start=T["GSwc"],
+        T_GS_c_5_start=T["GSc"],T_GS_c_6_start=T["GSwc"],T_GS_c_7_start=T["GSc"],T_CS_start=T["CS"],T_RLTS_start=T["RLTS"])
+        if binaries == True:
+            HP = self.getHP().tolist()
+            B = dict(zip(self.STATES,self.getStates().tolist()))
+            startValues.update(Start_Toggle_Constraints=True,B_HP_1_start=HP[0],B_HP_2_start=HP[1],B_HP_3_start=HP[2],B_HP_4_start=HP[3],
+            B_HXH_HS_start=B["HXH_HS"],B_HGC_HGCHXC_start=B["HGC_HGCHXC"],B_HXA_start=B["HXAb"],B_HXH_HGC_start=B["HXH_HGC"],B_HS_IS_start=B["HS_IS"],B_IS_HGS_start=B["IS_HGS"],
+            B_GS_HGS_start=B["GS_HGS"],B_GS_CS_start=B["GS_CS"],B_GS_HGS_CS_start=B["GS_HGS_CS"],B_VP_start=self.getVP().tolist())
+        return startValues
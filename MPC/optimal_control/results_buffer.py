@@ -0,0 +1,64 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+from collections import OrderedDict
+
+class Results_Buffer():
+    ## In-process hand-off of the result frames (ring buffer of the last size frames, keyed by iteration)
+    ## Shared between the writing Optimization_Results_Interface and the reading one of Measurements_Interface
+
+    def __init__(self,size=10):
+        self.size = size
+        self.frames = OrderedDict()
+        self.lock = threading.Lock()
+
+    def setResults(self,iteration,dataFrame):
+        with self.lock:
+            self.frames[iteration] = dataFrame.copy()
+            self.frames.move_to_end(iteration)
+            while len(self.frames) > self.size:
+                self.frames.popitem(last=False)
+
+    def getResults(self,iteration=None):
+        ## Frame of the given iteration (latest if None), None if not (or no longer) buffered
+        with self.lock:
+            if len(self.frames) == 0:
+                return None
+            if iteration is None:
+                return next(reversed(self.frames.values()))
+            return self.frames.get(iteration)
+
+    def getIterations(self):
+        with self.lock:
+            return list(self.frames.keys())
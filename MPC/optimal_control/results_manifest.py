@@ -0,0 +1,80 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+from threading import Lock
+
+class Results_Manifest():
+    ## Index of the results of a run (Results_<run>_index.csv): file, byte offset and first and last timestamp per iteration, csv files and Results_Store alike
+    ## Kept in memory, only the lines added since the last call are read (also the ones of another interface or process),
+    ## so finding an iteration or the latest one doesn't depend on the length of the run or the number of files in the directory
+    def __init__(self,savePath,run):
+        self.path = os.path.join(savePath,"Results_" + str(run) + "_index.csv")
+        self.entries = {}
+        self.position = 0
+        self.latest = None
+        self.lock = Lock() # the writing thread and the loop can use the same manifest
+
+    def getEntries(self):
+        with self.lock:
+            if os.path.isfile(self.path):
+                with open(self.path,"rb") as file:
+                    file.seek(self.position)
+                    for line in file:
+                        if line.endswith(b"\n") == False:
+                            break ## line is just being written
+                        self.position = self.position + len(line)
+                        iteration,name,offset,first,last = line.decode().rstrip("\n").split(";")
+                        if iteration == "iteration":
+                            continue
+                        self.entries[int(iteration)] = {"file":name,"offset":int(offset),"first":first,"last":last}
+                        if self.latest is None or int(iteration) > self.latest:
+                            self.latest = int(iteration)
+        return self.entries
+
+    def getEntry(self,iteration):
+        return self.getEntries().get(iteration)
+
+    def getLatest(self):
+        self.getEntries()
+        return self.latest
+
+    def setEntry(self,iteration,name,offset=0,first="",last=""):
+        ## name of the file in the save path, the line is only appended after the file (or batch) is written
+        with self.lock:
+            if os.path.isfile(self.path) == False:
+                with open(self.path,"w") as file:
+                    file.write("iteration;file;offset;first;last\n")
+            with open(self.path,"a") as file:
+                file.write(str(iteration) + ";" + str(name) + ";" + str(offset) + ";" + str(first) + ";" + str(last) + "\n")
+        self.getEntries()
@@ -0,0 +1,111 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import pandas as pd
+
+class Results_Store():
+    ## Results of all iterations of a run in one Arrow IPC stream (Results_<run>_part_<k>.arrows) instead of one csv file per iteration
+    ## Every iteration is one record batch with the columns iteration and timestamp, the manifest (Results_Manifest) holds file and byte offset per iteration,
+    ## so one iteration or a time range is read without reading the others. Results with other columns (e.g. frost period, warmstart models) go to their own part, a resumed run starts new parts.
+    def __init__(self,savePath,run,manifest):
+        self.savePath = savePath
+        self.run = str(run)
+        self.manifest = manifest
+        self.schemas = {}
+        self.parts = [] ## open parts with file name, schema, file and stream writer
+
+    def getPartName(self,part):
+        return "Results_" + self.run + "_part_" + str(part) + ".arrows"
+
+    def setResults(self,iteration,dataFrame):
+        import pyarrow as pa
+        frame = dataFrame.reset_index(names="timestamp")
+        frame["timestamp"] = frame["timestamp"].astype(str)
+        frame.insert(0,"iteration",iteration)
+        batch = pa.RecordBatch.from_pandas(frame,preserve_index=False).replace_schema_metadata(None)
+        part = None
+        for openPart in self.parts:
+            if openPart["schema"].equals(batch.schema):
+                part = openPart
+        if part is None:
+            names = set(entry["file"] for entry in self.manifest.getEntries().values() if entry["file"].endswith(".arrows")) | set(openPart["name"] for openPart in self.parts)
+            name = self.getPartName(len(names))
+            sink = pa.OSFile(os.path.join(self.savePath,name),"wb")
+            part = {"name":name,"schema":batch.schema,"sink":sink,"writer":pa.ipc.new_stream(sink,batch.schema)}
+            self.parts.append(part)
+            self.schemas[name] = batch.schema
+        offset = part["sink"].tell() ## the schema message is written with the first batch, getBatch skips it
+        part["writer"].write_batch(batch)
+        part["sink"].flush()
+        first = frame["timestamp"].iloc[0] if len(frame.index) > 0 else ""
+        last = frame["timestamp"].iloc[-1] if len(frame.index) > 0 else ""
+        self.manifest.setEntry(iteration=iteration,name=part["name"],offset=offset,first=first,last=last)
+
+    def getBatch(self,entry):
+        import pyarrow as pa
+        with pa.OSFile(os.path.join(self.savePath,entry["file"]),"rb") as source:
+            if entry["file"] not in self.schemas:
+                self.schemas[entry["file"]] = pa.ipc.read_schema(pa.ipc.read_message(source))
+            source.seek(entry["offset"])
+            message = pa.ipc.read_message(source)
+            if message.type == "schema":
+                message = pa.ipc.read_message(source)
+            return pa.ipc.read_record_batch(message,self.schemas[entry["file"]])
+
+    def getDataFrame(self,batches):
+        dataFrame = pd.concat([batch.to_pandas() for batch in batches]).set_index("timestamp")
+        dataFrame.index.name = None
+        return dataFrame
+
+    def getResults(self,iteration):
+        ## Results of one iteration like the csv file of the iteration, None if it isn't stored
+        entry = self.manifest.getEntry(iteration)
+        if entry is None or entry["file"].endswith(".arrows") == False:
+            return None
+        return self.getDataFrame([self.getBatch(entry)]).drop(columns="iteration")
+
+    def getResultsRange(self,timestampStart,timestampEnd):
+        ## Rows of all stored iterations between the timestamps ("%Y-%m-%d %H:%M:%S"), with the column iteration
+        entries = [entry for iteration,entry in sorted(self.manifest.getEntries().items()) if entry["file"].endswith(".arrows") and entry["first"] <= timestampEnd and entry["last"] >= timestampStart]
+        if len(entries) == 0:
+            return None
+        dataFrame = self.getDataFrame([self.getBatch(entry) for entry in entries])
+        return dataFrame[(dataFrame.index >= timestampStart) & (dataFrame.index <= timestampEnd)]
+
+    def close(self):
+        ## Ends the streams of the open parts, the next results start new parts
+        for part in self.parts:
+            part["writer"].close()
+            part["sink"].close()
+        self.parts = []
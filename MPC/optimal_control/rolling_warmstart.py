@@ -0,0 +1,91 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pandas as pd
+
+class Rolling_Warmstart():
+    ## Warmstart from the solution of the last iteration, shifted by the simulation interval (rolling horizon)
+    ## The long term model has no binaries to warmstart, so only the binary and linear binary parts are shifted
+    def __init__(self):
+        self.previousResults = None
+
+    def setParams(self,timestepsBinary,timestepsLinearBinary,stepSizeBinary,stepSizeLinearBinary,shiftInSec):
+        self.timestepsBinary = timestepsBinary
+        self.timestepsLinearBinary = timestepsLinearBinary
+        self.stepSizeBinary = stepSizeBinary
+        self.stepSizeLinearBinary = stepSizeLinearBinary
+        self.shiftInSec = shiftInSec
+
+    def setPreviousResults(self,previousResults=None):
+        ## Combined results (Optimal_Control.getResults) of the last iteration, None if there was no solution
+        self.previousResults = previousResults
+
+    def getPreviousResults(self):
+        return self.previousResults
+
+    def getAvailable(self):
+        return self.previousResults is not None
+
+    def getShiftedColumn(self,values,rows):
+        ## Values of the old time steps, gaps (other control period, end of the old horizon) hold the value before
+        values = np.round(pd.Series(values).ffill().fillna(0).to_numpy())
+        return values[np.minimum(rows,values.size-1)]
+
+    def getBinaryWarmstart(self):
+        binary = self.previousResults.iloc[0:self.timestepsBinary]
+        linear = self.previousResults.iloc[self.timestepsBinary-1:self.timestepsBinary+self.timestepsLinearBinary-1]
+        seconds = self.shiftInSec + np.arange(0,self.timestepsBinary)*self.stepSizeBinary
+        rows = (seconds // self.stepSizeBinary).astype(int)
+        rowsLinear = ((seconds - (self.timestepsBinary-1)*self.stepSizeBinary) // self.stepSizeLinearBinary).astype(int)
+        tail = rows > self.timestepsBinary-2
+
+        warmstart = {}
+        for column in binary.columns:
+            if column.startswith("B_") and column.endswith(("_T","_T_1","_T_2")):
+                warmstart[column] = self.getShiftedColumn(binary[column].to_numpy()[0:self.timestepsBinary-1],rows)
+                ## Heat pump stages behind the old binary horizon from the linear binary model
+                if column.startswith("B_HP_") and column[:-1]+"I" in linear.columns and tail.any():
+                    warmstart[column][tail] = self.getShiftedColumn(linear[column[:-1]+"I"].to_numpy()[0:self.timestepsLinearBinary-1],rowsLinear[tail])
+        return pd.DataFrame(warmstart,index=range(0,self.timestepsBinary))
+
+    def getLinearBinaryWarmstart(self):
+        linear = self.previousResults.iloc[self.timestepsBinary-1:self.timestepsBinary+self.timestepsLinearBinary-1]
+        seconds = self.shiftInSec + np.arange(0,self.timestepsLinearBinary)*self.stepSizeLinearBinary
+        rows = (seconds // self.stepSizeLinearBinary).astype(int)
+
+        warmstart = {}
+        for column in linear.columns:
+            if column.startswith("B_") and column.endswith(("_I","_I_2")):
+                warmstart[column] = self.getShiftedColumn(linear[column].to_numpy()[0:self.timestepsLinearBinary-1],rows)
+        return pd.DataFrame(warmstart,index=range(0,self.timestepsLinearBinary))
@@ -50,6 +50,7 @@ class Warmstart_Binary_Model():
         self.savingWarmstartSystemVals= savingWarmstartSystemVals
         self.optimization_results = pd.DataFrame()
         self.result_interface = sourceSavingSystemVals
+        self.partitionTimes = {}
 
     def setProfiles(self,profileForecastHeat,profileForecastCool,profileForecastDry,profileForecastWeather,profileForecastPrice,profileForecastFrost):
         self.profileForecastHeat = profileForecastHeat
@@ -94,8 +95,9 @@ class Warmstart_Binary_Model():
         self.T_CS_start = T_CS_start
         self.T_RLTS_start = T_RLTS_start
 
-    def runWarmstart(self,solver = 0, showSolverOutput = 0):
+    def runWarmstart(self,solver = 0, showSolverOutput = 0, threads = 8):
         print("Warmstart binary model started") 
+        self.partitionTimes = {}
         resultsFile = {} 
         j = 0
         controlPeriodSwitchCuted = self.controlPeriodSwitch
@@ -105,6 +107,7 @@ class Warmstart_Binary_Model():
 
         for partitionTimeSteps in partitionStepsTime:
             print("Optimizing model part " +str(j+1) + " of " + str(len(partitionStepsTime)) + ".")
+            timeStart = time.perf_counter()
             if timeStepStartPartition > 0:
                 self.m_prev = self.m
             self.m = pyo.ConcreteModel()
@@ -152,7 +155,7 @@ class Warmstart_Binary_Model():
             if solver == 0:
                 self.opt = pyo.SolverFactory('gurobi', solver_io="python")
                 self.opt.options['TimeLimit'] = int(self.timelimitWarmstart/2)
-                self.opt.options['threads'] = 8
+                self.opt.options['threads'] = threads
                 #self.opt.options['MIPFocus'] = 1
                 #self.opt.options['ObjBound'] = 50
                 #self.opt.options['Cutoff'] = 500
@@ -171,6 +174,7 @@ class Warmstart_Binary_Model():
 
             ## Get results ##
             resultsFile[j] = binary_model.getResults(model=self.m,source=None,savePath="",singleFile=False)
+            self.partitionTimes["part_"+str(j+1)] = time.perf_counter() - timeStart
             if timeStepStartPartition == 0:
                 pass
             else:
@@ -188,4 +192,7 @@ class Warmstart_Binary_Model():
                 pass
 
     def getResults(self):
-        return self.optimization_results
\ No newline at end of file
+        return self.optimization_results
+
+    def getPartitionTimes(self):
+        return self.partitionTimes
\ No newline at end of file
@@ -38,9 +38,66 @@ import pandas as pd
 from datetime import datetime
 from datetime import timedelta
 import time
+from concurrent.futures import ProcessPoolExecutor
+from pyomo.common.errors import ApplicationError
 
 from optimal_control.linear_binary_model import *
 
+def solveWarmstartPartition(partition):
+    ## Builds and solves one partition of the linear binary warmstart, returns its results and end state
+    ## (module level function, so it can be run in a worker process)
+    m = pyo.ConcreteModel()
+    linear_binary_model = Linear_Binary_Model()
+    linear_binary_model.setProfiles(**partition["profiles"])
+    linear_binary_model.setParams(timeSteps=list(range(0,partition["partitionTimeSteps"])),stepSizeInSec=partition["stepSizeInSec"],controlPeriod=partition["controlPeriod"],NMcCormick=partition["NMcCormick"])
+    m = linear_binary_model.setVariables(m)
+    m = linear_binary_model.setStartValues(model=m,**partition["startState"])
+    m = linear_binary_model.setEndValues(model=m,End_Temp_Constraints=False,T_HS_end=0,T_CS_end=0,T_RLTS_end=0,End_Toggle_Constraints=False,B_HP_1_end=0,B_HP_2_end=0,B_HP_3_end=0,B_HP_4_end=0,V_HP_HXH_end=0,V_HP_HS_end=0,V_HP_HGC_end=0,V_HGCHXC_end=0,V_HXA_end=0,V_HXA_HXH_end=0,V_HS_IS_end=0,V_IS_HGS_end=0,V_HXA_HGC_end=0,V_GS_HGS_end=0,V_GS_CS_end=0)
+    m = linear_binary_model.setConstraints(model=m)
+    m = linear_binary_model.setWarmstart(model=m,available=False,file=None)
+    m = linear_binary_model.setObjective(model=m)
+
+    if partition["solver"] == 0:
+        opt = pyo.SolverFactory('gurobi', solver_io="python")
+        opt.options['TimeLimit'] = partition["timeLimit"]
+        opt.options['threads'] = partition["threads"]
+        #opt.options['MIPFocus'] = 1
+        #opt.options['ObjBound'] = 50
+        #opt.options['Cutoff'] = 500
+    elif partition["solver"] == 1:
+        opt = pyo.SolverFactory('cbc')
+        opt.options['Sec'] = partition["timeLimit"]
+    elif partition["solver"] == 2:
+        opt = pyo.SolverFactory('glpk')
+        opt.options['tmlim'] = partition["timeLimit"]
+        #opt.options['mipgap'] = 1e-6 # not needed atm
+    elif partition["solver"] == 3:
+        opt = pyo.SolverFactory('appsi_highs')
+        opt.options['time_limit'] = partition["timeLimit"] ## threads of HiGHS are fixed per process, so they are not set here
+
+    results = opt.solve(m,warmstart=False,tee=True)
+
+    if partition["showSolverOutput"] == 1:
+        print(results)
+
+    ## Get results ##
+    i = linear_binary_model.I[-1]
+    endState = {"T_HP_HT_start":m.T_HP_HT_I[i](),"T_HP_LT_start":m.T_HP_LT_I[i](),"T_HS_start":m.T_HS_I[i](),"T_HXA_start":m.T_HXA_I[i](),"T_HXH_start":m.T_HXH_w_I[i](),"T_HGC_start":m.T_HGC_I[i](),
+    "T_HXC_start":m.T_HXC_b_I[i](),"T_HGS_start":m.T_HGS_I[i](),"T_IS_w_1_start":m.T_IS_W_I_WR[i,0](),"T_IS_w_2_start":m.T_IS_W_I_WR[i,2](),"T_IS_w_3_start":m.T_IS_W_I_WR[i,4](),
+    "T_IS_c_1_start":m.T_IS_C_I_CR[i,0](),"T_IS_c_2_start":m.T_IS_C_I_CR[i,1](),"T_IS_c_3_start":m.T_IS_C_I_CR[i,2](),"T_IS_c_4_start":m.T_IS_C_I_CR[i,3](),"T_IS_c_5_start":m.T_IS_C_I_CR[i,4](),
+    "T_GS_w_1_start":m.T_GS_W_I_WR_WC[i,0,1](),"T_GS_w_2_start":m.T_GS_W_I_WR_WC[i,0,3](),"T_GS_w_3_start":m.T_GS_W_I_WR_WC[i,0,5](),"T_GS_c_1_start":m.T_GS_C_I_CR_CC[i,0,0](),"T_GS_c_2_start":m.T_GS_C_I_CR_CC[i,0,1](),
+    "T_GS_c_3_start":m.T_GS_C_I_CR_CC[i,0,2](),"T_GS_c_4_start":m.T_GS_C_I_CR_CC[i,0,3](),"T_GS_c_5_start":m.T_GS_C_I_CR_CC[i,0,4](),"T_GS_c_6_start":m.T_GS_C_I_CR_CC[i,0,5](),"T_GS_c_7_start":m.T_GS_C_I_CR_CC[i,0,6](),
+    "T_CS_start":m.T_CS_I[i](),"T_RLTS_start":m.T_RLTS_I[i]()}
+    return linear_binary_model.getResults(model=m,source=None,savePath="",singleFile=False),endState
+
+def tryWarmstartPartition(partition):
+    ## A partition can be infeasible for an estimated start state, it is solved again in the repair pass then
+    try:
+        return solveWarmstartPartition(partition)
+    except (RuntimeError,ValueError,ApplicationError) as e:
+        print("Model part starting with the estimated state failed: " + str(e))
+        return None
+
 class Warmstart_Linear_Binary_Model():
     
     def __init__(self, timelimitWarmstart, warmstartPartitionLinearBinary, savingPathWarmstartSystemVals="", savingWarmstartSystemVals=False, sourceSavingSystemVals=None):
@@ -50,6 +107,9 @@ class Warmstart_Linear_Binary_Model():
         self.savingWarmstartSystemVals= savingWarmstartSystemVals
         self.optimization_results = pd.DataFrame()
         self.result_interface = sourceSavingSystemVals
+        self.previousResults = None
+        self.shiftInSec = 0
+        self.partitionTimes = {}
 
     def setProfiles(self,profileForecastHeat,profileForecastCool,profileForecastDry,profileForecastWeather,profileForecastPrice,profileForecastFrost):
         self.profileForecastHeat = profileForecastHeat
@@ -95,94 +155,144 @@ class Warmstart_Linear_Binary_Model():
         self.T_CS_start = T_CS_start
         self.T_RLTS_start = T_RLTS_start
 
-    def runWarmstart(self,solver = 0, showSolverOutput = 0):
-        print("Warmstart linear binary model started")
-        resultsFile = {} 
-        j = 0
+    def setPreviousResults(self,previousResults=None,shiftInSec=0):
+        ## Trajectory of the last cycle, used as estimate of the partition boundary states in the parallel mode
+        ## shiftInSec is the time between the cycles (SIM_INTERVAL), the time steps of the trajectory are that much earlier
+        self.previousResults = previousResults
+        self.shiftInSec = shiftInSec
 
+    def getPartitionStepsTime(self):
         partitionStepsTime = [int((self.timestepsLinearBinary+self.warmstartPartitionLinearBinary-1)/self.warmstartPartitionLinearBinary+0.999)] * (self.warmstartPartitionLinearBinary-1) + [self.timestepsLinearBinary-((int((self.timestepsLinearBinary+self.warmstartPartitionLinearBinary-1)/self.warmstartPartitionLinearBinary+0.999)-1)*(self.warmstartPartitionLinearBinary-1))]
-        timeStepStartPartition = 0 
-
         if partitionStepsTime[-1] == 1:
             partitionStepsTime[-2] = partitionStepsTime[-2] - 2
             partitionStepsTime[-1] = 3
         elif partitionStepsTime[-1] == 2:
             partitionStepsTime[-2] = partitionStepsTime[-2] - 1
             partitionStepsTime[-1] = 3
+        return partitionStepsTime
+
+    def getStartState(self):
+        return {"T_HP_HT_start":self.T_HP_HT_start,"T_HP_LT_start":self.T_HP_LT_start,"T_HS_start":self.T_HS_start,"T_HXA_start":self.T_HXA_start,"T_HXH_start":self.T_HXH_start,"T_HGC_start":self.T_HGC_start,
+        "T_HXC_start":self.T_HXC_start,"T_HGS_start":self.T_HGS_start,"T_IS_w_1_start":self.T_IS_w_1_start,"T_IS_w_2_start":self.T_IS_w_2_start,"T_IS_w_3_start":self.T_IS_w_3_start,
+        "T_IS_c_1_start":self.T_IS_c_1_start,"T_IS_c_2_start":self.T_IS_c_2_start,"T_IS_c_3_start":self.T_IS_c_3_start,"T_IS_c_4_start":self.T_IS_c_4_start,"T_IS_c_5_start":self.T_IS_c_5_start,
+        "T_GS_w_1_start":self.T_GS_w_1_start,"T_GS_w_2_start":self.T_GS_w_2_start,"T_GS_w_3_start":self.T_GS_w_3_start,"T_GS_c_1_start":self.T_GS_c_1_start,"T_GS_c_2_start":self.T_GS_c_2_start,
+        "T_GS_c_3_start":self.T_GS_c_3_start,"T_GS_c_4_start":self.T_GS_c_4_start,"T_GS_c_5_start":self.T_GS_c_5_start,"T_GS_c_6_start":self.T_GS_c_6_start,"T_GS_c_7_start":self.T_GS_c_7_start,
+        "T_CS_start":self.T_CS_start,"T_RLTS_start":self.T_RLTS_start}
+
+    def getEstimatedState(self,timeStep):
+        ## State of the last cycle's trajectory at the time step, shifted by the time between the cycles (interpolated between its steps)
+        ## if not available the current start state (steady state assumption)
+        if self.previousResults is None:
+            return self.getStartState()
+        columns = {"T_HP_HT_start":"T_HP_HT_I","T_HP_LT_start":"T_HP_LT_I","T_HS_start":"T_HS_I","T_HXA_start":"T_HXA_I","T_HXH_start":"T_HXH_w_I","T_HGC_start":"T_HGC_I",
+        "T_HXC_start":"T_HXC_b_I","T_HGS_start":"T_HGS_I","T_IS_w_1_start":"T_IS_W_0_I","T_IS_w_2_start":"T_IS_W_1_I","T_IS_w_3_start":"T_IS_W_2_I",
+        "T_IS_c_1_start":"T_IS_C_0_I","T_IS_c_2_start":"T_IS_C_1_I","T_IS_c_3_start":"T_IS_C_2_I","T_IS_c_4_start":"T_IS_C_3_I","T_IS_c_5_start":"T_IS_C_4_I",
+        "T_GS_w_1_start":"T_GS_W_0_I","T_GS_w_2_start":"T_GS_W_1_I","T_GS_w_3_start":"T_GS_W_2_I","T_GS_c_1_start":"T_GS_C_0_I","T_GS_c_2_start":"T_GS_C_1_I",
+        "T_GS_c_3_start":"T_GS_C_2_I","T_GS_c_4_start":"T_GS_C_3_I","T_GS_c_5_start":"T_GS_C_4_I","T_GS_c_6_start":"T_GS_C_5_I","T_GS_c_7_start":"T_GS_C_6_I",
+        "T_CS_start":"T_CS_I","T_RLTS_start":"T_RLTS_I"}
+        position = timeStep + self.shiftInSec / self.stepSizeLinearBinary
+        step = int(position)
+        weight = position - step
+        try:
+            rows = self.previousResults.loc[[step,step+1] if weight > 0 else [step,step],list(columns.values())].to_numpy(dtype=float)
+        except KeyError as e:
+            print("No state at time step " + str(timeStep) + " in last cycle's trajectory, using the start state: " + str(e))
+            return self.getStartState()
+        values = rows[0] * (1 - weight) + rows[1] * weight
+        if np.isnan(values).any():
+            print("No complete state at time step " + str(timeStep) + " in last cycle's trajectory, using the start state.")
+            return self.getStartState()
+        return dict(zip(columns.keys(),values.tolist()))
+
+    def getPartition(self,timeStepStartPartition,partitionTimeSteps,startState,solver,timeLimit,threads,showSolverOutput):
+        profiles = {}
+        for name in ["profileForecastHeat","profileForecastCool","profileForecastDry","profileForecastWeather","profileForecastPrice","profileForecastFrost"]:
+            profiles[name] = getattr(self,name)[timeStepStartPartition:timeStepStartPartition+partitionTimeSteps-1]
+        return {"profiles":profiles,"partitionTimeSteps":partitionTimeSteps,"stepSizeInSec":self.stepSizeLinearBinary,"controlPeriod":self.controlPeriod,"NMcCormick":self.NMcCormick,
+        "startState":startState,"solver":solver,"timeLimit":timeLimit,"threads":threads,"showSolverOutput":showSolverOutput}
 
-        for partitionTimeSteps in partitionStepsTime:
+    def addPartitionResults(self,results,timeStepStartPartition):
+        if timeStepStartPartition == 0:
+            pass
+        else:
+            results.index += (timeStepStartPartition)
+        self.optimization_results = pd.concat([self.optimization_results,results],axis=0) 
+        self.optimization_results = self.optimization_results[~self.optimization_results.index.duplicated(keep="last")]
+
+    def runWarmstart(self,solver = 0, showSolverOutput = 0, parallel = False, processes = None, repairTolerance = 0.5, threads = None):
+        if parallel == True:
+            return self.runParallelWarmstart(solver=solver,showSolverOutput=showSolverOutput,processes=processes,repairTolerance=repairTolerance,threads=threads)
+        print("Warmstart linear binary model started")
+        self.partitionTimes = {}
+        partitionStepsTime = self.getPartitionStepsTime()
+        timeStepStartPartition = 0 
+        startState = self.getStartState()
+
+        for j,partitionTimeSteps in enumerate(partitionStepsTime):
             print("Optimizing model part " +str(j+1) + " of " + str(len(partitionStepsTime)) + ".")
-            if timeStepStartPartition > 0:
-                self.m_prev = self.m
-            self.m = pyo.ConcreteModel()
-            linear_binary_model = Linear_Binary_Model()
-
-            linear_binary_model.setProfiles(profileForecastHeat=self.profileForecastHeat[timeStepStartPartition:timeStepStartPartition+partitionTimeSteps-1],profileForecastCool=self.profileForecastCool[timeStepStartPartition:timeStepStartPartition+partitionTimeSteps-1],profileForecastDry=self.profileForecastDry[timeStepStartPartition:timeStepStartPartition+partitionTimeSteps-1],profileForecastWeather=self.profileForecastWeather[timeStepStartPartition:timeStepStartPartition+partitionTimeSteps-1],profileForecastPrice=self.profileForecastPrice[timeStepStartPartition:timeStepStartPartition+partitionTimeSteps-1],profileForecastFrost=self.profileForecastFrost[timeStepStartPartition:timeStepStartPartition+partitionTimeSteps-1])
-            linear_binary_model.setParams(timeSteps=list(range(0,partitionTimeSteps)),stepSizeInSec=self.stepSizeLinearBinary,controlPeriod=self.controlPeriod,NMcCormick=self.NMcCormick)
-            self.m = linear_binary_model.setVariables(self.m)                                                          
-
-            if timeStepStartPartition == 0:
-                self.m = linear_binary_model.setStartValues(model=self.m,T_HP_HT_start=self.T_HP_HT_start,T_HP_LT_start=self.T_HP_LT_start,T_HS_start=self.T_HS_start,
-                T_HXA_start=self.T_HXA_start,T_HXH_start=self.T_HXH_start,T_HGC_start=self.T_HGC_start,T_HXC_start=self.T_HXC_start,T_HGS_start=self.T_HGS_start,
-                T_IS_w_1_start=self.T_IS_w_1_start,T_IS_w_2_start=self.T_IS_w_2_start,
-                T_IS_w_3_start=self.T_IS_w_3_start,T_IS_c_1_start=self.T_IS_c_1_start,T_IS_c_2_start=self.T_IS_c_2_start,T_IS_c_3_start=self.T_IS_c_3_start,
-                T_IS_c_4_start=self.T_IS_c_4_start,T_IS_c_5_start=self.T_IS_c_5_start,T_GS_w_1_start=self.T_GS_w_1_start,
-                T_GS_w_2_start=self.T_GS_w_2_start,T_GS_w_3_start=self.T_GS_w_3_start,T_GS_c_1_start=self.T_GS_c_1_start,T_GS_c_2_start=self.T_GS_c_2_start,
-                T_GS_c_3_start=self.T_GS_c_3_start,T_GS_c_4_start=self.T_GS_c_4_start,T_GS_c_5_start=self.T_GS_c_5_start,T_GS_c_6_start=self.T_GS_c_6_start,
-                T_GS_c_7_start=self.T_GS_c_7_start,T_CS_start=self.T_CS_start,T_RLTS_start=self.T_RLTS_start)
-            else:
-                self.m = linear_binary_model.setStartValues(model=self.m,T_HP_HT_start=self.m_prev.T_HP_HT_I[partitionStepsTime[j-1]-1](),T_HP_LT_start=self.m_prev.T_HP_LT_I[partitionStepsTime[j-1]-1](),
-                T_HS_start=self.m_prev.T_HS_I[partitionStepsTime[j-1]-1](),T_HXA_start=self.m_prev.T_HXA_I[partitionStepsTime[j-1]-1](),T_HXH_start=self.m_prev.T_HXH_w_I[partitionStepsTime[j-1]-1](),T_HGC_start=self.m_prev.T_HGC_I[partitionStepsTime[j-1]-1](),
-                T_HXC_start=self.m_prev.T_HXC_b_I[partitionStepsTime[j-1]-1](),T_HGS_start=self.m_prev.T_HGS_I[partitionStepsTime[j-1]-1](),T_IS_w_1_start=self.m_prev.T_IS_W_I_WR[partitionStepsTime[j-1]-1,0](),T_IS_w_2_start=self.m_prev.T_IS_W_I_WR[partitionStepsTime[j-1]-1,2](),
-                T_IS_w_3_start=self.m_prev.T_IS_W_I_WR[partitionStepsTime[j-1]-1,4](),T_IS_c_1_start=self.m_prev.T_IS_C_I_CR[partitionStepsTime[j-1]-1,0](),T_IS_c_2_start=self.m_prev.T_IS_C_I_CR[partitionStepsTime[j-1]-1,1](),
-                T_IS_c_3_start=self.m_prev.T_IS_C_I_CR[partitionStepsTime[j-1]-1,2](),T_IS_c_4_start=self.m_prev.T_IS_C_I_CR[partitionStepsTime[j-1]-1,3](),T_IS_c_5_start=self.m_prev.T_IS_C_I_CR[partitionStepsTime[j-1]-1,4](),
-                T_GS_w_1_start=self.m_prev.T_GS_W_I_WR_WC[partitionStepsTime[j-1]-1,0,1](),T_GS_w_2_start=self.m_prev.T_GS_W_I_WR_WC[partitionStepsTime[j-1]-1,0,3](),T_GS_w_3_start=self.m_prev.T_GS_W_I_WR_WC[partitionStepsTime[j-1]-1,0,5](),
-                T_GS_c_1_start=self.m_prev.T_GS_C_I_CR_CC[partitionStepsTime[j-1]-1,0,0](),T_GS_c_2_start=self.m_prev.T_GS_C_I_CR_CC[partitionStepsTime[j-1]-1,0,1](),T_GS_c_3_start=self.m_prev.T_GS_C_I_CR_CC[partitionStepsTime[j-1]-1,0,2](),
-                T_GS_c_4_start=self.m_prev.T_GS_C_I_CR_CC[partitionStepsTime[j-1]-1,0,3](),T_GS_c_5_start=self.m_prev.T_GS_C_I_CR_CC[partitionStepsTime[j-1]-1,0,4](),T_GS_c_6_start=self.m_prev.T_GS_C_I_CR_CC[partitionStepsTime[j-1]-1,0,5](),
-                T_GS_c_7_start=self.m_prev.T_GS_C_I_CR_CC[partitionStepsTime[j-1]-1,0,6](),T_CS_start=self.m_prev.T_CS_I[partitionStepsTime[j-1]-1](),T_RLTS_start=self.m_prev.T_RLTS_I[partitionStepsTime[j-1]-1]())
-
-            self.m = linear_binary_model.setEndValues(model=self.m,End_Temp_Constraints=False,T_HS_end=0,T_CS_end=0,T_RLTS_end=0,End_Toggle_Constraints=False,B_HP_1_end=0,B_HP_2_end=0,B_HP_3_end=0,B_HP_4_end=0,V_HP_HXH_end=0,V_HP_HS_end=0,V_HP_HGC_end=0,V_HGCHXC_end=0,V_HXA_end=0,V_HXA_HXH_end=0,V_HS_IS_end=0,V_IS_HGS_end=0,V_HXA_HGC_end=0,V_GS_HGS_end=0,V_GS_CS_end=0)
-            self.m = linear_binary_model.setConstraints(model=self.m)
-            self.m = linear_binary_model.setWarmstart(model=self.m,available=False,file=None)
-            self.m = linear_binary_model.setObjective(model=self.m)
-
-            if solver == 0:
-                self.opt = pyo.SolverFactory('gurobi', solver_io="python")
-                self.opt.options['TimeLimit'] = int(self.timelimitWarmstart/self.warmstartPartitionLinearBinary)
-                self.opt.options['threads'] = 8
-                #self.opt.options['MIPFocus'] = 1
-                #self.opt.options['ObjBound'] = 50
-                #self.opt.options['Cutoff'] = 500
-            elif solver == 1:
-                self.opt = pyo.SolverFactory('cbc')
-                self.opt.options['Sec'] = int(self.timelimitWarmstart/self.warmstartPartitionLinearBinary)
-            elif solver == 2:
-                self.opt = pyo.SolverFactory('glpk')
-                self.opt.options['tmlim'] = int(self.timelimitWarmstart/self.warmstartPartitionLinearBinary)
-                #self.opt.options['mipgap'] = 1e-6 # not needed atm
-
-            self.results = self.opt.solve(self.m,warmstart=False,tee=True)
-
-            if showSolverOutput == 1:
-                print(self.results)
-
-            ## Get results ##
-            resultsFile[j] = linear_binary_model.getResults(model=self.m,source=None,savePath="",singleFile=False)
-            if timeStepStartPartition == 0:
-                pass
-            else:
-                resultsFile[j].index += (timeStepStartPartition)
-            self.optimization_results = pd.concat([self.optimization_results,resultsFile[j]],axis=0) 
-            self.optimization_results = self.optimization_results[~self.optimization_results.index.duplicated(keep="last")]
-
-            j = j+1
+            timeStart = time.perf_counter()
+            results,startState = solveWarmstartPartition(self.getPartition(timeStepStartPartition=timeStepStartPartition,partitionTimeSteps=partitionTimeSteps,startState=startState,solver=solver,
+            timeLimit=int(self.timelimitWarmstart/self.warmstartPartitionLinearBinary),threads=threads or 8,showSolverOutput=showSolverOutput))
+            self.partitionTimes["part_"+str(j+1)] = time.perf_counter() - timeStart
+            self.addPartitionResults(results=results,timeStepStartPartition=timeStepStartPartition)
             timeStepStartPartition = timeStepStartPartition + partitionTimeSteps-1      
 
+        self.setWarmstartSystemVals()
+
+    def runParallelWarmstart(self,solver = 0, showSolverOutput = 0, processes = None, repairTolerance = 0.5, threads = None):
+        ## All partitions are solved at once in a process pool, starting from estimated boundary states (last cycle or steady state)
+        ## Afterwards a repair pass solves again every partition which failed or whose estimated start differs more than repairTolerance (K) from the end of the partition before
+        print("Parallel warmstart linear binary model started")
+        self.partitionTimes = {}
+        partitionStepsTime = self.getPartitionStepsTime()
+        timeStepsStartPartition = [0]
+        for partitionTimeSteps in partitionStepsTime[0:-1]:
+            timeStepsStartPartition.append(timeStepsStartPartition[-1] + partitionTimeSteps-1)
+        if processes is None:
+            processes = min(len(partitionStepsTime),os.cpu_count() or 1)
+        timeLimit = int(self.timelimitWarmstart/self.warmstartPartitionLinearBinary)
+        threadsPartition = max(1,int((threads or os.cpu_count() or 1)/processes)) ## threads (default all cores) are shared by the processes
+        startStates = [self.getStartState()] + [self.getEstimatedState(timeStep) for timeStep in timeStepsStartPartition[1:]]
+
+        partitions = []
+        for j in range(0,len(partitionStepsTime)):
+            partitions.append(self.getPartition(timeStepStartPartition=timeStepsStartPartition[j],partitionTimeSteps=partitionStepsTime[j],startState=startStates[j],solver=solver,
+            timeLimit=timeLimit,threads=threadsPartition,showSolverOutput=showSolverOutput))
+        timeStart = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            solutions = list(executor.map(tryWarmstartPartition,partitions))
+        self.partitionTimes["parallel"] = time.perf_counter() - timeStart
+
+        ## Repair pass (stitching of the boundaries)
+        repaired = 0
+        if solutions[0] is None:
+            solutions[0] = solveWarmstartPartition(partitions[0])
+        for j in range(1,len(partitionStepsTime)):
+            endState = solutions[j-1][1]
+            if solutions[j] is None or max(abs(endState[k] - startStates[j][k]) for k in endState) > repairTolerance:
+                print("Repairing model part " +str(j+1) + " of " + str(len(partitionStepsTime)) + ".")
+                timeStart = time.perf_counter()
+                startStates[j] = endState
+                solutions[j] = solveWarmstartPartition(self.getPartition(timeStepStartPartition=timeStepsStartPartition[j],partitionTimeSteps=partitionStepsTime[j],startState=endState,solver=solver,
+                timeLimit=max(1,int(timeLimit/2)),threads=threads or 8,showSolverOutput=showSolverOutput))
+                self.partitionTimes["repair_"+str(j+1)] = time.perf_counter() - timeStart
+                repaired = repaired + 1
+        print("Repaired " + str(repaired) + " of " + str(len(partitionStepsTime)-1) + " boundaries.")
+
+        for j in range(0,len(partitionStepsTime)):
+            self.addPartitionResults(results=solutions[j][0],timeStepStartPartition=timeStepsStartPartition[j])
+
+        self.setWarmstartSystemVals()
+
+    def setWarmstartSystemVals(self):
         if self.savingWarmstartSystemVals == True:
             try:
                 self.result_interface.setOptimizationResults(dataFrame=self.optimization_results,savePath=self.savingPathWarmstartSystemVals)
-            except:
-                pass
+            except OSError as e:
+                print("Warmstart results not saved: " + str(e))
 
     def getResults(self):
         return self.optimization_results
+
+    def getPartitionTimes(self):
+        return self.partitionTimes
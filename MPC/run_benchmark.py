@@ -0,0 +1,187 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+############################ IMPORTS #############################
+import os
+FILE_PATH = os.path.dirname(os.path.abspath(__file__))
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from itertools import product
+import time
+##################################################################
+
+#################### OPTIMAL CONTROL IMPORTS #####################
+from optimal_control.optimal_control import *
+from optimal_control.binary_model import *
+from optimal_control.linear_binary_model import *
+from optimal_control.long_term_model import *
+from optimal_control.forecast_interface import *
+from optimal_control.measurements_interface import *
+from optimal_control.cycle_profiler import *
+##################################################################
+
+############################ SETTINGS ############################
+## Every combination of the lists is built and solved once per seed (no sleeping, random forecasts, standard measurements)
+BENCHMARK_TIMESTEPS_BINARY = [7]
+BENCHMARK_TIMESTEPS_LINEAR_BINARY = [11,23]
+BENCHMARK_TIMESTEPS_LONG_TERM = [25]
+BENCHMARK_N_MCCORMICK = [2]
+BENCHMARK_SOLVERS = [1,2,3] ## 0 gurobi, 1 cbc, 2 glpk, 3 highs
+BENCHMARK_FROST = [False] ## long term model with or without frost period
+BENCHMARK_SEEDS = [0,1,2] ## seeds of the random forecasts
+
+TIMELIMIT_SOLVER = 200 ## in seconds
+BENCHMARK_LABEL = "" ## e.g. branch or commit, written to every row
+BENCHMARK_BASELINE = "" ## benchmark file to compare with, "" for no comparison
+
+SAVEPATH_BENCHMARK = FILE_PATH + "\\optimal_control\\benchmark_results\\"
+BENCHMARK_STARTTIME = "2022-06-15 00:00:00"
+
+CONTROL_PERIOD_1 = 1
+CONTROL_PERIOD_2 = 2
+CONTROL_PERIOD_3 = 1
+CONTROL_PERIOD_SWITCH = 2
+
+TEN_MINUTES = 600
+ONE_HOUR = 3600
+SIX_HOURS = 21600
+ONE_WEEK_IN_HOURS = 168
+##################################################################
+
+############################## CODE ##############################
+def setup():
+    print("Folder: " + str(FILE_PATH))
+    print("")
+    try:
+        os.makedirs(SAVEPATH_BENCHMARK,exist_ok=True)
+    except:
+        pass
+
+def buildModel(forecast_data,measurements_data,timestepsBinary,timestepsLinearBinary,timestepsLongTerm,nMcCormick):
+    ## Same model as in run_control, without warmstart
+    optimal_control = Optimal_Control()
+    binary_model = Binary_Model()
+    linear_binary_model = Linear_Binary_Model()
+    long_term_model = Long_Term_Model()
+
+    binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][:timestepsBinary-1],profileForecastCool=forecast_data["profileForecastCool"][:timestepsBinary-1],profileForecastDry=forecast_data["profileForecastDry"][:timestepsBinary-1],profileForecastWeather=forecast_data["profileForecastWeather"][:timestepsBinary-1],profileForecastPrice=forecast_data["profileForecastPrice"][:timestepsBinary-1],profileForecastFrost=forecast_data["profileForecastFrost"][:timestepsBinary-1])
+    linear_binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][timestepsBinary-1:timestepsBinary+timestepsLinearBinary-2],profileForecastCool=forecast_data["profileForecastCool"][timestepsBinary-1:timestepsBinary+timestepsLinearBinary-2],profileForecastDry=forecast_data["profileForecastDry"][timestepsBinary-1:timestepsBinary+timestepsLinearBinary-2],profileForecastWeather=forecast_data["profileForecastWeather"][timestepsBinary-1:timestepsBinary+timestepsLinearBinary-2],profileForecastPrice=forecast_data["profileForecastPrice"][timestepsBinary-1:timestepsBinary+timestepsLinearBinary-2],profileForecastFrost=forecast_data["profileForecastFrost"][timestepsBinary-1:timestepsBinary+timestepsLinearBinary-2])
+    long_term_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][timestepsBinary+timestepsLinearBinary-2:timestepsBinary+timestepsLinearBinary+timestepsLongTerm-3],profileForecastPrice=forecast_data["profileForecastPrice"][timestepsBinary+timestepsLinearBinary-2:timestepsBinary+timestepsLinearBinary+timestepsLongTerm-3],forecastFrost=forecast_data["forecastFrost"])
+
+    binary_model.setParams(timeSteps=list(range(0,timestepsBinary)),stepSizeInSec=TEN_MINUTES,controlPeriod1=CONTROL_PERIOD_1,controlPeriod2=CONTROL_PERIOD_2,tControlPeriodSwitch=CONTROL_PERIOD_SWITCH)
+    linear_binary_model.setParams(timeSteps=list(range(0,timestepsLinearBinary)),stepSizeInSec=ONE_HOUR,controlPeriod=CONTROL_PERIOD_3,NMcCormick=list(range(0,nMcCormick)))
+    long_term_model.setParams(timeSteps=list(range(0,timestepsLongTerm)),stepSizeInSec=SIX_HOURS)
+
+    optimal_control.addModelParts(model = binary_model.setVariables(optimal_control.getModel()))
+    optimal_control.addModelParts(model = linear_binary_model.setVariables(optimal_control.getModel()))
+    optimal_control.addModelParts(model = long_term_model.setVariables(optimal_control.getModel()))
+
+    m = optimal_control.getModel()
+    optimal_control.addModelParts(binary_model.setStartValues(model=m,**measurements_data.getStartValues()))
+    optimal_control.addModelParts(linear_binary_model.setStartValues(model=m,**binary_model.getEndStates(model=m)))
+    optimal_control.addModelParts(long_term_model.setStartValues(model=m,**linear_binary_model.getEndStates(model=m)))
+
+    optimal_control.addModelParts(binary_model.setEndValues(model=m,End_Temp_Constraints=False,T_HS_end=0,T_CS_end=0,T_RLTS_end=0,End_Toggle_Constraints=True,**linear_binary_model.getStartToggles(model=m)))
+    optimal_control.addModelParts(linear_binary_model.setEndValues(model=m,End_Temp_Constraints=False,T_HS_end=(40+33)/2,T_CS_end=(18+10)/2,T_RLTS_end=(18+6)/2,End_Toggle_Constraints=False,B_HP_1_end=0,B_HP_2_end=0,B_HP_3_end=0,B_HP_4_end=0,V_HP_HXH_end=0,V_HP_HS_end=0,V_HP_HGC_end=0,V_HGCHXC_end=0,V_HXA_end=0,V_HXA_HXH_end=0,V_HS_IS_end=0,V_IS_HGS_end=0,V_HXA_HGC_end=0,V_GS_HGS_end=0,V_GS_CS_end=0))
+    optimal_control.addModelParts(long_term_model.setEndValues(model=m,End_Temp_Constraints=False))
+
+    optimal_control.addModelParts(binary_model.setConstraints(model=optimal_control.getModel()))
+    optimal_control.addModelParts(linear_binary_model.setConstraints(model=optimal_control.getModel()))
+    optimal_control.addModelParts(long_term_model.setConstraints(model=optimal_control.getModel()))
+
+    optimal_control.addModelParts(binary_model.setWarmstart(model=optimal_control.getModel(),available=False,file=None))
+    optimal_control.addModelParts(linear_binary_model.setWarmstart(model=optimal_control.getModel(),available=False,file=None))
+    optimal_control.addModelParts(long_term_model.setWarmstart(model=optimal_control.getModel()))
+
+    optimal_control.addModelObject(object=binary_model,position=0,symbol="T")
+    optimal_control.addModelObject(object=linear_binary_model,position=1,symbol="I")
+    optimal_control.addModelObject(object=long_term_model,position=2,symbol="J")
+    optimal_control.setObjective()
+    return optimal_control
+
+def runBenchmark():
+    started = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+    timestampStart = datetime.strptime(BENCHMARK_STARTTIME,"%Y-%m-%d %H:%M:%S")
+    forecast_interface = Forecast_Interface(source="random")
+    measurements_interface = Measurements_Interface(source="standard")
+    cycle_profiler = Cycle_Profiler(active=False)
+    rows = []
+
+    for timestepsBinary,timestepsLinearBinary,timestepsLongTerm,nMcCormick,forecastFrost,seed,solver in product(BENCHMARK_TIMESTEPS_BINARY,BENCHMARK_TIMESTEPS_LINEAR_BINARY,BENCHMARK_TIMESTEPS_LONG_TERM,BENCHMARK_N_MCCORMICK,BENCHMARK_FROST,BENCHMARK_SEEDS,BENCHMARK_SOLVERS):
+        print("### Benchmark T=" + str(timestepsBinary) + " I=" + str(timestepsLinearBinary) + " J=" + str(timestepsLongTerm) + " N_MC=" + str(nMcCormick) + " frost=" + str(forecastFrost) + " seed=" + str(seed) + " solver=" + str(solver) + " ###")
+        np.random.seed(seed)
+        forecast_data = forecast_interface.getProfilesAll(timestampStart=timestampStart, intervals=[TEN_MINUTES] * (timestepsBinary-1) + [ONE_HOUR] * (timestepsLinearBinary-1) + [SIX_HOURS] * (timestepsLongTerm-1), periodFrostInHours=ONE_WEEK_IN_HOURS)
+        forecast_data["forecastFrost"] = forecastFrost
+        measurements_data = measurements_interface.getMeasurementsAll()
+
+        timeStart = time.perf_counter()
+        optimal_control = buildModel(forecast_data=forecast_data,measurements_data=measurements_data,timestepsBinary=timestepsBinary,timestepsLinearBinary=timestepsLinearBinary,timestepsLongTerm=timestepsLongTerm,nMcCormick=nMcCormick)
+        buildSeconds = time.perf_counter() - timeStart
+
+        timeStart = time.perf_counter()
+        try:
+            optimal_control.setSolverAndRunOptimization(solver=solver,warmstart=False,timeLimit=TIMELIMIT_SOLVER,showSolverOutput=0,writeILP=0,writeMPSfile=0,persistent=False)
+            statistics = optimal_control.getSolverStatistics()
+        except Exception as e:
+            print("Benchmark run failed: " + str(e))
+            statistics = {"termination":"error: " + str(e).split(".")[0],"objective":None,"bound":None,"gap":None}
+        solveSeconds = time.perf_counter() - timeStart
+
+        row = {"label":BENCHMARK_LABEL,"started":started,"timestepsBinary":timestepsBinary,"timestepsLinearBinary":timestepsLinearBinary,"timestepsLongTerm":timestepsLongTerm,"nMcCormick":nMcCormick,
+        "forecastFrost":forecastFrost,"seed":seed,"solver":solver,"buildSeconds":round(buildSeconds,4),"solveSeconds":round(solveSeconds,4)}
+        row.update(statistics)
+        row.update(cycle_profiler.getModelStatistics(model=optimal_control.getModel()))
+        rows.append(row)
+        ## Written after every run, so an aborted benchmark keeps its results
+        results = pd.DataFrame(rows)
+        results.to_csv(SAVEPATH_BENCHMARK + "Benchmark_" + started + ".csv", sep = ";", index=False)
+
+    print(results.groupby(["timestepsBinary","timestepsLinearBinary","timestepsLongTerm","nMcCormick","forecastFrost","solver"])[["buildSeconds","solveSeconds","objective","gap"]].mean())
+    if BENCHMARK_BASELINE != "":
+        compareBenchmark(results=results,baselinePath=BENCHMARK_BASELINE)
+    return results
+
+def compareBenchmark(results,baselinePath):
+    ## Ratio of build and solve time (new / baseline) and difference of the objective for the same configuration and seed
+    keys = ["timestepsBinary","timestepsLinearBinary","timestepsLongTerm","nMcCormick","forecastFrost","seed","solver"]
+    baseline = pd.read_csv(baselinePath, sep = ";")
+    compared = results.merge(baseline,on=keys,suffixes=("","_baseline"))
+    compared["buildRatio"] = compared["buildSeconds"] / compared["buildSeconds_baseline"]
+    compared["solveRatio"] = compared["solveSeconds"] / compared["solveSeconds_baseline"]
+    compared["objectiveDelta"] = compared["objective"] - compared["objective_baseline"]
+    print(compared.groupby(keys[:-2]+["solver"])[["buildRatio","solveRatio","objectiveDelta"]].mean())
+    return compared
+##################################################################
+if __name__ == "__main__":
+    setup()
+    runBenchmark()
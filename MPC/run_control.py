@@ -33,10 +33,9 @@
 
 ############################ IMPORTS #############################
 import os
+import sys
 FILE_PATH = os.path.dirname(os.path.abspath(__file__))
-import pyomo.environ as pyo
 import numpy as np
-import pandas as pd
 from datetime import datetime
 from datetime import timedelta
 import time
@@ -44,6 +43,7 @@ import time
 
 #################### OPTIMAL CONTROL IMPORTS #####################
 from optimal_control.optimal_control import *
+from optimal_control.matrix_model import *
 from optimal_control.binary_model import *
 from optimal_control.linear_binary_model import *
 from optimal_control.long_term_model import *
@@ -51,8 +51,16 @@ from optimal_control.forecast_interface import *
 from optimal_control.market_interface import *
 from optimal_control.measurements_interface import *
 from optimal_control.optimization_results_interface import *
+from optimal_control.results_buffer import *
 from optimal_control.warmstart_binary_model import *
 from optimal_control.warmstart_linear_binary_model import *
+from optimal_control.rolling_warmstart import *
+from optimal_control.long_term_cache import *
+from optimal_control.cycle_profiler import *
+from optimal_control.checkpoint_interface import *
+from optimal_control.closed_loop_summary import *
+from optimal_control.control_config import *
+from optimal_control.plant_simulator import *
 #from optimal_control.modelica_interface import * !! activate, if modelica model connected
 ##################################################################
 
@@ -70,8 +78,11 @@ SAVEPATH_MPC= FILE_PATH + "\\optimal_control\\optimization_results\\"
 LOADPATH_FORECAST_DEMAND= FILE_PATH + "\\optimal_control\\forecast_values\\all.csv"
 LOADPATH_FORECAST_WEATHER= FILE_PATH + "\\optimal_control\\forecast_values\\weather.csv"
 LOADPATH_FORECAST_PRICE = FILE_PATH + "\\optimal_control\\forecast_values\\dayaheadprices_2022.csv"
+SAVELOADPATH_FORECAST_STORE = FILE_PATH + "\\optimal_control\\forecast_values\\store\\" ## memory mapped copy of the forecast csv files, "" to read the csv files directly
 SAVELOADPATH_MEASUREMENTS= FILE_PATH + "\\optimal_control\\optimization_results\\"
 SAVEPATH_WARMSTART= FILE_PATH + "\\optimal_control\\warmstart_values\\"
+SAVEPATH_PROFILE= FILE_PATH + "\\optimal_control\\profile_values\\"
+SAVEPATH_CHECKPOINT= FILE_PATH + "\\optimal_control\\checkpoint_values\\" ## checkpoint and summary of the batch mode
 #PACKAGEPATH_MODELICA= FILE_PATH + "XXX\\package.mo" !! activate, if modelica model connected
 #MODEL_NAME_MODELICA= FILE_PATH + "XXX.essystem.control" !! activate, if modelica model connected
 #OUTPUTPATH_MODELICA= FILE_PATH + "XXX\\results" !! activate, if modelica model connected
@@ -82,6 +93,14 @@ SIM_STARTTIME = "2022-06-15 00:00:00" ## This here for MPC, since first iteratio
 SIM_ENDTIME = "2022-06-16 00:00:00"
 SIM_ENDTIME_PLUS_A_WEEK = "2022-06-30 00:00:00" # for long term model (end time + one week horizon)
 SIM_INTERVAL = 600 ## in seconds
+BATCH_MODE = False ## closed loop from SIM_STARTTIME to SIM_ENDTIME as fast as the solver allows (no sleeping), e.g. for tuning and seasonal studies
+CHECKPOINT_BATCH = True ## checkpoint after every iteration of the batch mode, an aborted run with the same time range is resumed
+
+PLANT_SIMULATOR = False ## closed loop with the plant surrogate (equations of the binary model) instead of the predicted states of the last optimization
+PLANT_SUBSTEPS = 10 ## internal steps of the plant surrogate per SIM_INTERVAL
+PLANT_NOISE = 0.0 ## in Kelvin, standard deviation of the measured temperatures of the plant surrogate
+PLANT_MISMATCH = 0.0 ## relative standard deviation of the masses, losses and heat transfer coefficients of the plant surrogate (drawn once per run)
+PLANT_SEED = None ## seed of the noise and the mismatch, None for a new one in every run
 
 PRICE_TYPE = "flat" ## flat or variable
 
@@ -93,12 +112,39 @@ DIRECTION_MARKET = "pos"
 TYPE_MARKET = "demandResponse"
 
 TIMELIMIT_SOLVER = 200 ## in seconds
+SOLVER_THREADS = 8 ## threads of the solver (main optimization and warmstart)
+SOLVER_CHAIN = [0] ## tried in this order until one comes to a solution: 0 gurobi, 1 cbc, 2 glpk, 3 highs, 4 lp relaxation with rounded binaries, 5 race of SOLVER_RACE, e.g. [0,3,1,4]
+SOLVER_CHAIN_SHARE = 0.6 ## share of the time left until the deadline for every solver of the chain, the last one gets all of it
+SOLVER_RACE = [{"solver":3,"options":{"random_seed":0}},{"solver":3,"options":{"random_seed":1,"mip_heuristic_effort":0.3}},{"solver":1}] ## solver settings raced in parallel processes as solver 5 of the chain
+SOLVER_RACE_GAP = 0.01 ## the first solution of the race within this relative mip gap wins
+SOLVER_GAP = None ## the solver stops at this relative mip gap (e.g. 0.01), None for the default of the solver
+SOLVER_STALL_TIME = None ## in seconds, the solver stops if the incumbent doesn't improve for this long (highs and gurobi, e.g. 60), None for no stall criterion
+SOLVER_DEADLINE_RESERVE = None ## in seconds, the chain has to finish this long before the end of CYCLETIME_LOOP (results and writing), e.g. 20, None for no deadline (TIMELIMIT_SOLVER per solver)
 CYCLETIME_LOOP = 240 ## in seconds
+PERSISTENT_MODEL = False ## Build the models once and only update profiles and start values in the following iterations (False: built in every iteration)
+PERSISTENT_SOLVER = False ## Keep the model alive in the solver and only push changes (together with PERSISTENT_MODEL)
+MATRIX_MODEL_BINARY = False ## constraints of the binary model as sparse matrix rows instead of pyomo constraints, set in every iteration and only solved by highs (3 of SOLVER_CHAIN)
+MATRIX_MODEL_LINEAR_BINARY = False ## the same for the linear binary model (McCormick segments of NMcCormick)
+LONG_TERM_CACHE = False ## the block of the long term model is reused while its inputs stay within the tolerances and only rebuilt for another frost period
+LONG_TERM_CACHE_TOLERANCE = 0.05 ## relative deviation of the heat demand and price profiles (6 hours) from the ones in the block, beyond it the profiles are updated
+LONG_TERM_CACHE_QUANTIZATION = 0.5 ## in Kelvin, start temperatures of HS and GS are compared rounded to this step
+RESULTS_BUFFER_SIZE = 10 ## results of the last iterations are handed to the measurements in memory
+WRITE_RESULTS_FILES = True ## csv files of the results (only needed for evaluation, not for the loop)
+ASYNC_RESULTS_WRITE = False ## write the results files (main and warmstart) in a background thread
+RESULTS_WRITE_QUEUE = 10 ## results waiting for the background thread, the loop only waits for the disk if the queue is full
+RESULTS_STORE = "csv" ## "csv": one file per iteration, "arrow": all iterations of a run in one Arrow IPC stream with an index file (pyarrow)
+
+PROFILE_CYCLE = True ## wall time of the phases of every iteration (json lines in SAVEPATH_PROFILE)
+PROFILE_MODEL_STATISTICS = False ## variables, binaries, constraints and nonzeros of the model in every iteration (phase model_statistics)
+PROFILE_CPROFILE = False ## cProfile file of every iteration
+PROFILE_TRACEMALLOC = False ## peak of the python allocations per phase instead of the peak memory of the process
 
 WARMSTART = True
 TIMELIMIT_WARMSTART = 100 ## in seconds
 WARMSTART_PARTITION_STEP_BINARY = 5
 WARMSTART_PARTITION_LINEAR_BINARY = 11  
+WARMSTART_ROLLING = False ## warmstart with the last solution shifted by SIM_INTERVAL, the warmstart models only run without a last solution
+WARMSTART_PARALLEL = False ## solve the partitions of the linear binary warmstart in parallel processes (boundaries estimated from the last cycle)
 
 TEN_MINUTES = 600
 ONE_HOUR = 3600
@@ -111,160 +157,286 @@ def setup():
     print("Folder: " + str(FILE_PATH))
     print("")
 
-def loop():
+def getConfig(**settings):
+    ## Settings of this file as defaults, overwritten by the given settings (e.g. from a config file with getConfig().setFromFile(path))
+    return Control_Config(defaults={name:value for name,value in globals().items() if name.isupper() and name not in ["FILE_PATH","TEN_MINUTES","ONE_HOUR","SIX_HOURS","ONE_WEEK_IN_HOURS"]},optional=["SOLVER_GAP","SOLVER_STALL_TIME","SOLVER_DEADLINE_RESERVE","PLANT_SEED"],**settings)
+
+def loop(simStartTime=None,simEndTime=None,batchMode=None,config=None):
+    if config is None:
+        config = getConfig()
+    if simStartTime is None:
+        simStartTime = config.SIM_STARTTIME
+    if simEndTime is None:
+        simEndTime = config.SIM_ENDTIME
+    if batchMode is None:
+        batchMode = config.BATCH_MODE
     started = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-    optimization_results_interface = Optimization_Results_Interface(source="csv",time="extern",timestamp=started)
-    optimization_results_interface_warmstart = Optimization_Results_Interface(source="csv",time="extern",timestamp=started)
+    checkpoint_interface = Checkpoint_Interface(savePath=config.SAVEPATH_CHECKPOINT)
+    checkpoint = None
+    if batchMode == True and config.CHECKPOINT_BATCH == True:
+        checkpoint = checkpoint_interface.getCheckpoint()
+        if checkpoint is not None and (checkpoint["simStartTime"] != simStartTime or checkpoint["simEndTime"] != simEndTime):
+            checkpoint = None ## other time range, start a new run
+        if checkpoint is not None:
+            started = checkpoint["started"]
+            print("Resuming batch run " + str(started) + " at " + str(checkpoint["timestampSim"]))
+    results_buffer = Results_Buffer(size=config.RESULTS_BUFFER_SIZE)
+    optimization_results_interface = Optimization_Results_Interface(source=config.RESULTS_STORE,time="extern",timestamp=started,buffer=results_buffer,writeFile=config.WRITE_RESULTS_FILES,asyncWrite=config.ASYNC_RESULTS_WRITE,writeQueueSize=config.RESULTS_WRITE_QUEUE)
+    optimization_results_interface_warmstart = Optimization_Results_Interface(source=config.RESULTS_STORE,time="extern",timestamp=started,asyncWrite=config.ASYNC_RESULTS_WRITE,writeQueueSize=config.RESULTS_WRITE_QUEUE)
+    cycle_profiler = Cycle_Profiler(savePath=config.SAVEPATH_PROFILE,timestamp=started,active=config.PROFILE_CYCLE,modelStatistics=config.PROFILE_MODEL_STATISTICS,profile=config.PROFILE_CPROFILE,traceMemory=config.PROFILE_TRACEMALLOC)
+    rolling_warmstart = Rolling_Warmstart()
+    long_term_cache = Long_Term_Cache(tolerance=config.LONG_TERM_CACHE_TOLERANCE,quantization=config.LONG_TERM_CACHE_QUANTIZATION)
+    rolling_warmstart.setParams(timestepsBinary=config.TIMESTEPS_BINARY,timestepsLinearBinary=config.TIMESTEPS_LINEAR_BINARY,stepSizeBinary=TEN_MINUTES,stepSizeLinearBinary=ONE_HOUR,shiftInSec=config.SIM_INTERVAL)
     #sim_results_interface = Optimization_Results_Interface(source="csv",time="extern",timestamp=started) !! activate, if modelica model connected
-    forecast_interface = Forecast_Interface(source="random",priceType=PRICE_TYPE,loadPathDemand=LOADPATH_FORECAST_DEMAND,loadPathWeather=LOADPATH_FORECAST_WEATHER,loadPathPrice=LOADPATH_FORECAST_PRICE)
-    measurements_interface = Measurements_Interface(source="sim",loadPathMeasurements=SAVELOADPATH_MEASUREMENTS,time="extern",timestamp=started)
-    market_interface = Market_Interface(type=TYPE_MARKET, directionSignal=DIRECTION_MARKET, timestampSignalStart=MARKET_SIGNAL_STARTTIME, timestampSignalStop=MARKET_SIGNAL_STOPPTIME, factorSignal=FACTOR_MARKET, simTimeStart=SIM_STARTTIME, simTimeStop=SIM_ENDTIME_PLUS_A_WEEK, intervalInSec=SIM_INTERVAL)
-
-    #modelica_interface = Modelica_Interface(simTimeStart=DYM_STARTTIME,simTimeStop=SIM_ENDTIME,packagePath=PACKAGEPATH_MODELICA, modelName=MODEL_NAME_MODELICA,simOutputPath=OUTPUTPATH_MODELICA,loadPathDemandsWeatherSIM=LOADPATH_MODELICA,loadPathDemandsMPC=LOADPATH_FORECAST_DEMAND,loadPathWeatherMPC=LOADPATH_FORECAST_WEATHER) !! activate, if modelica model connected
+    forecast_interface = Forecast_Interface(source="random",priceType=config.PRICE_TYPE,loadPathDemand=config.LOADPATH_FORECAST_DEMAND,loadPathWeather=config.LOADPATH_FORECAST_WEATHER,loadPathPrice=config.LOADPATH_FORECAST_PRICE,storePath=config.SAVELOADPATH_FORECAST_STORE)
+    if config.PLANT_SIMULATOR == True:
+        ## Results of the plant surrogate as run <started>_plant, read like the results of the Dymola model
+        plant_buffer = Results_Buffer(size=config.RESULTS_BUFFER_SIZE)
+        sim_results_interface = Optimization_Results_Interface(source=config.RESULTS_STORE,time="extern",timestamp=started+"_plant",buffer=plant_buffer,writeFile=config.WRITE_RESULTS_FILES,asyncWrite=config.ASYNC_RESULTS_WRITE,writeQueueSize=config.RESULTS_WRITE_QUEUE)
+        measurements_interface = Measurements_Interface(source="sim-dymola",loadPathMeasurements=config.SAVELOADPATH_MEASUREMENTS,time="extern",timestamp=started+"_plant",buffer=plant_buffer,resultsSource=config.RESULTS_STORE)
+        plant_simulator = Plant_Simulator(simTimeStart=str(datetime.strptime(simStartTime,"%Y-%m-%d %H:%M:%S") - timedelta(seconds=config.SIM_INTERVAL)),forecastInterface=forecast_interface,subSteps=config.PLANT_SUBSTEPS,noise=config.PLANT_NOISE,mismatch=config.PLANT_MISMATCH,seed=config.PLANT_SEED)
+        plant_simulator.setParams(stepSizeInSec=config.SIM_INTERVAL)
+        if checkpoint is None:
+            plant_simulator.setStartValues(**Measurements_Interface(source="sim",loadPathMeasurements=config.SAVELOADPATH_MEASUREMENTS,time="extern",timestamp=started,resultsSource=config.RESULTS_STORE).getMeasurementsAll().getStartValues(binaries=False))
+            plant_simulator.runInitialSimulation()
+            sim_results_interface.setOptimizationResults(dataFrame=plant_simulator.getResults(),savePath=config.SAVELOADPATH_MEASUREMENTS)
+    else:
+        measurements_interface = Measurements_Interface(source="sim",loadPathMeasurements=config.SAVELOADPATH_MEASUREMENTS,time="extern",timestamp=started,buffer=results_buffer,resultsSource=config.RESULTS_STORE)
+    market_interface = Market_Interface(type=config.TYPE_MARKET, directionSignal=config.DIRECTION_MARKET, timestampSignalStart=config.MARKET_SIGNAL_STARTTIME, timestampSignalStop=config.MARKET_SIGNAL_STOPPTIME, factorSignal=config.FACTOR_MARKET, simTimeStart=config.SIM_STARTTIME, simTimeStop=config.SIM_ENDTIME_PLUS_A_WEEK, intervalInSec=config.SIM_INTERVAL)
+
+    #modelica_interface = Modelica_Interface(simTimeStart=DYM_STARTTIME,simTimeStop=SIM_ENDTIME,packagePath=PACKAGEPATH_MODELICA, modelName=MODEL_NAME_MODELICA,simOutputPath=OUTPUTPATH_MODELICA,loadPathDemandsWeatherSIM=LOADPATH_MODELICA,loadPathDemandsMPC=LOADPATH_FORECAST_DEMAND,loadPathWeatherMPC=LOADPATH_FORECAST_WEATHER,storePath=SAVELOADPATH_FORECAST_STORE) !! activate, if modelica model connected
     #modelica_interface.setParams(stepSizeInSec=SIM_INTERVAL) !! activate, if modelica model connected
     #modelica_interface.runInitialSimulation() !! activate, if modelica model connected
     #modelica_results = modelica_interface.getResults() !! activate, if modelica model connected
     #sim_results_interface.setOptimizationResults(dataFrame=modelica_results,savePath=SAVELOADPATH_MEASUREMENTS) !! activate, if modelica model connected
 
-    timestampSimEndtime = datetime.strptime(SIM_ENDTIME,"%Y-%m-%d %H:%M:%S")
-    timestampSim = datetime.strptime(SIM_STARTTIME,"%Y-%m-%d %H:%M:%S")
+    timestampSimEndtime = datetime.strptime(simEndTime,"%Y-%m-%d %H:%M:%S")
+    timestampSim = datetime.strptime(simStartTime,"%Y-%m-%d %H:%M:%S")
+    closed_loop_summary = Closed_Loop_Summary()
 
     i_loop = 0
+    results_optimal_control = None
+    warmstart_binary_model_results = None
+    warmstart_linear_binary_model_results = None
+    if checkpoint is not None:
+        timestampSim = checkpoint["timestampSim"]
+        i_loop = checkpoint["iteration"]
+        results_optimal_control = checkpoint["results"]
+        warmstart_binary_model_results = checkpoint["warmstartBinary"]
+        warmstart_linear_binary_model_results = checkpoint["warmstartLinearBinary"]
+        optimization_results_interface.setCount(checkpoint["countResults"])
+        measurements_interface.setCount(checkpoint["countMeasurements"])
+        if results_optimal_control is not None:
+            results_buffer.setResults(iteration=checkpoint["countResults"]-1,dataFrame=results_optimal_control) ## measurements of the next iteration
+        rolling_warmstart.setPreviousResults(previousResults=checkpoint["previousResults"])
+        closed_loop_summary.setState(checkpoint["summary"])
+        if config.PLANT_SIMULATOR == True:
+            plant_simulator.setState(checkpoint["plant"])
+            sim_results_interface.setCount(checkpoint["countPlant"])
+            plant_buffer.setResults(iteration=checkpoint["countPlant"]-1,dataFrame=plant_simulator.getResults()) ## measurements of the next iteration
+    i_loop_start = i_loop
 
     while timestampSim < timestampSimEndtime:
         timestampStartLoop = datetime.now()
-
-        forecast_data = forecast_interface.getProfilesAll(timestampStart=timestampSim, intervals=[TEN_MINUTES] * (TIMESTEPS_BINARY-1) + [ONE_HOUR] * (TIMESTEPS_LINEAR_BINARY-1) + [SIX_HOURS] * (TIMESTEPS_LONG_TERM-1), periodFrostInHours=ONE_WEEK_IN_HOURS)
+        deadlineSolver = None
+        if config.SOLVER_DEADLINE_RESERVE is not None:
+            deadlineSolver = time.monotonic() + config.CYCLETIME_LOOP - config.SOLVER_DEADLINE_RESERVE
+        cycle_profiler.startIteration(iteration=i_loop,timestamp=timestampSim)
+
+        cycle_profiler.startPhase("forecast")
+        forecast_data = forecast_interface.getProfilesAll(timestampStart=timestampSim, intervals=[TEN_MINUTES] * (config.TIMESTEPS_BINARY-1) + [ONE_HOUR] * (config.TIMESTEPS_LINEAR_BINARY-1) + [SIX_HOURS] * (config.TIMESTEPS_LONG_TERM-1), periodFrostInHours=ONE_WEEK_IN_HOURS)
+        cycle_profiler.stopPhase("forecast")
+        cycle_profiler.startPhase("measurements")
         measurements_data = measurements_interface.getMeasurementsAll()
-        if MARKET_ACTIVE == True:
-            market_data = market_interface.getProfileForecastMarket(timestampStart=timestampSim, intervals=[TEN_MINUTES] * (TIMESTEPS_BINARY-1) + [ONE_HOUR] * (TIMESTEPS_LINEAR_BINARY-1) + [SIX_HOURS] * (TIMESTEPS_LONG_TERM-1))
+        cycle_profiler.stopPhase("measurements")
+        if config.MARKET_ACTIVE == True:
+            cycle_profiler.startPhase("market")
+            market_data = market_interface.getProfileForecastMarket(timestampStart=timestampSim, intervals=[TEN_MINUTES] * (config.TIMESTEPS_BINARY-1) + [ONE_HOUR] * (config.TIMESTEPS_LINEAR_BINARY-1) + [SIX_HOURS] * (config.TIMESTEPS_LONG_TERM-1))
+            cycle_profiler.stopPhase("market")
             profile_forecast_price = np.array(forecast_data["profileForecastPrice"]) + (np.array(market_data) * np.array(forecast_data["profileForecastPrice"]))
             profile_forecast_price = profile_forecast_price.tolist()
         else:
             profile_forecast_price = forecast_data["profileForecastPrice"]
 
-        optimal_control = Optimal_Control()
-        binary_model = Binary_Model()
-        linear_binary_model = Linear_Binary_Model()
-        long_term_model = Long_Term_Model()
-        warmstart_binary_model = Warmstart_Binary_Model(timelimitWarmstart=TIMELIMIT_WARMSTART, warmstartPartitionStepBinary=WARMSTART_PARTITION_STEP_BINARY, savingPathWarmstartSystemVals=SAVEPATH_WARMSTART, savingWarmstartSystemVals=True, sourceSavingSystemVals=optimization_results_interface_warmstart)
-        warmstart_linear_binary_model = Warmstart_Linear_Binary_Model(timelimitWarmstart=TIMELIMIT_WARMSTART, warmstartPartitionLinearBinary=WARMSTART_PARTITION_LINEAR_BINARY, savingPathWarmstartSystemVals=SAVEPATH_WARMSTART, savingWarmstartSystemVals=True, sourceSavingSystemVals=optimization_results_interface_warmstart)
-
-        binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][:TIMESTEPS_BINARY-1],profileForecastCool=forecast_data["profileForecastCool"][:TIMESTEPS_BINARY-1],profileForecastDry=forecast_data["profileForecastDry"][:TIMESTEPS_BINARY-1],profileForecastWeather=forecast_data["profileForecastWeather"][:TIMESTEPS_BINARY-1],profileForecastPrice=profile_forecast_price[:TIMESTEPS_BINARY-1],profileForecastFrost=forecast_data["profileForecastFrost"][:TIMESTEPS_BINARY-1])
-        linear_binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastCool=forecast_data["profileForecastCool"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastDry=forecast_data["profileForecastDry"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastWeather=forecast_data["profileForecastWeather"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastPrice=profile_forecast_price[TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastFrost=forecast_data["profileForecastFrost"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2])
-        long_term_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY+TIMESTEPS_LONG_TERM-3],profileForecastPrice=profile_forecast_price[TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY+TIMESTEPS_LONG_TERM-3],forecastFrost=forecast_data["forecastFrost"])
-
-        binary_model.setParams(timeSteps=list(range(0,TIMESTEPS_BINARY)),stepSizeInSec=TEN_MINUTES,controlPeriod1=CONTROL_PERIOD_1,controlPeriod2=CONTROL_PERIOD_2,tControlPeriodSwitch=CONTROL_PERIOD_SWITCH)
-        linear_binary_model.setParams(timeSteps=list(range(0,TIMESTEPS_LINEAR_BINARY)),stepSizeInSec=ONE_HOUR,controlPeriod=CONTROL_PERIOD_3,NMcCormick=list(range(0,2)))
-        long_term_model.setParams(timeSteps=list(range(0,TIMESTEPS_LONG_TERM)),stepSizeInSec=SIX_HOURS)
-
-        optimal_control.addModelParts(model = binary_model.setVariables(optimal_control.getModel()))
-        optimal_control.addModelParts(model = linear_binary_model.setVariables(optimal_control.getModel()))
-        optimal_control.addModelParts(model = long_term_model.setVariables(optimal_control.getModel()))
-
-        optimal_control.addModelParts(binary_model.setStartValues(model=optimal_control.getModel(),T_HP_HT_start=measurements_data["measurementHP_HT"],T_HP_LT_start=measurements_data["measurementHP_LT"],T_HS_start=measurements_data["measurementHS"],
-        T_HXA_start=measurements_data["measurementHXA"],T_HGC_start=measurements_data["measurementHGC"],T_HGS_start=measurements_data["measurementHGS"],T_IS_w_1_start=measurements_data["measurementISw"],T_IS_w_2_start=measurements_data["measurementISw"],
-        T_IS_w_3_start=measurements_data["measurementISw"],T_IS_c_1_start=measurements_data["measurementISwc"],T_IS_c_2_start=measurements_data["measurementISc"],T_IS_c_3_start=measurements_data["measurementISwc"],
-        T_IS_c_4_start=measurements_data["measurementISc"],T_IS_c_5_start=measurements_data["measurementISwc"],T_GS_w_1_start=measurements_data["measurementGSw"],
-        T_GS_w_2_start=measurements_data["measurementGSw"],T_GS_w_3_start=measurements_data["measurementGSw"],T_GS_c_1_start=measurements_data["measurementGSc"],T_GS_c_2_start=measurements_data["measurementGSwc"],
-        T_GS_c_3_start=measurements_data["measurementGSc"],T_GS_c_4_start=measurements_data["measurementGSwc"],T_GS_c_5_start=measurements_data["measurementGSc"],T_GS_c_6_start=measurements_data["measurementGSwc"],
-        T_GS_c_7_start=measurements_data["measurementGSc"],T_CS_start=measurements_data["measurementCS"],T_RLTS_start=measurements_data["measurementRLTS"],
-        Start_Toggle_Constraints=True,B_HP_1_start=measurements_data["measurementHP"][0],B_HP_2_start=measurements_data["measurementHP"][1],B_HP_3_start=measurements_data["measurementHP"][2],
-        B_HP_4_start=measurements_data["measurementHP"][3],B_HXH_HS_start=measurements_data["measurementHXH_HS"],B_HGC_HGCHXC_start=measurements_data["measurementHGC_HGCHXC"],B_HXA_start=measurements_data["measurementHXAb"],
-        B_HXH_HGC_start=measurements_data["measurementHXH_HGC"],B_HS_IS_start=measurements_data["measurementHS_IS"],B_IS_HGS_start=measurements_data["measurementIS_HGS"],B_GS_HGS_start=measurements_data["measurementGS_HGS"],
-        B_GS_CS_start=measurements_data["measurementGS_CS"],B_GS_HGS_CS_start=measurements_data["measurementGS_HGS_CS"],B_VP_start=measurements_data["measurementVP"]))
-        optimal_control.addModelParts(linear_binary_model.setStartValues(model=optimal_control.getModel(),T_HP_HT_start=optimal_control.m.T_HP_HT_T[TIMESTEPS_BINARY-1],T_HP_LT_start=optimal_control.m.T_HP_LT_T[TIMESTEPS_BINARY-1],
-        T_HS_start=optimal_control.m.T_HS_T[TIMESTEPS_BINARY-1],T_HXA_start=optimal_control.m.T_HXA_T[TIMESTEPS_BINARY-1],T_HXH_start=optimal_control.m.T_HP_HT_T[TIMESTEPS_BINARY-1],T_HGC_start=optimal_control.m.T_HGC_T[TIMESTEPS_BINARY-1],
-        T_HXC_start=optimal_control.m.T_HP_LT_T[TIMESTEPS_BINARY-1],T_HGS_start=optimal_control.m.T_HGS_T[TIMESTEPS_BINARY-1],T_IS_w_1_start=optimal_control.m.T_IS_W_T_WR[TIMESTEPS_BINARY-1,0],T_IS_w_2_start=optimal_control.m.T_IS_W_T_WR[TIMESTEPS_BINARY-1,2],
-        T_IS_w_3_start=optimal_control.m.T_IS_W_T_WR[TIMESTEPS_BINARY-1,4],T_IS_c_1_start=optimal_control.m.T_IS_C_T_CR[TIMESTEPS_BINARY-1,0],T_IS_c_2_start=optimal_control.m.T_IS_C_T_CR[TIMESTEPS_BINARY-1,1],
-        T_IS_c_3_start=optimal_control.m.T_IS_C_T_CR[TIMESTEPS_BINARY-1,2],T_IS_c_4_start=optimal_control.m.T_IS_C_T_CR[TIMESTEPS_BINARY-1,3],T_IS_c_5_start=optimal_control.m.T_IS_C_T_CR[TIMESTEPS_BINARY-1,4],
-        T_GS_w_1_start=optimal_control.m.T_GS_W_T_WR_WC[TIMESTEPS_BINARY-1,0,1],T_GS_w_2_start=optimal_control.m.T_GS_W_T_WR_WC[TIMESTEPS_BINARY-1,0,3],T_GS_w_3_start=optimal_control.m.T_GS_W_T_WR_WC[TIMESTEPS_BINARY-1,0,5],
-        T_GS_c_1_start=optimal_control.m.T_GS_C_T_CR_CC[TIMESTEPS_BINARY-1,0,0],T_GS_c_2_start=optimal_control.m.T_GS_C_T_CR_CC[TIMESTEPS_BINARY-1,0,1],T_GS_c_3_start=optimal_control.m.T_GS_C_T_CR_CC[TIMESTEPS_BINARY-1,0,2],
-        T_GS_c_4_start=optimal_control.m.T_GS_C_T_CR_CC[TIMESTEPS_BINARY-1,0,3],T_GS_c_5_start=optimal_control.m.T_GS_C_T_CR_CC[TIMESTEPS_BINARY-1,0,4],T_GS_c_6_start=optimal_control.m.T_GS_C_T_CR_CC[TIMESTEPS_BINARY-1,0,5],
-        T_GS_c_7_start=optimal_control.m.T_GS_C_T_CR_CC[TIMESTEPS_BINARY-1,0,6],T_CS_start=optimal_control.m.T_CS_T[TIMESTEPS_BINARY-1],T_RLTS_start=optimal_control.m.T_RLTS_T[TIMESTEPS_BINARY-1]))
-        optimal_control.addModelParts(long_term_model.setStartValues(model=optimal_control.getModel(),T_HS_start=optimal_control.m.T_HS_I[TIMESTEPS_LINEAR_BINARY-1],T_GS_w_1_start=optimal_control.m.T_GS_W_I_WR_WC[TIMESTEPS_LINEAR_BINARY-1,0,1],
-        T_GS_w_2_start=optimal_control.m.T_GS_W_I_WR_WC[TIMESTEPS_LINEAR_BINARY-1,0,3],T_GS_w_3_start=optimal_control.m.T_GS_W_I_WR_WC[TIMESTEPS_LINEAR_BINARY-1,0,5],T_GS_c_1_start=optimal_control.m.T_GS_C_I_CR_CC[TIMESTEPS_LINEAR_BINARY-1,0,0],
-        T_GS_c_2_start=optimal_control.m.T_GS_C_I_CR_CC[TIMESTEPS_LINEAR_BINARY-1,0,1],T_GS_c_3_start=optimal_control.m.T_GS_C_I_CR_CC[TIMESTEPS_LINEAR_BINARY-1,0,2],T_GS_c_4_start=optimal_control.m.T_GS_C_I_CR_CC[TIMESTEPS_LINEAR_BINARY-1,0,3],
-        T_GS_c_5_start=optimal_control.m.T_GS_C_I_CR_CC[TIMESTEPS_LINEAR_BINARY-1,0,4],T_GS_c_6_start=optimal_control.m.T_GS_C_I_CR_CC[TIMESTEPS_LINEAR_BINARY-1,0,5],T_GS_c_7_start=optimal_control.m.T_GS_C_I_CR_CC[TIMESTEPS_LINEAR_BINARY-1,0,6]))
-
-        optimal_control.addModelParts(binary_model.setEndValues(model=optimal_control.getModel(),End_Temp_Constraints=False,T_HS_end=0,T_CS_end=0,T_RLTS_end=0,End_Toggle_Constraints=True,B_HP_1_end=optimal_control.m.B_HP_H_I[1,0],B_HP_2_end=optimal_control.m.B_HP_H_I[2,0],B_HP_3_end=optimal_control.m.B_HP_H_I[3,0],B_HP_4_end=optimal_control.m.B_HP_H_I[4,0],B_HXH_HS_end=optimal_control.m.V_HP_HXH_I[0],
-        B_HGC_HGCHXC_end=optimal_control.m.V_HP_HGCHXC_I[0],B_HXA_end=optimal_control.m.P_HXA_I[0],B_HXH_HGC_end=optimal_control.m.V_HXA_HXH_I[0],B_HS_IS_end=optimal_control.m.V_HS_IS_I[0],B_IS_HGS_end=optimal_control.m.V_IS_HGS_I[0],B_GS_HGS_end=optimal_control.m.V_GS_HGS_I[0],B_GS_CS_end=optimal_control.m.V_GS_CS_I[0],B_GS_HGS_CS_end=optimal_control.m.V_GS_HGS_I[0]+optimal_control.m.V_GS_CS_I[0]))
-        optimal_control.addModelParts(linear_binary_model.setEndValues(model=optimal_control.getModel(),End_Temp_Constraints=False,T_HS_end=(40+33)/2,T_CS_end=(18+10)/2,T_RLTS_end=(18+6)/2,End_Toggle_Constraints=False,B_HP_1_end=0,B_HP_2_end=0,B_HP_3_end=0,B_HP_4_end=0,V_HP_HXH_end=0,V_HP_HS_end=0,V_HP_HGC_end=0,V_HGCHXC_end=0,V_HXA_end=0,V_HXA_HXH_end=0,V_HS_IS_end=0,V_IS_HGS_end=0,V_HXA_HGC_end=0,V_GS_HGS_end=0,V_GS_CS_end=0))
-        optimal_control.addModelParts(long_term_model.setEndValues(model=optimal_control.getModel(),End_Temp_Constraints=False))
-
-        optimal_control.addModelParts(binary_model.setConstraints(model=optimal_control.getModel()))
-        optimal_control.addModelParts(linear_binary_model.setConstraints(model=optimal_control.getModel()))
-        optimal_control.addModelParts(long_term_model.setConstraints(model=optimal_control.getModel()))
+        if config.PERSISTENT_MODEL == False or i_loop == i_loop_start:
+            rebuild_model = True
+        else:
+            rebuild_model = False
+        if config.LONG_TERM_CACHE == True:
+            long_term_state = long_term_cache.getState(forecastFrost=forecast_data["forecastFrost"],profileForecastHeat=forecast_data["profileForecastHeat"][config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY+config.TIMESTEPS_LONG_TERM-3],
+            profileForecastPrice=profile_forecast_price[config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY+config.TIMESTEPS_LONG_TERM-3],
+            T_HS_start=measurements_data["measurementHS"],T_GS_start=[measurements_data["measurementGSw"],measurements_data["measurementGSc"],measurements_data["measurementGSwc"]])
+        elif rebuild_model == True or forecast_data["forecastFrost"] != long_term_model.forecast_frost:
+            long_term_state = "rebuild" ## Frost period changes the structure of the long term model, only its block is built again
+        else:
+            long_term_state = "update"
+
+        if rebuild_model == True:
+            if long_term_state != "rebuild":
+                cached_optimal_control = optimal_control
+            optimal_control = Optimal_Control()
+            binary_model = Binary_Model()
+            linear_binary_model = Linear_Binary_Model()
+            if long_term_state != "rebuild":
+                optimal_control.setBlock("J",cached_optimal_control) ## block of the long term model from the last iteration
+        if long_term_state == "rebuild":
+            optimal_control.deleteBlock("J")
+            long_term_model = Long_Term_Model()
+        warmstart_binary_model = Warmstart_Binary_Model(timelimitWarmstart=config.TIMELIMIT_WARMSTART, warmstartPartitionStepBinary=config.WARMSTART_PARTITION_STEP_BINARY, savingPathWarmstartSystemVals=config.SAVEPATH_WARMSTART, savingWarmstartSystemVals=True, sourceSavingSystemVals=optimization_results_interface_warmstart)
+        warmstart_linear_binary_model = Warmstart_Linear_Binary_Model(timelimitWarmstart=config.TIMELIMIT_WARMSTART, warmstartPartitionLinearBinary=config.WARMSTART_PARTITION_LINEAR_BINARY, savingPathWarmstartSystemVals=config.SAVEPATH_WARMSTART, savingWarmstartSystemVals=True, sourceSavingSystemVals=optimization_results_interface_warmstart)
+
+        binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][:config.TIMESTEPS_BINARY-1],profileForecastCool=forecast_data["profileForecastCool"][:config.TIMESTEPS_BINARY-1],profileForecastDry=forecast_data["profileForecastDry"][:config.TIMESTEPS_BINARY-1],profileForecastWeather=forecast_data["profileForecastWeather"][:config.TIMESTEPS_BINARY-1],profileForecastPrice=profile_forecast_price[:config.TIMESTEPS_BINARY-1],profileForecastFrost=forecast_data["profileForecastFrost"][:config.TIMESTEPS_BINARY-1])
+        linear_binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastCool=forecast_data["profileForecastCool"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastDry=forecast_data["profileForecastDry"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastWeather=forecast_data["profileForecastWeather"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastPrice=profile_forecast_price[config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastFrost=forecast_data["profileForecastFrost"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2])
+        long_term_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY+config.TIMESTEPS_LONG_TERM-3],profileForecastPrice=profile_forecast_price[config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY+config.TIMESTEPS_LONG_TERM-3],forecastFrost=forecast_data["forecastFrost"])
+
+        if rebuild_model == True:
+            binary_model.setParams(timeSteps=list(range(0,config.TIMESTEPS_BINARY)),stepSizeInSec=TEN_MINUTES,controlPeriod1=config.CONTROL_PERIOD_1,controlPeriod2=config.CONTROL_PERIOD_2,tControlPeriodSwitch=config.CONTROL_PERIOD_SWITCH)
+            linear_binary_model.setParams(timeSteps=list(range(0,config.TIMESTEPS_LINEAR_BINARY)),stepSizeInSec=ONE_HOUR,controlPeriod=config.CONTROL_PERIOD_3,NMcCormick=list(range(0,2)))
+
+            cycle_profiler.startPhase("setVariables_T")
+            optimal_control.addModelParts(model = binary_model.setVariables(optimal_control.getModel("T")))
+            cycle_profiler.stopPhase("setVariables_T")
+            cycle_profiler.startPhase("setVariables_I")
+            optimal_control.addModelParts(model = linear_binary_model.setVariables(optimal_control.getModel("I")))
+            cycle_profiler.stopPhase("setVariables_I")
+        else:
+            cycle_profiler.startPhase("updateProfiles")
+            optimal_control.addModelParts(binary_model.updateProfiles(model=optimal_control.getModel("T")))
+            optimal_control.addModelParts(linear_binary_model.updateProfiles(model=optimal_control.getModel("I")))
+            cycle_profiler.stopPhase("updateProfiles")
+        if long_term_state == "rebuild":
+            long_term_model.setParams(timeSteps=list(range(0,config.TIMESTEPS_LONG_TERM)),stepSizeInSec=SIX_HOURS)
+
+            cycle_profiler.startPhase("setVariables_J")
+            optimal_control.addModelParts(model = long_term_model.setVariables(optimal_control.getModel("J")))
+            cycle_profiler.stopPhase("setVariables_J")
+        elif long_term_state == "update":
+            cycle_profiler.startPhase("updateProfiles")
+            optimal_control.addModelParts(long_term_model.updateProfiles(model=optimal_control.getModel("J")))
+            cycle_profiler.stopPhase("updateProfiles")
+        else:
+            print("Long term model reused, its inputs are within the tolerances of the cache.")
+
+        optimal_control.addModelParts(binary_model.setStartValues(model=optimal_control.getModel("T"),**measurements_data.getStartValues()))
+        if rebuild_model == True:
+            optimal_control.addModelParts(linear_binary_model.setStartValues(model=optimal_control.getModel("I"),**optimal_control.getLinks("I",**binary_model.getEndStates(model=optimal_control.getModel("T")))))
+
+            optimal_control.addModelParts(binary_model.setEndValues(model=optimal_control.getModel("T"),End_Temp_Constraints=False,T_HS_end=0,T_CS_end=0,T_RLTS_end=0,End_Toggle_Constraints=True,**optimal_control.getLinks("T",**linear_binary_model.getStartToggles(model=optimal_control.getModel("I")))))
+            optimal_control.addModelParts(linear_binary_model.setEndValues(model=optimal_control.getModel("I"),End_Temp_Constraints=False,T_HS_end=(40+33)/2,T_CS_end=(18+10)/2,T_RLTS_end=(18+6)/2,End_Toggle_Constraints=False,B_HP_1_end=0,B_HP_2_end=0,B_HP_3_end=0,B_HP_4_end=0,V_HP_HXH_end=0,V_HP_HS_end=0,V_HP_HGC_end=0,V_HGCHXC_end=0,V_HXA_end=0,V_HXA_HXH_end=0,V_HS_IS_end=0,V_IS_HGS_end=0,V_HXA_HGC_end=0,V_GS_HGS_end=0,V_GS_CS_end=0))
+
+            if config.MATRIX_MODEL_BINARY == False:
+                cycle_profiler.startPhase("setConstraints_T")
+                optimal_control.addModelParts(binary_model.setConstraints(model=optimal_control.getModel("T")))
+                cycle_profiler.stopPhase("setConstraints_T")
+            if config.MATRIX_MODEL_LINEAR_BINARY == False:
+                cycle_profiler.startPhase("setConstraints_I")
+                optimal_control.addModelParts(linear_binary_model.setConstraints(model=optimal_control.getModel("I")))
+                cycle_profiler.stopPhase("setConstraints_I")
+        if rebuild_model == True or long_term_state == "rebuild":
+            long_term_links = optimal_control.getLinks("J",**linear_binary_model.getEndStates(model=optimal_control.getModel("I")))
+        if long_term_state == "rebuild":
+            optimal_control.addModelParts(long_term_model.setStartValues(model=optimal_control.getModel("J"),**long_term_links))
+            optimal_control.addModelParts(long_term_model.setEndValues(model=optimal_control.getModel("J"),End_Temp_Constraints=False))
+
+            cycle_profiler.startPhase("setConstraints_J")
+            optimal_control.addModelParts(long_term_model.setConstraints(model=optimal_control.getModel("J")))
+            cycle_profiler.stopPhase("setConstraints_J")
+        if config.MATRIX_MODEL_BINARY == True:
+            cycle_profiler.startPhase("setConstraints_T")
+            optimal_control.addMatrixModel(matrixModel=Matrix_Model(optimal_control.getModel("T")).setConstraints(object=binary_model),symbol="T") ## the rows hold the values of profiles and start values, so they are set again in every iteration
+            cycle_profiler.stopPhase("setConstraints_T")
+        if config.MATRIX_MODEL_LINEAR_BINARY == True:
+            cycle_profiler.startPhase("setConstraints_I")
+            optimal_control.addMatrixModel(matrixModel=Matrix_Model(optimal_control.getModel("I")).setConstraints(object=linear_binary_model),symbol="I")
+            cycle_profiler.stopPhase("setConstraints_I")
          
-        if WARMSTART == True:
+        if config.WARMSTART == True and config.WARMSTART_ROLLING == True and rolling_warmstart.getAvailable() == True:
+            cycle_profiler.startPhase("warmstart_rolling")
+            warmstart_binary_model_results = rolling_warmstart.getBinaryWarmstart()
+        elif config.WARMSTART == True:
             if i_loop > 0:
                 old_warmstart_binary_model_results = warmstart_binary_model_results
             try:
-                warmstart_binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][:TIMESTEPS_BINARY-1],profileForecastCool=forecast_data["profileForecastCool"][:TIMESTEPS_BINARY-1],profileForecastDry=forecast_data["profileForecastDry"][:TIMESTEPS_BINARY-1],profileForecastWeather=forecast_data["profileForecastWeather"][:TIMESTEPS_BINARY-1],profileForecastPrice=profile_forecast_price[:TIMESTEPS_BINARY-1],profileForecastFrost=forecast_data["profileForecastFrost"][:TIMESTEPS_BINARY-1])
-                warmstart_binary_model.setParams(timestepsBinary=TIMESTEPS_BINARY,stepSizeBinary=TEN_MINUTES,controlPeriod1=CONTROL_PERIOD_1,controlPeriod2=CONTROL_PERIOD_2,controlPeriodSwitch=CONTROL_PERIOD_SWITCH)
-                warmstart_binary_model.setStartValues(T_HP_HT_start=measurements_data["measurementHP_HT"],T_HP_LT_start=measurements_data["measurementHP_LT"],T_HS_start=measurements_data["measurementHS"],
-                T_HXA_start=measurements_data["measurementHXA"],T_HGC_start=measurements_data["measurementHGC"],T_HGS_start=measurements_data["measurementHGS"],T_IS_w_1_start=measurements_data["measurementISw"],T_IS_w_2_start=measurements_data["measurementISw"],
-                T_IS_w_3_start=measurements_data["measurementISw"],T_IS_c_1_start=measurements_data["measurementISwc"],T_IS_c_2_start=measurements_data["measurementISc"],T_IS_c_3_start=measurements_data["measurementISwc"],
-                T_IS_c_4_start=measurements_data["measurementISc"],T_IS_c_5_start=measurements_data["measurementISwc"],T_GS_w_1_start=measurements_data["measurementGSw"],
-                T_GS_w_2_start=measurements_data["measurementGSw"],T_GS_w_3_start=measurements_data["measurementGSw"],T_GS_c_1_start=measurements_data["measurementGSc"],T_GS_c_2_start=measurements_data["measurementGSwc"],
-                T_GS_c_3_start=measurements_data["measurementGSc"],T_GS_c_4_start=measurements_data["measurementGSwc"],T_GS_c_5_start=measurements_data["measurementGSc"],T_GS_c_6_start=measurements_data["measurementGSwc"],
-                T_GS_c_7_start=measurements_data["measurementGSc"],T_CS_start=measurements_data["measurementCS"],T_RLTS_start=measurements_data["measurementRLTS"])
-                warmstart_binary_model.runWarmstart()
+                warmstart_binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][:config.TIMESTEPS_BINARY-1],profileForecastCool=forecast_data["profileForecastCool"][:config.TIMESTEPS_BINARY-1],profileForecastDry=forecast_data["profileForecastDry"][:config.TIMESTEPS_BINARY-1],profileForecastWeather=forecast_data["profileForecastWeather"][:config.TIMESTEPS_BINARY-1],profileForecastPrice=profile_forecast_price[:config.TIMESTEPS_BINARY-1],profileForecastFrost=forecast_data["profileForecastFrost"][:config.TIMESTEPS_BINARY-1])
+                warmstart_binary_model.setParams(timestepsBinary=config.TIMESTEPS_BINARY,stepSizeBinary=TEN_MINUTES,controlPeriod1=config.CONTROL_PERIOD_1,controlPeriod2=config.CONTROL_PERIOD_2,controlPeriodSwitch=config.CONTROL_PERIOD_SWITCH)
+                warmstart_binary_model.setStartValues(**measurements_data.getStartValues(binaries=False))
+                warmstart_binary_model.runWarmstart(threads=config.SOLVER_THREADS)
                 warmstart_binary_model_results = warmstart_binary_model.getResults()
+                for name,seconds in warmstart_binary_model.getPartitionTimes().items():
+                    cycle_profiler.setPhase(name="warmstart_binary_"+name,seconds=seconds)
             except:
                 warmstart_binary_model_results = old_warmstart_binary_model_results
         else:
             warmstart_binary_model_results = None
         
-        if WARMSTART == True:
+        if config.WARMSTART == True and config.WARMSTART_ROLLING == True and rolling_warmstart.getAvailable() == True:
+            warmstart_linear_binary_model_results = rolling_warmstart.getLinearBinaryWarmstart()
+            cycle_profiler.stopPhase("warmstart_rolling")
+        elif config.WARMSTART == True:
             if i_loop > 0:
                 old_warmstart_linear_binary_model_results = warmstart_linear_binary_model_results
             try:
-                warmstart_linear_binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastCool=forecast_data["profileForecastCool"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastDry=forecast_data["profileForecastDry"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastWeather=forecast_data["profileForecastWeather"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastPrice=profile_forecast_price[TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2],profileForecastFrost=forecast_data["profileForecastFrost"][TIMESTEPS_BINARY-1:TIMESTEPS_BINARY+TIMESTEPS_LINEAR_BINARY-2])
-                warmstart_linear_binary_model.setParams(timestepsLinearBinary=TIMESTEPS_LINEAR_BINARY,stepSizeLinearBinary=ONE_HOUR,controlPeriod=CONTROL_PERIOD_3,NMcCormick=list(range(0,2)))
-                warmstart_linear_binary_model.setStartValues(T_HP_HT_start=warmstart_binary_model_results["T_HP_HT_T"].iloc[-1],T_HP_LT_start=warmstart_binary_model_results["T_HP_LT_T"].iloc[-1],
-                T_HS_start=warmstart_binary_model_results["T_HS_T"].iloc[-1],T_HXA_start=warmstart_binary_model_results["T_HXA_T"].iloc[-1],T_HXH_start=warmstart_binary_model_results["T_HP_HT_T"].iloc[-1],T_HGC_start=warmstart_binary_model_results["T_HGC_T"].iloc[-1],
-                T_HXC_start=warmstart_binary_model_results["T_HP_LT_T"].iloc[-1],T_HGS_start=warmstart_binary_model_results["T_HGS_T"].iloc[-1],T_IS_w_1_start=warmstart_binary_model_results["T_IS_W_0_T"].iloc[-1],T_IS_w_2_start=warmstart_binary_model_results["T_IS_W_1_T"].iloc[-1],
-                T_IS_w_3_start=warmstart_binary_model_results["T_IS_W_2_T"].iloc[-1],T_IS_c_1_start=warmstart_binary_model_results["T_IS_C_0_T"].iloc[-1],T_IS_c_2_start=warmstart_binary_model_results["T_IS_C_1_T"].iloc[-1],
-                T_IS_c_3_start=warmstart_binary_model_results["T_IS_C_2_T"].iloc[-1],T_IS_c_4_start=warmstart_binary_model_results["T_IS_C_3_T"].iloc[-1],T_IS_c_5_start=warmstart_binary_model_results["T_IS_C_4_T"].iloc[-1],
-                T_GS_w_1_start=warmstart_binary_model_results["T_GS_W_0_T"].iloc[-1],T_GS_w_2_start=warmstart_binary_model_results["T_GS_W_1_T"].iloc[-1],T_GS_w_3_start=warmstart_binary_model_results["T_GS_W_2_T"].iloc[-1],
-                T_GS_c_1_start=warmstart_binary_model_results["T_GS_C_0_T"].iloc[-1],T_GS_c_2_start=warmstart_binary_model_results["T_GS_C_1_T"].iloc[-1],T_GS_c_3_start=warmstart_binary_model_results["T_GS_C_2_T"].iloc[-1],
-                T_GS_c_4_start=warmstart_binary_model_results["T_GS_C_3_T"].iloc[-1],T_GS_c_5_start=warmstart_binary_model_results["T_GS_C_4_T"].iloc[-1],T_GS_c_6_start=warmstart_binary_model_results["T_GS_C_5_T"].iloc[-1],
-                T_GS_c_7_start=warmstart_binary_model_results["T_GS_C_6_T"].iloc[-1],T_CS_start=warmstart_binary_model_results["T_CS_T"].iloc[-1],T_RLTS_start=warmstart_binary_model_results["T_RLTS_T"].iloc[-1])
-                warmstart_linear_binary_model.runWarmstart()
+                warmstart_linear_binary_model.setProfiles(profileForecastHeat=forecast_data["profileForecastHeat"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastCool=forecast_data["profileForecastCool"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastDry=forecast_data["profileForecastDry"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastWeather=forecast_data["profileForecastWeather"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastPrice=profile_forecast_price[config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2],profileForecastFrost=forecast_data["profileForecastFrost"][config.TIMESTEPS_BINARY-1:config.TIMESTEPS_BINARY+config.TIMESTEPS_LINEAR_BINARY-2])
+                warmstart_linear_binary_model.setParams(timestepsLinearBinary=config.TIMESTEPS_LINEAR_BINARY,stepSizeLinearBinary=ONE_HOUR,controlPeriod=config.CONTROL_PERIOD_3,NMcCormick=list(range(0,2)))
+                warmstart_linear_binary_model.setStartValues(**binary_model.getEndStates(results=warmstart_binary_model_results))
+                if i_loop > 0:
+                    warmstart_linear_binary_model.setPreviousResults(previousResults=old_warmstart_linear_binary_model_results,shiftInSec=config.SIM_INTERVAL)
+                warmstart_linear_binary_model.runWarmstart(parallel=config.WARMSTART_PARALLEL,threads=config.SOLVER_THREADS)
                 warmstart_linear_binary_model_results = warmstart_linear_binary_model.getResults()
+                for name,seconds in warmstart_linear_binary_model.getPartitionTimes().items():
+                    cycle_profiler.setPhase(name="warmstart_linear_binary_"+name,seconds=seconds)
             except:
                 warmstart_linear_binary_model_results = old_warmstart_linear_binary_model_results
         else:
             warmstart_linear_binary_model_results = None
 
-        optimal_control.addModelParts(binary_model.setWarmstart(model=optimal_control.getModel(),available=WARMSTART,file=warmstart_binary_model_results))
-        optimal_control.addModelParts(linear_binary_model.setWarmstart(model=optimal_control.getModel(),available=WARMSTART,file=warmstart_linear_binary_model_results))
-        optimal_control.addModelParts(long_term_model.setWarmstart(model=optimal_control.getModel()))
+        optimal_control.addModelParts(binary_model.setWarmstart(model=optimal_control.getModel("T"),available=config.WARMSTART,file=warmstart_binary_model_results))
+        optimal_control.addModelParts(linear_binary_model.setWarmstart(model=optimal_control.getModel("I"),available=config.WARMSTART,file=warmstart_linear_binary_model_results))
+        optimal_control.addModelParts(long_term_model.setWarmstart(model=optimal_control.getModel("J")))
 
         optimal_control.addModelObject(object=binary_model,position=0,symbol="T")
         optimal_control.addModelObject(object=linear_binary_model,position=1,symbol="I")
         optimal_control.addModelObject(object=long_term_model,position=2,symbol="J")
 
-        optimal_control.setObjective()
+        if rebuild_model == True or long_term_state == "rebuild":
+            optimal_control.setObjective()
 
-        optimal_control.setSolverAndRunOptimization(solver=0,warmstart=WARMSTART, timeLimit=TIMELIMIT_SOLVER, showSolverOutput=0,writeILP=0,writeMPSfile=0)
+        cycle_profiler.setModelStatistics(model=optimal_control.getModel())
+        cycle_profiler.startPhase("solve")
+        optimal_control.setSolverChainAndRunOptimization(solvers=config.SOLVER_CHAIN,deadline=deadlineSolver,share=config.SOLVER_CHAIN_SHARE,warmstart=config.WARMSTART, timeLimit=config.TIMELIMIT_SOLVER, showSolverOutput=0,persistent=config.PERSISTENT_SOLVER,threads=config.SOLVER_THREADS,racers=config.SOLVER_RACE,targetGap=config.SOLVER_RACE_GAP,gap=config.SOLVER_GAP,stallTime=config.SOLVER_STALL_TIME)
+        cycle_profiler.stopPhase("solve")
+        solver_statistics = optimal_control.getSolverStatistics()
+        cycle_profiler.setSolverStatistics(statistics=solver_statistics)
+        print("Solver stopped (" + str(solver_statistics["reason"]) + ") with gap " + str(solver_statistics["gap"]) + ".")
+        for stage in optimal_control.getSolverChainLog():
+            cycle_profiler.setPhase(name="solve_solver_"+str(stage["solver"]),seconds=stage["seconds"])
 
         if i_loop > 0: 
             old_results_optimal_control = results_optimal_control
 
+        cycle_profiler.startPhase("results")
         try:
             if forecast_data["forecastFrost"] == False:
-                results_optimal_control = optimal_control.getResults(source=optimization_results_interface,savePath=SAVEPATH_MPC,combinedFile=True,singleFile=False,timestampStart=timestampSim,intervals=[TEN_MINUTES] * TIMESTEPS_BINARY + [ONE_HOUR] * (TIMESTEPS_LINEAR_BINARY-1))
+                results_optimal_control = optimal_control.getResults(source=optimization_results_interface,savePath=config.SAVEPATH_MPC,combinedFile=True,singleFile=False,timestampStart=timestampSim,intervals=[TEN_MINUTES] * config.TIMESTEPS_BINARY + [ONE_HOUR] * (config.TIMESTEPS_LINEAR_BINARY-1))
             else:
-                results_optimal_control = optimal_control.getResults(source=optimization_results_interface,savePath=SAVEPATH_MPC,combinedFile=True,singleFile=False,timestampStart=timestampSim,intervals=[TEN_MINUTES] * TIMESTEPS_BINARY + [ONE_HOUR] * (TIMESTEPS_LINEAR_BINARY-1) + [SIX_HOURS] * (TIMESTEPS_LONG_TERM-1))
+                results_optimal_control = optimal_control.getResults(source=optimization_results_interface,savePath=config.SAVEPATH_MPC,combinedFile=True,singleFile=False,timestampStart=timestampSim,intervals=[TEN_MINUTES] * config.TIMESTEPS_BINARY + [ONE_HOUR] * (config.TIMESTEPS_LINEAR_BINARY-1) + [SIX_HOURS] * (config.TIMESTEPS_LONG_TERM-1))
+            rolling_warmstart.setPreviousResults(previousResults=results_optimal_control)
+            closed_loop_summary.setIteration(timestamp=timestampSim,results=results_optimal_control)
+            if config.PLANT_SIMULATOR == True:
+                plant_simulator.runSimulation(**plant_simulator.getResultsInputs(results=results_optimal_control,row=0))
 
             #modelica_interface.runSimulation(B_HP_0=results_optimal_control["B_HP_0_T"].iloc[0],B_HP_1=results_optimal_control["B_HP_1_T"].iloc[0],B_HP_2=results_optimal_control["B_HP_2_T"].iloc[0],B_HP_3=results_optimal_control["B_HP_3_T"].iloc[0],B_HP_4=results_optimal_control["B_HP_4_T"].iloc[0],B_HXH_HS=results_optimal_control["B_HXH_HS_T"].iloc[0],
             #B_HGC_HGCHXC=results_optimal_control["B_HGC_HGCHXC_T"].iloc[0],B_HXA=results_optimal_control["B_HXA_T"].iloc[0],B_HXH_HGC=results_optimal_control["B_HXH_HGC_T"].iloc[0],B_HS_IS=results_optimal_control["B_HS_IS_T"].iloc[0],B_IS_HGS=results_optimal_control["B_IS_HGS_T"].iloc[0],B_GS_HGS=results_optimal_control["B_GS_HGS_T"].iloc[0],
             #B_GS_CS=results_optimal_control["B_GS_CS_T"].iloc[0],B_GS_HGS_CS=results_optimal_control["B_GS_HGS_CS_T"].iloc[0],B_VP_0=results_optimal_control["B_VP_0_T_1"].iloc[0],B_VP_1=results_optimal_control["B_VP_1_T_1"].iloc[0],B_VP_2=results_optimal_control["B_VP_2_T_1"].iloc[0],B_VP_3=results_optimal_control["B_VP_3_T_1"].iloc[0],
             #B_VP_4=results_optimal_control["B_VP_4_T_1"].iloc[0],B_VP_5=results_optimal_control["B_VP_5_T_1"].iloc[0],B_VP_6=results_optimal_control["B_VP_6_T_1"].iloc[0],B_VP_7=results_optimal_control["B_VP_7_T_1"].iloc[0]) !! activate, if modelica model connected
         except:
-            pass
+            rolling_warmstart.setPreviousResults(previousResults=None)
+            closed_loop_summary.setIteration(timestamp=timestampSim,results=None)
+            if config.PLANT_SIMULATOR == True:
+                if i_loop > 0 and old_results_optimal_control is not None:
+                    plant_simulator.runSimulation(**plant_simulator.getResultsInputs(results=old_results_optimal_control,row=1)) ## second step of the last solution
+                else:
+                    plant_simulator.runSimulation(**plant_simulator.getInputs())
             #results_optimal_control = old_results_optimal_control
             #modelica_interface.runSimulation(B_HP_0=results_optimal_control["B_HP_0_T"].iloc[1],B_HP_1=results_optimal_control["B_HP_1_T"].iloc[1],B_HP_2=results_optimal_control["B_HP_2_T"].iloc[1],B_HP_3=results_optimal_control["B_HP_3_T"].iloc[1],B_HP_4=results_optimal_control["B_HP_4_T"].iloc[1],B_HXH_HS=results_optimal_control["B_HXH_HS_T"].iloc[1],
             #B_HGC_HGCHXC=results_optimal_control["B_HGC_HGCHXC_T"].iloc[1],B_HXA=results_optimal_control["B_HXA_T"].iloc[1],B_HXH_HGC=results_optimal_control["B_HXH_HGC_T"].iloc[1],B_HS_IS=results_optimal_control["B_HS_IS_T"].iloc[1],B_IS_HGS=results_optimal_control["B_IS_HGS_T"].iloc[1],B_GS_HGS=results_optimal_control["B_GS_HGS_T"].iloc[1],
@@ -272,18 +444,51 @@ def loop():
             #B_VP_4=results_optimal_control["B_VP_4_T_1"].iloc[1],B_VP_5=results_optimal_control["B_VP_5_T_1"].iloc[1],B_VP_6=results_optimal_control["B_VP_6_T_1"].iloc[1],B_VP_7=results_optimal_control["B_VP_7_T_1"].iloc[1]) !! activate, if modelica model connected
             #optimization_results_interface.setOptimizationResults(dataFrame=pd.DataFrame(),savePath=SAVEPATH_MPC) !! activate, if modelica model connected
 
+        cycle_profiler.stopPhase("results")
+        cycle_profiler.setPhase(name="write_csv",seconds=optimization_results_interface.writeSeconds) ## last finished file (with config.ASYNC_RESULTS_WRITE in the background)
+        if config.PLANT_SIMULATOR == True:
+            sim_results_interface.setOptimizationResults(dataFrame=plant_simulator.getResults(),savePath=config.SAVELOADPATH_MEASUREMENTS)
+
         #modelica_results = modelica_interface.getResults() !! activate, if modelica model connected
         #sim_results_interface.setOptimizationResults(dataFrame=modelica_results,savePath=SAVELOADPATH_MEASUREMENTS) !! activate, if modelica model connected
-        timestampSim = timestampSim + timedelta(seconds=SIM_INTERVAL)
+        timestampSim = timestampSim + timedelta(seconds=config.SIM_INTERVAL)
         i_loop=i_loop+1
         timestampStopLoop = datetime.now()
+        cycle_profiler.stopIteration()
+        if batchMode == True:
+            if config.CHECKPOINT_BATCH == True:
+                checkpoint_interface.setCheckpoint({"simStartTime":simStartTime,"simEndTime":simEndTime,"started":started,"timestampSim":timestampSim,"iteration":i_loop,
+                "countResults":optimization_results_interface.getCount(),"countMeasurements":measurements_interface.getCount(),"results":results_optimal_control,
+                "previousResults":rolling_warmstart.getPreviousResults(),"warmstartBinary":warmstart_binary_model_results,"warmstartLinearBinary":warmstart_linear_binary_model_results,
+                "summary":closed_loop_summary.getState(),"plant":plant_simulator.getState() if config.PLANT_SIMULATOR == True else None,"countPlant":sim_results_interface.getCount() if config.PLANT_SIMULATOR == True else None})
+            print("### Done ! ### (" + str(round((timestampStopLoop - timestampStartLoop).total_seconds(),2)) + " seconds)")
+            continue
         timeDeltaLoop = timestampStopLoop - timestampStartLoop
-        if timeDeltaLoop.total_seconds() > CYCLETIME_LOOP:
-            timeDeltaLoop = timedelta(seconds=CYCLETIME_LOOP)
+        if timeDeltaLoop.total_seconds() > config.CYCLETIME_LOOP:
+            timeDeltaLoop = timedelta(seconds=config.CYCLETIME_LOOP)
         print("### Done ! ###")
-        print("Sleeping for " +str(round(CYCLETIME_LOOP-timeDeltaLoop.total_seconds(),2)) +" seconds. Good night!")
-        time.sleep(CYCLETIME_LOOP-timeDeltaLoop.total_seconds())
+        print("Sleeping for " +str(round(config.CYCLETIME_LOOP-timeDeltaLoop.total_seconds(),2)) +" seconds. Good night!")
+        time.sleep(config.CYCLETIME_LOOP-timeDeltaLoop.total_seconds())
+
+    optimization_results_interface.waitForWrites()
+    optimization_results_interface_warmstart.waitForWrites()
+    if config.PLANT_SIMULATOR == True:
+        sim_results_interface.waitForWrites()
+    summary = closed_loop_summary.getSummary()
+    print("### Summary " + str(simStartTime) + " to " + str(simEndTime) + " ###")
+    for key,value in summary.items():
+        print(str(key) + ": " + str(value))
+    try:
+        closed_loop_summary.getIterations().to_csv(config.SAVEPATH_CHECKPOINT + "Summary_" + str(started) + ".csv", sep = ";")
+    except:
+        print("Summary could not be written.")
+    if batchMode == True:
+        checkpoint_interface.removeCheckpoint()
+    return summary
 ##################################################################
 if __name__ == "__main__":
     setup()
-    loop()
+    if len(sys.argv) > 1:
+        loop(config=getConfig().setFromFile(sys.argv[1])) ## json, toml or yaml with the settings to overwrite
+    else:
+        loop()
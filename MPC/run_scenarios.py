@@ -0,0 +1,124 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+############################ IMPORTS #############################
+import os
+FILE_PATH = os.path.dirname(os.path.abspath(__file__))
+import pandas as pd
+import shutil
+import contextlib
+from datetime import datetime
+from itertools import product
+from concurrent.futures import ProcessPoolExecutor
+import time
+##################################################################
+
+############################ SETTINGS ############################
+## Settings of run_control to overwrite, every combination of the grid is one scenario (closed loop in batch mode)
+SCENARIO_GRID = {"FACTOR_MARKET":[2.0,3.0],"DIRECTION_MARKET":["pos","neg"],"WARMSTART_ROLLING":[True,False]}
+## Further scenarios as list of dicts (e.g. {"MARKET_ACTIVE":False,"PRICE_TYPE":"flat"}), the settings of the grid are not combined with them
+SCENARIO_LIST = []
+SCENARIO_BASE = {"SIM_STARTTIME":"2022-06-15 00:00:00","SIM_ENDTIME":"2022-06-16 00:00:00","MARKET_ACTIVE":True} ## settings for all scenarios
+
+SCENARIO_PROCESSES = max(1,int((os.cpu_count() or 1)/8)) ## scenarios solved at the same time
+SCENARIO_THREADS = max(1,int((os.cpu_count() or 1)/SCENARIO_PROCESSES)) ## solver threads of every scenario, so the cores are not oversubscribed
+
+SAVEPATH_SCENARIOS = FILE_PATH + "\\optimal_control\\scenario_results\\"
+LOADPATH_START_VALUES = FILE_PATH + "\\optimal_control\\optimization_results\\Results_start_values.csv"
+##################################################################
+
+############################## CODE ##############################
+def setup():
+    print("Folder: " + str(FILE_PATH))
+    print("")
+    try:
+        os.makedirs(SAVEPATH_SCENARIOS,exist_ok=True)
+    except:
+        pass
+
+def getScenarios():
+    scenarios = []
+    keys = list(SCENARIO_GRID.keys())
+    for values in product(*[SCENARIO_GRID[key] for key in keys]):
+        scenarios.append(dict(zip(keys,values)))
+    scenarios = scenarios + [dict(scenario) for scenario in SCENARIO_LIST]
+    for j,settings in enumerate(scenarios):
+        name = "scenario_" + str(j) + "_" + "_".join(str(key) + "-" + str(value) for key,value in settings.items())
+        scenarios[j] = {"name":name.replace(" ","").replace(":",""),"settings":dict(SCENARIO_BASE,**settings),"threads":SCENARIO_THREADS,"savePath":SAVEPATH_SCENARIOS}
+    return scenarios
+
+def runScenario(scenario):
+    ## Runs in a worker process: own config, own output folders and own log file
+    import run_control
+    path = scenario["savePath"] + scenario["name"] + "\\"
+    config = run_control.getConfig(**scenario["settings"])
+    config.setSettings(SOLVER_THREADS=scenario["threads"],BATCH_MODE=True,WARMSTART_PARALLEL=False) ## no process pool inside the worker
+    config.setSettings(SAVEPATH_MPC=path + "optimization_results\\",SAVELOADPATH_MEASUREMENTS=path + "optimization_results\\",SAVEPATH_WARMSTART=path + "warmstart_values\\",
+    SAVEPATH_PROFILE=path + "profile_values\\",SAVEPATH_CHECKPOINT=path + "checkpoint_values\\")
+    if config.SAVELOADPATH_FORECAST_STORE != "":
+        config.setSettings(SAVELOADPATH_FORECAST_STORE=path + "forecast_store\\") ## no concurrent writes into the same store
+    row = {"name":scenario["name"]}
+    row.update(scenario["settings"])
+    timeStart = time.perf_counter()
+    try:
+        for folder in [config.SAVEPATH_MPC,config.SAVEPATH_WARMSTART,config.SAVEPATH_PROFILE,config.SAVEPATH_CHECKPOINT,config.SAVELOADPATH_FORECAST_STORE]:
+            if folder != "":
+                os.makedirs(folder,exist_ok=True)
+        if not os.path.isfile(config.SAVEPATH_MPC + "Results_start_values.csv"):
+            shutil.copy(LOADPATH_START_VALUES,config.SAVEPATH_MPC + "Results_start_values.csv") ## measurements of the first iteration
+        with open(path + "log.txt","a") as log, contextlib.redirect_stdout(log):
+            summary = run_control.loop(config=config)
+        row.update(summary)
+    except Exception as e:
+        row["error"] = str(e)
+    row["seconds"] = round(time.perf_counter() - timeStart,2)
+    return row
+
+def runScenarios(scenarios=None,processes=SCENARIO_PROCESSES):
+    started = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+    if scenarios is None:
+        scenarios = getScenarios()
+    print("Running " + str(len(scenarios)) + " scenarios in " + str(processes) + " processes with " + str(SCENARIO_THREADS) + " solver threads each.")
+    rows = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for row in executor.map(runScenario,scenarios):
+            print("Scenario " + str(row["name"]) + " finished after " + str(row["seconds"]) + " seconds.")
+            rows.append(row)
+            ## Written after every scenario, so finished scenarios are kept if the sweep is aborted
+            results = pd.DataFrame(rows)
+            results.to_csv(SAVEPATH_SCENARIOS + "Scenarios_" + started + ".csv", sep = ";", index=False)
+    print(results)
+    return results
+##################################################################
+if __name__ == "__main__":
+    setup()
+    runScenarios()
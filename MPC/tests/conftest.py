@@ -0,0 +1,102 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import sys
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) ## imports like run_control (from optimal_control.xxx import *)
+
+import pytest
+
+START_TEMPERATURES = dict(T_HP_HT_start=35,T_HP_LT_start=12,T_HS_start=36,T_HXA_start=8,T_HGC_start=11,T_HGS_start=15,T_CS_start=14,T_RLTS_start=13,T_IS_w_1_start=22,T_IS_w_2_start=22,T_IS_w_3_start=22,
+T_IS_c_1_start=22,T_IS_c_2_start=22,T_IS_c_3_start=22,T_IS_c_4_start=22,T_IS_c_5_start=22,T_GS_w_1_start=16,T_GS_w_2_start=16,T_GS_w_3_start=16,T_GS_c_1_start=16,T_GS_c_2_start=16,T_GS_c_3_start=16,
+T_GS_c_4_start=16,T_GS_c_5_start=16,T_GS_c_6_start=16,T_GS_c_7_start=16)
+
+@pytest.fixture
+def loopStartValues(tmp_path):
+    ## Start values of the binary model like in run_control.loop: the measured state of Results_start_values.csv with the start and toggle constraints
+    import shutil
+    from optimal_control.measurements_interface import Measurements_Interface
+    shutil.copy(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"optimal_control","optimization_results","Results_start_values.csv"),str(tmp_path))
+    return Measurements_Interface(source="sim",loadPathMeasurements=str(tmp_path) + os.sep,time="extern",timestamp="test").getMeasurementsAll().getStartValues()
+
+@pytest.fixture
+def binaryModel():
+    ## Builds the binary model (T) of a short horizon in an optimal control problem, with its constraints as pyomo constraints or as matrix model
+    ## Without start values, the start temperatures are START_TEMPERATURES without start and toggle constraints
+    from optimal_control.optimal_control import Optimal_Control
+    from optimal_control.binary_model import Binary_Model
+    from optimal_control.matrix_model import Matrix_Model
+    def build(matrix=False,startValues=None):
+        if startValues is None:
+            startValues = dict(START_TEMPERATURES,Start_Toggle_Constraints=False,B_HP_1_start=0,B_HP_2_start=0,B_HP_3_start=0,B_HP_4_start=0,B_HXH_HS_start=0,B_HGC_HGCHXC_start=0,B_HXA_start=0,B_HXH_HGC_start=0,
+            B_HS_IS_start=0,B_IS_HGS_start=0,B_GS_HGS_start=0,B_GS_CS_start=0,B_GS_HGS_CS_start=0,B_VP_start=[1,0,0,0,0,0,0,0])
+        optimal_control = Optimal_Control()
+        binary_model = Binary_Model()
+        binary_model.setProfiles(profileForecastHeat=[60,80,40,50,70,30,0],profileForecastCool=[-20,-10,-30,-20,-10,-5,0],profileForecastDry=[-10,-5,-8,-12,-3,-4,0],profileForecastWeather=[5,6,7,8,9,10,10],profileForecastPrice=[0.16]*7,profileForecastFrost=[0]*7)
+        binary_model.setParams(timeSteps=list(range(0,8)),stepSizeInSec=600,controlPeriod1=1,controlPeriod2=2,tControlPeriodSwitch=2)
+        optimal_control.addModelObject(binary_model,0,"T")
+        optimal_control.addModelParts(binary_model.setVariables(optimal_control.getModel("T")))
+        optimal_control.addModelParts(binary_model.setStartValues(model=optimal_control.getModel("T"),**startValues))
+        optimal_control.addModelParts(binary_model.setEndValues(model=optimal_control.getModel("T"),End_Temp_Constraints=False,T_HS_end=0,T_CS_end=0,T_RLTS_end=0,End_Toggle_Constraints=False,B_HP_1_end=0,B_HP_2_end=0,
+        B_HP_3_end=0,B_HP_4_end=0,B_HXH_HS_end=0,B_HGC_HGCHXC_end=0,B_HXA_end=0,B_HXH_HGC_end=0,B_HS_IS_end=0,B_IS_HGS_end=0,B_GS_HGS_end=0,B_GS_CS_end=0,B_GS_HGS_CS_end=0))
+        if matrix == True:
+            optimal_control.addMatrixModel(matrixModel=Matrix_Model(optimal_control.getModel("T")).setConstraints(object=binary_model),symbol="T")
+        else:
+            optimal_control.addModelParts(binary_model.setConstraints(model=optimal_control.getModel("T")))
+        optimal_control.setObjective()
+        return optimal_control
+    return build
+
+@pytest.fixture
+def linearBinaryModel():
+    ## Builds the linear binary model (I) of a short horizon in an optimal control problem, with its constraints as pyomo constraints or as matrix model
+    from optimal_control.optimal_control import Optimal_Control
+    from optimal_control.linear_binary_model import Linear_Binary_Model
+    from optimal_control.matrix_model import Matrix_Model
+    def build(matrix=False):
+        optimal_control = Optimal_Control()
+        linear_binary_model = Linear_Binary_Model()
+        linear_binary_model.setProfiles(profileForecastHeat=[600,800,400,500,700],profileForecastCool=[-20,-10,-30,-20,-10],profileForecastDry=[-10]*5,profileForecastWeather=[5,6,7,8,9],profileForecastPrice=[0.16]*5,profileForecastFrost=[0]*5)
+        linear_binary_model.setParams(timeSteps=list(range(0,6)),stepSizeInSec=3600,controlPeriod=1,NMcCormick=list(range(0,2)))
+        optimal_control.addModelObject(linear_binary_model,1,"I")
+        optimal_control.addModelParts(linear_binary_model.setVariables(optimal_control.getModel("I")))
+        optimal_control.addModelParts(linear_binary_model.setStartValues(model=optimal_control.getModel("I"),T_HXH_start=35,T_HXC_start=12,**START_TEMPERATURES))
+        optimal_control.addModelParts(linear_binary_model.setEndValues(model=optimal_control.getModel("I"),End_Temp_Constraints=False,T_HS_end=0,T_CS_end=0,T_RLTS_end=0,End_Toggle_Constraints=False,B_HP_1_end=0,B_HP_2_end=0,
+        B_HP_3_end=0,B_HP_4_end=0,V_HP_HXH_end=0,V_HP_HS_end=0,V_HP_HGC_end=0,V_HGCHXC_end=0,V_HXA_end=0,V_HXA_HXH_end=0,V_HS_IS_end=0,V_IS_HGS_end=0,V_HXA_HGC_end=0,V_GS_HGS_end=0,V_GS_CS_end=0))
+        if matrix == True:
+            optimal_control.addMatrixModel(matrixModel=Matrix_Model(optimal_control.getModel("I")).setConstraints(object=linear_binary_model),symbol="I")
+        else:
+            optimal_control.addModelParts(linear_binary_model.setConstraints(model=optimal_control.getModel("I")))
+        optimal_control.setObjective()
+        return optimal_control
+    return build
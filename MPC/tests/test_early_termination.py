@@ -0,0 +1,84 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+import pytest
+import numpy as np
+import pyomo.environ as pyo
+
+from optimal_control.optimal_control import *
+from optimal_control.early_termination import *
+
+pytestmark = pytest.mark.skipif(Optimal_Control().getSolverAvailable(3) == False,reason="highs not available")
+
+def getKnapsackModel(rows=150,columns=300,seed=0):
+    ## Random multidimensional knapsack, hard enough to run into the time limits
+    rng = np.random.default_rng(seed)
+    optimal_control = Optimal_Control()
+    m = optimal_control.getModel()
+    m.N = pyo.RangeSet(0,columns-1)
+    m.b = pyo.Var(m.N,domain=pyo.Binary)
+    m.C = pyo.ConstraintList()
+    for i in range(0,rows):
+        index = rng.choice(columns,30,replace=False)
+        m.C.add(sum(rng.uniform(1,5) * m.b[int(j)] for j in index) <= rng.uniform(5,10))
+    m.OBJ = pyo.Objective(expr=-sum(rng.uniform(1,10) * m.b[j] for j in m.N))
+    return optimal_control
+
+def test_stall_keeps_incumbent_and_next_solve_runs():
+    optimal_control = getKnapsackModel()
+    optimal_control.setSolverAndRunOptimization(solver=3,timeLimit=30,persistent=True,earlyTermination=Early_Termination(stallTime=0.5))
+    assert optimal_control.terminationReason == "stall"
+    assert optimal_control.solutionAvailable == True
+    assert pyo.value(optimal_control.getModel().OBJ) < 0
+    ## The interrupt doesn't carry over to the next run of the instance
+    timeStart = time.monotonic()
+    optimal_control.setSolverAndRunOptimization(solver=3,timeLimit=1,persistent=True)
+    assert time.monotonic() - timeStart >= 0.9
+    assert optimal_control.terminationReason == "maxTimeLimit"
+
+def test_deadline_is_time_limit_of_linear_program():
+    optimal_control = getKnapsackModel(rows=3000,columns=3000)
+    for var in optimal_control.getModel().b.values():
+        var.domain = pyo.UnitInterval
+    timeStart = time.monotonic()
+    optimal_control.setSolverAndRunOptimization(solver=3,timeLimit=60,persistent=True,earlyTermination=Early_Termination(deadline=time.monotonic()+1))
+    assert time.monotonic() - timeStart < 1 + 3
+    assert optimal_control.terminationReason == "deadline"
+
+def test_time_limit_of_solver_is_no_deadline():
+    optimal_control = getKnapsackModel()
+    optimal_control.setSolverAndRunOptimization(solver=3,timeLimit=1,persistent=False,earlyTermination=Early_Termination(gap=1e-9,deadline=time.monotonic()+60))
+    assert optimal_control.terminationReason == "maxTimeLimit"
+    optimal_control.setSolverAndRunOptimization(solver=3,timeLimit=60,persistent=False,earlyTermination=Early_Termination(gap=1e-9,deadline=time.monotonic()+1))
+    assert optimal_control.terminationReason == "deadline"
@@ -0,0 +1,67 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+
+from optimal_control.optimal_control import *
+
+pytestmark = pytest.mark.skipif(Optimal_Control().getSolverAvailable(3) == False,reason="highs not available")
+
+def getSchedule(binaryModel):
+    ## Integer feasible binaries of the binary model from the rounded relaxation
+    optimal_control = binaryModel()
+    assert optimal_control.setSolverChainAndRunOptimization(solvers=[4],timeLimit=60) == True
+    return {var.name:round(var.value) for var in optimal_control.getModel().component_data_objects(pyo.Var) if var.is_binary()}
+
+def test_matrix_binary_model_objective(binaryModel):
+    ## The rows of the matrix model and the pyomo constraints of the binary model give the same optimum for the same binaries
+    schedule = getSchedule(binaryModel)
+    optimal_control = binaryModel(matrix=True)
+    for var in optimal_control.getModel().component_data_objects(pyo.Var):
+        if var.name in schedule:
+            var.fix(schedule[var.name])
+    validation = optimal_control.getMatrixValidation(timeLimit=60)
+    assert validation["matrix"] is not None and validation["pyomo"] is not None
+    assert validation["matrix"] > 1
+    assert validation["deviation"] < 1e-6
+
+def test_matrix_linear_binary_model_objective(linearBinaryModel):
+    ## The same for the linear binary model, compared on the linear relaxation (its mixed integer program takes too long for a test)
+    optimal_control = linearBinaryModel(matrix=True)
+    for var in optimal_control.getModel().component_data_objects(pyo.Var):
+        if var.is_binary():
+            var.domain = pyo.UnitInterval
+    validation = optimal_control.getMatrixValidation(timeLimit=60)
+    assert validation["matrix"] is not None and validation["pyomo"] is not None
+    assert validation["matrix"] > 0.1
+    assert validation["deviation"] < 1e-5 ## tolerances of the solver
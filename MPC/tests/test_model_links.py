@@ -0,0 +1,78 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pandas as pd
+
+from optimal_control.optimal_control import *
+from optimal_control.binary_model import *
+from optimal_control.linear_binary_model import *
+
+def getModels():
+    optimal_control = Optimal_Control()
+    binary_model = Binary_Model()
+    binary_model.setProfiles(profileForecastHeat=[60]*6,profileForecastCool=[-20]*6,profileForecastDry=[-10]*6,profileForecastWeather=[5]*6,profileForecastPrice=[0.16]*6,profileForecastFrost=[0]*6)
+    binary_model.setParams(timeSteps=list(range(0,7)),stepSizeInSec=600,controlPeriod1=1,controlPeriod2=2,tControlPeriodSwitch=2)
+    linear_binary_model = Linear_Binary_Model()
+    linear_binary_model.setProfiles(profileForecastHeat=[600]*4,profileForecastCool=[-20]*4,profileForecastDry=[-10]*4,profileForecastWeather=[5]*4,profileForecastPrice=[0.16]*4,profileForecastFrost=[0]*4)
+    linear_binary_model.setParams(timeSteps=list(range(0,5)),stepSizeInSec=3600,controlPeriod=1,NMcCormick=list(range(0,2)))
+    optimal_control.addModelParts(binary_model.setVariables(optimal_control.getModel("T")))
+    optimal_control.addModelParts(linear_binary_model.setVariables(optimal_control.getModel("I")))
+    return optimal_control,binary_model,linear_binary_model
+
+def test_end_states_of_the_binary_model():
+    optimal_control,binary_model,linear_binary_model = getModels()
+    T = optimal_control.getModel("T")
+    endStates = binary_model.getEndStates(model=T)
+    assert endStates["T_HXH_start"] is T.T_HP_HT_T[6]
+    assert endStates["T_IS_w_2_start"] is T.T_IS_W_T_WR[6,2]
+    assert endStates["T_GS_c_7_start"] is T.T_GS_C_T_CR_CC[6,0,6]
+    assert set(endStates) == set(linear_binary_model.setStartValues.__code__.co_varnames[2:linear_binary_model.setStartValues.__code__.co_argcount])
+    ## Same start values from the last row of the results (e.g. of the warmstart)
+    columns = sorted(set(column for variable,index,column in binary_model.END_STATES.values()))
+    results = pd.DataFrame({column:[0.0,float(k)] for k,column in enumerate(columns)})
+    endStates = binary_model.getEndStates(results=results)
+    assert endStates["T_HXH_start"] == endStates["T_HP_HT_start"] == columns.index("T_HP_HT_T")
+    assert endStates["T_IS_w_2_start"] == columns.index("T_IS_W_1_T")
+
+def test_links_of_the_linear_binary_model():
+    optimal_control,binary_model,linear_binary_model = getModels()
+    I = optimal_control.getModel("I")
+    toggles = linear_binary_model.getStartToggles(model=I)
+    assert toggles["B_HP_4_end"] is I.B_HP_H_I[4,0]
+    assert set(var.name for var in identify_variables(toggles["B_GS_HGS_CS_end"])) == {I.V_GS_HGS_I[0].name,I.V_GS_CS_I[0].name}
+    endStates = linear_binary_model.getEndStates(model=I)
+    assert endStates["T_HS_start"] is I.T_HS_I[4]
+    assert endStates["T_GS_w_3_start"] is I.T_GS_W_I_WR_WC[4,0,5]
+    ## As links, the boundary values are variables of the receiving block
+    links = optimal_control.getLinks("T",**toggles)
+    assert all(link.parent_block() is optimal_control.getModel("T") for link in links.values())
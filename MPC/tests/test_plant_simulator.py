@@ -0,0 +1,104 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+
+from optimal_control.plant_simulator import *
+from conftest import START_TEMPERATURES
+
+class Profile_Interface:
+    ## Forecast interface of one trajectory of the batch profiles, the frost profile is read last in every interval
+    def __init__(self,profiles,scenario):
+        self.profiles = profiles
+        self.scenario = scenario
+        self.step = 0
+
+    def getProfile(self,name):
+        return [self.profiles[name][self.scenario,self.step]]
+
+    def getProfileForecastHeat(self,timestampStart,intervals):
+        return self.getProfile("heat")
+
+    def getProfileForecastCool(self,timestampStart,intervals):
+        return self.getProfile("cool")
+
+    def getProfileForecastDry(self,timestampStart,intervals):
+        return self.getProfile("dry")
+
+    def getProfileForecastWeather(self,timestampStart,intervals):
+        return self.getProfile("weather")
+
+    def getProfileForecastFrost(self,timestampStart,intervals):
+        profile = self.getProfile("frost")
+        self.step += 1
+        return profile
+
+def test_batch_simulation_matches_single_steps():
+    ## Every trajectory of runBatchSimulation equals the same schedule applied step by step with runSimulation
+    n,horizon = 5,6
+    rng = np.random.default_rng(0)
+    plant_simulator = Plant_Simulator(simTimeStart="2022-01-01 00:00:00",subSteps=10,mismatch=0.05,seed=3)
+    plant_simulator.setParams(600)
+    startStates = plant_simulator.getStartState(**START_TEMPERATURES) + rng.normal(0,1,(n,plant_simulator.SIZE_STATE))
+    schedules = {"B_HP_H":rng.integers(0,5,(n,horizon)),"B_VP_V":rng.integers(0,8,(n,horizon))}
+    for name in plant_simulator.MODES:
+        schedules[name] = rng.integers(0,2,(n,horizon))
+    profiles = {"heat":rng.uniform(0,300,(n,horizon)),"cool":-rng.uniform(0,100,(n,horizon)),"dry":-rng.uniform(0,30,(n,horizon)),"weather":rng.uniform(0,30,(n,horizon)),
+    "frost":rng.integers(0,2,(n,horizon)),"price":0.16}
+    results = plant_simulator.runBatchSimulation(startStates=startStates,schedules=schedules,profiles=profiles)
+    assert results["states"].shape == (n,horizon+1,plant_simulator.SIZE_STATE)
+    assert results["power"].shape == (n,horizon)
+    assert results["cost"].shape == (n,)
+    assert results["slack"].shape == (n,)
+    assert np.all(np.isfinite(results["states"]))
+
+    for k in range(0,n):
+        plant_simulator.forecastInterface = Profile_Interface(profiles=profiles,scenario=k)
+        plant_simulator.x[:plant_simulator.SIZE_STATE] = startStates[k]
+        for t in range(0,horizon):
+            inputs = {"B_HP_" + str(h):int(h == schedules["B_HP_H"][k,t]) for h in range(0,5)}
+            inputs.update({"B_VP_" + str(v):int(v == schedules["B_VP_V"][k,t]) for v in range(0,8)})
+            inputs.update({name:schedules[name][k,t] for name in plant_simulator.MODES})
+            plant_simulator.runSimulation(**inputs)
+            assert np.max(np.abs(plant_simulator.x[:plant_simulator.SIZE_STATE] - results["states"][k,t+1])) < 1e-8, (k,t)
+
+def test_batch_simulation_broadcasts_start_state_and_profiles():
+    ## One start state and scalar profiles for all trajectories, the costs are the energy times the price
+    plant_simulator = Plant_Simulator(simTimeStart="2022-01-01 00:00:00")
+    plant_simulator.setParams(600)
+    schedules = {"B_HP_H":np.array([[0,0,0],[2,2,2]]),"B_VP_V":0}
+    results = plant_simulator.runBatchSimulation(startStates=plant_simulator.getStartState(**START_TEMPERATURES),schedules=schedules,profiles={"heat":50,"price":0.5})
+    assert results["states"].shape == (2,4,plant_simulator.SIZE_STATE)
+    assert np.all(results["states"][:,0,:] == plant_simulator.getStartState(**START_TEMPERATURES))
+    assert np.allclose(results["cost"],np.sum(600 / 3600 * results["power"] * 0.5,axis=1))
+    assert results["power"][1,0] > results["power"][0,0] ## stage 2 of HP uses more power than stage 0
@@ -0,0 +1,69 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import pytest
+import numpy as np
+import pandas as pd
+
+from optimal_control.optimization_results_interface import *
+
+def getResults(iteration,length=6):
+    index = pd.date_range("2024-01-01 00:00:00",periods=length,freq="10min").strftime("%Y-%m-%d %H:%M:%S") ## like the results of getResults
+    return pd.DataFrame({"T_HS":np.linspace(30,40,length) + iteration,"B_HP_1":np.arange(0,length) % 2,"Cost":np.full(length,0.1 * iteration)},index=index)
+
+@pytest.mark.parametrize("source,asyncWrite",[("csv",False),("csv",True),("arrow",False),("arrow",True)])
+def test_results_round_trip(tmp_path,source,asyncWrite):
+    if source == "arrow":
+        pytest.importorskip("pyarrow")
+    savePath = str(tmp_path) + os.sep
+    interface = Optimization_Results_Interface(source=source,time="byCreate",asyncWrite=asyncWrite,writeQueueSize=2)
+    for iteration in range(0,5):
+        interface.setOptimizationResults(dataFrame=getResults(iteration),savePath=savePath)
+    interface.waitForWrites()
+    reader = Optimization_Results_Interface(source=source,time="extern",timestamp=interface.started)
+    for iteration in range(0,5):
+        pd.testing.assert_frame_equal(reader.readOptimizationResults(savePath=savePath,iteration=iteration),getResults(iteration),check_dtype=False)
+    reader.setCount(2)
+    pd.testing.assert_frame_equal(reader.getOptimizationResults(savePath=savePath),getResults(3),check_dtype=False) ## next iteration first
+
+def test_async_write_error_is_raised(tmp_path):
+    interface = Optimization_Results_Interface(source="csv",time="byCreate",asyncWrite=True)
+    savePath = os.path.join(str(tmp_path),"missing") + os.sep
+    interface.setOptimizationResults(dataFrame=getResults(0),savePath=savePath)
+    with pytest.raises(OSError):
+        interface.waitForWrites()
+    ## Later writes are not blocked by the failed one
+    interface.setOptimizationResults(dataFrame=getResults(1),savePath=str(tmp_path) + os.sep)
+    interface.waitForWrites()
+    assert interface.getManifest(str(tmp_path) + os.sep).getLatest() == 1
@@ -0,0 +1,68 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import pandas as pd
+
+from optimal_control.results_manifest import *
+from optimal_control.optimization_results_interface import *
+
+def test_manifest_reads_entries_of_another_instance(tmp_path):
+    writer = Results_Manifest(savePath=str(tmp_path),run="run")
+    reader = Results_Manifest(savePath=str(tmp_path),run="run")
+    assert reader.getLatest() is None
+    writer.setEntry(iteration=0,name="Results_0.csv",first="2024-01-01 00:00:00",last="2024-01-01 01:00:00")
+    writer.setEntry(iteration=1,name="Results_1.csv")
+    assert reader.getLatest() == 1
+    assert reader.getEntry(0) == {"file":"Results_0.csv","offset":0,"first":"2024-01-01 00:00:00","last":"2024-01-01 01:00:00"}
+    ## A line that is just being written is read with the next call once it is complete
+    with open(reader.path,"a") as file:
+        file.write("2;Results_2.csv;0;;")
+    assert reader.getLatest() == 1 and reader.getEntry(2) is None
+    with open(reader.path,"a") as file:
+        file.write("\n")
+    assert reader.getLatest() == 2
+    assert reader.getEntry(2)["file"] == "Results_2.csv"
+
+def test_results_of_latest_iteration_and_start_values(tmp_path):
+    savePath = str(tmp_path) + os.sep
+    startValues = pd.DataFrame({"T_HS":[35.0]},index=["2024-01-01 00:00:00"])
+    startValues.to_csv(savePath + "Results_start_values.csv",sep=";")
+    interface = Optimization_Results_Interface(source="csv",time="byCreate")
+    ## Without results of the run the last csv file of the directory
+    pd.testing.assert_frame_equal(interface.getOptimizationResults(savePath=savePath),startValues)
+    for iteration in range(0,3):
+        interface.setOptimizationResults(dataFrame=pd.DataFrame({"T_HS":[40.0 + iteration]},index=["2024-01-01 00:00:00"]),savePath=savePath)
+    ## An iteration far from the counter (e.g. a resumed run) gets the latest results of the run
+    interface.setCount(10)
+    assert interface.getOptimizationResults(savePath=savePath)["T_HS"].iloc[0] == 42.0
@@ -0,0 +1,126 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+import pytest
+import numpy as np
+import pyomo.environ as pyo
+
+from optimal_control.optimal_control import *
+
+pytestmark = pytest.mark.skipif(Optimal_Control().getSolverAvailable(3) == False,reason="highs not available")
+
+def getRoundingModel(feasibleFirstStep):
+    ## b_T[0] + b_T[1] == 1 with costs, the relaxation splits the steps, 2 * b_T[t] == 1 can't be rounded
+    optimal_control = Optimal_Control()
+    m = optimal_control.getModel()
+    m.b_T = pyo.Var([0,1],domain=pyo.Binary)
+    m.x = pyo.Var(bounds=(0,10))
+    m.C = pyo.ConstraintList()
+    m.C.add(2 * m.b_T[1 if feasibleFirstStep == True else 0] == 1)
+    m.C.add(m.x >= m.b_T[0] + m.b_T[1])
+    m.OBJ = pyo.Objective(expr=m.x + 0.1 * m.b_T[0])
+    return optimal_control
+
+def test_relaxed_solution_with_rounded_first_step():
+    optimal_control = getRoundingModel(feasibleFirstStep=True)
+    assert optimal_control.setSolverChainAndRunOptimization(solvers=[4],timeLimit=30) == True
+    m = optimal_control.getModel()
+    assert m.b_T[0].value == 0 ## rounded
+    assert m.b_T[1].value == pytest.approx(0.5) ## relaxed value of the last feasible linear program
+    assert m.x.value == pytest.approx(0.5)
+    assert optimal_control.getSolverChainLog()[-1]["reason"] == "rounded"
+    assert m.b_T[0].domain is pyo.Binary and m.b_T[0].fixed == False
+
+def test_relaxed_without_rounded_first_step_has_no_solution():
+    optimal_control = getRoundingModel(feasibleFirstStep=False)
+    assert optimal_control.setSolverChainAndRunOptimization(solvers=[4],timeLimit=30) == False
+    m = optimal_control.getModel()
+    assert optimal_control.solutionAvailable == False
+    assert optimal_control.getSolverChainLog()[-1]["reason"] == "infeasible"
+    assert m.b_T[0].value == pytest.approx(0.5) ## values of the linear program, not the rounded ones
+    with pytest.raises(RuntimeError):
+        optimal_control.getResults(source=None,savePath="",combinedFile=False,singleFile=False,timestampStart=None,intervals=[])
+
+@pytest.mark.parametrize("loopStart",[False,True])
+def test_relaxed_binary_model_is_feasible(binaryModel,loopStartValues,loopStart):
+    ## The schedule of the fallback satisfies all constraints and the first step is integer, also with the start and toggle constraints of the loop
+    optimal_control = binaryModel(startValues=loopStartValues if loopStart == True else None)
+    assert optimal_control.setSolverChainAndRunOptimization(solvers=[4],timeLimit=120) == True
+    assert optimal_control.getSolverChainLog()[-1]["reason"] == "rounded"
+    m = optimal_control.getModel()
+    for var in m.component_data_objects(pyo.Var,active=True):
+        index = var.index()
+        if var.is_binary() and var.parent_component().name.endswith(("_T","_T_1","_T_2")) and (index[-1] if isinstance(index,tuple) else index) == 0:
+            assert abs(var.value - round(var.value)) < 1e-6, var.name
+    for constraint in m.component_data_objects(pyo.Constraint,active=True):
+        body = pyo.value(constraint.body)
+        if constraint.has_lb():
+            assert body >= pyo.value(constraint.lower) - 1e-4, constraint.name
+        if constraint.has_ub():
+            assert body <= pyo.value(constraint.upper) + 1e-4, constraint.name
+
+def test_persistent_solves_stay_within_time_limit():
+    ## Every solve on the same persistent instance gets the given limit, not the run time of the earlier solves added
+    rng = np.random.default_rng(0)
+    optimal_control = Optimal_Control()
+    m = optimal_control.getModel()
+    m.N = pyo.RangeSet(0,299)
+    m.b = pyo.Var(m.N,domain=pyo.Binary)
+    m.C = pyo.ConstraintList()
+    for i in range(0,150):
+        index = rng.choice(300,30,replace=False)
+        m.C.add(sum(rng.uniform(1,5) * m.b[int(j)] for j in index) <= rng.uniform(5,10))
+    m.OBJ = pyo.Objective(expr=-sum(rng.uniform(1,10) * m.b[j] for j in m.N))
+    for k in range(0,3):
+        timeStart = time.monotonic()
+        optimal_control.setSolverAndRunOptimization(solver=3,timeLimit=1,persistent=True)
+        assert time.monotonic() - timeStart < 1 + 1.5
+        assert optimal_control.getSolverStatistics()["termination"] == "maxTimeLimit"
+    ## The relaxation on the same instance isn't stopped by the run time of the mixed integer programs
+    for var in m.b.values():
+        var.domain = pyo.UnitInterval
+    optimal_control.setSolverAndRunOptimization(solver=3,timeLimit=1,persistent=True)
+    assert optimal_control.solutionAvailable == True
+    assert optimal_control.getSolverStatistics()["termination"] == "optimal"
+
+def test_persistent_highs_falls_back_without_private_attributes():
+    ## The instance of the appsi interface is reached by private attributes, an interface without them is solved non persistent
+    optimal_control = getRoundingModel(feasibleFirstStep=False)
+    m = optimal_control.getModel()
+    optimal_control.setSolverAndRunOptimization(solver=3,timeLimit=30,persistent=True)
+    assert optimal_control.getHighsInstance() is optimal_control.persistent_solvers[3]._solver_model
+    optimal_control.persistent_solvers[3] = pyo.SolverFactory("glpk") ## no _solver_model and _model
+    optimal_control.setSolverAndRunOptimization(solver=3,timeLimit=30,persistent=True)
+    assert 3 not in optimal_control.persistent_solvers
+    assert optimal_control.getSolverStatistics()["termination"] == "infeasible"
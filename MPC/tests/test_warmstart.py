@@ -0,0 +1,58 @@
+# This file is part of rtMPCuGC.
+# 
+# Copyright (c) 2025, Daniel Bull
+# Developed at HKA - Karlsruhe University of Applied Sciences.
+# All rights reserved.
+# 
+# The BSD 3-Clause License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from optimal_control.warmstart_linear_binary_model import *
+
+def getWarmstart(previousResults,shiftInSec):
+    warmstart = Warmstart_Linear_Binary_Model(timelimitWarmstart=60,warmstartPartitionLinearBinary=3)
+    warmstart.setParams(timestepsLinearBinary=10,stepSizeLinearBinary=3600,controlPeriod=1,NMcCormick=[0,1])
+    warmstart.setStartValues(**{name:20.0 for name in ["T_HP_HT_start","T_HP_LT_start","T_HS_start","T_HXA_start","T_HXH_start","T_HGC_start","T_HXC_start","T_HGS_start","T_IS_w_1_start","T_IS_w_2_start",
+    "T_IS_w_3_start","T_IS_c_1_start","T_IS_c_2_start","T_IS_c_3_start","T_IS_c_4_start","T_IS_c_5_start","T_GS_w_1_start","T_GS_w_2_start","T_GS_w_3_start","T_GS_c_1_start","T_GS_c_2_start",
+    "T_GS_c_3_start","T_GS_c_4_start","T_GS_c_5_start","T_GS_c_6_start","T_GS_c_7_start","T_CS_start","T_RLTS_start"]})
+    warmstart.setPreviousResults(previousResults=previousResults,shiftInSec=shiftInSec)
+    return warmstart
+
+def test_estimated_state_is_shifted_by_the_cycle():
+    columns = ["T_HP_HT_I","T_HP_LT_I","T_HS_I","T_HXA_I","T_HXH_w_I","T_HGC_I","T_HXC_b_I","T_HGS_I"] + ["T_IS_W_" + str(k) + "_I" for k in range(0,3)] + ["T_IS_C_" + str(k) + "_I" for k in range(0,5)] \
+    + ["T_GS_W_" + str(k) + "_I" for k in range(0,3)] + ["T_GS_C_" + str(k) + "_I" for k in range(0,7)] + ["T_CS_I","T_RLTS_I"]
+    previousResults = pd.DataFrame({column:30.0 + np.arange(0,10) for column in columns},index=range(0,10)) ## one Kelvin per hour
+    assert getWarmstart(previousResults,shiftInSec=0).getEstimatedState(4)["T_HS_start"] == pytest.approx(34)
+    assert getWarmstart(previousResults,shiftInSec=600).getEstimatedState(4)["T_HS_start"] == pytest.approx(34 + 1/6)
+    assert getWarmstart(previousResults,shiftInSec=3600).getEstimatedState(4)["T_CS_start"] == pytest.approx(35)
+    ## Beyond the last cycle's trajectory or without it the start state
+    assert getWarmstart(previousResults,shiftInSec=600).getEstimatedState(9)["T_HS_start"] == 20.0
+    assert getWarmstart(None,shiftInSec=600).getEstimatedState(4)["T_HS_start"] == 20.0